@@ -33,12 +33,18 @@ export class ExportdJobSchedulingStepComponent extends ExportdJobBaseStepCompone
   set preData(data: ExportdJob) {
     if (data !== undefined && data.scheduling !== undefined) {
       this.eventForm.patchValue(data.scheduling.event);
+      this.deltaControl.setValue(data.delta === true);
       this.taskType = data.exportd_type;
     }
   }
 
   public eventForm: UntypedFormGroup;
 
+  /**
+   * Transfer only the changes since the last successful run
+   */
+  public deltaControl: UntypedFormControl = new UntypedFormControl(false);
+
   /**
    * Type of execution (PULL or PUSH)
    */
@@ -50,6 +56,14 @@ export class ExportdJobSchedulingStepComponent extends ExportdJobBaseStepCompone
   public info: string = 'Excludes jobs that have been executed manually ' +
     'and jobs that are executed automatically after they have been created.';
 
+  /**
+   * Information on the delta transfer
+   */
+  public deltaInfo: string = 'Created and changed objects are updated, ' +
+    'removed objects are deleted at the destination. ' +
+    'The first run and the first run after an edit of the job transfer all objects. ' +
+    'Destinations without delta support always receive all objects.';
+
   constructor(private formBuilder: UntypedFormBuilder) {
     super();
     this.eventForm = this.formBuilder.group({
@@ -120,6 +120,7 @@ export class ExportdJobSettingsBuilderComponent implements OnInit, OnDestroy {
     this.task.sources = this.sourcesStep.sourcesForm.get('sources').value;
     this.task.variables = this.variablesStep.variableForm.get('variables').value;
     this.task.scheduling = { event: this.schedulingStep.eventForm.value };
+    this.task.delta = this.schedulingStep.deltaControl.value;
 
     if (this.mode === CmdbMode.Create) {
       this.taskService.postTask(this.task).pipe(takeUntil(this.subscriber)).subscribe((job: ExportdJob) => {
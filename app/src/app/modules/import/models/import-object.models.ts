@@ -34,6 +34,7 @@ export class ImporterConfig {
 
 
 export class ImportResponse {
-    success_imports: any[];
+    success_count: number;
     failed_imports: any[];
+    failed_count: number;
 }
@@ -34,4 +34,5 @@ export class ExportdJob {
   public running: boolean;
   public state: any;
   public exportd_type: string;
+  public delta: boolean;
 }
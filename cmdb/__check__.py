@@ -22,6 +22,10 @@
 from pymongo.errors import OperationFailure
 
 from cmdb.database.database_manager_mongo import DatabaseManagerMongo
+from cmdb.database.index_manager import IndexManager
+from cmdb.manager.search_index_manager import SearchIndexManager
+from cmdb.manager.object_refs_manager import ObjectRefsManager
+from cmdb.manager.type_manager import TypeManager
 from cmdb.manager.users_manager import UsersManager
 from cmdb.manager.group_manager import GroupManager
 from cmdb.security.security import SecurityManager
@@ -89,6 +93,15 @@ def checker(self):
                                An update is avaiable which will be installed automatically.
                                """)
                 self.status = CheckRoutine.CheckStatus.HAS_UPDATES
+
+            # build missing indexes without waiting for them
+            IndexManager(self.setup_database_manager).reconcile_in_background()
+            # fill the search entries of databases which were created without them
+            SearchIndexManager(self.setup_database_manager).rebuild_in_background()
+            # fill the reference edges of databases which were created without them
+            ObjectRefsManager(self.setup_database_manager).rebuild_in_background()
+            # continue the multi data section migrations of types which were interrupted
+            TypeManager(self.setup_database_manager).resume_in_background()
         LOGGER.info('FINISHED Checks!')
 
         return self.status
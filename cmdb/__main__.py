@@ -26,6 +26,9 @@
 import sys
 
 from cmdb.database.database_manager_mongo import DatabaseManagerMongo
+from cmdb.database.index_manager import IndexManager
+from cmdb.manager.object_refs_manager import ObjectRefsManager
+from cmdb.manager.type_manager import TypeManager
 
 import cmdb
 from cmdb import __title__
@@ -37,6 +40,7 @@
 import cmdb.process_management.process_manager
 
 from cmdb.errors.database import ServerTimeoutError, DatabaseConnectionError
+from cmdb.errors.manager import ManagerUpdateError
 # -------------------------------------------------------------------------------------------------------------------- #
 
 # setup logging for startup
@@ -80,6 +84,15 @@ def main(args: Namespace):
         if args.keys and not args.cloud:
             _start_key_routine(dbm)
 
+        if args.index_report and not args.cloud:
+            _start_index_report(dbm)
+
+        if args.rebuild_object_refs and not args.cloud:
+            _start_object_refs_rebuild(dbm)
+
+        if args.resume_type_migrations and not args.cloud:
+            _start_type_migrations_resume(dbm)
+
         if args.start:
             _start_app()
             LOGGER.info("DATAGERRY successfully started")
@@ -110,6 +123,61 @@ def _start_key_routine(dbm: DatabaseManagerMongo):
         sys.exit(1)
 
 
+def _start_index_report(dbm: DatabaseManagerMongo = None):
+    """
+    Prints the existing, missing and undeclared indexes of all collections with their usage
+    Args:
+        dbm (DatabaseManagerMongo): Database Connector
+    """
+    dbm = dbm or _check_database()
+
+    if not dbm:
+        LOGGER.critical('Could not establish connection to db')
+        sys.exit(1)
+
+    index_manager = IndexManager(dbm)
+    print(IndexManager.format_report(index_manager.get_report()))
+    sys.exit(0)
+
+
+def _start_object_refs_rebuild(dbm: DatabaseManagerMongo = None):
+    """
+    Rebuilds the reference edges of all objects
+    Args:
+        dbm (DatabaseManagerMongo): Database Connector
+    """
+    dbm = dbm or _check_database()
+
+    if not dbm:
+        LOGGER.critical('Could not establish connection to db')
+        sys.exit(1)
+
+    LOGGER.info('Rebuilt reference edges of %s objects', ObjectRefsManager(dbm).rebuild())
+    sys.exit(0)
+
+
+def _start_type_migrations_resume(dbm: DatabaseManagerMongo = None):
+    """
+    Resumes the interrupted multi data section migrations of types
+    Args:
+        dbm (DatabaseManagerMongo): Database Connector
+    """
+    dbm = dbm or _check_database()
+
+    if not dbm:
+        LOGGER.critical('Could not establish connection to db')
+        sys.exit(1)
+
+    try:
+        LOGGER.info('Resumed type migrations, changed objects: %s',
+                    TypeManager(dbm).resume_multi_data_sections_migrations())
+    except ManagerUpdateError as err:
+        LOGGER.critical('Type migrations could not be resumed: %s', err.message)
+        sys.exit(1)
+
+    sys.exit(0)
+
+
 def _start_check_routines(dbm: DatabaseManagerMongo):
     """
     Starts validation of database structure
@@ -207,6 +275,24 @@ def build_arg_parser() -> Namespace:
                          dest='keys',
                          help="init keys")
 
+    _parser.add_argument('--index-report',
+                         action='store_true',
+                         default=False,
+                         dest='index_report',
+                         help="show the existing, missing and unused database indexes")
+
+    _parser.add_argument('--rebuild-object-refs',
+                         action='store_true',
+                         default=False,
+                         dest='rebuild_object_refs',
+                         help="rebuild the reference edges of all objects")
+
+    _parser.add_argument('--resume-type-migrations',
+                         action='store_true',
+                         default=False,
+                         dest='resume_type_migrations',
+                         help="resume the interrupted multi data section migrations of types")
+
     _parser.add_argument('--cloud',
                          action='store_true',
                          default=False,
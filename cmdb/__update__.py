@@ -19,9 +19,13 @@
 from pymongo.errors import CollectionInvalid
 
 from cmdb.database.database_manager_mongo import DatabaseManagerMongo
+from cmdb.database.index_manager import IndexManager
+from cmdb.manager.search_index_manager import SearchIndexManager
+from cmdb.manager.object_refs_manager import ObjectRefsManager
 
 from cmdb.updater import UpdaterModule
 from cmdb.updater.updater_settings import UpdateSettings
+from cmdb.manager.type_cache import TYPE_CACHE
 from cmdb.utils.system_reader import SystemSettingsReader
 from cmdb.utils.system_writer import SystemSettingsWriter
 from cmdb.utils.system_config import SystemConfigReader
@@ -149,6 +153,10 @@ def update_database_collection(self):
                     self.setup_database_manager.create_indexes(collection.COLLECTION,
                                                                collection.get_index_keys())
                     LOGGER.info('UPDATE ROUTINE: Database collection %s was created.', collection.COLLECTION)
+
+            # build the declared indexes which are missing in the existing collections
+            created_indexes = IndexManager(self.setup_database_manager).reconcile()
+            LOGGER.info('UPDATE ROUTINE: Built missing indexes: %s', created_indexes or 'none')
         except Exception as ex:
             LOGGER.info('UPDATE ROUTINE: Database collection validation failed: %s', ex)
 
@@ -171,6 +179,16 @@ def update_db_version(self):
             # start running update files
             updater_setting_instance.run_updates(updater_settings_values.get('version'), ssr)
 
+            # update files modify types directly in the database
+            TYPE_CACHE.invalidate(self.setup_database_manager)
+
+            # update files modify objects directly in the database
+            indexed_objects = SearchIndexManager(self.setup_database_manager).rebuild()
+            LOGGER.info('UPDATE ROUTINE: Rebuilt search entries of %s objects', indexed_objects)
+
+            indexed_objects = ObjectRefsManager(self.setup_database_manager).rebuild()
+            LOGGER.info('UPDATE ROUTINE: Rebuilt reference edges of %s objects', indexed_objects)
+
         except Exception as err:
             self.status = UpdateRoutine.UpateStatus.ERROR
             raise RuntimeError(
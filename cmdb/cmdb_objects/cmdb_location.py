@@ -74,8 +74,21 @@ class CmdbLocation(CmdbDAO):
             'type': 'boolean',
             'default': True
         },
+        'ancestors': {
+            'type': 'list',
+            'schema': {
+                'type': 'integer'
+            },
+            'default': []
+        },
     }
 
+    INDEX_KEYS = [
+        {'keys': [('parent', CmdbDAO.DAO_ASCENDING)], 'name': 'parent', 'unique': False},
+        {'keys': [('object_id', CmdbDAO.DAO_ASCENDING)], 'name': 'object_id', 'unique': False},
+        {'keys': [('ancestors', CmdbDAO.DAO_ASCENDING)], 'name': 'ancestors', 'unique': False}
+    ]
+
 # ---------------------------------------------------- CONSTRUCTOR --------------------------------------------------- #
 
     def __init__(self, name: str,
@@ -85,6 +98,7 @@ def __init__(self, name: str,
                  type_label: str,
                  type_icon: str = "fas fa-cube",
                  type_selectable = True,
+                 ancestors: list[int] = None,
                  **kwargs):
         """
         Initialisation of location
@@ -97,6 +111,7 @@ def __init__(self, name: str,
             type_label (str): label of type for which this location is set
             type_icon (str): icon of type for which this location is set, default is 'fas fa-cube'
             type_selectable (bool): sets if this type is selectable as a parent for other locations, default is yes
+            ancestors (list[int]): public_ids of all parent locations, starting with the root location
         """
         self.name: str = name
         self.parent: int = parent
@@ -105,6 +120,7 @@ def __init__(self, name: str,
         self.type_label: str = type_label
         self.type_icon: str = type_icon
         self.type_selectable: bool = type_selectable
+        self.ancestors: list[int] = ancestors or []
         super().__init__(**kwargs)
 
 # -------------------------------------------------- CLASS FUNCTIONS ------------------------------------------------- #
@@ -129,6 +145,7 @@ def from_data(cls, data: dict, *args, **kwargs) -> "CmdbLocation":
             type_label = data.get('type_label'),
             type_icon = data.get('type_icon', 'fas fa-cube'),
             type_selectable = data.get('type_selectable', True),
+            ancestors = data.get('ancestors', []),
         )
 
 
@@ -152,6 +169,7 @@ def to_json(cls, instance: "CmdbLocation") -> dict:
             'type_label': instance.type_label,
             'type_icon': instance.type_icon,
             'type_selectable': instance.type_selectable,
+            'ancestors': instance.ancestors,
         }
 
 
@@ -169,6 +187,7 @@ def to_data(cls, instance: "CmdbLocation") -> dict:
             'type_label': instance['type_label'],
             'type_icon': instance['type_icon'],
             'type_selectable': instance['type_selectable'],
+            'ancestors': instance.get('ancestors', []),
         }
 
 
@@ -98,6 +98,15 @@ class CmdbObject(CmdbDAO):
         }
     }
 
+    INDEX_KEYS = [
+        {'keys': [('type_id', CmdbDAO.DAO_ASCENDING), ('public_id', CmdbDAO.DAO_ASCENDING)],
+         'name': 'type_id_public_id', 'unique': False},
+        {'keys': [('fields.name', CmdbDAO.DAO_ASCENDING), ('fields.value', CmdbDAO.DAO_ASCENDING)],
+         'name': 'fields_name_value', 'unique': False},
+        {'keys': [('author_id', CmdbDAO.DAO_ASCENDING)], 'name': 'author_id', 'unique': False},
+        {'keys': [('active', CmdbDAO.DAO_ASCENDING)], 'name': 'active', 'unique': False}
+    ]
+
 
     def __init__(self,
                  type_id,
@@ -0,0 +1,232 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2024 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+This module contains the implementation of CmdbObjectRefs, the materialised
+reference edges of a CmdbObject
+"""
+import logging
+from datetime import datetime, timezone
+
+from cmdb.cmdb_objects.cmdb_dao import CmdbDAO
+from cmdb.framework.utils import Collection, Model
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                                CmdbObjectRefs - CLASS                                                #
+# -------------------------------------------------------------------------------------------------------------------- #
+class CmdbObjectRefs(CmdbDAO):
+    """
+    The reference edges of an object to the objects it references.
+    It shares the public_id with its object (the source of the edges), so all edges of an object
+    are replaced with a single document write.
+
+    Every edge contains the `target_id`, the `field` and the `section` of the reference and `via_mds`
+    if the reference is a value of a multi data section.
+
+    Attributes:
+        COLLECTION (Collection):    Name of the database collection.
+        MODEL (Model):              Name of the DAO.
+        INDEX_KEYS (list):          List of index keys for the database.
+    """
+    COLLECTION: Collection = 'framework.object_refs'
+    MODEL: Model = 'ObjectRefs'
+    REQUIRED_INIT_KEYS = ['type_id']
+
+    REFERENCE_FIELD_TYPES = ('ref', 'ref-section-field')
+
+    SCHEMA: dict = {
+        'public_id': {
+            'type': 'integer'
+        },
+        'type_id': {
+            'type': 'integer'
+        },
+        'references': {
+            'type': 'list'
+        },
+        'indexed_time': {
+            'type': 'dict'
+        }
+    }
+
+    INDEX_KEYS = [
+        {'keys': [('references.target_id', CmdbDAO.DAO_ASCENDING)], 'name': 'references.target_id', 'unique': False},
+        {'keys': [('type_id', CmdbDAO.DAO_ASCENDING)], 'name': 'type_id', 'unique': False},
+        {'keys': [('indexed_time', CmdbDAO.DAO_ASCENDING)], 'name': 'indexed_time', 'unique': False}
+    ]
+
+# ---------------------------------------------------- CONSTRUCTOR --------------------------------------------------- #
+
+    def __init__(self, type_id: int,
+                 references: list[dict] = None,
+                 indexed_time: datetime = None,
+                 **kwargs):
+        """
+        Initialisation of the reference edges of an object
+
+        Args:
+            type_id (int): public_id of the type of the object
+            references (list[dict]): The edges to the referenced objects
+            indexed_time (datetime): Point in time when the edges were built
+        """
+        self.type_id: int = type_id
+        self.references: list[dict] = references or []
+        self.indexed_time: datetime = indexed_time
+        super().__init__(**kwargs)
+
+# -------------------------------------------------- CLASS FUNCTIONS ------------------------------------------------- #
+
+    @classmethod
+    def from_object(cls, object_data: dict, type_data: dict) -> "CmdbObjectRefs":
+        """
+        Builds the reference edges of an object
+
+        Args:
+            object_data (dict): Document of the object
+            type_data (dict): Document of the type of the object
+
+        Returns:
+            CmdbObjectRefs: The edges of all reference fields of the object
+        """
+        reference_fields = cls.get_reference_fields(type_data or {})
+        references = []
+
+        def add_references(field: dict, section: str, via_mds: bool):
+            for target_id in cls.get_target_ids(field.get('value')):
+                edge = {'target_id': target_id, 'field': field['name'], 'section': section, 'via_mds': via_mds}
+
+                if edge not in references:
+                    references.append(edge)
+
+        for field in object_data.get('fields', []):
+            if field.get('name') in reference_fields:
+                add_references(field, reference_fields[field['name']], False)
+
+        for section in object_data.get('multi_data_sections') or []:
+            for value in section.get('values', []):
+                for data_set in value.get('data', []):
+                    if data_set.get('name') in reference_fields:
+                        add_references(data_set, section.get('section_id'), True)
+
+        return cls(
+            public_id = object_data['public_id'],
+            type_id = object_data['type_id'],
+            references = references,
+            indexed_time = datetime.now(timezone.utc)
+        )
+
+
+    @classmethod
+    def from_data(cls, data: dict, *args, **kwargs) -> "CmdbObjectRefs":
+        """
+        Returns an Instance of CmdbObjectRefs
+
+        Args:
+            data (dict): Dict which contains parameters to initiate a CmdbObjectRefs
+
+        Returns:
+            (CmdbObjectRefs): Instance of CmdbObjectRefs with data from dict
+        """
+        return cls(
+            public_id = data.get('public_id'),
+            type_id = data.get('type_id'),
+            references = data.get('references', []),
+            indexed_time = data.get('indexed_time'),
+        )
+
+
+    @classmethod
+    def to_json(cls, instance: "CmdbObjectRefs") -> dict:
+        """
+        Convert a CmdbObjectRefs instance to json conform data
+
+        Args:
+            instance (CmdbObjectRefs): Instance of CmdbObjectRefs
+
+        Returns:
+            (dict): Json conform dict
+        """
+        return {
+            'public_id': instance.get_public_id(),
+            'type_id': instance.type_id,
+            'references': instance.references,
+            'indexed_time': instance.indexed_time,
+        }
+
+
+    @classmethod
+    def to_data(cls, instance: "CmdbObjectRefs") -> dict:
+        """
+        Dict representation of a CmdbObjectRefs
+        """
+        return {
+            'public_id': instance.get_public_id(),
+            'type_id': instance.type_id,
+            'references': instance.references,
+            'indexed_time': instance.indexed_time,
+        }
+
+
+    @classmethod
+    def to_dict(cls, instance: "CmdbObjectRefs") -> dict:
+        """
+        Dict representation of a CmdbObjectRefs
+        """
+        return cls.to_data(instance)
+
+
+    @classmethod
+    def get_reference_fields(cls, type_data: dict) -> dict[str, str]:
+        """
+        Retrieves the reference fields of a type
+
+        Args:
+            type_data (dict): Document of the type
+
+        Returns:
+            dict[str, str]: Names of the sections by the names of their reference fields
+        """
+        field_types = {field.get('name'): field.get('type') for field in type_data.get('fields', [])}
+        reference_fields = {}
+
+        for section in type_data.get('render_meta', {}).get('sections', []):
+            if section.get('type') == 'ref-section':
+                section_fields = [f"{section.get('name')}-field"]
+            else:
+                section_fields = section.get('fields', [])
+
+            for field_name in section_fields:
+                if field_types.get(field_name) in cls.REFERENCE_FIELD_TYPES:
+                    reference_fields[field_name] = section.get('name')
+
+        return reference_fields
+
+
+    @staticmethod
+    def get_target_ids(value) -> list[int]:
+        """Returns the public_ids of a reference field value"""
+        if isinstance(value, bool):
+            return []
+
+        if isinstance(value, int):
+            return [value]
+
+        if isinstance(value, list):
+            return [item for item in value if isinstance(item, int) and not isinstance(item, bool)]
+
+        return []
@@ -0,0 +1,293 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2024 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+This module contains the implementation of CmdbSearchEntry, the denormalised
+search document of a CmdbObject
+"""
+import re
+import logging
+from datetime import datetime, timezone
+
+from cmdb.cmdb_objects.cmdb_dao import CmdbDAO
+from cmdb.framework.utils import Collection, Model
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                               CmdbSearchEntry - CLASS                                                #
+# -------------------------------------------------------------------------------------------------------------------- #
+class CmdbSearchEntry(CmdbDAO):
+    """
+    The search entry holds the searchable text of an object and of the objects it references.
+    It shares the public_id with its object.
+
+    Attributes:
+        COLLECTION (Collection):    Name of the database collection.
+        MODEL (Model):              Name of the DAO.
+        INDEX_KEYS (list):          List of index keys for the database.
+        MAX_TOKEN_LENGTH (int):     Tokens are cut to this length, longer search words match their prefix
+    """
+    COLLECTION: Collection = 'framework.searchEntries'
+    MODEL: Model = 'SearchEntry'
+    REQUIRED_INIT_KEYS = ['type_id']
+    MAX_TOKEN_LENGTH: int = 64
+
+    SCHEMA: dict = {
+        'public_id': {
+            'type': 'integer'
+        },
+        'type_id': {
+            'type': 'integer'
+        },
+        'active': {
+            'type': 'boolean'
+        },
+        'tokens': {
+            'type': 'list'
+        },
+        'values': {
+            'type': 'list'
+        },
+        'references': {
+            'type': 'list'
+        },
+        'indexed_time': {
+            'type': 'dict'
+        }
+    }
+
+    INDEX_KEYS = [
+        {'keys': [('tokens', CmdbDAO.DAO_ASCENDING)], 'name': 'tokens', 'unique': False},
+        {'keys': [('type_id', CmdbDAO.DAO_ASCENDING), ('active', CmdbDAO.DAO_ASCENDING)],
+         'name': 'type_id_active', 'unique': False},
+        {'keys': [('references', CmdbDAO.DAO_ASCENDING)], 'name': 'references', 'unique': False},
+        {'keys': [('indexed_time', CmdbDAO.DAO_ASCENDING)], 'name': 'indexed_time', 'unique': False}
+    ]
+
+    TOKEN_PATTERN = re.compile(r'\w+')
+
+# ---------------------------------------------------- CONSTRUCTOR --------------------------------------------------- #
+
+    def __init__(self, type_id: int,
+                 active: bool = True,
+                 tokens: list[str] = None,
+                 values: list[str] = None,
+                 references: list[int] = None,
+                 indexed_time: datetime = None,
+                 **kwargs):
+        """
+        Initialisation of a search entry
+
+        Args:
+            type_id (int): public_id of the type of the object
+            active (bool): active state of the object
+            tokens (list[str]): Distinct lowercase words of `values`
+            values (list[str]): String values of the object fields and of the fields of the referenced objects
+            references (list[int]): public_ids of the referenced objects
+            indexed_time (datetime): Point in time when the entry was built
+        """
+        self.type_id: int = type_id
+        self.active: bool = active
+        self.tokens: list[str] = tokens or []
+        self.values: list[str] = values or []
+        self.references: list[int] = references or []
+        self.indexed_time: datetime = indexed_time
+        super().__init__(**kwargs)
+
+# -------------------------------------------------- CLASS FUNCTIONS ------------------------------------------------- #
+
+    @classmethod
+    def from_object(cls,
+                    object_data: dict,
+                    ref_field_names: set[str],
+                    referenced_fields: dict[int, list[dict]]) -> "CmdbSearchEntry":
+        """
+        Builds the search entry of an object
+
+        Args:
+            object_data (dict): Document of the object
+            ref_field_names (set[str]): Names of the reference fields of the object type
+            referenced_fields (dict[int, list[dict]]): Fields of the referenced objects by their public_id
+
+        Returns:
+            CmdbSearchEntry: Entry with the values of the object and of its referenced objects
+        """
+        values = cls.get_string_values(object_data.get('fields', []))
+        references = []
+
+        for field in object_data.get('fields', []):
+            if field.get('name') not in ref_field_names:
+                continue
+
+            for ref_id in cls.get_reference_ids(field.get('value')):
+                if ref_id not in references:
+                    references.append(ref_id)
+
+        for ref_id in references:
+            values.extend(cls.get_string_values(referenced_fields.get(ref_id, [])))
+
+        return cls(
+            public_id = object_data['public_id'],
+            type_id = object_data['type_id'],
+            active = object_data.get('active', True),
+            tokens = cls.tokenize(values),
+            values = values,
+            references = references,
+            indexed_time = datetime.now(timezone.utc)
+        )
+
+
+    @classmethod
+    def from_data(cls, data: dict, *args, **kwargs) -> "CmdbSearchEntry":
+        """
+        Returns an Instance of CmdbSearchEntry
+
+        Args:
+            data (dict): Dict which contains parameters to initiate a CmdbSearchEntry
+
+        Returns:
+            (CmdbSearchEntry): Instance of CmdbSearchEntry with data from dict
+        """
+        return cls(
+            public_id = data.get('public_id'),
+            type_id = data.get('type_id'),
+            active = data.get('active', True),
+            tokens = data.get('tokens', []),
+            values = data.get('values', []),
+            references = data.get('references', []),
+            indexed_time = data.get('indexed_time'),
+        )
+
+
+    @classmethod
+    def to_json(cls, instance: "CmdbSearchEntry") -> dict:
+        """
+        Convert a CmdbSearchEntry instance to json conform data
+
+        Args:
+            instance (CmdbSearchEntry): Instance of CmdbSearchEntry
+
+        Returns:
+            (dict): Json conform dict
+        """
+        return {
+            'public_id': instance.get_public_id(),
+            'type_id': instance.type_id,
+            'active': instance.active,
+            'tokens': instance.tokens,
+            'values': instance.values,
+            'references': instance.references,
+            'indexed_time': instance.indexed_time,
+        }
+
+
+    @classmethod
+    def to_data(cls, instance: "CmdbSearchEntry") -> dict:
+        """
+        Dict representation of a CmdbSearchEntry
+        """
+        return {
+            'public_id': instance.get_public_id(),
+            'type_id': instance.type_id,
+            'active': instance.active,
+            'tokens': instance.tokens,
+            'values': instance.values,
+            'references': instance.references,
+            'indexed_time': instance.indexed_time,
+        }
+
+
+    @classmethod
+    def to_dict(cls, instance: "CmdbSearchEntry") -> dict:
+        """
+        Dict representation of a CmdbSearchEntry
+        """
+        return cls.to_data(instance)
+
+
+    @classmethod
+    def tokenize(cls, values: list[str]) -> list[str]:
+        """
+        Splits values into distinct lowercase words
+
+        Args:
+            values (list[str]): Texts which should be split
+
+        Returns:
+            list[str]: Words in order of their first occurrence
+        """
+        tokens = {}
+
+        for value in values:
+            for token in cls.TOKEN_PATTERN.findall(value.lower()):
+                tokens[token[:cls.MAX_TOKEN_LENGTH]] = None
+
+        return list(tokens)
+
+
+    @classmethod
+    def build_token_query(cls, search_text: str) -> dict:
+        """
+        Builds the filter for entries which contain a word starting with each word of the search text
+
+        The regexes are anchored and case sensitive on the lowercase tokens, so MongoDB reads
+        them as key ranges of the `tokens` index.
+
+        Args:
+            search_text (str): Text of the search
+
+        Returns:
+            dict: The filter, empty if the text contains no word
+        """
+        search_tokens = cls.tokenize([search_text or ''])
+
+        if not search_tokens:
+            return {}
+
+        return {'$and': [{'tokens': {'$regex': f'^{re.escape(token)}'}} for token in search_tokens]}
+
+
+    @staticmethod
+    def get_string_values(fields: list[dict]) -> list[str]:
+        """Returns the string values of fields, strings inside of list values included"""
+        values = []
+
+        for field in fields:
+            value = field.get('value')
+
+            if isinstance(value, str):
+                if value:
+                    values.append(value)
+            elif isinstance(value, list):
+                values.extend(item for item in value if isinstance(item, str) and item)
+
+        return values
+
+
+    @staticmethod
+    def get_reference_ids(value) -> list[int]:
+        """Returns the public_ids of a reference field value"""
+        if isinstance(value, bool):
+            return []
+
+        if isinstance(value, int):
+            return [value]
+
+        if isinstance(value, list):
+            return [item for item in value if isinstance(item, int) and not isinstance(item, bool)]
+
+        return []
@@ -14,6 +14,11 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 """Class for public_id handling in database"""
+import logging
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
 
 class PublicIDCounter:
     """
@@ -26,3 +31,78 @@ class PublicIDCounter:
     def __init__(self, _id: str, counter: int):
         self._id = _id
         self.counter = counter
+
+
+class PublicIDBlock:
+    """
+    Block of reserved public_ids of a collection for bulk inserts
+
+    The block reserves `block_size` public_ids with a single counter update and hands them out locally,
+    a new block is only reserved when all ids are used. Ids which were not used are given back by
+    `release()` if no other worker reserved ids in the meantime, otherwise they remain as gaps.
+
+    Examples:
+        with PublicIDBlock(dbm, CmdbObject.COLLECTION, len(objects)) as public_ids:
+            for obj in objects:
+                obj['public_id'] = public_ids.next_id()
+    """
+
+    def __init__(self, database_manager, collection: str, block_size: int = 100):
+        """
+        Args:
+            database_manager: Database connection which provides `reserve_public_ids`
+            collection (str): name of database collection
+            block_size (int): number of public_ids which are reserved at once
+        """
+        self.database_manager = database_manager
+        self.collection = collection
+        self.block_size = max(block_size, 1)
+        self.__reserved: range = range(0)
+        self.__position: int = 0
+
+
+    def __enter__(self) -> "PublicIDBlock":
+        return self
+
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+
+    def next_id(self) -> int:
+        """
+        Retrieves the next public_id of the block, reserves a new block if all ids are used
+
+        Returns:
+            int: The next public_id
+        """
+        if self.__position >= len(self.__reserved):
+            self.__reserved = self.database_manager.reserve_public_ids(self.collection, self.block_size)
+            self.__position = 0
+
+        public_id = self.__reserved[self.__position]
+        self.__position += 1
+
+        return public_id
+
+
+    def release(self):
+        """Gives the unused public_ids of the block back to the counter"""
+        unused = len(self.__reserved) - self.__position
+
+        if unused <= 0:
+            return
+
+        last_reserved = self.__reserved[-1]
+
+        try:
+            self.database_manager.get_collection(PublicIDCounter.COLLECTION).update_one(
+                                                                    {'_id': self.collection, 'counter': last_reserved},
+                                                                    {'$inc': {'counter': -unused}}
+                                                                )
+        except Exception as err:
+            #TODO: ERROR-FIX
+            LOGGER.debug("[PublicIDBlock] Unused public_ids could not be released: %s", err)
+
+        self.__reserved = range(0)
+        self.__position = 0
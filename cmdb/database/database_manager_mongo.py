@@ -17,7 +17,9 @@
 Database Management instance for database actions
 """
 import logging
-from pymongo.results import DeleteResult, UpdateResult
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from pymongo.results import BulkWriteResult, DeleteResult, UpdateResult
 
 from cmdb.database.database_manager import DatabaseManager
 
@@ -93,20 +95,51 @@ def insert(self, collection: str, data: dict, skip_public: bool = False) -> int:
 
         if 'public_id' not in data:
             data['public_id'] = self.get_next_public_id(collection)
-
-        self.get_collection(collection).insert_one(data)
-        self.update_public_id_counter(collection, data['public_id'])
+            self.get_collection(collection).insert_one(data)
+        else:
+            self.get_collection(collection).insert_one(data)
+            self.update_public_id_counter(collection, data['public_id'])
 
         return data['public_id']
 
 
+    def bulk_write(self, collection: str, requests: list, ordered: bool = True) -> BulkWriteResult:
+        """
+        Sends multiple write operations to a collection in a single request
+
+        Args:
+            collection (str): name of database collection
+            requests (list): write operations like `InsertOne` or `ReplaceOne`
+            ordered (bool): Stop at the first failed operation, otherwise all operations are attempted
+
+        Raises:
+            BulkWriteError: If at least one operation failed, the details contain the index of every failed operation
+
+        Returns:
+            BulkWriteResult: Result of the bulk write
+        """
+        return self.get_collection(collection).bulk_write(requests, ordered=ordered)
+
+
     def _init_public_id_counter(self, collection: str):
-        """TODO:document"""
+        """
+        Creates the public_id counter of a collection starting at the highest existing public_id
+
+        Args:
+            collection (str): name of database collection
+
+        Returns:
+            int: highest public_id of the collection
+        """
         docs_count = self.get_highest_id(collection)
-        self.get_collection(PublicIDCounter.COLLECTION).insert_one({
-            '_id': collection,
-            'counter': docs_count
-        })
+
+        try:
+            self.get_collection(PublicIDCounter.COLLECTION).update_one({'_id': collection},
+                                                                       {'$max': {'counter': docs_count}},
+                                                                       upsert=True)
+        except DuplicateKeyError:
+            # The counter was created by a parallel worker in the meantime
+            pass
 
         return docs_count
 
@@ -169,40 +202,33 @@ def update_many(self, collection: str, query: dict, update: dict, add_to_set:boo
 
 
     def increment_public_id_counter(self, collection: str):
-        """TODO: document"""
-        working_collection = self.get_collection(PublicIDCounter.COLLECTION)
-        query = {
-            '_id': collection
-        }
-        counter_doc = working_collection.find_one(query)
-        counter_doc['counter'] = counter_doc['counter'] + 1
+        """
+        Increases the public_id counter of a collection by one
 
+        Args:
+            collection (str): name of database collection
+        """
         try:
-            self.get_collection(PublicIDCounter.COLLECTION).update_one(
-                                                                query, {'$set':{'counter':counter_doc['counter']}}
-                                                            )
+            self.get_collection(PublicIDCounter.COLLECTION).update_one({'_id': collection}, {'$inc': {'counter': 1}})
         except Exception as error:
             LOGGER.info('Public ID Counter not increased: reason => %s',error)
 
 
     def update_public_id_counter(self, collection: str, value: int):
-        """TODO: document"""
-        working_collection = self.get_collection(PublicIDCounter.COLLECTION)
-        query = {
-            '_id': collection
-        }
-        counter_doc = working_collection.find_one(query)
+        """
+        Raises the public_id counter of a collection to the given value if it is lower
+
+        Args:
+            collection (str): name of database collection
+            value (int): public_id which was used
+        """
+        result = self.get_collection(PublicIDCounter.COLLECTION).update_one({'_id': collection},
+                                                                            {'$max': {'counter': value}})
         # init counter, if it was not found
-        if counter_doc is None:
+        if result.matched_count == 0:
             self._init_public_id_counter(collection)
-            counter_doc = working_collection.find_one(query)
-        # update counter only, if value is higher than counter
-        if value > counter_doc['counter']:
-            counter_doc['counter'] = value
-
-            formatted_data = {'$set':counter_doc}
-
-            self.get_collection(PublicIDCounter.COLLECTION).update_one(query, formatted_data)
+            self.get_collection(PublicIDCounter.COLLECTION).update_one({'_id': collection},
+                                                                       {'$max': {'counter': value}})
 
 # ---------------------------------------------------- CRUD - READ --------------------------------------------------- #
 
@@ -329,17 +355,40 @@ def get_highest_id(self, collection: str) -> int:
 
 
     def get_next_public_id(self, collection: str) -> int:
-        """TODO: document"""
-        try:
-            found_counter = self.get_collection(PublicIDCounter.COLLECTION).find_one(filter={'_id': collection})
-            new_id = found_counter['counter'] + 1
-        except (NoDocumentFound, Exception):
-            docs_count = self._init_public_id_counter(collection)
-            new_id = docs_count + 1
-        finally:
-            self.increment_public_id_counter(collection)
+        """
+        Retrieves the next public_id of a collection, the counter is increased in the same operation
+
+        Args:
+            collection (str): name of database collection
+
+        Returns:
+            int: The reserved public_id
+        """
+        return self.reserve_public_ids(collection, 1)[0]
+
+
+    def reserve_public_ids(self, collection: str, amount: int) -> range:
+        """
+        Reserves a block of consecutive public_ids of a collection with a single atomic counter update
+
+        Args:
+            collection (str): name of database collection
+            amount (int): number of public_ids which should be reserved
+
+        Returns:
+            range: The reserved public_ids
+        """
+        counter_doc = self.get_collection(PublicIDCounter.COLLECTION).find_one_and_update(
+                                                                            {'_id': collection},
+                                                                            {'$inc': {'counter': amount}},
+                                                                            return_document=ReturnDocument.AFTER
+                                                                        )
+        if counter_doc is None:
+            self._init_public_id_counter(collection)
+
+            return self.reserve_public_ids(collection, amount)
 
-        return new_id
+        return range(counter_doc['counter'] - amount + 1, counter_doc['counter'] + 1)
 
 # --------------------------------------------------- CRUD - DELETE -------------------------------------------------- #
 
@@ -406,7 +455,8 @@ def get_root_location_data(self) -> dict:
             "type_id":0,
             "type_label":"Root",
             "type_icon":"fas fa-globe",
-            "type_selectable":True
+            "type_selectable":True,
+            "ancestors":[]
         }
 
 
@@ -0,0 +1,253 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2024 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Reconciles the indexes declared by the models (`INDEX_KEYS` and `SUPER_INDEX_KEYS`) with the database
+
+An index counts as existing if an index with the same key specification exists, regardless of its name.
+Missing indexes are built in a background thread, MongoDB builds them without blocking reads and writes.
+"""
+import logging
+import threading
+from pymongo import IndexModel
+from pymongo.errors import OperationFailure, PyMongoError
+
+from cmdb.database.database_manager import DatabaseManager
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                                 IndexManager - CLASS                                                 #
+# -------------------------------------------------------------------------------------------------------------------- #
+class IndexManager:
+    """Compares, builds and reports the declared indexes of the CMDB collections"""
+
+    def __init__(self, dbm: DatabaseManager, collections: list = None):
+        """
+        Args:
+            dbm (DatabaseManager): Database connection
+            collections (list, optional): Model classes with a `COLLECTION` and `get_index_keys()`,
+                                          all framework, user management and exportd models if not set
+        """
+        self.dbm = dbm
+        self.collections = collections if collections is not None else self.__get_default_collections()
+
+
+    def get_declared_indexes(self) -> dict[str, list[IndexModel]]:
+        """
+        Retrieves the declared indexes of every collection
+
+        Returns:
+            dict[str, list[IndexModel]]: Declared indexes by collection name
+        """
+        declared_indexes: dict[str, list[IndexModel]] = {}
+
+        for collection in self.collections:
+            collection_indexes = declared_indexes.setdefault(collection.COLLECTION, [])
+            known_keys = [self.__get_key(index.document['key']) for index in collection_indexes]
+
+            for index in collection.get_index_keys():
+                if self.__get_key(index.document['key']) not in known_keys:
+                    collection_indexes.append(index)
+                    known_keys.append(self.__get_key(index.document['key']))
+
+        return declared_indexes
+
+
+    def get_existing_indexes(self, collection: str) -> list[dict]:
+        """
+        Retrieves the indexes of a collection
+
+        Args:
+            collection (str): Name of the collection
+
+        Returns:
+            list[dict]: Index documents of the collection, empty if the collection does not exist
+        """
+        return list(self.dbm.get_collection(collection).list_indexes())
+
+
+    def get_missing_indexes(self, collection: str, declared_indexes: list[IndexModel]) -> list[IndexModel]:
+        """
+        Filters the declared indexes which do not exist in the collection
+
+        Args:
+            collection (str): Name of the collection
+            declared_indexes (list[IndexModel]): Declared indexes of the collection
+
+        Returns:
+            list[IndexModel]: Indexes which have to be built
+        """
+        existing_keys = [self.__get_key(index['key']) for index in self.get_existing_indexes(collection)]
+
+        return [index for index in declared_indexes if self.__get_key(index.document['key']) not in existing_keys]
+
+
+    def get_index_stats(self, collection: str) -> dict[str, dict]:
+        """
+        Retrieves the usage statistics of the indexes of a collection with `$indexStats`
+
+        Args:
+            collection (str): Name of the collection
+
+        Returns:
+            dict[str, dict]: Accesses (`ops` and `since`) by index name, empty if the stats are not available
+        """
+        try:
+            return {stats['name']: stats.get('accesses', {})
+                    for stats in self.dbm.get_collection(collection).aggregate([{'$indexStats': {}}])}
+        except PyMongoError as err:
+            LOGGER.debug("[IndexManager] Index stats of %s are not available: %s", collection, err)
+            return {}
+
+# ----------------------------------------------------- RECONCILE ---------------------------------------------------- #
+
+    def reconcile(self) -> dict[str, list[str]]:
+        """
+        Builds the missing declared indexes of all existing collections
+
+        Returns:
+            dict[str, list[str]]: Names of the built indexes by collection name
+        """
+        created_indexes: dict[str, list[str]] = {}
+        existing_collections = self.dbm.connector.database.list_collection_names()
+
+        for collection, declared_indexes in self.get_declared_indexes().items():
+            if collection not in existing_collections:
+                continue
+
+            # indexes are built one by one, so that a failing index (e.g. a violated unique key) skips only itself
+            for index in self.get_missing_indexes(collection, declared_indexes):
+                try:
+                    LOGGER.info("INDEXES: Building missing index %s of %s", index.document['name'], collection)
+                    created_indexes.setdefault(collection, []).extend(self.dbm.create_indexes(collection, [index]))
+                except OperationFailure as err:
+                    #TODO: ERROR-FIX
+                    LOGGER.warning("INDEXES: Index %s of %s could not be built: %s",
+                                   index.document['name'], collection, err)
+
+        return created_indexes
+
+
+    def reconcile_in_background(self) -> threading.Thread:
+        """
+        Builds the missing declared indexes in a daemon thread, so that the startup does not wait for the builds
+
+        Returns:
+            threading.Thread: The started thread
+        """
+        def run_reconcile():
+            try:
+                created_indexes = self.reconcile()
+                LOGGER.info("INDEXES: Reconciliation finished, built indexes: %s", created_indexes or 'none')
+            except PyMongoError as err:
+                LOGGER.error("INDEXES: Reconciliation failed: %s", err)
+
+        reconcile_thread = threading.Thread(target=run_reconcile, name='IndexReconcile', daemon=True)
+        reconcile_thread.start()
+
+        return reconcile_thread
+
+# ------------------------------------------------------ REPORT ------------------------------------------------------ #
+
+    def get_report(self) -> list[dict]:
+        """
+        Generates a report of the existing, missing and undeclared indexes with their usage
+
+        Returns:
+            list[dict]: Report entry for every declared collection
+        """
+        report = []
+        existing_collections = self.dbm.connector.database.list_collection_names()
+
+        for collection, declared_indexes in self.get_declared_indexes().items():
+            declared_keys = [self.__get_key(index.document['key']) for index in declared_indexes]
+            existing_indexes = self.get_existing_indexes(collection) if collection in existing_collections else []
+            existing_keys = [self.__get_key(index['key']) for index in existing_indexes]
+            index_stats = self.get_index_stats(collection) if existing_indexes else {}
+
+            report.append({
+                'collection': collection,
+                'exists': collection in existing_collections,
+                'indexes': [{
+                    'name': index['name'],
+                    'key': self.__get_key(index['key']),
+                    'declared': self.__get_key(index['key']) in declared_keys or index['name'] == '_id_',
+                    'ops': index_stats.get(index['name'], {}).get('ops'),
+                    'since': index_stats.get(index['name'], {}).get('since'),
+                } for index in existing_indexes],
+                'missing': [{
+                    'name': index.document['name'],
+                    'key': self.__get_key(index.document['key'])
+                } for index in declared_indexes if self.__get_key(index.document['key']) not in existing_keys]
+            })
+
+        return report
+
+
+    @staticmethod
+    def format_report(report: list[dict]) -> str:
+        """
+        Formats a report of `get_report()` as text
+
+        Args:
+            report (list[dict]): The generated report
+
+        Returns:
+            str: One block per collection
+        """
+        lines = []
+
+        for entry in report:
+            state = '' if entry['exists'] else ' (collection does not exist)'
+            lines.append(f"{entry['collection']}{state}")
+
+            for index in entry['indexes']:
+                status = 'OK' if index['declared'] else 'UNDECLARED'
+                ops = 'n/a' if index['ops'] is None else index['ops']
+                since = '' if index['since'] is None else f" since {index['since']:%Y-%m-%d %H:%M}"
+                lines.append(f"    {status:<11}{index['name']:<28}{IndexManager.__format_key(index['key']):<48}"
+                             f"ops: {ops}{since}")
+
+            for index in entry['missing']:
+                lines.append(f"    {'MISSING':<11}{index['name']:<28}{IndexManager.__format_key(index['key'])}")
+
+            lines.append('')
+
+        return '\n'.join(lines)
+
+# ------------------------------------------------- HELPER - SECTION ------------------------------------------------- #
+
+    @staticmethod
+    def __get_key(key) -> tuple:
+        """Returns the key specification of an index as comparable tuple"""
+        return tuple((field, int(direction) if isinstance(direction, float) else direction)
+                     for field, direction in key.items())
+
+
+    @staticmethod
+    def __format_key(key: tuple) -> str:
+        return ', '.join(f'{field}: {direction}' for field, direction in key)
+
+
+    @staticmethod
+    def __get_default_collections() -> list:
+        """Model classes of all collections with declared indexes"""
+        from cmdb.framework import __COLLECTIONS__ as FRAMEWORK_CLASSES
+        from cmdb.user_management import __COLLECTIONS__ as USER_MANAGEMENT_COLLECTION
+        from cmdb.exportd import __COLLECTIONS__ as JOB_MANAGEMENT_COLLECTION
+
+        return [*FRAMEWORK_CLASSES, *USER_MANAGEMENT_COLLECTION, *JOB_MANAGEMENT_COLLECTION]
@@ -15,11 +15,12 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 """TODO: document"""
 
-from cmdb.exportd.exportd_job.exportd_job import ExportdJob
+from cmdb.exportd.exportd_job.exportd_job import ExportdJob, ExportdExportedObject
 from cmdb.exportd.exportd_logs.exportd_log import ExportdMetaLog
 # -------------------------------------------------------------------------------------------------------------------- #
 
 __COLLECTIONS__ = [
     ExportdJob,
+    ExportdExportedObject,
     ExportdMetaLog
     ]
@@ -46,6 +46,7 @@ class ExportdJob(JobManagementBase):
     Exportd Job
     """
     COLLECTION: Collection = 'exportd.jobs'
+    WATERMARK_COLLECTION: Collection = 'exportd.watermarks'
     MODEL: Model = 'ExportDJob'
 
     INDEX_KEYS = [
@@ -54,7 +55,7 @@ class ExportdJob(JobManagementBase):
 
     def __init__(self, name, label=None, description=None, active=None, author_id=None,
                  last_execute_date=None, sources=None, destination=None,
-                 variables=None, scheduling=None, exportd_type=None, state=None, **kwargs):
+                 variables=None, scheduling=None, exportd_type=None, state=None, delta=None, **kwargs):
         """
         Args:
             name: name of this job
@@ -62,6 +63,7 @@ def __init__(self, name, label=None, description=None, active=None, author_id=No
             sources: consists of multiple objects of a specific object type and a specific status
             destination: is an external system, where you want to push the yourcmdb objects
             variables: has a name and gets its value out of fields of the objects
+            delta: only transfer the objects changed since the last successful run
             **kwargs: optional params
         """
         self.name = name
@@ -76,6 +78,7 @@ def __init__(self, name, label=None, description=None, active=None, author_id=No
         self.scheduling = scheduling
         self.state = state or 0
         self.exportd_type = exportd_type or ExportdJobType.PUSH.name
+        self.delta = delta or False
         super().__init__(**kwargs)
 
 
@@ -96,6 +99,7 @@ def from_data(cls, data: dict) -> "ExportdJob":
             scheduling=data.get('scheduling', None),
             state=data.get('state', None),
             exportd_type=data.get('exportd_type', None),
+            delta=data.get('delta', None),
         )
 
 
@@ -116,6 +120,7 @@ def to_json(cls, instance: "ExportdJob") -> dict:
             'scheduling': instance.scheduling,
             'state': instance.state,
             'exportd_type': instance.exportd_type,
+            'delta': instance.delta,
         }
 
 
@@ -206,3 +211,27 @@ def get_variables(self):
     def get_author_id(self):
         """TODO: document"""
         return self.author_id
+
+
+class ExportdExportedObject(JobManagementBase):
+    """
+    Object which a delta job transferred to its destinations, stored as one document per job and object
+    """
+    COLLECTION: Collection = 'exportd.exported_objects'
+    MODEL: Model = 'ExportdExportedObject'
+
+    SUPER_INDEX_KEYS = []
+    INDEX_KEYS = [
+        {'keys': [('job_id', CmdbDAO.DAO_ASCENDING), ('public_id', CmdbDAO.DAO_ASCENDING)],
+         'name': 'job_id_public_id',
+         'unique': True}
+    ]
+
+    def __init__(self, job_id: int, public_id: int):
+        """
+        Args:
+            job_id: public_id of the delta job
+            public_id: public_id of the transferred object
+        """
+        self.job_id = job_id
+        super().__init__(public_id=public_id)
@@ -15,6 +15,7 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 """TODO: document"""
 import logging
+from datetime import datetime, timezone
 
 from cmdb.manager.exportd_job_manager import ExportdJobManager
 from cmdb.manager.exportd_log_manager import ExportdLogManager
@@ -26,9 +27,10 @@
 from cmdb.utils.helpers import load_class
 from cmdb.manager.exportd_log_manager import LogAction, ExportdJobLog
 from cmdb.framework.cmdb_render import RenderList
-from cmdb.templates.template_data import ObjectTemplateData
+from cmdb.templates.template_data import ObjectTemplateDataBuilder
 from cmdb.templates.template_engine import TemplateEngine
 from cmdb.framework.cmdb_render import RenderResult
+from cmdb.framework.models.type import TypeModel
 
 from cmdb.errors.manager.exportd_log_manager import ExportdLogManagerInsertError
 from cmdb.errors.manager.exportd_job_manager import ExportJobConfigError
@@ -48,11 +50,11 @@ def __init__(self, job: ExportdJob,
                  objects_manager: ObjectsManager):
         self.job = job
         self.event = event
+        self.objects_manager = objects_manager
         self.variables = self.__get_exportvars()
         self.destinations = self.__get__destinations()
         self.log_manager = log_manager
         self.sources = self.__get_sources()
-        self.objects_manager = objects_manager
 
         super().__init__(objects_manager.dbm)
 
@@ -94,23 +96,63 @@ def __get__destinations(self):
 
 
     def execute(self, user_id: int, user_name: str, log_flag: bool = True) -> ExportdHeader:
-        """TODO. document"""
+        """
+        Exports the objects of the sources to every destination
+
+        Delta jobs transfer only the objects changed since their last successful run, including the objects whose
+        referenced objects changed, and remove the objects which left the sources, as long as all destinations
+        support it. Otherwise all objects are transferred.
+        """
+        run_date = datetime.now(timezone.utc)
+        exportd_header = ExportdHeader()
+        template_data_builder = ObjectTemplateDataBuilder(self.objects_manager)
+        watermark = self.get_watermark(self.job.get_public_id()) if self.job.delta else None
+        exported_ids = self.get_exported_ids(self.job.get_public_id()) if self.job.delta else set()
+        # objects of edited types are transferred completely, the type data is part of every object
+        delta_run = watermark is not None and not self.__has_changed_source_types(watermark['date']) \
+                    and all(destination.get_external_system().supports_delta() for destination in self.destinations)
+
         # get cmdb objects from all sources
         cmdb_objects = set()
-        exportd_header = ExportdHeader()
+        deleted_ids = set()
+
+        if delta_run:
+            current_ids = set()
+
+            for source in self.sources:
+                current_ids.update(source.get_public_ids())
+
+            # objects which were not exported yet are transferred as well, e.g. after a changed type ACL,
+            # and objects whose template data changed with one of their referenced objects
+            referencing_ids = self.__get_referencing_changed_ids(watermark['date'], template_data_builder.depth)
+            resent_ids = (current_ids - exported_ids) | (current_ids & referencing_ids)
 
-        for source in self.sources:
-            cmdb_objects.update(source.get_objects())
+            for source in self.sources:
+                cmdb_objects.update(source.get_changed_objects(watermark['date'], sorted(resent_ids)))
+
+            deleted_ids = exported_ids - current_ids
+        else:
+            for source in self.sources:
+                cmdb_objects.update(source.get_objects())
+
+            current_ids = {cmdb_object.object_information['object_id'] for cmdb_object in cmdb_objects}
+
+        # setup objectdata for use in ExportVariable templates, shared by all destinations
+        cmdb_objects = list(cmdb_objects)
+        template_data_list = template_data_builder.build(cmdb_objects)
 
         # for every destination: do export
         for destination in self.destinations:
             external_system = destination.get_external_system()
+            external_system.delta = delta_run
             external_system.prepare_export()
 
-            for cmdb_object in cmdb_objects:
-                # setup objectdata for use in ExportVariable templates
-                template_data = ObjectTemplateData(cmdb_object, self.objects_manager).get_template_data()
+            for cmdb_object, template_data in zip(cmdb_objects, template_data_list):
                 external_system.add_object(cmdb_object, template_data)
+
+            for object_id in sorted(deleted_ids):
+                external_system.delete_object(object_id)
+
             exportd_header = external_system.finish_export()
 
             if log_flag:
@@ -128,9 +170,61 @@ def execute(self, user_id: int, user_name: str, log_flag: bool = True) -> Export
                     #TODO: ERROR-FIX
                     LOGGER.error(err)
 
+        # the watermark only moves after all destinations received the changes
+        if self.job.delta:
+            self.set_watermark(self.job.get_public_id(),
+                               run_date,
+                               added_ids=current_ids - exported_ids,
+                               removed_ids=exported_ids - current_ids)
+
         return exportd_header
 
 
+    def __has_changed_source_types(self, changed_since: datetime) -> bool:
+        """
+        Checks if a type of the sources was edited after a point in time
+
+        Args:
+            changed_since (datetime): Start of the last successful run
+
+        Returns:
+            bool: True if the objects of the sources have to be transferred completely
+        """
+        type_ids = [source['type_id'] for source in self.job.get_sources()]
+
+        return self.objects_manager.dbm.get_collection(TypeModel.COLLECTION).count_documents(
+                                            {'public_id': {'$in': type_ids}, 'last_edit_time': {'$gt': changed_since}}
+                                        ) > 0
+
+
+    def __get_referencing_changed_ids(self, changed_since: datetime, depth: int) -> set[int]:
+        """
+        Retrieves the objects which reference an object created or edited after a point in time
+
+        The references are followed from the changed objects as many levels as the template data expands them.
+
+        Args:
+            changed_since (datetime): Start of the last successful run
+            depth (int): Number of reference levels of the template data
+
+        Returns:
+            set[int]: public_ids of the referencing objects
+        """
+        changed = [{'creation_time': {'$gt': changed_since}}, {'last_edit_time': {'$gt': changed_since}}]
+        level = {obj['public_id'] for obj in self.objects_manager.get(filter={'$or': changed},
+                                                                      projection={'_id': 0, 'public_id': 1})}
+        referencing_ids = set()
+
+        for _ in range(depth):
+            if not level:
+                break
+
+            level = set(self.objects_manager.object_refs.get_referencing_ids(level)) - referencing_ids
+            referencing_ids.update(level)
+
+        return referencing_ids
+
+
 class ExportVariable:
     """TODO: document"""
     def __init__(self, name, value_tpl_default, value_tpl_types: dict = None):
@@ -170,58 +264,111 @@ def __init__(self,
                  objects_manager: ObjectsManager):
         self.__job = job
         self.event = event
-        self.__objects = self.__fetch_objects()
         self.objects_manager = objects_manager
 
 
     def get_objects(self):
         """TODO: document"""
-        return self.__objects
-
-
-    def __fetch_objects(self):
-        """TODO: document"""
-        query = []
         result = []
-        condition = []
-        subset: bool = self.__job.scheduling['event'].get('subset', False)
+        # delta jobs need all objects to know which ones are at the destinations
+        subset: bool = self.__job.scheduling['event'].get('subset', False) and not self.__job.delta
 
         if subset and self.event.get_param('event') in ['delete']:
-            deleted = RenderResult()
-            deleted.object_information['object_id'] = self.event.get_param('id')
-            deleted.type_information['type_id'] = self.event.get_param('type_id')
-            result.append(deleted)
+            for object_id in self.get_event_ids():
+                deleted = RenderResult()
+                deleted.object_information['object_id'] = object_id
+                deleted.type_information['type_id'] = self.event.get_param('type_id')
+                result.append(deleted)
 
         else:
+            condition = []
+
             if subset and self.event.get_param('event') in ['insert', 'update']:
-                condition.append({'public_id': self.event.get_param('id')})
+                condition.append({'public_id': {'$in': self.get_event_ids()}})
 
-            for source in self.__job.get_sources():
-                temp = []
-                for con in source["condition"]:
-                    operator = con["operator"]
-                    value = con["value"]
+            result = self.__render_objects({'$or': self.__build_query(condition)})
 
-                    regex = {"$ne": con["value"]} if operator == "!=" else {"$regex": value, "$options": "si"}
-                    regex = True if value in ['True', 'true'] else False if value in ['False', 'false'] else regex
+        return result
 
-                    temp.append({'fields': {"$elemMatch": {"name": con["name"], "value": regex}}})
-                    temp.append({'type_id': source["type_id"]})
-                    temp.append({'active': {'$eq': True}})
-                    query.append({"$and": [*condition, *temp]})
 
-                if not source["condition"]:
-                    query.append({'type_id': source["type_id"], 'active': {'$eq': True}})
+    def get_event_ids(self) -> list[int]:
+        """
+        Retrieves the objects of the event, aggregated events of many objects contain them as `ids`
 
-            current_objects = self.objects_manager.get_objects_by(sort="public_id", **{'$or': query})
+        Returns:
+            list[int]: public_ids of the objects of the event
+        """
+        if self.event.get_param('id') is not None:
+            return [int(self.event.get_param('id'))]
 
-            result = (
-                        RenderList(current_objects,
-                                   None,
-                                   objects_manager=self.objects_manager).render_result_list()
-                     )
+        return [int(public_id) for public_id in self.event.get_param('ids') or []]
 
-        return result
+
+    def get_public_ids(self) -> set[int]:
+        """
+        Retrieves the public_ids of all objects of the sources without loading the objects
+
+        Returns:
+            set[int]: public_ids of the objects
+        """
+        return {obj['public_id'] for obj in self.objects_manager.get(filter={'$or': self.__build_query()},
+                                                                     projection={'_id': 0, 'public_id': 1})}
+
+
+    def get_changed_objects(self, changed_since: datetime, public_ids: list[int] = None) -> list[RenderResult]:
+        """
+        Retrieves the objects of the sources which were created or edited after a point in time
+
+        Args:
+            changed_since (datetime): Start of the last successful run
+            public_ids (list[int], optional): Objects which are retrieved regardless of their changes
+
+        Returns:
+            list[RenderResult]: The rendered objects
+        """
+        changed = [{'creation_time': {'$gt': changed_since}}, {'last_edit_time': {'$gt': changed_since}}]
+
+        if public_ids:
+            changed.append({'public_id': {'$in': public_ids}})
+
+        return self.__render_objects({'$and': [{'$or': self.__build_query()}, {'$or': changed}]})
+
+
+    def __build_query(self, condition: list = None) -> list[dict]:
+        """Builds the filters of the sources, the objects match if one of the filters matches"""
+        query = []
+        condition = condition or []
+
+        for source in self.__job.get_sources():
+            temp = []
+            for con in source["condition"]:
+                operator = con["operator"]
+                value = con["value"]
+
+                regex = {"$ne": con["value"]} if operator == "!=" else {"$regex": value, "$options": "si"}
+                regex = True if value in ['True', 'true'] else False if value in ['False', 'false'] else regex
+
+                temp.append({'fields': {"$elemMatch": {"name": con["name"], "value": regex}}})
+                temp.append({'type_id': source["type_id"]})
+                temp.append({'active': {'$eq': True}})
+                query.append({"$and": [*condition, *temp]})
+
+            if not source["condition"]:
+                query.append({"$and": [*condition, {'type_id': source["type_id"]}, {'active': {'$eq': True}}]})
+
+        return query
+
+
+    def __render_objects(self, requirements: dict) -> list[RenderResult]:
+        """Renders the objects which match the requirements"""
+        current_objects = self.objects_manager.get_objects_by(sort="public_id", **requirements)
+
+        return (
+                    RenderList(current_objects,
+                               None,
+                               objects_manager=self.objects_manager,
+                               batch=True).render_result_list()
+               )
 
 
 class ExportDestination:
@@ -257,6 +404,21 @@ def __init__(self, destination_parms, export_vars, event: Event = None):
         self._destination_parms = destination_parms
         self._export_vars = export_vars
         self.msg_string = ""
+        # set by the exporter: the run only transfers the changes since the last successful run
+        self.delta = False
+
+
+    def supports_delta(self) -> bool:
+        """
+        Checks if the destination can apply the changes of a delta run
+
+        In delta runs `add_object` is called for created and changed objects only and has to update
+        them at the destination, `delete_object` is called for the objects which left the sources.
+
+        Returns:
+            bool: False, destinations which support delta runs override it
+        """
+        return False
 
 
     def prepare_export(self):
@@ -267,6 +429,15 @@ def add_object(self, cmdb_object, template_data):
         """TODO: document"""
 
 
+    def delete_object(self, object_id: int):
+        """
+        Removes an object from the destination, only called in delta runs
+
+        Args:
+            object_id (int): public_id of the object which was deleted or left the sources
+        """
+
+
     def finish_export(self) -> ExportdHeader:
         """TODO: document"""
 
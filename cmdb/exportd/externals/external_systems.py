@@ -743,6 +743,12 @@ class ExternalSystemCsv(ExternalSystem):
             "required": False,
             "description": "CSV enclosure. Default: '“'",
             "default": '”'
+        },
+        {
+            "name": "csv_id_column",
+            "required": False,
+            "description": "name of a column with the object ID. Required to update the file in delta jobs",
+            "default": ""
         }
     ]
 
@@ -756,8 +762,15 @@ def __init__(self, destination_parms, export_vars, event=None):
         self.filename = self._destination_parms.get("csv_filename")
         self.delimiter = self._destination_parms.get("csv_delimiter")
         self.enclosure = self._destination_parms.get("csv_enclosure")
-        self.header = []
+        self.id_column = self._destination_parms.get("csv_id_column")
+        self.header = [self.id_column] if self.id_column else []
         self.rows = []
+        self.deleted_ids = []
+
+
+    def supports_delta(self) -> bool:
+        # rows of changed and deleted objects are found by their ID column
+        return bool(self.id_column)
 
 
     def prepare_export(self):
@@ -766,6 +779,8 @@ def prepare_export(self):
 
     def add_object(self, cmdb_object, template_data):
         row = {}
+        if self.id_column:
+            row[self.id_column] = str(cmdb_object.object_information['object_id'])
         for key in self.__variables:
             if key not in self.header:
                 self.header.append(key)
@@ -775,18 +790,54 @@ def add_object(self, cmdb_object, template_data):
         self.rows.append(row)
 
 
+    def delete_object(self, object_id: int):
+        self.deleted_ids.append(str(object_id))
+
+
     def finish_export(self):
         import csv
+        header = self.header
+        rows = self.rows
+
+        if self.delta:
+            header, rows = self.__merge_rows()
+
         with open(self.filename, 'w', encoding='utf-8', newline='') as csv_file:
             writer = csv.DictWriter(csv_file,
-                                    fieldnames=self.header,
+                                    fieldnames=header,
                                     delimiter=self.delimiter,
                                     quotechar=self.enclosure)
             writer.writeheader()
-            for row in self.rows:
+            for row in rows:
                 writer.writerow(row)
 
 
+    def __merge_rows(self):
+        """Applies the changed and deleted objects to the rows of the existing file"""
+        import csv
+        header = []
+        rows = {}
+
+        if os.path.isfile(self.filename):
+            with open(self.filename, 'r', encoding='utf-8', newline='') as csv_file:
+                reader = csv.DictReader(csv_file, delimiter=self.delimiter, quotechar=self.enclosure)
+                header = list(reader.fieldnames or [])
+                rows = {row.get(self.id_column): row for row in reader}
+
+        for key in self.header:
+            if key not in header:
+                header.append(key)
+
+        for object_id in self.deleted_ids:
+            rows.pop(object_id, None)
+
+        # changed objects keep their position, created objects are appended
+        for row in self.rows:
+            rows[row[self.id_column]] = row
+
+        return header, list(rows.values())
+
+
 class ExternalSystemAnsible(ExternalSystem):
     """TODO: document"""
     parameters = []
@@ -1007,6 +1058,11 @@ def __init__(self, destination_parms, export_vars, event=None):
             self.error("missing parameters")
 
 
+    def supports_delta(self) -> bool:
+        # every row carries its object ID, the rows of delta runs are marked as upsert or delete
+        return True
+
+
     def prepare_export(self):
         pass
 
@@ -1016,6 +1072,8 @@ def add_object(self, cmdb_object, template_data):
         row["object_id"] = str(cmdb_object.object_information['object_id'])
         if self.event:
             row["event"] = self.event.get_param('event')
+        if self.delta:
+            row["delta"] = "upsert"
         row["variables"] = {}
         for key in self._export_vars:
             row["variables"][key] = str(self._export_vars\
@@ -1024,7 +1082,15 @@ def add_object(self, cmdb_object, template_data):
         self.__rows.append(row)
 
 
+    def delete_object(self, object_id: int):
+        self.__rows.append({"object_id": str(object_id), "delta": "delete"})
+
+
     def finish_export(self):
+        # nothing changed since the last run
+        if self.delta and not self.__rows:
+            return
+
         # create json data
         json_data = json.dumps(self.__rows)
 
@@ -1105,6 +1171,12 @@ class ExternalSystemMySQLDB(ExternalSystem):
             "required": False,
             "description": "password for database server",
             "default": "password"
+        },
+        {
+            "name": "id_column",
+            "required": False,
+            "description": "name of a column with the object ID in all tables. Required for delta jobs",
+            "default": ""
         }
     ]
 
@@ -1129,12 +1201,21 @@ def __init__(self, destination_parms, export_vars, event=None):
                 self.__tables.append(table_name)
                 self.__table_data[table_name] = []
 
+        self.__id_column = self._destination_parms.get("id_column")
+        self.__changed_ids = []
+
+
+    def supports_delta(self) -> bool:
+        # rows of changed and deleted objects are found by the ID column
+        return bool(self.__id_column)
+
 
     def prepare_export(self):
         pass
 
 
     def add_object(self, cmdb_object, template_data):
+        self.__changed_ids.append(cmdb_object.object_information['object_id'])
         # add data for insert statement
         for table in self.__tables:
             varname = "table_" + table
@@ -1143,7 +1224,15 @@ def add_object(self, cmdb_object, template_data):
                                                 .get_value(cmdb_object, template_data)))
 
 
+    def delete_object(self, object_id: int):
+        self.__changed_ids.append(object_id)
+
+
     def finish_export(self):
+        # nothing changed since the last run
+        if self.delta and not self.__changed_ids:
+            return
+
         # connect to database
         db_connection = pymysql.connect(host=self._destination_parms.get("dbserver"),
                                         user=self._destination_parms.get("username"),
@@ -1158,11 +1247,16 @@ def finish_export(self):
             # beginn transaction
             db_connection.begin()
 
-            # remove all data from existing tables
+            # remove all data from existing tables, delta runs only remove the rows of the changed objects
             for table in self.__tables:
                 with db_connection.cursor() as cursor:
-                    sql = f"DELETE FROM {table}"
-                    cursor.execute(sql)
+                    if self.delta:
+                        placeholders = ", ".join(["%s"] * len(self.__changed_ids))
+                        sql = f"DELETE FROM {table} WHERE {self.__id_column} IN ({placeholders})"
+                        cursor.execute(sql, self.__changed_ids)
+                    else:
+                        sql = f"DELETE FROM {table}"
+                        cursor.execute(sql)
 
             # insert new data in all tables
             for table in self.__tables:
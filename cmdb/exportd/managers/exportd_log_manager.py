@@ -19,9 +19,6 @@
 
 from cmdb.exportd.exportd_logs.exportd_log import ExportdJobLog
 from cmdb.framework.results import IterationResult
-from cmdb.search import Pipeline
-
-from cmdb.errors.manager import ManagerGetError, ManagerIterationError
 # -------------------------------------------------------------------------------------------------------------------- #
 
 class ExportDLogManager(ExportDManager):
@@ -54,20 +51,7 @@ def iterate(self, filter: dict, limit: int, skip: int, sort: str, order: int, *a
         Returns:
             IterationResult: Instance of IterationResult with generic ExportdJobLog.
         """
-        try:
-            query: Pipeline = self.builder.build(filter=filter, limit=limit, skip=skip, sort=sort, order=order)
-            count_query: Pipeline = self.builder.count(filter=filter)
-            aggregation_result = list(self._aggregate(self.collection, query))
-            total_cursor = self._aggregate(self.collection, count_query)
-            total = 0
-
-            while total_cursor.alive:
-                total = next(total_cursor)['total']
-
-        except ManagerGetError as err:
-            raise ManagerIterationError(err) from err
-
-        iteration_result: IterationResult[ExportdJobLog] = IterationResult(aggregation_result, total)
+        iteration_result: IterationResult[ExportdJobLog] = self._iterate(filter, limit, skip, sort, order, **kwargs)
         iteration_result.convert_to(ExportdJobLog)
 
         return iteration_result
@@ -13,11 +13,17 @@
 #
 # You should have received a copy of the GNU Affero General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
-"""TODO: document"""
+"""
+Exportd service
+
+Events are coalesced per job: every event of a job within the debounce window re-arms one pending run.
+The pending runs are executed on a fixed number of workers which share one database connection,
+the same job never runs twice at the same time.
+"""
 import logging
 import time
-import sched
-from threading import Thread
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime, timezone
 
 from cmdb.database.database_manager_mongo import DatabaseManagerMongo
@@ -25,11 +31,12 @@
 from cmdb.manager.objects_manager import ObjectsManager
 from cmdb.manager.users_manager import UsersManager
 from cmdb.manager.exportd_log_manager import ExportdLogManager
+from cmdb.manager.type_cache import TYPE_CACHE
 
 import cmdb.process_management.service
 import cmdb.exportd.exporter_base
 from cmdb.event_management.event import Event
-from cmdb.exportd.exportd_job.exportd_job import ExecuteState
+from cmdb.exportd.exportd_job.exportd_job import ExportdJob, ExecuteState
 from cmdb.utils.system_config import SystemConfigReader
 from cmdb.manager.exportd_log_manager import LogAction, ExportdJobLog
 
@@ -38,8 +45,6 @@
 
 LOGGER = logging.getLogger(__name__)
 
-scheduler = sched.scheduler(time.time, time.sleep)
-
 # -------------------------------------------------------------------------------------------------------------------- #
 #                                                    ExportdService                                                    #
 # -------------------------------------------------------------------------------------------------------------------- #
@@ -47,6 +52,15 @@
 class ExportdService(cmdb.process_management.service.AbstractCmdbService):
     """TODO: document"""
 
+    DEFAULT_WORKERS: int = 4
+    # seconds a run waits for further events of the same job
+    DEBOUNCE_DELAY: int = 5
+    # seconds an added or activated job waits before its first run
+    ACTIVATION_DELAY: int = 10
+    # a pending run starts at the latest this many seconds after its first event, even if events keep coming
+    MAX_DEBOUNCE_DELAY: int = 60
+    METRICS_INTERVAL: int = 60
+
     def __init__(self):
         super().__init__()
         self._name = "exportd"
@@ -59,14 +73,50 @@ def __init__(self):
             "cmdb.exportd.#"
         ]
 
+        self.metrics = ExportdMetrics()
+        self.__pending: dict[tuple, PendingRun] = {}
+        self.__pending_lock = threading.Lock()
+        self.__job_locks: dict[int, threading.Lock] = {}
+        self.__database = None
+        self.__runner = None
+        self.__executor = None
+
+
+    def start(self):
+        # the connection is opened in the service process, it is shared by the event handling and all workers
+        scr = SystemConfigReader()
+        self.__database = DatabaseManagerMongo(**scr.get_all_values_from_section('Database'))
+        self.init_workers(ExportdJobRunner(self.__database),
+                          ThreadPoolExecutor(max_workers=self.__get_workers(scr), thread_name_prefix='exportd'))
+        super().start()
+
+
+    def init_workers(self, runner: "ExportdJobRunner", executor: Executor):
+        """
+        Sets the runner which executes the jobs and the workers which call it
+
+        Args:
+            runner (ExportdJobRunner): Executes a job for an event, it is shared by all workers
+            executor (Executor): Workers for the due runs
+        """
+        self.__runner = runner
+        self.__executor = executor
+
 
     def _run(self):
         LOGGER.info("%s: start run", self._name)
+        last_report = time.monotonic()
 
         while not self._event_shutdown.is_set():
-            scheduler.run()
+            self.dispatch_due_runs()
+
+            if time.monotonic() - last_report >= self.METRICS_INTERVAL:
+                LOGGER.info("%s: metrics %s", self._name, self.get_metrics())
+                last_report = time.monotonic()
+
             time.sleep(1)
 
+        self.__executor.shutdown(wait=False, cancel_futures=True)
         LOGGER.info("%s: end run", self._name)
 
 
@@ -75,124 +125,317 @@ def _handle_event(self, event: Event):
         self.handler(event)
 
 
-    def __schedule_job(self, event: Event):
-        pass
-
-
     def handler(self, event: Event):
-        """TODO: document"""
+        """
+        Schedules the job runs of an event
+
+        Object events schedule the event based jobs with a source of the object type, exportd events
+        schedule the job itself. Pending runs of the same job are replaced by the newer event, the objects
+        of aggregated events are merged.
+        """
         # get type of Event
         event_type = event.get_type()
 
-        # get public_id from Event
-        event_param_id = event.get_param("id")
+        # type changes only invalidate the cached types, they don't trigger any jobs
+        if event_type.startswith("cmdb.core.objecttype"):
+            TYPE_CACHE.handle_event(event, event.get_param("database"))
+            return
+
+        if event_type.startswith("cmdb.exportd"):
+            job_id = int(event.get_param("id"))
+
+            if "cmdb.exportd.run_manual" == event_type:
+                self.schedule_run((job_id, None), event, self.DEBOUNCE_DELAY)
+            elif event.get_param("active") in ['true', True]:
+                self.schedule_run((job_id, None), event, self.ACTIVATION_DELAY)
+            else:
+                # deleted or deactivated jobs don't run anymore
+                self.cancel_runs(job_id)
+
+            return
+
+        if not event.get_param("type_id"):
+            return
+
+        type_id = int(event.get_param("type_id"))
+
+        for job in self.__runner.exportd_job_manager.get_job_by_event_based(True):
+            if not (job.get_active() and next((item for item in job.get_sources() if item["type_id"] == type_id),
+                                              None)):
+                continue
+
+            self.schedule_run(self.__get_run_key(job, event), event, self.DEBOUNCE_DELAY)
+
+
+    def schedule_run(self, key: tuple, event: Event, delay: int):
+        """
+        Schedules a run or re-arms the pending run with the same key
+
+        The objects of aggregated events (`ids`) are merged into the pending run, so a subset run transfers
+        the objects of all coalesced events.
+
+        Args:
+            key (tuple): public_id of the job and the objects of subset runs
+            event (Event): Event which triggered the run
+            delay (int): Seconds to wait for further events
+        """
+        now = time.monotonic()
+
+        with self.__pending_lock:
+            pending_run = self.__pending.get(key)
+
+            if pending_run:
+                pending_run.event = self.__merge_events(pending_run.event, event)
+                pending_run.due_time = min(now + delay, pending_run.first_time + self.MAX_DEBOUNCE_DELAY)
+                self.metrics.coalesced()
+            else:
+                self.__pending[key] = PendingRun(event, now, now + delay)
+
+
+    def cancel_runs(self, job_id: int):
+        """Removes all pending runs of a job"""
+        with self.__pending_lock:
+            for key in [key for key in self.__pending if key[0] == job_id]:
+                del self.__pending[key]
+
+
+    def dispatch_due_runs(self):
+        """Hands the due runs to the workers, runs of a job which is still running wait for the next round"""
+        now = time.monotonic()
+
+        with self.__pending_lock:
+            for key in [key for key, pending_run in self.__pending.items() if pending_run.due_time <= now]:
+                job_lock = self.__job_locks.setdefault(key[0], threading.Lock())
+
+                # released by the worker after the run
+                if not job_lock.acquire(blocking=False):
+                    continue
+
+                pending_run = self.__pending.pop(key)
+                self.metrics.submitted()
+                self.__executor.submit(self.__run_job, key[0], pending_run, job_lock)
 
-        # Remove duplicate entries in the Queue of upcoming events
-        for q in scheduler.queue:
-            arg = q.argument[0]
-            if "cmdb.core.object" in event_type and event_param_id == arg.get_param("id"):
-                scheduler.cancel(q)
+            self.metrics.set_pending(len(self.__pending))
 
-            elif "cmdb.exportd" in event_type and event_param_id == arg.get_param("id"):
-                scheduler.cancel(q)
 
-        if event.get_param("active"):
-            scheduler.enter(10, 1, self.start_thread, argument=(event,))
+    def get_metrics(self) -> dict:
+        """
+        Retrieves the current metrics of the service
 
-        elif "cmdb.exportd.deleted" != event_type:
-            scheduler.enter(5, 1, self.start_thread, argument=(event, ))
+        Returns:
+            dict: Pending and queued runs, counters and latencies in seconds
+        """
+        return self.metrics.get_snapshot()
+
+
+    def __run_job(self, job_id: int, pending_run: "PendingRun", job_lock: threading.Lock):
+        """Executes a job in a worker"""
+        started = time.monotonic()
+        self.metrics.started(started - pending_run.first_time)
+        successful = False
+
+        try:
+            successful = self.__runner.run(job_id, pending_run.event)
+        except Exception as err:
+            #TODO: ERROR-FIX
+            LOGGER.error("%s: job %s failed: %s", self._name, job_id, err)
+        finally:
+            job_lock.release()
+            self.metrics.finished(time.monotonic() - started, successful)
 
 
     @staticmethod
-    def start_thread(event: Event):
-        """TODO: document"""
-        event_type = event.get_type()
-        # start new threads
+    def __get_run_key(job: ExportdJob, event: Event) -> tuple:
+        """
+        Retrieves the key under which the runs of a job are coalesced
+
+        Subset runs only transfer the objects of their event, so only the events of one object are coalesced.
+        Aggregated events of many objects are coalesced per type and kind of change and merged later.
+        All other runs transfer all objects, so every event of the job is coalesced.
+        """
+        if not job.scheduling["event"].get("subset") or job.delta:
+            return (job.get_public_id(), None)
 
-        if "cmdb.exportd.run_manual" == event_type:
-            new_thread = ExportdThread(event=event, state=True)
-            new_thread.start()
+        if event.get_param("id") is None:
+            return (job.get_public_id(), event.get_param("event"), event.get_param("type_id"))
 
-        elif "cmdb.core.object" in event_type:
-            new_thread = ExportdThread(event=event, state=False)
-            new_thread.start()
+        return (job.get_public_id(), event.get_param("id"))
 
-        elif "cmdb.exportd" in event_type:
-            new_thread = ExportdThread(event=event, state=event.get_param("active") in ['true', True])
-            new_thread.start()
+
+    @staticmethod
+    def __merge_events(pending_event: Event, event: Event) -> Event:
+        """Merges the objects of two aggregated events, other events are replaced by the newer one"""
+        if pending_event.get_param("ids") is None or event.get_param("ids") is None:
+            return event
+
+        merged_ids = list(dict.fromkeys([*pending_event.get_param("ids"), *event.get_param("ids")]))
+
+        return Event(event.get_type(), {"ids": merged_ids,
+                                        "type_id": event.get_param("type_id"),
+                                        "user_id": event.get_param("user_id"),
+                                        "event": event.get_param("event")})
+
+
+    def __get_workers(self, scr: SystemConfigReader) -> int:
+        """Reads the number of workers from the `Exportd` section of the config"""
+        try:
+            return max(1, int(scr.get_all_values_from_section('Exportd').get('workers', self.DEFAULT_WORKERS)))
+        except Exception:
+            return self.DEFAULT_WORKERS
 
 # -------------------------------------------------------------------------------------------------------------------- #
-#                                                     ExportdThread                                                    #
+#                                                      PendingRun                                                      #
 # -------------------------------------------------------------------------------------------------------------------- #
-class ExportdThread(Thread):
-    """Extends: Thread"""
-
-    def __init__(self, event: Event, state: bool = False):
-        scr = SystemConfigReader()
-        database_options = scr.get_all_values_from_section('Database')
-        database = DatabaseManagerMongo(**database_options)
+class PendingRun:
+    """A scheduled run of a job with the latest event which triggered it"""
 
-        super().__init__()
-        self.job = None
-        self.job_id = int(event.get_param("id"))
-        self.type_id = int(event.get_param("type_id")) if event.get_param("type_id") else None
-        self.user_id = int(event.get_param("user_id"))
+    def __init__(self, event: Event, first_time: float, due_time: float):
         self.event = event
-        self.is_active = state
-        self.exception_handling = None
+        self.first_time = first_time
+        self.due_time = due_time
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                                    ExportdMetrics                                                    #
+# -------------------------------------------------------------------------------------------------------------------- #
+class ExportdMetrics:
+    """Thread safe counters of the exportd service"""
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__pending = 0
+        self.__queued = 0
+        self.__running = 0
+        self.__coalesced = 0
+        self.__successful = 0
+        self.__failed = 0
+        self.__wait_total = 0.0
+        self.__wait_max = 0.0
+        self.__run_total = 0.0
+        self.__run_max = 0.0
+
+
+    def set_pending(self, pending: int):
+        """Number of runs waiting for their debounce window"""
+        with self.__lock:
+            self.__pending = pending
+
+
+    def coalesced(self):
+        """An event was merged into a pending run"""
+        with self.__lock:
+            self.__coalesced += 1
+
+
+    def submitted(self):
+        """A run was handed to the workers"""
+        with self.__lock:
+            self.__queued += 1
+
+
+    def started(self, wait_time: float):
+        """A worker started a run, `wait_time` since the first event of the run"""
+        with self.__lock:
+            self.__queued -= 1
+            self.__running += 1
+            self.__wait_total += wait_time
+            self.__wait_max = max(self.__wait_max, wait_time)
+
+
+    def finished(self, run_time: float, successful: bool):
+        """A worker finished a run"""
+        with self.__lock:
+            self.__running -= 1
+            self.__run_total += run_time
+            self.__run_max = max(self.__run_max, run_time)
+
+            if successful:
+                self.__successful += 1
+            else:
+                self.__failed += 1
+
+
+    def get_snapshot(self) -> dict:
+        """Returns the current values"""
+        with self.__lock:
+            finished = self.__successful + self.__failed
+
+            return {
+                'pending': self.__pending,
+                'queued': self.__queued,
+                'running': self.__running,
+                'coalesced': self.__coalesced,
+                'successful': self.__successful,
+                'failed': self.__failed,
+                'wait_avg': round(self.__wait_total / finished, 3) if finished else None,
+                'wait_max': round(self.__wait_max, 3),
+                'run_avg': round(self.__run_total / finished, 3) if finished else None,
+                'run_max': round(self.__run_max, 3),
+            }
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                                   ExportdJobRunner                                                   #
+# -------------------------------------------------------------------------------------------------------------------- #
+class ExportdJobRunner:
+    """Executes jobs with managers which are shared by all workers"""
 
+    def __init__(self, database: DatabaseManagerMongo):
         self.log_manager = ExportdLogManager(database)
         self.exportd_job_manager = ExportdJobManager(database)
         self.users_manager = UsersManager(database)
         self.objects_manager = ObjectsManager(database)
 
 
-    def run(self):
-        """TODO: document"""
-        try:
-            if self.type_id:
-                for obj in self.exportd_job_manager.get_job_by_event_based(True):
-                    if next((item for item in obj.get_sources() if item["type_id"] == self.type_id), None):
-                        if obj.get_active() and obj.scheduling["event"]["active"]:
-                            self.job = obj
-                            self.worker()
-            elif self.is_active:
-                self.job = self.exportd_job_manager.get_job(self.job_id)
-                self.worker()
-        except Exception as ex:
-            LOGGER.error(ex)
-            return ex
-
-
-    def worker(self):
+    def run(self, job_id: int, event: Event) -> bool:
+        """
+        Executes a job for an event
+
+        Args:
+            job_id (int): public_id of the job
+            event (Event): Latest event which triggered the run
+
+        Returns:
+            bool: True if the job was executed successfully
+        """
+        job = self.exportd_job_manager.get_job(job_id)
+
+        # the job could have been deactivated since the object event
+        if event.get_type().startswith("cmdb.core.object") \
+            and not (job.get_active() and job.scheduling["event"]["active"]):
+            return False
+
+        return self.worker(job, event, int(event.get_param("user_id")))
+
+
+    def worker(self, job: ExportdJob, event: Event, user_id: int) -> bool:
         """TODO: document"""
         cur_user = None
+        exception_handling = None
         try:
             # update job for UI
-            self.job.state = ExecuteState.RUNNING.name
-            self.job.last_execute_date = datetime.now(timezone.utc)
+            job.state = ExecuteState.RUNNING.name
+            job.last_execute_date = datetime.now(timezone.utc)
 
             # get current user
-            cur_user = self.users_manager.get_user(self.user_id)
+            cur_user = self.users_manager.get_user(user_id)
 
-            self.exportd_job_manager.update_job(self.job, self.users_manager.get_user(self.user_id), event_start=False)
+            self.exportd_job_manager.update_job(job, cur_user, event_start=False)
             # execute Exportd job
-            job = cmdb.exportd.exporter_base.ExportdManagerBase(job=self.job, event=self.event,
-                                                                log_manager=self.log_manager,
-                                                                objects_manager=self.objects_manager)
-            job.execute(cur_user.get_public_id(), cur_user.get_display_name())
+            exporter = cmdb.exportd.exporter_base.ExportdManagerBase(job=job, event=event,
+                                                                     log_manager=self.log_manager,
+                                                                     objects_manager=self.objects_manager)
+            exporter.execute(cur_user.get_public_id(), cur_user.get_display_name())
 
         except Exception as err:
             LOGGER.error(err)
-            self.exception_handling = err
+            exception_handling = err
             # Generate Error log
             try:
                 log_params = {
-                    'job_id': self.job.get_public_id(),
+                    'job_id': job.get_public_id(),
                     'state': False,
                     'user_id': cur_user.get_public_id(),
                     'user_name': cur_user.get_display_name(),
-                    'event': self.event.get_type(),
+                    'event': event.get_type(),
                     'message': ['Successful'] if not err else err.args,
                 }
                 self.log_manager.insert_log(action=LogAction.EXECUTE, log_type=ExportdJobLog.__name__, **log_params)
@@ -201,7 +444,7 @@ def worker(self):
                 LOGGER.error(error)
         finally:
             # update job for UI
-            self.job.state = ExecuteState.SUCCESSFUL.name if not self.exception_handling else ExecuteState.FAILED.name
-            self.exportd_job_manager.update_job(self.job,
-                                                self.users_manager.get_user(self.user_id),
-                                                event_start=False)
+            job.state = ExecuteState.SUCCESSFUL.name if not exception_handling else ExecuteState.FAILED.name
+            self.exportd_job_manager.update_job(job, self.users_manager.get_user(user_id), event_start=False)
+
+        return exception_handling is None
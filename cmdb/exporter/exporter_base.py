@@ -17,12 +17,15 @@
 import logging
 import csv
 import io
+import itertools
 import json
 import re
 import tempfile
+import textwrap
 import xml.dom.minidom
 import xml.etree.ElementTree as ET
 import zipfile
+from typing import Iterable, Iterator
 import openpyxl
 
 from cmdb.database.database_manager_mongo import DatabaseManagerMongo
@@ -47,6 +50,31 @@
 #                                                     ZipExportType                                                    #
 # -------------------------------------------------------------------------------------------------------------------- #
 
+class ZipStreamBuffer(io.RawIOBase):
+    """Write-only stream which collects the written archive data until it is taken by the response"""
+
+    def __init__(self):
+        super().__init__()
+        self.__chunks: list[bytes] = []
+
+
+    def writable(self) -> bool:
+        return True
+
+
+    def write(self, b) -> int:
+        self.__chunks.append(bytes(b))
+        return len(b)
+
+
+    def pop(self) -> bytes:
+        """Returns all data written since the last call"""
+        data = b''.join(self.__chunks)
+        self.__chunks = []
+
+        return data
+
+
 class ZipExportType(BaseExporterFormat):
     """Extends: BaseExporterFormat"""
     FILE_EXTENSION = "zip"
@@ -55,6 +83,9 @@ class ZipExportType(BaseExporterFormat):
     ICON = "file-archive"
     DESCRIPTION = "Export Zipped Files"
     ACTIVE = True
+    GROUP_BY_TYPE = True
+
+    COMPRESSION_LEVEL = 6
 
 
     def export(self, data: list[RenderResult], *args):
@@ -65,42 +96,78 @@ def export(self, data: list[RenderResult], *args):
             data: List of objects to be exported
             args: the filetype with which the objects are stored
         Returns:
-            zip file containing object files separated by types
+            zip file containing object files separated by types (temporary file)
         """
-        # check what export type is requested and intitializes a new zip file in memory
-        export_type = load_class(f'cmdb.exporter.exporter_base.{args[0].get("classname", "")}')()
-        zipped_file = io.BytesIO()
+        zipped_file = tempfile.TemporaryFile()
 
-        # Build .zip file
-        with zipfile.ZipFile(zipped_file, "a", zipfile.ZIP_DEFLATED, False) as f:
-            # Enters loop until the object list is empty
-            while len(data) > 0:
-                # Set what type the loop filters to and makes an empty list
-                type_id = data[len(data) - 1].type_information['type_id']
-                type_name = data[len(data) - 1].type_information['type_name']
-                type_list = []
-
-                # Filters object list to the current type_id and inserts it into type_list
-                # When an object is inserted into type_list it gets deleted from object_list
-                for i in range(len(data) - 1, -1, -1):
-                    if data[i].type_information['type_id'] == type_id:
-                        type_list.append(data[i])
-                        del data[i]
-
-                # Runs the requested export function and returns the output in the export variable
-                export = export_type.export(type_list)
-
-                # check if export output is a string, bytes or a file and inserts it into the zip file
-                if isinstance(export, str) or isinstance(export, bytes):
-                    f.writestr((type_name + "_ID_" + str(type_id) + "." + export_type.FILE_EXTENSION).format(i), export)
-                else:
-                    f.writestr((type_name + "_ID_" + str(type_id) + "." + export_type.FILE_EXTENSION).format(i),
-                               export.getvalue())
+        for chunk in self.iter_export(self.__order_by_type(data), *args):
+            zipped_file.write(chunk)
 
         # returns zipped file
         zipped_file.seek(0)
         return zipped_file
 
+
+    def iter_export(self, data: Iterable[RenderResult], *args) -> Iterator[bytes]:
+        """
+        Streams a zip file, the output of every type is written into its archive entry while it is produced
+
+        Args:
+            data: Objects to be exported, the objects of a type have to follow each other
+            args: the filetype with which the objects are stored and the optional `compression_level` (0-9)
+        Returns:
+            Chunks of the zip file
+        """
+        # check what export type is requested
+        export_type = load_class(f'cmdb.exporter.exporter_base.{args[0].get("classname", "")}')()
+        archive_stream = ZipStreamBuffer()
+
+        # Build .zip file
+        with zipfile.ZipFile(archive_stream,
+                             "w",
+                             zipfile.ZIP_DEFLATED,
+                             allowZip64=True,
+                             compresslevel=self.__get_compression_level(args[0])) as f:
+
+            for type_id, type_objects in itertools.groupby(data, key=lambda obj: obj.type_information['type_id']):
+                first_object = next(type_objects)
+                type_name = first_object.type_information['type_name']
+                file_name = f'{type_name}_ID_{type_id}.{export_type.FILE_EXTENSION}'
+
+                # Runs the requested export function and writes its output into the archive entry
+                with f.open(file_name, "w", force_zip64=True) as entry:
+                    for chunk in export_type.iter_export(itertools.chain([first_object], type_objects)):
+                        entry.write(chunk.encode('utf-8') if isinstance(chunk, str) else chunk)
+
+                        archive_chunk = archive_stream.pop()
+                        if archive_chunk:
+                            yield archive_chunk
+
+                archive_chunk = archive_stream.pop()
+                if archive_chunk:
+                    yield archive_chunk
+
+        yield archive_stream.pop()
+
+
+    @staticmethod
+    def __order_by_type(data: list[RenderResult]) -> list[RenderResult]:
+        """Groups the objects by their type in a single pass"""
+        grouped_objects: dict[int, list[RenderResult]] = {}
+
+        for obj in data:
+            grouped_objects.setdefault(obj.type_information['type_id'], []).append(obj)
+
+        return [obj for type_objects in grouped_objects.values() for obj in type_objects]
+
+
+    def __get_compression_level(self, options: dict) -> int:
+        """Returns the requested compression level (0-9) or the default level"""
+        try:
+            return min(max(int(options.get('compression_level', self.COMPRESSION_LEVEL)), 0), 9)
+        except (TypeError, ValueError):
+            return self.COMPRESSION_LEVEL
+
 # -------------------------------------------------------------------------------------------------------------------- #
 #                                                     CsvExportType                                                    #
 # -------------------------------------------------------------------------------------------------------------------- #
@@ -123,10 +190,34 @@ def export(self, data: list[RenderResult], *args):
         Returns:
             Csv file containing the data
         """
+        csv_file = io.StringIO()
+
+        for chunk in self.iter_export(data, *args):
+            csv_file.write(chunk)
+
+        csv_file.seek(0)
+        return csv_file
+
+
+    def iter_export(self, data: Iterable[RenderResult], *args) -> Iterator[str]:
+        """Yields the .csv file in chunks while the objects are rendered
+
+        Args:
+            data: The objects to be exported
+        Returns:
+            Chunks of the csv file
+        """
+        return ExperterUtils.join_chunks(self.__generate_lines(data, *args))
+
+
+    def __generate_lines(self, data: Iterable[RenderResult], *args) -> Iterator[str]:
+        """Yields the header and every object as a line of the csv file"""
+        data = iter(data)
+        first_object = next(data, None)
+
         # init values
         header = ['public_id', 'active']
-        columns = [] if not data else [x['name'] for x in data[0].fields]
-        rows = []
+        columns = [] if first_object is None else [x['name'] for x in first_object.fields]
         view = 'native'
         current_type_id = None
 
@@ -137,7 +228,16 @@ def export(self, data: list[RenderResult], *args):
             header = _meta['header']
             columns = _meta['columns']
 
-        for obj in data:
+        line = io.StringIO()
+        writer = csv.writer(line, dialect=csv.excel)
+
+        writer.writerow([*header, *columns])
+        yield self.__pop_line(line)
+
+        if first_object is None:
+            return
+
+        for obj in itertools.chain([first_object], data):
             # get type from first object and setup csv header
             if current_type_id is None:
                 current_type_id = obj.type_information['type_id']
@@ -163,9 +263,18 @@ def export(self, data: list[RenderResult], *args):
             for name in columns:
                 row.append(str(obj_fields_dict.get(name, None)))
 
-            rows.append(row)
+            writer.writerow(row)
+            yield self.__pop_line(line)
+
+
+    @staticmethod
+    def __pop_line(line: io.StringIO) -> str:
+        """Returns the written line and empties the buffer for the next one"""
+        value = line.getvalue()
+        line.seek(0)
+        line.truncate()
 
-        return self.csv_writer([*header, *columns], rows)
+        return value
 
 
     def csv_writer(self, header, rows, dialect=csv.excel):
@@ -201,6 +310,23 @@ def export(self, data: list[RenderResult], *args):
         Returns:
             Json file containing the data
         """
+        return ''.join(self.iter_export(data, *args))
+
+
+    def iter_export(self, data: Iterable[RenderResult], *args) -> Iterator[str]:
+        """Yields the .json file in chunks, every object is encoded on its own
+
+        Args:
+            data: The objects to be exported
+
+        Returns:
+            Chunks of the json file
+        """
+        return ExperterUtils.join_chunks(self.__generate_parts(data, *args))
+
+
+    def __generate_parts(self, data: Iterable[RenderResult], *args) -> Iterator[str]:
+        """Yields the list brackets and the indented objects, the result equals `json.dumps(output, indent=2)`"""
         meta = False
         view = 'native'
 
@@ -209,72 +335,87 @@ def export(self, data: list[RenderResult], *args):
             view = args[0].get('view', 'native')
 
         header = ['public_id', 'active', 'type_label']
-        output = []
+        shown_columns = None
+
+        # Export only the shown fields chosen by the user
+        if meta and view == ExporterConfigType.render.name:
+            _meta = json.loads(meta)
+            header = _meta['header']
+            shown_columns = _meta['columns']
+
+        is_empty = True
+        yield '['
 
         for obj in data:
-            # init columns
-            columns = obj.fields
-            multi_data_sections = []
+            output_element = self.__generate_element(obj, header, shown_columns, view)
+            encoded_element = json.dumps(output_element, default=json_encoding.default, ensure_ascii=False, indent=2)
 
-            if len(obj.multi_data_sections) > 0:
-                multi_data_sections = obj.multi_data_sections
+            yield ('\n' if is_empty else ',\n') + textwrap.indent(encoded_element, '  ')
+            is_empty = False
 
-            # Export only the shown fields chosen by the user
-            if meta and view == ExporterConfigType.render.name:
-                _meta = json.loads(meta)
-                header = _meta['header']
-                columns = [x for x in columns if x['name'] in _meta['columns']]
+        yield ']' if is_empty else '\n]'
 
-            # init output element
-            output_element = {}
 
-            for head in header:
-                head = 'object_id' if head == 'public_id' else head
+    def __generate_element(self, obj: RenderResult, header: list, shown_columns: list, view: str) -> dict:
+        """Generates the output of a single object"""
+        # init columns
+        columns = obj.fields
+        multi_data_sections = []
 
-                if head == 'type_label':
-                    output_element.update({head: obj.type_information[head]})
-                else:
-                    output_element.update({head: obj.object_information[head]})
-
-            # get object fields
-            output_element.update({'fields': []})
-            for field in columns:
-                output_element['fields'].append({
-                    'name': field.get('name'),
-                    'value': ExperterUtils.summary_renderer(obj, field, view)
-                })
+        if len(obj.multi_data_sections) > 0:
+            multi_data_sections = obj.multi_data_sections
 
-            if len(multi_data_sections) > 0:
-                output_element.update({'multi_data_sections': []})
+        if shown_columns is not None:
+            columns = [x for x in columns if x['name'] in shown_columns]
 
-                for index, mds in enumerate(multi_data_sections):
-                    # set first level items
-                    output_element['multi_data_sections'].append({
-                        'section_id': mds.get('section_id'),
-                        'highest_id': mds.get('highest_id')
-                    })
-                    output_element['multi_data_sections'][index].update({'values': []})
+        # init output element
+        output_element = {}
 
-                    #set values
-                    values = mds.get('values')
+        for head in header:
+            head = 'object_id' if head == 'public_id' else head
 
-                    for val_index, value in enumerate(values):
-                        output_element['multi_data_sections'][index]['values'].append({
-                             'multi_data_id': value.get('multi_data_id')
-                        })
-                        output_element['multi_data_sections'][index]['values'][val_index].update({'data': []})
+            if head == 'type_label':
+                output_element.update({head: obj.type_information[head]})
+            else:
+                output_element.update({head: obj.object_information[head]})
+
+        # get object fields
+        output_element.update({'fields': []})
+        for field in columns:
+            output_element['fields'].append({
+                'name': field.get('name'),
+                'value': ExperterUtils.summary_renderer(obj, field, view)
+            })
 
-                        #set all data
-                        data = value.get('data')
-                        for data_set in data:
-                            output_element['multi_data_sections'][index]['values'][val_index]['data'].append({
-                                'name': data_set.get('name'),
-                                'value': data_set.get('value')
-                            })
+        if len(multi_data_sections) > 0:
+            output_element.update({'multi_data_sections': []})
 
-            output.append(output_element)
+            for index, mds in enumerate(multi_data_sections):
+                # set first level items
+                output_element['multi_data_sections'].append({
+                    'section_id': mds.get('section_id'),
+                    'highest_id': mds.get('highest_id')
+                })
+                output_element['multi_data_sections'][index].update({'values': []})
+
+                #set values
+                values = mds.get('values')
+
+                for val_index, value in enumerate(values):
+                    output_element['multi_data_sections'][index]['values'].append({
+                         'multi_data_id': value.get('multi_data_id')
+                    })
+                    output_element['multi_data_sections'][index]['values'][val_index].update({'data': []})
+
+                    #set all data
+                    data = value.get('data')
+                    for data_set in data:
+                        output_element['multi_data_sections'][index]['values'][val_index]['data'].append({
+                            'name': data_set.get('name'),
+                            'value': data_set.get('value')
+                        })
 
-        return json.dumps(output, default=json_encoding.default, ensure_ascii=False, indent=2)
+        return output_element
 
 
 class XlsxExportType(BaseExporterFormat):
@@ -286,6 +427,8 @@ class XlsxExportType(BaseExporterFormat):
     DESCRIPTION = "Export as XLS"
     ACTIVE = True
 
+    CHUNK_SIZE = 64 * 1024
+
 
     def export(self, data: list[RenderResult], *args):
         """Exports object_list as .xlsx file
@@ -296,29 +439,39 @@ def export(self, data: list[RenderResult], *args):
         Returns:
             Xlsx file containing the data
         """
+        return b''.join(self.iter_export(data, *args))
+
+
+    def iter_export(self, data: Iterable[RenderResult], *args) -> Iterator[bytes]:
+        """Writes the objects in write-only mode to a temporary file and yields the saved file in chunks
+
+        Args:
+            data: The objects to be exported
+
+        Returns:
+            Chunks of the xlsx file
+        """
         workbook = self.create_xls_object(data, args)
 
         # save workbook
         with tempfile.NamedTemporaryFile() as tmp:
             workbook.save(tmp.name)
             tmp.seek(0)
-            return tmp.read()
 
+            while chunk := tmp.read(self.CHUNK_SIZE):
+                yield chunk
 
-    def create_xls_object(self, data: list[RenderResult], args):
-        """TODO: ducoment"""
-        # create workbook
-        workbook = openpyxl.Workbook()
 
-        # sorts data_list by type_id
-        decorated = [(dict_.type_information['type_id'], dict_) for dict_ in data]
-        decorated = sorted(decorated, key=lambda x: x[0], reverse=False)
-        sorted_list = [dict_ for (key, dict_) in decorated]
+    def create_xls_object(self, data: Iterable[RenderResult], args):
+        """Creates a write-only workbook with a sheet for every type, rows are appended while the objects are read"""
+        # create workbook
+        workbook = openpyxl.Workbook(write_only=True)
 
         # init values
-        current_type_id = None
+        sheets: dict = {}
+        type_columns: dict[int, list] = {}
         header = ['public_id', 'active']
-        columns = [] if not data else [x['name'] for x in data[0].fields]
+        columns = None
         view = 'native'
 
         # Export only the shown fields chosen by the user
@@ -328,40 +481,20 @@ def create_xls_object(self, data: list[RenderResult], args):
             header = _meta['header']
             columns = _meta['columns']
 
-        i = 0
-        for obj in sorted_list:
+        for obj in data:
+            current_type_id = obj.type_information['type_id']
+            sheet = sheets.get(current_type_id)
 
             # check, if starting a new object type
-            if current_type_id != obj.type_information['type_id']:
-                # set current type id and fields
-                current_type_id = obj.type_information['type_id']
-                i = 1
-
-                # delete default sheet
-                workbook.remove(workbook.active)
-
-                # start a new worksheet and rename it
+            if sheet is None:
+                # start a new worksheet with the fields of the type
                 title = self.__normalize_sheet_title(obj.type_information['type_label'])
                 sheet = workbook.create_sheet(title)
+                sheets[current_type_id] = sheet
+                type_columns[current_type_id] = columns if columns is not None else [x['name'] for x in obj.fields]
 
-                # insert header: public_id, active
-                for count, head in enumerate(header):
-                    cell = sheet.cell(row=i, column=count+1)
-                    cell.value = head
-
-                # insert header: get fields from type definition
-                c = len(header)
-                for field in columns:
-                    cell = sheet.cell(row=i, column=c+1)
-                    cell.value = field
-                    c = c + 1
-                i = i + 1
-
-            # insert row values: header
-            for count, head in enumerate(header):
-                head = 'object_id' if head == 'public_id' else head
-                cell = sheet.cell(row=i, column=count+1)
-                cell.value = str(obj.object_information[head])
+                # insert header: public_id, active and the fields from type definition
+                sheet.append([*header, *type_columns[current_type_id]])
 
             # get object fields as dict:
             obj_fields_dict = {}
@@ -369,15 +502,20 @@ def create_xls_object(self, data: list[RenderResult], args):
                 obj_field_name = field.get('name')
                 obj_fields_dict[obj_field_name] = ExperterUtils.summary_renderer(obj, field, view)
 
-            # insert row values: fields
-            c = len(header)+1
-            for field in columns:
-                cell = sheet.cell(row=i, column=c)
-                cell.value = str(obj_fields_dict.get(field))
-                c = c + 1
+            # insert row values: header and fields
+            row = []
+            for head in header:
+                head = 'object_id' if head == 'public_id' else head
+                row.append(str(obj.object_information[head]))
+
+            for field in type_columns[current_type_id]:
+                row.append(str(obj_fields_dict.get(field)))
+
+            sheet.append(row)
 
-            # increase row number
-            i = i + 1
+        # a workbook needs at least one sheet
+        if not sheets:
+            workbook.create_sheet()
 
         return workbook
 
@@ -405,9 +543,29 @@ def export(self, data: list[RenderResult], *args):
         Returns:
             Xml file containing the data
         """
+        return ''.join(self.iter_export(data, *args))
+
+
+    def iter_export(self, data: Iterable[RenderResult], *args) -> Iterator[str]:
+        """Yields the .xml file in chunks, every object element is serialized on its own
+
+        Args:
+            data: The objects to be exported
+
+        Returns:
+            Chunks of the (pretty printed) xml file
+        """
+        return ExperterUtils.join_chunks(self.__generate_parts(data, *args))
+
+
+    def __generate_parts(self, data: Iterable[RenderResult], *args) -> Iterator[str]:
+        """Yields the declaration, the root element and the indented object elements"""
+        data = iter(data)
+        first_object = next(data, None)
+
         # init values
         header = ['public_id', 'active', 'type_label']
-        columns = [] if not data else [x['name'] for x in data[0].fields]
+        columns = [] if first_object is None else [x['name'] for x in first_object.fields]
         view = 'native'
 
         # Export only the shown fields chosen by the user
@@ -417,41 +575,58 @@ def export(self, data: list[RenderResult], *args):
             header = _meta['header']
             columns = _meta['columns']
 
-        # object list
-        cmdb_object_list = ET.Element('objects')
-
-        for obj in data:
-            # get object fields as dict:
-            obj_fields_dict = {}
-            for field in obj.fields:
-                obj_field_name = field.get('name')
-                obj_fields_dict[obj_field_name] = ExperterUtils.summary_renderer(obj, field, view)
+        yield '<?xml version="1.0" ?>\n'
 
-            # xml output: object
-            cmdb_object = ET.SubElement(cmdb_object_list, 'object')
-            cmdb_object_meta = ET.SubElement(cmdb_object, 'meta')
+        if first_object is None:
+            yield '<objects/>\n'
+            return
 
-            # xml output meta: header
-            for head in header:
-                head = 'object_id' if head == 'public_id' else head
-                if head == 'type_label':
-                    cmdb_object_meta_type = ET.SubElement(cmdb_object_meta, 'type')
-                    cmdb_object_meta_type.text = obj.type_information['type_label']
-                else:
-                    cmdb_object_meta_id = ET.SubElement(cmdb_object_meta, head)
-                    cmdb_object_meta_id.text = str(obj.object_information[head])
-
-            # xml output: fields
-            cmdb_object_fields = ET.SubElement(cmdb_object, 'fields')
-
-            # walk over all type fields and add object field values
-            for field in columns:
-                field_attribs = {
-                    'name': str(field),
-                    'value': str(obj_fields_dict.get(field))
-                }
-                ET.SubElement(cmdb_object_fields, "field", field_attribs)
-
-        # return xml as string (pretty printed)
-        return xml.dom.minidom.parseString(
-            ET.tostring(cmdb_object_list, encoding='unicode', method='xml')).toprettyxml()
+        # object list
+        yield '<objects>\n'
+
+        for obj in itertools.chain([first_object], data):
+            cmdb_object = self.__generate_element(obj, header, columns, view)
+
+            # xml output: object (pretty printed as a child of the root element, values are written unchanged)
+            object_xml = io.StringIO()
+            xml.dom.minidom.parseString(ET.tostring(cmdb_object, encoding='unicode', method='xml')) \
+                           .documentElement.writexml(object_xml, indent='\t', addindent='\t', newl='\n')
+            yield object_xml.getvalue()
+
+        yield '</objects>\n'
+
+
+    def __generate_element(self, obj: RenderResult, header: list, columns: list, view: str) -> ET.Element:
+        """Generates the element of a single object"""
+        # get object fields as dict:
+        obj_fields_dict = {}
+        for field in obj.fields:
+            obj_field_name = field.get('name')
+            obj_fields_dict[obj_field_name] = ExperterUtils.summary_renderer(obj, field, view)
+
+        # xml output: object
+        cmdb_object = ET.Element('object')
+        cmdb_object_meta = ET.SubElement(cmdb_object, 'meta')
+
+        # xml output meta: header
+        for head in header:
+            head = 'object_id' if head == 'public_id' else head
+            if head == 'type_label':
+                cmdb_object_meta_type = ET.SubElement(cmdb_object_meta, 'type')
+                cmdb_object_meta_type.text = obj.type_information['type_label']
+            else:
+                cmdb_object_meta_id = ET.SubElement(cmdb_object_meta, head)
+                cmdb_object_meta_id.text = str(obj.object_information[head])
+
+        # xml output: fields
+        cmdb_object_fields = ET.SubElement(cmdb_object, 'fields')
+
+        # walk over all type fields and add object field values
+        for field in columns:
+            field_attribs = {
+                'name': str(field),
+                'value': str(obj_fields_dict.get(field))
+            }
+            ET.SubElement(cmdb_object_fields, "field", field_attribs)
+
+        return cmdb_object
@@ -14,6 +14,8 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 """TODO: ducoment"""
+from typing import Iterable, Iterator
+
 from cmdb.exporter.config.config_type import ExporterConfigType
 # -------------------------------------------------------------------------------------------------------------------- #
 
@@ -40,3 +42,32 @@ def summary_renderer(obj, field, view: str = 'native') -> str:
             return summary_line
 
         return field.get('value', None)
+
+
+    @staticmethod
+    def join_chunks(parts: Iterable[str], chunk_size: int = 64 * 1024) -> Iterator[str]:
+        """
+        Joins small parts of a streamed export to chunks of at least `chunk_size` characters,
+        so that not every single row is sent on its own
+
+        Args:
+            parts: Strings in the order of the output
+            chunk_size: Minimum length of a chunk, the last chunk can be shorter
+
+        Returns:
+            Iterator over the joined chunks
+        """
+        buffer: list[str] = []
+        buffer_length = 0
+
+        for part in parts:
+            buffer.append(part)
+            buffer_length += len(part)
+
+            if buffer_length >= chunk_size:
+                yield ''.join(buffer)
+                buffer = []
+                buffer_length = 0
+
+        if buffer:
+            yield ''.join(buffer)
@@ -15,6 +15,7 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 """TODO: document"""
 from abc import ABC, abstractmethod
+from typing import Iterable, Iterator, Union
 
 class BaseExporterFormat(ABC):
     """TODO: document"""
@@ -24,6 +25,8 @@ class BaseExporterFormat(ABC):
     ICON = None
     DESCRIPTION = None
     ACTIVE = None
+    # the objects have to be passed ordered by their type
+    GROUP_BY_TYPE = False
 
     def __init__(self, file_name=''):
         self.file_name = f'{file_name}.{self.FILE_EXTENSION}'
@@ -31,3 +34,15 @@ def __init__(self, file_name=''):
     @abstractmethod
     def export(self, data, *args):
         """TODO: document"""
+
+
+    def iter_export(self, data: Iterable, *args) -> Iterator[Union[str, bytes]]:
+        """
+        Yields the export in chunks, formats which can be written incrementally should override this
+
+        Args:
+            data: The objects to be exported, can be a generator
+        """
+        export = self.export(list(data), *args)
+
+        yield export.getvalue() if hasattr(export, 'getvalue') else export
@@ -17,7 +17,9 @@
 import logging
 import datetime
 import time
-from flask import Response, abort
+from typing import Iterable, Iterator
+from itertools import islice
+from flask import Response, abort, stream_with_context
 
 from cmdb.manager.objects_manager import ObjectsManager
 
@@ -74,6 +76,8 @@ def convert_to(self):
 class  BaseExportWriter:
     """TODO: document"""
 
+    RENDER_BATCH_SIZE: int = 500
+
     def __init__(self, export_format: BaseExporterFormat, export_config: ExporterConfig):
         """init of FileExporter
 
@@ -83,11 +87,12 @@ def __init__(self, export_format: BaseExporterFormat, export_config: ExporterCon
         """
         self.export_format = export_format
         self.export_config = export_config
-        self.data: list[RenderResult] = []
+        self.data: Iterable[RenderResult] = []
 
 
     def from_database(self, database_manager, user: UserModel, permission: AccessControlPermission):
-        """Get all objects from the collection"""
+        """Get all objects from the collection
+        The objects are read from a cursor and rendered lazily in batches while the export is written"""
         objects_manager = ObjectsManager(database_manager)
 
         export_params = self.export_config.parameters
@@ -96,23 +101,42 @@ def from_database(self, database_manager, user: UserModel, permission: AccessCon
                                            order=export_params.order)
 
         try:
-            tmp_result: list[CmdbObject] = objects_manager.iterate(builder_params, user, permission).results
+            objects: Iterator[CmdbObject] = objects_manager.iterate_cursor(
+                                                                builder_params,
+                                                                user,
+                                                                permission,
+                                                                group_by_type=self.export_format.GROUP_BY_TYPE)
 
-            self.data = RenderList(tmp_result,
-                                   user,
-                                   True,
-                                   objects_manager).render_result_list(raw=False)
+            self.data = self.__render_objects(objects, user, objects_manager)
         except Exception:
             #TODO: ERROR-FIX
             return abort(400)
 
 
+    def __render_objects(self,
+                         objects: Iterator[CmdbObject],
+                         user: UserModel,
+                         objects_manager: ObjectsManager) -> Iterator[RenderResult]:
+        """Renders the objects of the cursor in batches of `RENDER_BATCH_SIZE`"""
+        while True:
+            batch_objects: list[CmdbObject] = list(islice(objects, self.RENDER_BATCH_SIZE))
+
+            if not batch_objects:
+                return
+
+            yield from RenderList(batch_objects,
+                                  user,
+                                  True,
+                                  objects_manager,
+                                  batch=True).render_result_list(raw=False)
+
+
     def export(self):
-        """TODO: document"""
+        """Streams the export to the client while it is written"""
 
         conf_option = self.export_config.options
         timestamp = datetime.datetime.fromtimestamp(time.time()).strftime('%Y_%m_%d-%H_%M_%S')
-        export = self.export_format.export(self.data, conf_option)
+        export = stream_with_context(self.export_format.iter_export(self.data, conf_option))
 
         return Response(
             export,
@@ -25,6 +25,8 @@
 from cmdb.cmdb_objects.cmdb_object import CmdbObject
 from cmdb.cmdb_objects.cmdb_location import CmdbLocation
 from cmdb.cmdb_objects.cmdb_section_template import CmdbSectionTemplate
+from cmdb.cmdb_objects.cmdb_search_entry import CmdbSearchEntry
+from cmdb.cmdb_objects.cmdb_object_refs import CmdbObjectRefs
 
 from cmdb.framework.models import TypeModel
 from cmdb.framework.models import CategoryModel
@@ -42,5 +44,7 @@
     CmdbMetaLog,
     ObjectLinkModel,
     CmdbLocation,
-    CmdbSectionTemplate
+    CmdbSectionTemplate,
+    CmdbSearchEntry,
+    CmdbObjectRefs
 ]
@@ -14,6 +14,7 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 """Object/Type render"""
+import copy
 import logging
 from typing import Union
 from datetime import datetime, timezone
@@ -22,7 +23,9 @@
 from cmdb.manager.objects_manager import ObjectsManager
 from cmdb.manager.users_manager import UsersManager
 from cmdb.manager.type_manager import TypeManager
+from cmdb.manager.type_cache import TYPE_CACHE
 
+from cmdb.security.acl.helpers import verify_access
 from cmdb.security.acl.permission import AccessControlPermission
 from cmdb.cmdb_objects.cmdb_object import CmdbObject
 from cmdb.framework.models.type import TypeModel
@@ -73,6 +76,209 @@ def __init__(self):
         self.externals: list = []
         self.multi_data_sections: list = []
 
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                              RenderReferenceCache - CLASS                                            #
+# -------------------------------------------------------------------------------------------------------------------- #
+class RenderReferenceCache:
+    """
+    Holds the objects, types and users which are required to render a list of objects.
+    All ids of a list are collected first and every set is loaded with a single `$in` query. Lookups for ids
+    which were not prefetched are delegated to the managers, so renders behave the same with or without the cache.
+    """
+
+    REFERENCE_FIELD_TYPES = ('ref', 'location', 'ref-section-field')
+
+    def __init__(self, objects_manager: ObjectsManager):
+        self.objects_manager: ObjectsManager = objects_manager
+        self.users_manager: UsersManager = UsersManager(objects_manager.dbm)
+
+        self.objects: dict[int, CmdbObject] = {}
+        self.types: dict[int, dict] = {}
+        self.users: dict[int, UserModel] = {}
+
+        self.__requested_objects: set[int] = set()
+        self.__requested_types: set[int] = set()
+        self.__requested_users: set[int] = set()
+
+
+    def prefetch(self, object_list: list[CmdbObject]):
+        """
+        Loads all objects, types and users which are referenced by the objects of the list
+
+        Args:
+            object_list (list[CmdbObject]): Objects which will be rendered
+        """
+        self.__load_types({object_.type_id for object_ in object_list})
+
+        # direct references of the listed objects and the references of those (summaries of nested refs)
+        current_level: list[CmdbObject] = object_list
+        for _ in range(2):
+            reference_ids = set()
+            for object_ in current_level:
+                reference_ids.update(self.__collect_reference_ids(object_))
+
+            self.__load_objects(reference_ids)
+            current_level = [self.objects[ref_id] for ref_id in reference_ids if ref_id in self.objects]
+            self.__load_types({object_.type_id for object_ in current_level} | self.__collect_section_type_ids())
+
+        user_ids = set()
+        for object_ in object_list:
+            user_ids.update([object_.author_id, object_.editor_id])
+
+        for raw_type in self.types.values():
+            user_ids.add(raw_type.get('author_id'))
+
+        self.__load_users(user_ids)
+
+
+    def get_object(self, public_id: int, user: UserModel = None, permission: AccessControlPermission = None) \
+            -> CmdbObject:
+        """
+        Retrieves an object from the cache or the database
+
+        Raises:
+            ObjectManagerGetError: If the object was not found
+            AccessDeniedError: If the user has no permission for the object
+        """
+        if not self.__is_requested(public_id, self.__requested_objects):
+            return self.objects_manager.get_object(public_id, user, permission)
+
+        requested_object = self.objects.get(public_id)
+
+        if not requested_object:
+            raise ObjectManagerGetError(f'Object with ID: {public_id} not found!')
+
+        verify_access(self.get_object_type(requested_object.type_id), user, permission)
+
+        return requested_object
+
+
+    def get_object_type(self, type_id: int) -> TypeModel:
+        """
+        Retrieves a new TypeModel instance from the cache or the database
+
+        Raises:
+            ObjectManagerGetError: If the type was not found
+        """
+        if not self.__is_requested(type_id, self.__requested_types):
+            return self.objects_manager.get_object_type(type_id)
+
+        raw_type = self.types.get(type_id)
+
+        if not raw_type:
+            raise ObjectManagerGetError(f"Error while retrieving type with ID: {type_id}. Error: Type not found!")
+
+        # renders write values into the field dicts of a type, therefore every render gets its own copy
+        return TypeModel.from_data(copy.deepcopy(raw_type))
+
+
+    def get_user(self, public_id: int) -> UserModel:
+        """
+        Retrieves a user from the cache or the database
+
+        Raises:
+            ManagerGetError: If the user was not found
+        """
+        if not self.__is_requested(public_id, self.__requested_users):
+            return self.users_manager.get_user(public_id)
+
+        requested_user = self.users.get(public_id)
+
+        if not requested_user:
+            raise ManagerGetError("User not found!")
+
+        return requested_user
+
+# ------------------------------------------------- HELPER - SECTION ------------------------------------------------- #
+
+    @staticmethod
+    def __is_requested(public_id, requested_ids: set[int]) -> bool:
+        """Checks if a lookup can be answered by the prefetched data"""
+        return isinstance(public_id, int) and not isinstance(public_id, bool) and public_id in requested_ids
+
+
+    @staticmethod
+    def __filter_ids(ids: set, requested_ids: set[int]) -> list[int]:
+        """Returns all valid ids which were not requested yet"""
+        return [public_id for public_id in ids
+                if isinstance(public_id, int) and not isinstance(public_id, bool) and public_id not in requested_ids]
+
+
+    def __collect_reference_ids(self, object_: CmdbObject) -> set[int]:
+        """Collects the ids of all objects referenced by fields of the given object"""
+        reference_ids = set()
+        raw_type = self.types.get(object_.type_id)
+
+        if not raw_type:
+            return reference_ids
+
+        reference_fields = {field.get('name') for field in raw_type.get('fields') or []
+                            if field.get('type') in self.REFERENCE_FIELD_TYPES}
+
+        for field in object_.fields:
+            if field.get('name') not in reference_fields or not field.get('value'):
+                continue
+
+            try:
+                reference_ids.add(int(field['value']))
+            except (TypeError, ValueError):
+                continue
+
+        return reference_ids
+
+
+    def __collect_section_type_ids(self) -> set[int]:
+        """Collects the type ids of all reference sections of the loaded types"""
+        type_ids = set()
+
+        for raw_type in list(self.types.values()):
+            for section in (raw_type.get('render_meta') or {}).get('sections') or []:
+                if section.get('type') == 'ref-section' and section.get('reference'):
+                    type_ids.add(section['reference'].get('type_id'))
+
+        return type_ids
+
+
+    def __load_objects(self, object_ids: set):
+        """Loads all not yet requested objects with one query"""
+        object_ids = self.__filter_ids(object_ids, self.__requested_objects)
+
+        if not object_ids:
+            return
+
+        self.__requested_objects.update(object_ids)
+
+        for raw_object in self.objects_manager.get_many(public_id={'$in': object_ids}):
+            self.objects[raw_object['public_id']] = CmdbObject.from_data(raw_object)
+
+
+    def __load_types(self, type_ids: set):
+        """Loads all not yet requested types with one query"""
+        type_ids = self.__filter_ids(type_ids, self.__requested_types)
+
+        if not type_ids:
+            return
+
+        self.__requested_types.update(type_ids)
+
+        self.types.update(TYPE_CACHE.get_many_type_data(self.objects_manager.dbm, type_ids))
+
+
+    def __load_users(self, user_ids: set):
+        """Loads all not yet requested users with one query"""
+        user_ids = self.__filter_ids(user_ids, self.__requested_users)
+
+        if not user_ids:
+            return
+
+        self.__requested_users.update(user_ids)
+
+        for user in self.users_manager.get_many_users({'public_id': {'$in': user_ids}}):
+            self.users[user.public_id] = user
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                                   CmdbRender - CLASS                                                 #
+# -------------------------------------------------------------------------------------------------------------------- #
 #TODO: CLASS-FIX
 class CmdbRender:
     """TODO: document"""
@@ -83,11 +289,13 @@ def __init__(self, object_instance: CmdbObject,
                  type_instance: TypeModel,
                  render_user: UserModel,
                  ref_render=False,
-                 objects_manager: ObjectsManager = None):
+                 objects_manager: ObjectsManager = None,
+                 render_cache: RenderReferenceCache = None):
         self.object_instance: CmdbObject = object_instance
         self.type_instance: TypeModel = type_instance
         self.render_user: UserModel = render_user
         self.objects_manager = objects_manager
+        self.render_cache = render_cache
 
         if self.objects_manager:  # TODO: Refactor to pass database-manager in init
             self.type_manager = TypeManager(self.objects_manager.dbm)
@@ -161,6 +369,38 @@ def is_ref_field(self, field_name):
         return False
 
 
+    def __get_object(self, public_id: int, user: UserModel = None, permission: AccessControlPermission = None) \
+            -> CmdbObject:
+        if self.render_cache:
+            return self.render_cache.get_object(public_id, user, permission)
+
+        return self.objects_manager.get_object(public_id, user, permission)
+
+
+    def __get_object_type(self, type_id: int) -> TypeModel:
+        if self.render_cache:
+            return self.render_cache.get_object_type(type_id)
+
+        return self.objects_manager.get_object_type(type_id)
+
+
+    def __get_type(self, type_id: int) -> TypeModel:
+        if self.render_cache:
+            try:
+                return self.render_cache.get_object_type(type_id)
+            except ObjectManagerGetError as err:
+                raise ManagerGetError(f'Type with ID: {type_id} not found!') from err
+
+        return self.type_manager.get(type_id)
+
+
+    def __get_user(self, public_id: int) -> UserModel:
+        if self.render_cache:
+            return self.render_cache.get_user(public_id)
+
+        return self.users_manager.get_user(public_id)
+
+
     def _generate_result(self, level: int) -> RenderResult:
         render_result = RenderResult()
 
@@ -185,14 +425,14 @@ def __set_multi_data_sections(self, render_result: RenderResult) -> RenderResult
 
     def __generate_object_information(self, render_result: RenderResult) -> RenderResult:
         try:
-            author_name = self.users_manager.get_user(self.object_instance.author_id).get_display_name()
+            author_name = self.__get_user(self.object_instance.author_id).get_display_name()
         except Exception:
             #TODO: ERROR-FIX
             author_name = CmdbRender.AUTHOR_ANONYMOUS_NAME
 
         if self.object_instance.editor_id:
             try:
-                editor_name = self.users_manager.get_user(self.object_instance.editor_id).get_display_name()
+                editor_name = self.__get_user(self.object_instance.editor_id).get_display_name()
             except Exception:
                 #TODO: ERROR-FIX
                 editor_name = None
@@ -215,7 +455,7 @@ def __generate_object_information(self, render_result: RenderResult) -> RenderRe
 
     def __generate_type_information(self, render_result: RenderResult) -> RenderResult:
         try:
-            author_name = self.users_manager.get_user(self.type_instance.author_id).get_display_name()
+            author_name = self.__get_user(self.type_instance.author_id).get_display_name()
         except Exception:
             #TODO: ERROR-FIX
             author_name = CmdbRender.AUTHOR_ANONYMOUS_NAME
@@ -293,8 +533,8 @@ def __merge_fields_value(self, level: int = 3) -> list[dict]:
                             field['value'] = reference_id
 
                             if field['type'] == 'ref':
-                                reference_object: CmdbObject = self.objects_manager.get_object(reference_id)
-                                ref_type: TypeModel = self.objects_manager.get_object_type(
+                                reference_object: CmdbObject = self.__get_object(reference_id)
+                                ref_type: TypeModel = self.__get_object_type(
                                                                                 reference_object.get_type_id()
                                                                            )
                                 field['reference'] = {
@@ -344,12 +584,12 @@ def __merge_fields_value(self, level: int = 3) -> list[dict]:
                 try:
                     reference_id: int = self.object_instance.get_value(ref_field_name)
                     ref_field['value'] = reference_id
-                    reference_object: CmdbObject = self.objects_manager.get_object(reference_id)
+                    reference_object: CmdbObject = self.__get_object(reference_id)
                 except (ObjectManagerGetError, ValueError, KeyError):
                     reference_object = None
 
                 try:
-                    ref_type: TypeModel = self.type_manager.get(section.reference.type_id)
+                    ref_type: TypeModel = self.__get_type(section.reference.type_id)
                     ref_section = ref_type.get_section(section.reference.section_name)
                     ref_field['references'] = {
                         'type_id': ref_type.public_id,
@@ -393,13 +633,14 @@ def __merge_fields_value(self, level: int = 3) -> list[dict]:
     def __merge_reference_section_fields(self, ref_section_field, ref_type, ref_section_fields, level):
         if ref_section_field and ref_section_field.get('type', '') == 'ref-section-field':
             try:
-                instance = self.objects_manager.get_object(ref_section_field.get('value'))
-                reference_type: TypeModel = self.objects_manager.get_object_type(instance.get_type_id())
+                instance = self.__get_object(ref_section_field.get('value'))
+                reference_type: TypeModel = self.__get_object_type(instance.get_type_id())
                 render = CmdbRender(object_instance=instance,
                                     type_instance=ref_type,
                                     render_user=self.render_user,
                                     ref_render=True,
-                                    objects_manager=self.objects_manager)
+                                    objects_manager=self.objects_manager,
+                                    render_cache=self.render_cache)
                 fields = render.result(level).fields
                 res = next((x for x in fields if x['name'] == ref_section_field.get('name', '')), None)
                 if res and ref_section_field.get('type', '') == 'ref-section-field':
@@ -423,7 +664,7 @@ def __merge_references(self, current_field):
         if current_field['value']:
 
             try:
-                ref_object = self.objects_manager.get_object(int(current_field['value']),
+                ref_object = self.__get_object(int(current_field['value']),
                                                              self.render_user,
                                                              AccessControlPermission.READ)
             except AccessDeniedError as err:
@@ -433,7 +674,7 @@ def __merge_references(self, current_field):
                 return TypeReference.to_json(reference)
 
             try:
-                ref_type = self.objects_manager.get_object_type(ref_object.get_type_id())
+                ref_type = self.__get_object_type(ref_object.get_type_id())
 
                 _summary_fields = []
                 _nested_summaries = current_field.get('summaries', [])
@@ -570,23 +811,46 @@ def __init__(self,
                  object_list: list[CmdbObject],
                  request_user: UserModel,
                  ref_render=False,
-                 objects_manager: ObjectsManager = None):
+                 objects_manager: ObjectsManager = None,
+                 batch: bool = False):
+        """
+        Args:
+            object_list (list[CmdbObject]): Objects which should be rendered
+            request_user (UserModel): User requesting the render
+            ref_render (bool): Render the references of the objects
+            objects_manager (ObjectsManager): Manager used to retrieve referenced data
+            batch (bool): Prefetch all referenced objects, types and users of the list with a few `$in` queries
+                          instead of querying them for every single object
+        """
         self.object_list: list[CmdbObject] = object_list
         self.request_user = request_user
         self.ref_render = ref_render
         self.objects_manager = objects_manager
+        self.batch = batch
 
 
     def render_result_list(self, raw: bool = False) -> list[Union[RenderResult, dict]]:
         """TODO: document"""
         preparation_objects: list[RenderResult] = []
+        render_cache: RenderReferenceCache = None
+
+        if self.batch and self.object_list:
+            render_cache = RenderReferenceCache(self.objects_manager)
+            render_cache.prefetch(self.object_list)
+
         for passed_object in self.object_list:
+            if render_cache:
+                type_instance = render_cache.get_object_type(passed_object.type_id)
+            else:
+                type_instance = self.objects_manager.get_object_type(passed_object.type_id)
+
             tmp_render = CmdbRender(
-                type_instance=self.objects_manager.get_object_type(passed_object.type_id),
+                type_instance=type_instance,
                 object_instance=passed_object,
                 render_user=self.request_user,
                 ref_render=self.ref_render,
-                objects_manager=self.objects_manager)
+                objects_manager=self.objects_manager,
+                render_cache=render_cache)
 
             if raw:
                 current_render_result = tmp_render.result().__dict__
@@ -23,6 +23,9 @@
 
 from cmdb.manager.categories_manager import CategoriesManager
 
+from cmdb.database.counter import PublicIDBlock
+from cmdb.framework import TypeModel
+
 from .profile_name import ProfileName
 from .profile_user_management import UserManagementProfile
 from .profile_location import LocationProfile
@@ -72,35 +75,38 @@ def create_profiles(self, profile_list):
             'wireless_access_point_id': None,
         }
 
+        # reserve the public_ids for the largest possible number of new types at once
+        public_ids = PublicIDBlock(current_app.database_manager, TypeModel.COLLECTION, len(created_type_ids))
+
         try:
             # create all types from user management profile
             if ProfileName.USER_MANAGEMENT in profile_list:
-                cur_profile = UserManagementProfile(created_type_ids)
+                cur_profile = UserManagementProfile(created_type_ids, public_ids)
                 created_type_ids = cur_profile.create_user_management_profile()
 
             # create all types from location profile
             if ProfileName.LOCATION in profile_list:
-                cur_profile = LocationProfile(created_type_ids)
+                cur_profile = LocationProfile(created_type_ids, public_ids)
                 created_type_ids = cur_profile.create_location_profile()
 
             # create all types from ipam profile
             if ProfileName.IPAM in profile_list:
-                cur_profile = IPAMProfile(created_type_ids)
+                cur_profile = IPAMProfile(created_type_ids, public_ids)
                 created_type_ids = cur_profile.create_ipam_profile()
 
             # create all types from client management profile
             if ProfileName.CLIENT_MANAGEMENT in profile_list:
-                cur_profile = ClientManagementProfile(created_type_ids)
+                cur_profile = ClientManagementProfile(created_type_ids, public_ids)
                 created_type_ids = cur_profile.create_client_management_profile()
 
             # create all types from server management profile
             if ProfileName.SERVER_MANAGEMENT in profile_list:
-                cur_profile = ServerManagementProfile(created_type_ids)
+                cur_profile = ServerManagementProfile(created_type_ids, public_ids)
                 created_type_ids = cur_profile.create_server_management_profile()
 
             # create all types from network infrastructure profile
             if ProfileName.NETWORK_INFRASTRUCTURE in profile_list:
-                cur_profile = NetworkInfrastructureProfile(created_type_ids)
+                cur_profile = NetworkInfrastructureProfile(created_type_ids, public_ids)
                 created_type_ids = cur_profile.create_network_infrastructure_profile()
 
 
@@ -108,6 +114,8 @@ def create_profiles(self, profile_list):
 
         except Exception as err:
             LOGGER.info("Assitant Error: %s",err)
+        finally:
+            public_ids.release()
 
         created_ids = []
 
@@ -21,6 +21,8 @@
 
 from cmdb.manager.type_manager import TypeManager
 
+from cmdb.database.counter import PublicIDBlock
+
 from cmdb.framework import TypeModel
 from .profile_type_constructor import ProfileTypeConstructor
 # -------------------------------------------------------------------------------------------------------------------- #
@@ -34,9 +36,15 @@ class ProfileBase:
     """
     This class cointains all functions required by the different profiles
     """
-    def __init__(self, created_type_ids: dict):
+    def __init__(self, created_type_ids: dict, public_ids: PublicIDBlock = None):
+        """
+        Args:
+            created_type_ids (dict): public_ids of the already created types
+            public_ids (PublicIDBlock, optional): Reserved public_ids for the new types
+        """
         self.type_dict: dict = {}
         self.created_type_ids: dict = created_type_ids
+        self.public_ids: PublicIDBlock = public_ids
 
         self.type_collection = TypeModel.COLLECTION
 
@@ -65,7 +73,11 @@ def create_basic_type(self, type_name_key: str, type_dict: dict):
             type_name_id (str): Key which should be used for the id of this type, like 'user_type_id'
             type_dict (dict): all the required data to create the type except the public_id
         """
-        type_dict['public_id'] = self.type_manager.get_new_id()
+        if self.public_ids:
+            type_dict['public_id'] = self.public_ids.next_id()
+        else:
+            type_dict['public_id'] = self.type_manager.get_new_id()
+
         new_type_id: int = self.type_manager.insert(type_dict)
 
         self.created_type_ids[type_name_key] = new_type_id
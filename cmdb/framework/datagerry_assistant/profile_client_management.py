@@ -18,6 +18,8 @@
 """
 import logging
 
+from cmdb.database.counter import PublicIDBlock
+
 from .profile_base import ProfileBase
 # -------------------------------------------------------------------------------------------------------------------- #
 
@@ -29,9 +31,9 @@ class ClientManagementProfile(ProfileBase):
     This class cointains all types and logics for the 'Client Management'-Profile
     """
 
-    def __init__(self, created_type_ids: dict):
+    def __init__(self, created_type_ids: dict, public_ids: PublicIDBlock = None):
         self.created_type_ids = created_type_ids
-        super().__init__(created_type_ids)
+        super().__init__(created_type_ids, public_ids)
 
 
     def create_client_management_profile(self) -> dict:
@@ -18,6 +18,8 @@
 """
 import logging
 
+from cmdb.database.counter import PublicIDBlock
+
 from .profile_base import ProfileBase
 # -------------------------------------------------------------------------------------------------------------------- #
 
@@ -28,9 +30,9 @@ class NetworkInfrastructureProfile(ProfileBase):
     """
     This class cointains all types and logics for the 'Network Infrastructure'-Profile
     """
-    def __init__(self, created_type_ids: dict):
+    def __init__(self, created_type_ids: dict, public_ids: PublicIDBlock = None):
         self.created_type_ids = created_type_ids
-        super().__init__(created_type_ids)
+        super().__init__(created_type_ids, public_ids)
 
 
     def create_network_infrastructure_profile(self) -> dict:
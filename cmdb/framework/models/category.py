@@ -208,14 +208,19 @@ class CategoryNode:
         """Class of a category node inside the category tree"""
 
         def __init__(self, category: CategoryModel, children: list["CategoryTree.CategoryNode"] = None,
-                     types: list[TypeModel] = None):
+                     types: dict[int, TypeModel] = None):
+            """
+            Args:
+                category (CategoryModel): Category of the node
+                children (list[CategoryNode], optional): Nodes of the child categories
+                types (dict[int, TypeModel], optional): All possible types by their public_id
+            """
             self.category: CategoryModel = category
             self.node_order: int = self.category.get_meta().get_order()
             self.children: list["CategoryTree.CategoryNode"] = sorted(children or [], key=lambda node: (
                                                              node.get_order() is None, node.get_order()))
             # prevent wrong type order
-            self.types: list[TypeModel] = [type_ for id_ in self.category.types for type_ in types if
-                                           id_ == type_.public_id]
+            self.types: list[TypeModel] = [types[id_] for id_ in self.category.types if id_ in (types or {})]
 
 
         @classmethod
@@ -279,17 +284,24 @@ def tree(self) -> list[CategoryNode]:
 
 
     @classmethod
-    def __create_tree(cls, categories, parent: int = None, types: list[TypeModel] = None) -> list[CategoryNode]:
+    def __create_tree(cls, categories, types: list[TypeModel] = None) -> list[CategoryNode]:
         """
-        Generate the category tree from list structure
+        Generate the category tree from list structure with one pass over the categories and types
         Args:
             categories: list of root/child categories
-            parent: the parent id of the current subset, None if root list
             types: list of all possible types
         """
-        return [category for category in [CategoryTree.CategoryNode(category, CategoryTree.__create_tree(
-            categories, category.get_public_id(), types), types) for category in categories if
-                                          category.get_parent() == parent]]
+        type_index: dict[int, TypeModel] = {type_.public_id: type_ for type_ in types or []}
+        children_index: dict[int, list[CategoryModel]] = {}
+
+        for category in categories:
+            children_index.setdefault(category.get_parent(), []).append(category)
+
+        def create_nodes(parent: int) -> list[CategoryTree.CategoryNode]:
+            return [CategoryTree.CategoryNode(category, create_nodes(category.get_public_id()), type_index)
+                    for category in children_index.get(parent, [])]
+
+        return create_nodes(None)
 
 
     @classmethod
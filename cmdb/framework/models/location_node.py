@@ -35,31 +35,28 @@ def __init__(self, params: dict):
         self.children: list[LocationNode] = []
 
 
-    def get_children(self, public_id:int, locations_list: list[dict]):
+    @classmethod
+    def build_tree(cls, locations_list: list[dict], root_id: int = 1) -> list["LocationNode"]:
         """
-        Gets recursively all children for a location
+        Builds the location tree with one pass over the locations
 
         Args:
-            public_id (int): public:id of the location
             locations_list (list): list of locations from database
+            root_id (int): public_id of the location whose children are the roots of the tree
 
         Returns:
-            list[LocationNode]: returns all children for the given public_id
+            list[LocationNode]: the root nodes with their children, in the order of `locations_list`
         """
-        sorted_children: list["LocationNode"] = []
-        filtered_list: list[dict] = []
-
-        if len(locations_list) > 0:
-            for location in locations_list:
-                if location['parent'] == public_id:
-                    sorted_children.append(LocationNode(location))
-                else:
-                    filtered_list.append(location)
-
-            if len(filtered_list) > 0:
-                for child in sorted_children:
-                    child.children = self.get_children(child.get_public_id(), filtered_list)
-        return sorted_children
+        nodes: dict[int, LocationNode] = {location['public_id']: cls(location) for location in locations_list}
+        root_nodes: list[LocationNode] = []
+
+        for node in nodes.values():
+            if node.parent == root_id:
+                root_nodes.append(node)
+            elif node.parent in nodes:
+                nodes[node.parent].children.append(node)
+
+        return root_nodes
 
 
     def get_public_id(self):
@@ -39,6 +39,11 @@ class CmdbMetaLog(CmdbDAO):
     COLLECTION: Collection = 'framework.logs'
     MODEL: Model = 'CmdbLog'
 
+    INDEX_KEYS = [
+        {'keys': [('object_id', CmdbDAO.DAO_ASCENDING), ('log_time', CmdbDAO.DAO_DESCENDING)],
+         'name': 'object_id_log_time', 'unique': False}
+    ]
+
     def __init__(self, public_id, log_type, log_time: datetime, action: LogAction, action_name: str):
         self.log_type = log_type
         self.log_time: datetime = log_time
@@ -17,6 +17,8 @@
 from typing import TypeVar, Generic, Union, Type
 
 from cmdb.framework import CmdbDAO
+from cmdb.manager.query_builder.builder_parameters import BuilderParameters
+from cmdb.manager.query_builder.page_cursor import PageCursor
 # -------------------------------------------------------------------------------------------------------------------- #
 
 C = TypeVar('C', bound=CmdbDAO)
@@ -35,6 +37,44 @@ def __init__(self, results: list[Union[C, dict]], total: int):
         self.results = results
         self.count = len(self.results)
         self.total = total
+        self.next_cursor: str = None
+        self.prev_cursor: str = None
+
+
+    def apply_cursor(self, builder_params: BuilderParameters):
+        """
+        Cuts the raw results of a cursor mode query to the page and sets the tokens of the neighbour pages
+
+        Args:
+            builder_params (BuilderParameters): Parameters of the query, nothing is done if not in cursor mode
+        """
+        if not builder_params.is_cursor_mode():
+            return
+
+        cursor = builder_params.get_cursor()
+        direction = cursor.direction if cursor else PageCursor.NEXT
+        limit = builder_params.get_limit()
+        has_more = 0 < limit < len(self.results)
+
+        if has_more:
+            self.results = self.results[:limit]
+
+        # documents before the cursor were read backwards
+        if direction == PageCursor.PREV:
+            self.results.reverse()
+
+        self.count = len(self.results)
+
+        if not self.results:
+            return
+
+        sort, order = builder_params.get_sort(), builder_params.get_order()
+
+        if has_more or direction == PageCursor.PREV:
+            self.next_cursor = PageCursor.from_document(self.results[-1], sort, order, PageCursor.NEXT).encode()
+
+        if cursor and (has_more or direction == PageCursor.NEXT):
+            self.prev_cursor = PageCursor.from_document(self.results[0], sort, order, PageCursor.PREV).encode()
 
 
     def convert_to(self, c: Type[C]):
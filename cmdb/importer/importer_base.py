@@ -14,11 +14,21 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 """Module of basic importers"""
+import json
 from datetime import datetime, timezone
+import time
 import logging
-from typing import Optional
+from typing import Iterable, Iterator, Optional
+from itertools import islice
 
 from cmdb.manager.objects_manager import ObjectsManager
+from cmdb.manager.logs_manager import LogsManager
+
+from cmdb.database.counter import PublicIDBlock
+from cmdb.framework import CmdbObject, TypeModel
+from cmdb.framework.cmdb_render import RenderList
+from cmdb.framework.models.log import LogAction, CmdbObjectLog
+from cmdb.database.utils import default
 
 from cmdb.importer.importer_config import ObjectImporterConfig, BaseImporterConfig
 from cmdb.importer.importer_response import BaseImporterResponse,\
@@ -26,12 +36,15 @@
                                             ImportFailedMessage,\
                                             ImportSuccessMessage
 from cmdb.importer.parser_base import BaseObjectParser
-from cmdb.importer.parser_response import ObjectParserResponse
 from cmdb.user_management.models.user import UserModel
-
-from cmdb.errors.manager.object_manager import ObjectManagerDeleteError,\
-                                               ObjectManagerInsertError,\
-                                               ObjectManagerGetError
+from cmdb.security.acl.helpers import verify_access
+from cmdb.security.acl.permission import AccessControlPermission
+
+from cmdb.errors.manager.object_manager import ObjectManagerInsertError, ObjectManagerGetError
+from cmdb.errors.importer import ImportRuntimeError
+from cmdb.errors.manager import ManagerInsertError
+from cmdb.errors.render import InstanceRenderError
+from cmdb.errors.security import AccessDeniedError
 # -------------------------------------------------------------------------------------------------------------------- #
 
 LOGGER = logging.getLogger(__name__)
@@ -81,13 +94,16 @@ def start_import(self) -> BaseImporterResponse:
 class ObjectImporter(BaseImporter):
     """Superclass for object importers"""
 
+    BATCH_SIZE: int = 1000
+
     def __init__(self,
                  file,
                  file_type,
                  config: ObjectImporterConfig = None,
                  parser: BaseObjectParser = None,
                  objects_manager: ObjectsManager = None,
-                 request_user: UserModel = None):
+                 request_user: UserModel = None,
+                 logs_manager: LogsManager = None):
         """
         Basic importer super class for object imports
         Normally should be started by start_import
@@ -97,23 +113,43 @@ def __init__(self,
             config: importer configuration
             parser: the parser instance based on content-type
             request_user: the instance of the started user
+            logs_manager (optional): writes the create logs of the imported objects batch by batch
         """
         self.parser = parser
         self.objects_manager = objects_manager
         self.request_user = request_user
+        self.logs_manager = logs_manager
 
         super().__init__(file=file, file_type=file_type, config=config)
 
 
-    def _generate_objects(self, parsed: ObjectParserResponse, *args, **kwargs) -> list:
-        """Generate a list of all data from the parser.
+    def _iterate_entries(self) -> Iterator[dict]:
+        """Streams the entries of the file from the parser
+        Only the entries between `start_element` and `max_elements` of the config are generated"""
+        run_config = self.get_config()
+        stop = run_config.max_elements if run_config.max_elements > 0 else None
+
+        return self.parser.iterate_entries(self.file, run_config.start_element, stop)
+
+
+    def _generate_objects(self, entries: Iterable[dict], *args, **kwargs) -> Iterator[list[dict]]:
+        """Generate the objects of the entries in batches of `BATCH_SIZE`.
         The implementation of the object generation should be written in the sub class"""
-        object_instance_list: list[dict] = []
+        entries = iter(entries)
 
-        for entry in parsed.entries:
-            object_instance_list.append(self.generate_object(entry, *args, **kwargs))
+        while True:
+            batch_entries: list[dict] = list(islice(entries, self.BATCH_SIZE))
 
-        return object_instance_list
+            if not batch_entries:
+                return
+
+            self._prepare_batch(batch_entries)
+
+            yield [self.generate_object(entry, *args, **kwargs) for entry in batch_entries]
+
+
+    def _prepare_batch(self, batch_entries: list[dict]):
+        """Hook which is called with the entries of a batch before their objects are generated"""
 
 
     def generate_object(self, entry, *args, **kwargs) -> dict:
@@ -122,22 +158,88 @@ def generate_object(self, entry, *args, **kwargs) -> dict:
         raise NotImplementedError
 
 
-    def _import(self, import_objects: list) -> ImporterObjectResponse:
+    def _import(self, import_batches: Iterable[list[dict]]) -> ImporterObjectResponse:
         """Basic import wrapper - starting the import process
+        The type and the ACL are validated once, afterwards every batch is written with a single bulk write
+        Args:
+            import_batches: batches of the objects for import - output of _generate_objects()
+        """
+        start_time = time.perf_counter()
+
+        success_count = 0
+        failed_imports: list[ImportFailedMessage] = []
+
+        try:
+            object_type = self.objects_manager.get_object_type(self.get_config().get_type_id())
+        except ObjectManagerGetError as err:
+            raise ImportRuntimeError(f"Type of the import could not be loaded: {err}") from err
+
+        if not object_type.active:
+            raise AccessDeniedError(f'Objects cannot be created because type `{object_type.name}` is deactivated.')
+
+        verify_access(object_type, self.request_user, AccessControlPermission.CREATE)
+
+        processed_rows = 0
+
+        for batch_rows in import_batches:
+            processed_rows += len(batch_rows)
+
+            # reserve the public_ids of all new objects of the batch with a single counter update
+            new_objects_count = sum(1 for import_object in batch_rows if not import_object.get('public_id'))
+
+            with PublicIDBlock(self.objects_manager.dbm, CmdbObject.COLLECTION, new_objects_count) as public_ids:
+                batch_success, batch_failed = self._import_batch(batch_rows, object_type.public_id, public_ids)
+
+            self._log_batch(batch_success, object_type)
+
+            success_count += len(batch_success)
+            failed_imports.extend(batch_failed)
+
+        duration = time.perf_counter() - start_time
+        rows_per_second = round(processed_rows / duration, 2) if duration > 0 else None
+
+        LOGGER.info("[ObjectImporter] Imported %s of %s objects (%s rows/s)",
+                    success_count, processed_rows, rows_per_second)
+
+        return ImporterObjectResponse(
+            message=f'Import of {success_count} objects',
+            success_count=success_count,
+            failed_imports=failed_imports,
+            duration=round(duration, 3),
+            rows_per_second=rows_per_second
+        )
+
+
+    def _import_batch(self, batch_rows: list[dict], type_id: int, public_ids: PublicIDBlock) \
+            -> tuple[list[ImportSuccessMessage], list[ImportFailedMessage]]:
+        """Writes a batch of objects with a single bulk write
         Args:
-            import_objects: list of all objects for import - or output of _generate_objects()
+            batch_rows: objects of the batch
+            type_id: public_id of the validated type
+            public_ids: reserved public_ids for new objects
+        Returns:
+            tuple: success and failed messages of the batch
         """
         run_config = self.get_config()
 
         success_imports: list[ImportSuccessMessage] = []
         failed_imports: list[ImportFailedMessage] = []
 
-        current_import_index = run_config.start_element
-        importer_counter = 0
-        import_objects_length: int = len(import_objects)
+        # existing objects are only looked up once per batch
+        given_public_ids = [row.get('public_id') for row in batch_rows if row.get('public_id')]
+        existing_objects: dict[int, dict] = {}
+
+        if given_public_ids and run_config.overwrite_public:
+            existing_objects = {existing['public_id']: existing for existing in self.objects_manager.get(
+                                                                    {'public_id': {'$in': given_public_ids}},
+                                                                    projection={'_id': 0,
+                                                                                'public_id': 1,
+                                                                                'creation_time': 1})}
 
-        while current_import_index < import_objects_length:
-            current_import_object: dict = import_objects[current_import_index]
+        batch_rows_to_write: list[dict] = []
+        batch_objects: list[dict] = []
+
+        for current_import_object in batch_rows:
             current_public_id: int = current_import_object.get('public_id')
 
             # Object has PublicID and can not overwrite
@@ -145,59 +247,76 @@ def _import(self, import_objects: list) -> ImporterObjectResponse:
                 failed_imports.append(ImportFailedMessage(
                     error_message='Object import for object - has PublicID but not overwrite setting',
                     obj=current_import_object))
-                current_import_index += 1
+                continue
+
+            if current_import_object.get('type_id') != type_id:
+                failed_imports.append(ImportFailedMessage(
+                    error_message=f'Object import for object - type_id is not {type_id}',
+                    obj=current_import_object))
                 continue
 
             # Object has no PublicID <- assign new
             if not current_public_id:
-                current_public_id = self.objects_manager.get_new_object_public_id()
+                current_public_id = public_ids.next_id()
                 current_import_object.update({'public_id': current_public_id})
-            # else assign given PublicID
-            else:
-                current_public_id = current_import_object.get('public_id')
+            # Object exists <- keep its creation time
+            elif current_public_id in existing_objects:
+                current_import_object['creation_time'] = existing_objects[current_public_id].get('creation_time')
+                current_import_object['last_edit_time'] = datetime.now(timezone.utc)
 
-            # Insert data
             try:
-                existing = self.objects_manager.get_object(current_public_id)
-                current_import_object['creation_time'] = existing.creation_time
-                current_import_object['last_edit_time'] = datetime.now(timezone.utc)
-            except ObjectManagerGetError:
-                try:
-                    self.objects_manager.insert_object(current_import_object)
-                except ObjectManagerInsertError as err:
-                    failed_imports.append(ImportFailedMessage(error_message=err.message, obj=current_import_object))
-                    current_import_index += 1
-                    continue
-                else:
-                    success_imports.append(ImportSuccessMessage(public_id=current_public_id, obj=current_import_object))
+                batch_objects.append(CmdbObject(**current_import_object).__dict__)
+            except Exception as err:
+                failed_imports.append(ImportFailedMessage(error_message=str(err), obj=current_import_object))
+                continue
+
+            batch_rows_to_write.append(current_import_object)
+
+        try:
+            failed_writes = self.objects_manager.insert_many_objects(batch_objects, set(existing_objects))
+        except ObjectManagerInsertError as err:
+            failed_writes = {index: err.message for index in range(len(batch_objects))}
+
+        for index, current_import_object in enumerate(batch_rows_to_write):
+            if index in failed_writes:
+                failed_imports.append(ImportFailedMessage(error_message=failed_writes[index],
+                                                          obj=current_import_object))
             else:
-                try:
-                    self.objects_manager.delete_object(current_public_id, self.request_user)
-                except ObjectManagerDeleteError as err:
-                    failed_imports.append(ImportFailedMessage(error_message=err.message, obj=current_import_object))
-                    current_import_index += 1
-                    continue
-                else:
-                    try:
-                        self.objects_manager.insert_object(current_import_object)
-                    except ObjectManagerInsertError as err:
-                        failed_imports.append(ImportFailedMessage(error_message=err.message, obj=current_import_object))
-                        current_import_index += 1
-                        continue
-                    else:
-                        success_imports.append(
-                            ImportSuccessMessage(public_id=current_public_id, obj=current_import_object))
-
-            # check if still import valid
-            current_import_index += 1
-            if run_config.max_elements > 0 and (current_import_index >= run_config.max_elements):
-                break
+                success_imports.append(ImportSuccessMessage(public_id=current_import_object['public_id'],
+                                                            obj=current_import_object))
 
-        return ImporterObjectResponse(
-            message=f'Import of {importer_counter} objects',
-            success_imports=success_imports,
-            failed_imports=failed_imports
-        )
+        return success_imports, failed_imports
+
+
+    def _log_batch(self, batch_success: list[ImportSuccessMessage], object_type: TypeModel):
+        """Writes the create logs of the imported objects of a batch with a single write
+        Args:
+            batch_success: messages of the imported objects of the batch
+            object_type: type of the imported objects
+        """
+        if not self.logs_manager or not batch_success:
+            return
+
+        try:
+            imported_objects = [CmdbObject(**message.obj) for message in batch_success]
+            render_results = RenderList(imported_objects, self.request_user, objects_manager=self.objects_manager,
+                                        batch=True).render_result_list()
+
+            self.logs_manager.insert_logs(LogAction.CREATE, CmdbObjectLog.__name__, [
+                {
+                    'object_id': imported_object.public_id,
+                    'user_id': self.request_user.get_public_id(),
+                    'user_name': self.request_user.get_display_name(),
+                    'comment': 'Object was imported',
+                    'render_state': json.dumps(render_result, default=default).encode('UTF-8'),
+                    'version': imported_object.version
+                }
+                for imported_object, render_result in zip(imported_objects, render_results)
+            ])
+        except (InstanceRenderError, ManagerInsertError) as err:
+            #TODO: ERROR-FIX
+            LOGGER.error("[ObjectImporter] Logs of %s imported %s objects could not be written: %s",
+                         len(batch_success), object_type.name, err.message)
 
 
     def start_import(self) -> ImporterObjectResponse:
@@ -18,19 +18,18 @@
 from datetime import datetime, timezone
 
 from cmdb.manager.objects_manager import ObjectsManager
+from cmdb.manager.logs_manager import LogsManager
 
-from cmdb.framework import CmdbObject
 from cmdb.importer import JsonObjectParser
 from cmdb.importer.content_types import JSONContent, CSVContent, XLSXContent
 from cmdb.importer.importer_base import ObjectImporter
 from cmdb.importer.importer_config import ObjectImporterConfig
 from cmdb.importer.importer_response import ImporterObjectResponse
 from cmdb.importer.mapper import Mapping, MapEntry
-from cmdb.importer.parser_object import JsonObjectParserResponse, CsvObjectParserResponse, ExcelObjectParserResponse
 from cmdb.importer.improve_object import ImproveObject
+from cmdb.importer.reference_resolver import ImportReferenceResolver
 from cmdb.user_management.models.user import UserModel
 
-from cmdb.errors.manager.object_manager import ObjectManagerGetError
 from cmdb.errors.importer import ImportRuntimeError, ParserRuntimeError
 # -------------------------------------------------------------------------------------------------------------------- #
 
@@ -81,14 +80,16 @@ def __init__(self,
                  config: JsonObjectImporterConfig = None,
                  parser: JsonObjectParser = None,
                  objects_manager: ObjectsManager = None,
-                 request_user: UserModel = None):
+                 request_user: UserModel = None,
+                 logs_manager: LogsManager = None):
         super().__init__(
             file=file,
             file_type=self.FILE_TYPE,
             config=config,
             parser=parser,
             objects_manager=objects_manager,
-            request_user=request_user
+            request_user=request_user,
+            logs_manager=logs_manager
         )
 
 
@@ -140,11 +141,13 @@ def _map_element(self, prop, entry: dict, working: dict):
 
     def start_import(self) -> ImporterObjectResponse:
         """TODO: document"""
-        parsed_response: JsonObjectParserResponse = self.parser.parse(self.file)
         type_instance_fields: list = self.objects_manager.get_object_type(self.config.get_type_id()).get_fields()
 
-        import_objects: list[dict] = self._generate_objects(parsed_response, fields=type_instance_fields)
-        import_result: ImporterObjectResponse = self._import(import_objects)
+        try:
+            import_batches = self._generate_objects(self._iterate_entries(), fields=type_instance_fields)
+            import_result: ImporterObjectResponse = self._import(import_batches)
+        except ParserRuntimeError as err:
+            raise ImportRuntimeError(f"{err.message}") from err
 
         return import_result
 
@@ -168,15 +171,18 @@ def __init__(self,
                  config: CsvObjectImporterConfig = None,
                  parser: JsonObjectParser = None,
                  objects_manager: ObjectsManager = None,
-                 request_user: UserModel = None):
+                 request_user: UserModel = None,
+                 logs_manager: LogsManager = None):
         super().__init__(
                     file=file,
                     file_type=self.FILE_TYPE,
                     config=config,
                     parser=parser,
                     objects_manager=objects_manager,
-                    request_user=request_user
+                    request_user=request_user,
+                    logs_manager=logs_manager
                 )
+        self.reference_resolver: ImportReferenceResolver = None
 
 
     def generate_object(self, entry: dict, *args, **kwargs) -> dict:
@@ -216,54 +222,58 @@ def generate_object(self, entry: dict, *args, **kwargs) -> dict:
                      'value': entry.get(entry_field.get_value())
                      })
 
+        if not self.reference_resolver:
+            self.reference_resolver = ImportReferenceResolver(self.objects_manager)
+
         for foreign_entry in foreign_entries:
             LOGGER.debug('[CSV] search for object based on %s', foreign_entry.__dict__)
             try:
                 working_type_id = foreign_entry.get_option()['type_id']
+                ref_name = foreign_entry.get_option()['ref_name']
             except (KeyError, IndexError):
                 continue
 
             try:
-                query: dict = {
-                    'type_id': working_type_id,
-                    'fields': {
-                        '$elemMatch': {
-                            '$and': [
-                                {'name': foreign_entry.get_option()['ref_name']},
-                                {'value': entry.get(foreign_entry.get_value())},
-                            ]
-                        }
-                    }
-                }
-                LOGGER.debug('[CSV] Ref query: %s', query)
-                founded_objects: list[CmdbObject] = self.objects_manager.get_objects_by(**query)
-                LOGGER.debug(founded_objects)
-
-                if len(founded_objects) != 1:
+                reference_id = self.reference_resolver.get_reference(working_type_id,
+                                                                     ref_name,
+                                                                     entry.get(foreign_entry.get_value()))
+
+                if reference_id is None:
                     continue
 
                 working_object['fields'].append(
                     {'name': foreign_entry.get_name(),
-                        'value': founded_objects[0].get_public_id()
+                        'value': reference_id
                 })
 
-            except (ObjectManagerGetError, Exception) as err:
-                LOGGER.error('[CSV] Error while loading ref object %s', err.message)
+            except Exception as err:
+                LOGGER.error('[CSV] Error while loading ref object %s', getattr(err, 'message', err))
                 continue
 
         return working_object
 
 
-    def start_import(self) -> ImporterObjectResponse:
+    def _prepare_batch(self, batch_entries: list[dict]):
+        """Resolves all foreign keys of the batch before its objects are generated"""
+        self.reference_resolver = ImportReferenceResolver(self.objects_manager)
         try:
-            parsed_response: CsvObjectParserResponse = self.parser.parse(self.file)
-        except ParserRuntimeError as err:
-            raise ImportRuntimeError(f"{err.message}") from err
+            self.reference_resolver.prefetch(
+                self.get_config().get_mapping().get_entries_with_option(query={'type': 'ref'}),
+                batch_entries
+            )
+        except Exception as err:
+            #TODO: ERROR-FIX
+            LOGGER.error('[CSV] Error while loading ref objects %s', getattr(err, 'message', err))
+
 
+    def start_import(self) -> ImporterObjectResponse:
         type_instance_fields: list[dict] = self.objects_manager.get_object_type(self.config.get_type_id()).get_fields()
 
-        import_objects: list[dict] = self._generate_objects(parsed_response, fields=type_instance_fields)
-        import_result: ImporterObjectResponse = self._import(import_objects)
+        try:
+            import_batches = self._generate_objects(self._iterate_entries(), fields=type_instance_fields)
+            import_result: ImporterObjectResponse = self._import(import_batches)
+        except ParserRuntimeError as err:
+            raise ImportRuntimeError(f"{err.message}") from err
 
         return import_result
 
@@ -286,14 +296,16 @@ def __init__(self,
                  config: ExcelObjectImporterConfig = None,
                  parser: JsonObjectParser = None,
                  objects_manager: ObjectsManager = None,
-                 request_user: UserModel = None):
+                 request_user: UserModel = None,
+                 logs_manager: LogsManager = None):
         super().__init__(
                     file=file,
                     file_type=self.FILE_TYPE,
                     config=config,
                     parser=parser,
                     objects_manager=objects_manager,
-                    request_user=request_user
+                    request_user=request_user,
+                    logs_manager=logs_manager
                 )
 
 
@@ -301,7 +313,7 @@ def generate_object(self, entry: dict, *args, **kwargs) -> dict:
         try:
             possible_fields: list[dict] = kwargs['fields']
         except (KeyError, IndexError, ValueError) as err:
-            raise ImportRuntimeError(f"[CsvObjectImporter] cant import objects: {str(err)}") from err
+            raise ImportRuntimeError(f"[ExcelObjectImporter] cant import objects: {str(err)}") from err
 
         working_object: dict = {
             'active': True,
@@ -327,7 +339,7 @@ def generate_object(self, entry: dict, *args, **kwargs) -> dict:
 
         # Validate insert fields
         for field_entry in field_entries:
-            if field_entry.get_name() not in possible_fields:
+            if not next((item for item in possible_fields if item["name"] == field_entry.get_name()), None):
                 continue
             working_object['fields'].append(
                 {'name': field_entry.get_name(),
@@ -338,11 +350,12 @@ def generate_object(self, entry: dict, *args, **kwargs) -> dict:
 
 
     def start_import(self) -> ImporterObjectResponse:
+        type_instance_fields: list[dict] = self.objects_manager.get_object_type(self.config.get_type_id()).get_fields()
+
         try:
-            parsed_response: ExcelObjectParserResponse = self.parser.parse(self.file)
+            import_batches = self._generate_objects(self._iterate_entries(), fields=type_instance_fields)
+            import_result: ImporterObjectResponse = self._import(import_batches)
         except ParserRuntimeError as err:
             raise ImportRuntimeError(f"{err.message}") from err
 
-        LOGGER.debug(parsed_response)
-
-        return ImporterObjectResponse('Nope')
+        return import_result
@@ -26,9 +26,26 @@ def __init__(self, message: str):
 class ImporterObjectResponse(BaseImporterResponse):
     """Response of an bulk object import"""
 
-    def __init__(self, message: str, success_imports: list = None, failed_imports: list = None):
-        self.success_imports: list[ImportSuccessMessage] = success_imports or []
+    def __init__(self,
+                 message: str,
+                 success_count: int = 0,
+                 failed_imports: list = None,
+                 duration: float = None,
+                 rows_per_second: float = None):
+        """Init response
+        Only the failed rows are returned, the imported objects are counted
+        Args:
+            message: summary of the import
+            success_count: number of the imported objects
+            failed_imports: messages of the objects which could not be imported
+            duration (optional): runtime of the import in seconds
+            rows_per_second (optional): number of processed rows per second
+        """
+        self.success_count: int = success_count
         self.failed_imports: list[ImportFailedMessage] = failed_imports or []
+        self.failed_count: int = len(self.failed_imports)
+        self.duration: float = duration
+        self.rows_per_second: float = rows_per_second
         super().__init__(message=message)
 
 
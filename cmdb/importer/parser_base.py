@@ -15,6 +15,8 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 """TODO: document"""
 import logging
+from typing import Iterator
+from itertools import islice
 
 from cmdb.importer.parser_response import ParserResponse, ObjectParserResponse
 # -------------------------------------------------------------------------------------------------------------------- #
@@ -58,6 +60,19 @@ def parse(self, file) -> ObjectParserResponse:
         raise NotImplementedError
 
 
+    def iterate_entries(self, file, start: int = 0, stop: int = None) -> Iterator[dict]:
+        """
+        Yields the parsed entries of a file one by one
+        Parsers which can read their format incrementally should override this, the default parses the whole file
+
+        Args:
+            file: path of the file
+            start (int): index of the first entry
+            stop (int, optional): index after the last entry, None for all entries
+        """
+        yield from islice(self.parse(file).entries, start, stop)
+
+
 class BaseTypeParser(BaseParser):
     """TODO: document"""
 
@@ -17,6 +17,8 @@
 import csv
 import json
 import logging
+from typing import Iterator
+from itertools import islice
 from openpyxl.worksheet.worksheet import Worksheet
 
 from cmdb.utils.cast import auto_cast
@@ -47,6 +49,8 @@ class JsonObjectParser(BaseObjectParser, JSONContent):
         'encoding': 'UTF-8'
     }
 
+    CHUNK_SIZE = 64 * 1024
+
     def __init__(self, parser_config: dict = None):
         super().__init__(parser_config)
 
@@ -58,6 +62,88 @@ def parse(self, file) -> (dict, list, JsonObjectParserResponse):
         return JsonObjectParserResponse(count=len(parsed), entries=parsed)
 
 
+    def iterate_entries(self, file, start: int = 0, stop: int = None) -> Iterator[dict]:
+        """
+        Yields the elements of the top level list of a JSON file without loading the whole file
+
+        Args:
+            file: path of the file
+            start (int): index of the first entry
+            stop (int, optional): index after the last entry, None for all entries
+
+        Raises:
+            ParserRuntimeError: If the file is not a valid JSON list
+        """
+        run_config = self.get_config()
+
+        try:
+            with open(file, 'r', encoding=run_config.get('encoding')) as json_file:
+                yield from islice(self.__iterate_list(json_file), start, stop)
+        except (ValueError, OSError) as err:
+            LOGGER.error(str(err))
+            raise ParserRuntimeError(f"[{self.__class__.__name__}]: An error occured: {str(err)}") from err
+
+
+    def __iterate_list(self, json_file) -> Iterator:
+        """Decodes the elements of the top level list chunk by chunk"""
+        decoder = json.JSONDecoder()
+        buffer = ''
+        list_started = False
+        end_of_file = False
+
+        while not end_of_file:
+            chunk = json_file.read(self.CHUNK_SIZE)
+            end_of_file = not chunk
+            buffer += chunk
+            position = 0
+
+            while True:
+                position = self.__skip_separators(buffer, position, list_started)
+
+                if position >= len(buffer):
+                    break
+
+                if not list_started:
+                    if buffer[position] != '[':
+                        raise ValueError('The file does not contain a list of objects')
+                    list_started = True
+                    position += 1
+                    continue
+
+                if buffer[position] == ']':
+                    return
+
+                try:
+                    element, element_end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if end_of_file:
+                        raise
+                    # the element is not completely read yet
+                    break
+
+                # numbers at the end of the buffer could continue in the next chunk
+                if element_end == len(buffer) and not end_of_file:
+                    break
+
+                yield element
+                position = element_end
+
+            buffer = buffer[position:]
+
+        raise ValueError('Unexpected end of the file')
+
+
+    @staticmethod
+    def __skip_separators(buffer: str, position: int, list_started: bool) -> int:
+        """Returns the position of the next character which is not whitespace (or a comma inside the list)"""
+        separators = ' \t\r\n,' if list_started else ' \t\r\n\ufeff'
+
+        while position < len(buffer) and buffer[position] in separators:
+            position += 1
+
+        return position
+
+
 class CsvObjectParserResponse(ObjectParserResponse):
     """TODO: document"""
 
@@ -117,11 +203,7 @@ def parse(self, file) -> CsvObjectParserResponse:
         }
         try:
             with open(f'{file}', 'r', encoding='utf-8', newline=run_config.get('newline')) as csv_file:
-                csv_reader = csv.reader(csv_file,
-                                        delimiter=run_config.get('delimiter'),
-                                        quotechar=run_config.get('quoteChar'),
-                                        escapechar=run_config.get('escapeChar'),
-                                        skipinitialspace=True)
+                csv_reader = self.__get_reader(csv_file)
                 if run_config.get('header'):
                     parsed['header'] = next(csv_reader)
                 for row in csv_reader:
@@ -141,6 +223,47 @@ def parse(self, file) -> CsvObjectParserResponse:
         return CsvObjectParserResponse(**parsed)
 
 
+    def iterate_entries(self, file, start: int = 0, stop: int = None) -> Iterator[dict]:
+        """
+        Yields the rows of a CSV file one by one, skipped rows are not casted
+
+        Args:
+            file: path of the file
+            start (int): index of the first entry
+            stop (int, optional): index after the last entry, None for all entries
+
+        Raises:
+            ParserRuntimeError: If the file could not be read or contains no rows
+        """
+        run_config = self.get_config()
+        try:
+            with open(f'{file}', 'r', encoding='utf-8', newline=run_config.get('newline')) as csv_file:
+                csv_reader = self.__get_reader(csv_file)
+                if run_config.get('header'):
+                    next(csv_reader, None)
+
+                has_content = False
+                for row in islice(csv_reader, start, stop):
+                    has_content = True
+                    yield self.__generate_index_pair([auto_cast(entry) for entry in row])
+
+                if not has_content and csv_reader.line_num <= int(bool(run_config.get('header'))):
+                    raise ParserRuntimeError(f"[{self.__class__.__name__}]: No content data!")
+        except Exception as err:
+            LOGGER.error(str(err))
+            raise ParserRuntimeError(f"[{self.__class__.__name__}]: An error occured: {str(err)}") from err
+
+
+    def __get_reader(self, csv_file):
+        """Creates the CSV reader with the parser config"""
+        run_config = self.get_config()
+        return csv.reader(csv_file,
+                          delimiter=run_config.get('delimiter'),
+                          quotechar=run_config.get('quoteChar'),
+                          escapechar=run_config.get('escapeChar'),
+                          skipinitialspace=True)
+
+
 class ExcelObjectParserResponse(ObjectParserResponse):
     """TODO: document"""
 
@@ -183,8 +306,6 @@ def __generate_index_pair(row: list) -> dict:
         return line
 
     def parse(self, file) -> ExcelObjectParserResponse:
-        from openpyxl import load_workbook
-
         parsed = {
             'count': 0,
             'header': None,
@@ -192,16 +313,49 @@ def parse(self, file) -> ExcelObjectParserResponse:
             'entry_length': 0
         }
 
+        for entry in self.iterate_entries(file):
+            parsed.get('entries').append(entry)
+            parsed['count'] = parsed['count'] + 1
+
+        if parsed['count'] > 0:
+            parsed['entry_length'] = len(parsed.get('entries')[0])
+
+        return ExcelObjectParserResponse(**parsed)
+
+
+    def iterate_entries(self, file, start: int = 0, stop: int = None) -> Iterator[dict]:
+        """
+        Yields the rows of the configured sheet one by one, the workbook is opened in read-only mode
+
+        Args:
+            file: path of the file
+            start (int): index of the first entry
+            stop (int, optional): index after the last entry, None for all entries
+
+        Raises:
+            ParserRuntimeError: If the workbook or the sheet could not be opened
+        """
+        from openpyxl import load_workbook
+
         run_config = self.get_config()
         try:
             working_sheet = run_config['sheet_name']
         except (IndexError, ValueError, KeyError) as err:
             raise ParserRuntimeError(f"[ExcelObjectParser] An error occured: {str(err)}") from err
 
-        wb = load_workbook(file)
         try:
-            sheet: Worksheet = wb[working_sheet]
-        except KeyError as err:
+            wb = load_workbook(file, read_only=True, data_only=True)
+        except Exception as err:
             raise ParserRuntimeError(f"[ExcelObjectParser] An error occured: {str(err)}") from err
 
-        return ExcelObjectParserResponse(0, [], 0)
+        try:
+            try:
+                sheet: Worksheet = wb[working_sheet]
+            except KeyError as err:
+                raise ParserRuntimeError(f"[ExcelObjectParser] An error occured: {str(err)}") from err
+
+            first_row = 2 if run_config.get('header') else 1
+            for row in islice(sheet.iter_rows(min_row=first_row, values_only=True), start, stop):
+                yield self.__generate_index_pair(list(row))
+        finally:
+            wb.close()
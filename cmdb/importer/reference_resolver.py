@@ -0,0 +1,142 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2024 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""Resolves the foreign key columns of an import to the public_ids of the referenced objects"""
+import logging
+from typing import Any
+from collections.abc import Hashable
+
+from cmdb.manager.objects_manager import ObjectsManager
+
+from cmdb.importer.mapper import MapEntry
+
+from cmdb.errors.manager.object_manager import ObjectManagerGetError
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                            ImportReferenceResolver - CLASS                                           #
+# -------------------------------------------------------------------------------------------------------------------- #
+class ImportReferenceResolver:
+    """
+    Lookup table of the referenced objects of an import
+
+    The distinct values of every foreign key mapping are collected from all rows and resolved with a single
+    aggregation per (type_id, ref_name). A value is only resolved if exactly one object of the type matches it,
+    ambiguous or missing matches are skipped like before.
+    """
+
+    def __init__(self, objects_manager: ObjectsManager):
+        self.objects_manager = objects_manager
+        self.references: dict[tuple[int, str], dict[Hashable, list[int]]] = {}
+        self.valid_types: dict[int, bool] = {}
+
+
+    def prefetch(self, foreign_entries: list[MapEntry], rows: list[dict]):
+        """
+        Resolves the values of all rows for the foreign key mappings
+
+        Args:
+            foreign_entries (list[MapEntry]): Mappings with the type `ref`
+            rows (list[dict]): Parsed rows of the import
+        """
+        requested_values: dict[tuple[int, str], set] = {}
+
+        for foreign_entry in foreign_entries:
+            try:
+                lookup_key = (foreign_entry.get_option()['type_id'], foreign_entry.get_option()['ref_name'])
+            except (KeyError, IndexError):
+                continue
+
+            values = requested_values.setdefault(lookup_key, set())
+
+            for row in rows:
+                value = row.get(foreign_entry.get_value())
+
+                if isinstance(value, Hashable):
+                    values.add(value)
+
+        for (type_id, ref_name), values in requested_values.items():
+            self.__load(type_id, ref_name, values)
+
+
+    def get_reference(self, type_id: int, ref_name: str, value: Any) -> int:
+        """
+        Retrieves the public_id of the object of a type whose field `ref_name` has the value
+
+        Args:
+            type_id (int): public_id of the referenced type
+            ref_name (str): name of the field which identifies the object
+            value (Any): value of the field
+
+        Returns:
+            int: public_id of the referenced object, None if no or more than one object matches
+        """
+        if not isinstance(value, Hashable):
+            return None
+
+        lookup_key = (type_id, ref_name)
+
+        if value not in self.references.get(lookup_key, {}):
+            # values which were changed after the prefetch are resolved on demand
+            self.__load(type_id, ref_name, {value})
+
+        public_ids = self.references[lookup_key][value]
+
+        return public_ids[0] if len(public_ids) == 1 else None
+
+# ------------------------------------------------- HELPER - SECTION ------------------------------------------------- #
+
+    def __load(self, type_id: int, ref_name: str, values: set):
+        """Resolves values of a (type_id, ref_name) mapping with a single aggregation"""
+        references = self.references.setdefault((type_id, ref_name), {})
+        missing_values = [value for value in values if value not in references]
+
+        for value in missing_values:
+            references[value] = []
+
+        if not missing_values or not self.__is_valid_type(type_id):
+            return
+
+        query = [
+            {'$match': {
+                'type_id': type_id,
+                'fields': {'$elemMatch': {'name': ref_name, 'value': {'$in': missing_values}}}
+            }},
+            {'$unwind': '$fields'},
+            {'$match': {'fields.name': ref_name}},
+            {'$group': {'_id': '$fields.value', 'public_ids': {'$addToSet': '$public_id'}}}
+        ]
+
+        for result in self.objects_manager.aggregate(query):
+            matched_values = result['_id'] if isinstance(result['_id'], list) else [result['_id']]
+
+            for matched_value in matched_values:
+                if isinstance(matched_value, Hashable) and matched_value in references:
+                    references[matched_value] = sorted(set(references[matched_value]) | set(result['public_ids']))
+
+
+    def __is_valid_type(self, type_id: int) -> bool:
+        """Objects are only found if their type exists"""
+        if type_id not in self.valid_types:
+            try:
+                self.objects_manager.get_object_type(type_id)
+                self.valid_types[type_id] = True
+            except ObjectManagerGetError as err:
+                LOGGER.error('[CSV] Error while loading ref type %s', err.message)
+                self.valid_types[type_id] = False
+
+        return self.valid_types[type_id]
@@ -155,6 +155,52 @@ def create(cls, url: str, page: int, total_pages: int):
         return cls(current=url, first=first_url, prev=prev_url, next_=next_url, last=last_url)
 
 
+    @classmethod
+    def create_without_total(cls, url: str, page: int, has_next: bool):
+        """
+        Create a APIPagination when the total was not counted, there is no last page
+
+        Args:
+            url: Full url path
+            page: current page number
+            has_next: If the current page is full, so a next page can exist
+
+        Returns:
+            Instance of a APIPagination
+        """
+        parsed_url: parse.ParseResult = parse.urlparse(url)
+        first_url = parse.urlunparse(cls.__first_url(parsed_url))
+        prev_url = parse.urlunparse(cls.__pre_url(parsed_url, page))
+        next_url = parse.urlunparse(cls.__next_url(parsed_url, page, page if not has_next else page + 1))
+        return cls(current=url, first=first_url, prev=prev_url, next_=next_url)
+
+
+    @classmethod
+    def create_from_cursor(cls, url: str, next_cursor: str = None, prev_cursor: str = None):
+        """
+        Create a APIPagination for the keyset pagination, there is no last page
+
+        Args:
+            url: Full url path
+            next_cursor: Token of the next page, None on the last page
+            prev_cursor: Token of the previous page, None on the first page
+
+        Returns:
+            Instance of a APIPagination
+        """
+        parsed_url: parse.ParseResult = parse.urlparse(url)
+
+        def cursor_url(cursor: str) -> str:
+            url_dict = dict(parse.parse_qsl(parsed_url.query, keep_blank_values=True))
+            url_dict.update(cursor=cursor)
+            return parse.urlunparse(parsed_url._replace(query=parse.urlencode(url_dict)))
+
+        return cls(current=url,
+                   first=cursor_url(''),
+                   prev=cursor_url(prev_cursor) if prev_cursor else None,
+                   next_=cursor_url(next_cursor) if next_cursor else None)
+
+
     def to_dict(self) -> dict:
         """TODO: document"""
         return {
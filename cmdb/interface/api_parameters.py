@@ -17,6 +17,9 @@
 from enum import Enum
 from json import loads
 from typing import NewType, Union
+
+from cmdb.manager.query_builder.builder_parameters import TotalCount
+from cmdb.manager.query_builder.page_cursor import PageCursor
 # -------------------------------------------------------------------------------------------------------------------- #
 
 Parameter = NewType('Parameter', str)
@@ -64,7 +67,8 @@ class CollectionParameters(APIParameters):
     """Rest API class for parameters passed by a http request on a collection route"""
 
     def __init__(self, query_string: Parameter, limit: int = None, sort: str = None,
-                 order: int = None, page: int = None, filter: Union[list[dict], dict] = None, **kwargs):
+                 order: int = None, page: int = None, filter: Union[list[dict], dict] = None,
+                 cursor: str = None, total: str = None, **kwargs):
         """
         Constructor of the CollectionParameters.
 
@@ -75,6 +79,11 @@ def __init__(self, query_string: Parameter, limit: int = None, sort: str = None,
             order: The order sequence in which `way` the sort should be returned.
             page: The current page. N number of elements will be skip based on (limit * page)
             filter: A generic query filter based on https://docs.mongodb.com/compass/master/query/filter/
+            cursor: Enables the keyset pagination. Token of the `next`/`prev` cursor of a response,
+                    an empty value requests the first page. `page` is ignored in this mode and sorts by
+                    object fields (`fields.<name>`) are not supported.
+            total: How the total is determined (`exact`, `estimated` or `none`), exact if not set.
+                   Without total the response has no `total_pages` and no `last` page.
             **kwargs:
         """
         self.limit: int = int(limit or 10)
@@ -88,6 +97,17 @@ def __init__(self, query_string: Parameter, limit: int = None, sort: str = None,
             self.skip: int = (self.page - 1) * self.limit
 
         self.filter: Union[list[dict], dict] = filter or {}
+        self.cursor_mode: bool = cursor is not None
+        self.cursor: PageCursor = PageCursor.decode(cursor) if cursor else None
+
+        if self.cursor and (self.cursor.sort != self.sort or self.cursor.order != self.order):
+            raise ValueError('The page cursor does not belong to the requested sort')
+
+        # the values of object fields are list entries ({name, value}), a cursor can't mark a position in them
+        if self.cursor_mode and str(self.sort).startswith('fields.'):
+            raise ValueError('The page cursor can not be used with a sort by object fields')
+
+        self.total: TotalCount = TotalCount(total) if total else TotalCount.EXACT
 
         super().__init__(query_string=query_string, **kwargs)
 
@@ -122,6 +142,10 @@ def to_dict(cls, parameters: "CollectionParameters") -> dict:
             'filter': parameters.filter,
             'optional': parameters.optional,
         }
+        if parameters.cursor_mode:
+            params.update({'cursor': parameters.cursor.encode() if parameters.cursor else ''})
+        if parameters.total != TotalCount.EXACT:
+            params.update({'total': parameters.total.value})
         if parameters.projection:
             params.update({'projection': parameters.projection})
         return params
@@ -136,6 +160,9 @@ def get_builder_params(cls, params: "CollectionParameters") -> dict:
             'sort': params.sort,
             'order': params.order,
             'skip': params.skip,
+            'cursor_mode': params.cursor_mode,
+            'cursor': params.cursor,
+            'total': params.total,
         }
 
     def __repr__(self):
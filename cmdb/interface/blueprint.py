@@ -17,17 +17,11 @@
 from functools import wraps
 import logging
 from cerberus import Validator
-from flask import Blueprint, abort, request, current_app
-
-from cmdb.manager.users_manager import UsersManager
+from flask import Blueprint, abort, request, g
 
 from cmdb.interface.api_parameters import CollectionParameters
-from cmdb.interface.route_utils import auth_is_valid, user_has_right, parse_authorization_header
+from cmdb.interface.route_utils import auth_is_valid, user_has_right
 from cmdb.user_management.models.user import UserModel
-from cmdb.security.token.validator import TokenValidator
-
-from cmdb.errors.manager import ManagerGetError
-from cmdb.errors.security import TokenValidationError
 # -------------------------------------------------------------------------------------------------------------------- #
 
 LOGGER = logging.getLogger(__name__)
@@ -52,39 +46,23 @@ def _decorate(*args, **kwargs):
 
                 if auth and right:
                     if not user_has_right(right):
-                        if excepted:
-                            with current_app.app_context():
-                                users_manager = UsersManager(current_app.database_manager)
-
-                            token = parse_authorization_header(request.headers['Authorization'])
-                            try:
-                                decrypted_token = TokenValidator(current_app.database_manager).decode_token(token)
-                            except TokenValidationError:
-                                #TODO: ERROR-FIX
-                                return abort(401)
-                            try:
-                                user_id = decrypted_token['DATAGERRY']['value']['user']['public_id']
-
-                                if current_app.cloud_mode:
-                                    database = decrypted_token['DATAGERRY']['value']['user']['database']
-                                    users_manager = UsersManager(current_app.database_manager, database)
-
-                                user_dict: dict = UserModel.to_dict(users_manager.get_user(user_id))
-
-                                if excepted:
-                                    for exe_key, exe_value in excepted.items():
-                                        try:
-                                            route_parameter = kwargs[exe_value]
-                                        except KeyError:
-                                            return abort(403, f'User has not the required right {right}')
-
-                                        if exe_key not in user_dict:
-                                            return abort(403, f'User has not the required right {right}')
-
-                                        if user_dict[exe_key] == route_parameter:
-                                            return f(*args, **kwargs)
-                            except ManagerGetError:
-                                return abort(404)
+                        if excepted and g.request_user:
+                            user_dict: dict = UserModel.to_dict(g.request_user)
+
+                            for exe_key, exe_value in excepted.items():
+                                try:
+                                    route_parameter = kwargs[exe_value]
+                                except KeyError:
+                                    return abort(403, f'User has not the required right {right}')
+
+                                if exe_key not in user_dict:
+                                    return abort(403, f'User has not the required right {right}')
+
+                                if user_dict[exe_key] == route_parameter:
+                                    return f(*args, **kwargs)
+                        elif excepted:
+                            return abort(404)
+
                         return abort(403, f'User has not the required right {right}')
 
                 return f(*args, **kwargs)
@@ -232,20 +232,22 @@ class GetMultiResponse(BaseAPIResponse):
     """
     API Response for get calls with a collection of resources.
     """
-    __slots__ = 'results', 'count', 'total', 'parameters', 'pager', 'pagination'
+    __slots__ = 'results', 'count', 'total', 'parameters', 'pager', 'pagination', 'cursor'
 
     def __init__(self, results: list[dict], total: int, params: CollectionParameters, url: str = None,
-                 model: Model = None, body: bool = None):
+                 model: Model = None, body: bool = None, next_cursor: str = None, prev_cursor: str = None):
         """
         Constructor of GetMultiResponse.
 
         Args:
             results: List of filtered elements in payload.
-            total: Complete number of elements.
+            total: Complete number of elements, None if it was not counted.
             params: HTTP query parameters.
             url: Requested url.
             model: Data-Model of the results.
             body: If http response should not have a body.
+            next_cursor: Token of the next page in cursor mode.
+            prev_cursor: Token of the previous page in cursor mode.
         """
         self.parameters = params
 
@@ -260,12 +262,23 @@ def __init__(self, results: list[dict], total: int, params: CollectionParameters
 
         if params.limit == 0:
             total_pages = 1
+        elif total is None:
+            total_pages = None
         else:
             total_pages = ceil(total / params.limit)
 
         self.pager: APIPager = APIPager(page=params.page, page_size=params.limit,
                                         total_pages=total_pages)
-        self.pagination: APIPagination = APIPagination.create(url, self.pager.page, self.pager.total_pages)
+        self.cursor: dict = None
+
+        if params.cursor_mode:
+            self.cursor = {'next': next_cursor, 'prev': prev_cursor}
+            self.pagination: APIPagination = APIPagination.create_from_cursor(url, next_cursor, prev_cursor)
+        elif total_pages is None:
+            self.pagination: APIPagination = APIPagination.create_without_total(url, self.pager.page,
+                                                                                self.count == params.limit)
+        else:
+            self.pagination: APIPagination = APIPagination.create(url, self.pager.page, self.pager.total_pages)
         super().__init__(operation_type=OperationType.GET, url=url, model=model, body=body)
 
 
@@ -285,7 +298,8 @@ def make_response(self, *args, **kwargs) -> Response:
         else:
             response = make_api_response(None)
 
-        response.headers['X-Total-Count'] = self.total
+        if self.total is not None:
+            response.headers['X-Total-Count'] = self.total
 
         return response
 
@@ -307,6 +321,8 @@ def export(self, text: str = 'json', pagination: bool = True) -> dict:
                 'pager': self.pager.to_dict(),
                 'pagination': self.pagination.to_dict()
             }
+            if self.cursor is not None:
+                extra.update({'cursor': self.cursor})
         return {**{
             'results': self.results,
             'count': self.count,
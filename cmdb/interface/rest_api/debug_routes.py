@@ -18,6 +18,7 @@
 from werkzeug.exceptions import abort
 
 from cmdb.interface.route_utils import make_response
+from cmdb.manager.type_cache import TYPE_CACHE
 from cmdb.interface.blueprint import RootBlueprint
 # -------------------------------------------------------------------------------------------------------------------- #
 debug_blueprint = RootBlueprint('debug_rest', __name__, url_prefix='/debug')
@@ -34,6 +35,13 @@ def get_index(collection: str):
     return make_response(database_manager.get_index_info(collection))
 
 
+@debug_blueprint.route('/cache/types/', methods=['GET'])
+@debug_blueprint.route('/cache/types', methods=['GET'])
+def get_type_cache_statistics():
+    """Returns the hit/miss counters of the type cache of this worker process"""
+    return make_response(TYPE_CACHE.get_statistics())
+
+
 @debug_blueprint.route('/error/<int:status_code>/', methods=['GET', 'POST'])
 @debug_blueprint.route('/error/<int:status_code>', methods=['GET', 'POST'])
 def trigger_error_handler(status_code: int):
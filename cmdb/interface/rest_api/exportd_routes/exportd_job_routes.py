@@ -60,7 +60,8 @@ def get_exportd_jobs(params: CollectionParameters, request_user: UserModel):
 
     try:
         iteration_result: IterationResult[ExportdJob] = job_manager.iterate(
-            filter=params.filter, limit=params.limit, skip=params.skip, sort=params.sort, order=params.order)
+            filter=params.filter, limit=params.limit, skip=params.skip, sort=params.sort, order=params.order,
+            total=params.total)
         types = [ExportdJob.to_json(type) for type in iteration_result.results]
         api_response = GetMultiResponse(types, total=iteration_result.total, params=params,
                                         url=request.url, model=ExportdJob.MODEL, body=request.method == 'HEAD')
@@ -221,6 +222,8 @@ def update_job(request_user: UserModel):
 
     try:
         exportd_manager.update_job(update_job_instance, request_user, False)
+        # the changed sources or variables can affect every object, the next run transfers all of them
+        exportd_manager.delete_watermark(update_job_instance.get_public_id())
     except ExportdJobManagerUpdateError:
         #TODO: ERROR-FIX
         return abort(500)
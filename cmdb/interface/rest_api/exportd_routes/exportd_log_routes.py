@@ -54,7 +54,8 @@ def get_exportd_logs(params: CollectionParameters, request_user: UserModel):
                                                                 limit=params.limit,
                                                                 skip=params.skip,
                                                                 sort=params.sort,
-                                                                order=params.order)
+                                                                order=params.order,
+                                                                total=params.total)
 
         types = [ExportdJobLog.to_json(type) for type in iteration_result.results]
         api_response = GetMultiResponse(types, total=iteration_result.total, params=params,
@@ -111,8 +111,8 @@ def get_categories(params: CollectionParameters, request_user: UserModel):
 
     try:
         if params.optional['view'] == 'tree':
-            tree: CategoryTree = categories_manager.tree
-            api_response = GetMultiResponse(CategoryTree.to_json(tree),
+            tree: list[dict] = categories_manager.get_tree_data()
+            api_response = GetMultiResponse(tree,
                                             len(tree),
                                             params,
                                             request.url,
@@ -133,7 +133,9 @@ def get_categories(params: CollectionParameters, request_user: UserModel):
                                         params,
                                         request.url,
                                         CategoryModel.MODEL,
-                                        body)
+                                        body,
+                                        next_cursor=iteration_result.next_cursor,
+                                        prev_cursor=iteration_result.prev_cursor)
     except ManagerIterationError as err:
         LOGGER.debug("[get_categories] ManagerIterationError: %s", err.message)
         return ErrorMessage(400, "Could not retrieve categories from database!").response()
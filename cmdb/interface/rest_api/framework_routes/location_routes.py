@@ -133,7 +133,9 @@ def get_all_locations(params: CollectionParameters, request_user: UserModel):
                                         params,
                                         request.url,
                                         CmdbLocation.MODEL,
-                                        request.method == 'HEAD')
+                                        request.method == 'HEAD',
+                                        next_cursor=iteration_result.next_cursor,
+                                        prev_cursor=iteration_result.prev_cursor)
 
     except ManagerIterationError as err:
         LOGGER.debug("[get_all_locations] ManagerIterationError: %s", err.message)
@@ -165,20 +167,7 @@ def get_locations_tree(params: CollectionParameters, request_user: UserModel):
         iteration_result: IterationResult[CmdbLocation] = locations_manager.iterate(builder_params)
 
         location_list: list[dict] = [location_.__dict__ for location_ in iteration_result.results]
-        # get all root locations
-        filtered_location_list = []
-        root_locations: list[LocationNode] = []
-
-        for location in location_list:
-            if location['parent'] == 1:
-                root_locations.append(LocationNode(location))
-            else:
-                filtered_location_list.append(location)
-
-        # get all children for each root location
-        for root_location in root_locations:
-            children = root_location.get_children(root_location.public_id, filtered_location_list)
-            root_location.children = children
+        root_locations: list[LocationNode] = LocationNode.build_tree(location_list)
 
         # pack the root locations
         packed_locations = []
@@ -343,7 +332,7 @@ def update_location_for_object(params: dict, request_user: UserModel):
                                                      else f"ObjectID: {location_update_params['object_id']}"
 
     try:
-        result = locations_manager.update({'object_id': object_id}, location_update_params)
+        result = locations_manager.update_location(object_id, location_update_params)
     except ManagerUpdateError as err:
         LOGGER.debug("[update_location_for_object] ManagerUpdateError: %s", err.message)
         return ErrorMessage(400, "Could not update the location!").response()
@@ -125,7 +125,9 @@ def get_links(params: CollectionParameters, request_user: UserModel):
                                         params,
                                         request.url,
                                         ObjectLinkModel.MODEL,
-                                        request.method == 'HEAD')
+                                        request.method == 'HEAD',
+                                        next_cursor=iteration_result.next_cursor,
+                                        prev_cursor=iteration_result.prev_cursor)
 
     except ManagerIterationError:
         #TODO: ERROR-FIX
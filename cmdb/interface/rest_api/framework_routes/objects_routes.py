@@ -18,6 +18,7 @@
 import copy
 import logging
 from datetime import datetime, timezone
+from dateutil.parser import parse
 from bson import json_util
 from flask import abort, jsonify, request, current_app
 
@@ -30,8 +31,8 @@
 from cmdb.manager.query_builder.builder_parameters import BuilderParameters
 from cmdb.database.utils import object_hook, default
 from cmdb.framework import CmdbObject, TypeModel
+from cmdb.framework.models.type_model import TypeReferenceSection
 from cmdb.framework.models.log import LogAction, CmdbObjectLog
-from cmdb.framework import ObjectLinkModel
 from cmdb.framework.results import IterationResult
 from cmdb.framework.utils import Model
 from cmdb.interface.api_parameters import CollectionParameters
@@ -39,8 +40,8 @@
     ResponseFailedMessage, ErrorMessage
 from cmdb.interface.route_utils import make_response, insert_request_user
 from cmdb.interface.blueprint import APIBlueprint
+from cmdb.security.acl.helpers import verify_access
 from cmdb.security.acl.permission import AccessControlPermission
-from cmdb.cmdb_objects.cmdb_location import CmdbLocation
 from cmdb.user_management.models.user import UserModel
 from cmdb.manager.manager_provider import ManagerType, ManagerProvider
 from cmdb.framework.cmdb_render import CmdbRender, RenderList
@@ -237,7 +238,9 @@ def get_objects(params: CollectionParameters, request_user: UserModel):
                                             params=params,
                                             url=request.url,
                                             model=CmdbObject.MODEL,
-                                            body=request.method == 'HEAD')
+                                            body=request.method == 'HEAD',
+                                            next_cursor=iteration_result.next_cursor,
+                                            prev_cursor=iteration_result.prev_cursor)
         elif view == 'render':
             if current_app.cloud_mode:
                 current_app.database_manager.connector.set_database(request_user.database)
@@ -245,14 +248,17 @@ def get_objects(params: CollectionParameters, request_user: UserModel):
             rendered_list = RenderList(object_list=iteration_result.results,
                                        request_user=request_user,
                                        ref_render=True,
-                                       objects_manager=objects_manager).render_result_list(raw=True)
+                                       objects_manager=objects_manager,
+                                       batch=True).render_result_list(raw=True)
 
             api_response = GetMultiResponse(rendered_list,
                                             total=iteration_result.total,
                                             params=params,
                                             url=request.url,
                                             model=Model('RenderResult'),
-                                            body=request.method == 'HEAD')
+                                            body=request.method == 'HEAD',
+                                            next_cursor=iteration_result.next_cursor,
+                                            prev_cursor=iteration_result.prev_cursor)
         else:
             return abort(401, 'No possible view parameter')
 
@@ -446,7 +452,8 @@ def get_object_references(public_id: int, params: CollectionParameters, request_
             rendered_list = RenderList(object_list=iteration_result.results,
                                        request_user=request_user,
                                        ref_render=True,
-                                       objects_manager=objects_manager).render_result_list(raw=True)
+                                       objects_manager=objects_manager,
+                                       batch=True).render_result_list(raw=True)
 
             api_response = GetMultiResponse(rendered_list, total=iteration_result.total, params=params,
                                             url=request.url, model=Model('RenderResult'), body=request.method == 'HEAD')
@@ -529,10 +536,11 @@ def update_object(public_id: int, data: dict, request_user: UserModel):
 
     object_ids = request.args.getlist('objectIDs')
 
+    # mass edits are written with one bulk for all objects
     if len(object_ids) > 0:
-        object_ids = list(map(int, object_ids))
-    else:
-        object_ids = [public_id]
+        return update_objects_bulk(list(map(int, object_ids)), data, request_user)
+
+    object_ids = [public_id]
 
     results: list[dict] = []
     failed = []
@@ -551,71 +559,23 @@ def update_object(public_id: int, data: dict, request_user: UserModel):
                                                       ref_render=False,
                                                       objects_manager=objects_manager
                                                       ).result()
-            update_comment = ''
+            old_fields = list(map(lambda x: {k: v for k, v in x.items() if k in ['name', 'value']},
+                                  current_object_render_result.fields))
 
             try:
-                # check for comment
-                new_data['public_id'] = obj_id
-                new_data['creation_time'] = current_object_instance.creation_time
-                new_data['author_id'] = current_object_instance.author_id
-                new_data['active'] = active_state if active_state in [True, False] else current_object_instance.active
-
-                if 'version' not in data:
-                    new_data['version'] = current_object_instance.version
-
-                old_fields = list(map(lambda x: {k: v for k, v in x.items() if k in ['name', 'value']},
-                                      current_object_render_result.fields))
-                new_fields = data['fields']
-                for item in new_fields:
-                    for old in old_fields:
-                        if item['name'] == old['name']:
-                            old['value'] = item['value']
-                new_data['fields'] = old_fields
-
-                update_comment = data['comment']
-                del new_data['comment']
-
-            except (KeyError, IndexError, ValueError):
-                update_comment = ''
+                new_data, log_data = build_object_update(current_object_instance, old_fields, data, active_state,
+                                                         request_user)
             except TypeError as err:
                 LOGGER.error('Error: %s Object: %s', str(err.args), json.dumps(new_data, default=default))
                 failed.append(ResponseFailedMessage(error_message=str(err.args), status=400,
                                                     public_id=obj_id, obj=new_data).to_dict())
                 continue
 
-            # update edit time
-            new_data['last_edit_time'] = datetime.now(timezone.utc)
-            new_data['editor_id'] = request_user.public_id
-
-            update_object_instance = CmdbObject(**json.loads(json.dumps(new_data, default=json_util.default),
-                                                             object_hook=object_hook))
-
-            # calc version
-            changes = current_object_instance / update_object_instance
-
-            if len(changes['new']) == 1:
-                new_data['version'] = update_object_instance.update_version(update_object_instance.VERSIONING_PATCH)
-            elif len(changes['new']) == len(update_object_instance.fields):
-                new_data['version'] = update_object_instance.update_version(update_object_instance.VERSIONING_MAJOR)
-            elif len(changes['new']) > (len(update_object_instance.fields) / 2):
-                new_data['version'] = update_object_instance.update_version(update_object_instance.VERSIONING_MINOR)
-            else:
-                new_data['version'] = update_object_instance.update_version(update_object_instance.VERSIONING_PATCH)
-
             objects_manager.update_object(obj_id, new_data, request_user, AccessControlPermission.UPDATE)
             results.append(new_data)
 
             # Generate log entry
             try:
-                log_data = {
-                    'object_id': obj_id,
-                    'version': update_object_instance.get_version(),
-                    'user_id': request_user.get_public_id(),
-                    'user_name': request_user.get_display_name(),
-                    'comment': update_comment,
-                    'changes': changes,
-                    'render_state': json.dumps(update_object_instance, default=default).encode('UTF-8')
-                }
                 logs_manager.insert_log(action=LogAction.EDIT, log_type=CmdbObjectLog.__name__, **log_data)
             except ManagerInsertError as err:
                 LOGGER.debug("[update_object] ManagerInsertError: %s", err.message)
@@ -643,6 +603,100 @@ def update_object(public_id: int, data: dict, request_user: UserModel):
     return api_response.make_response()
 
 
+def update_objects_bulk(object_ids: list[int], data: dict, request_user: UserModel):
+    """
+    Updates multiple objects with the same data
+
+    The objects and their types are loaded with one query each, the old values are taken from the
+    stored objects. All objects are written with one bulk and all logs with one insert.
+
+    Args:
+        object_ids (list[int]): public_ids of the objects
+        data (dict): New data, fields which are not contained keep their values
+        request_user (UserModel): User requesting the update
+
+    Returns:
+        Response: UpdateMultiResponse with the updated and the failed objects
+    """
+    logs_manager: LogsManager = ManagerProvider.get_manager(ManagerType.LOGS_MANAGER, request_user)
+    objects_manager: ObjectsManager = ManagerProvider.get_manager(ManagerType.OBJECTS_MANAGER, request_user)
+
+    active_state = request.get_json().get('active', None)
+    updated_objects: list[dict] = []
+    update_logs: list[dict] = []
+    failed = []
+
+    try:
+        current_objects: dict[int, CmdbObject] = {
+            object_data['public_id']: CmdbObject.from_data(object_data)
+            for object_data in objects_manager.get(filter={'public_id': {'$in': object_ids}})
+        }
+        object_types = objects_manager.get_object_types({obj.type_id for obj in current_objects.values()})
+
+        for object_type in object_types.values():
+            if not object_type.active:
+                #TODO: ERROR-FIX
+                raise AccessDeniedError(f'Objects cannot be updated because type `{object_type.name}` is deactivated.')
+
+            verify_access(object_type, request_user, AccessControlPermission.READ)
+            verify_access(object_type, request_user, AccessControlPermission.UPDATE)
+    except AccessDeniedError as err:
+        LOGGER.error("AccessDeniedError: %s", err)
+        return abort(403)
+    except ObjectManagerGetError as err:
+        LOGGER.debug("[update_objects_bulk] ObjectManagerGetError: %s", err.message)
+        return abort(400, err.message)
+
+    for obj_id in object_ids:
+        new_data = copy.deepcopy(data)
+        current_object_instance = current_objects.get(obj_id)
+
+        if not current_object_instance or current_object_instance.type_id not in object_types:
+            failed.append(ResponseFailedMessage(error_message=f'Object with ID: {obj_id} not found!', status=400,
+                                                public_id=obj_id, obj=new_data).to_dict())
+            continue
+
+        old_fields = get_field_values(current_object_instance, object_types[current_object_instance.type_id])
+
+        try:
+            new_data, log_data = build_object_update(current_object_instance, old_fields, data, active_state,
+                                                     request_user)
+        except TypeError as err:
+            LOGGER.error('Error: %s Object: %s', str(err.args), json.dumps(new_data, default=default))
+            failed.append(ResponseFailedMessage(error_message=str(err.args), status=400,
+                                                public_id=obj_id, obj=new_data).to_dict())
+            continue
+
+        updated_objects.append(new_data)
+        update_logs.append(log_data)
+
+    try:
+        failed_writes = objects_manager.bulk_update_objects(updated_objects, request_user)
+    except ObjectManagerUpdateError as err:
+        LOGGER.error("[update_objects_bulk] ObjectManagerUpdateError: %s", err.message)
+        failed_writes = {index: err.message for index in range(len(updated_objects))}
+
+    results = []
+
+    for index, new_data in enumerate(updated_objects):
+        if index in failed_writes:
+            failed.append(ResponseFailedMessage(error_message=failed_writes[index], status=500,
+                                                public_id=new_data['public_id'], obj=new_data).to_dict())
+        else:
+            results.append(new_data)
+
+    # Generate log entries
+    try:
+        logs_manager.insert_logs(LogAction.EDIT,
+                                 CmdbObjectLog.__name__,
+                                 [log for index, log in enumerate(update_logs) if index not in failed_writes])
+    except ManagerInsertError as err:
+        LOGGER.debug("[update_objects_bulk] ManagerInsertError: %s", err.message)
+
+    api_response = UpdateMultiResponse(results=results, failed=failed, url=request.url, model=CmdbObject.MODEL)
+    return api_response.make_response()
+
+
 @objects_blueprint.route('/<int:public_id>/state', methods=['PUT'])
 @insert_request_user
 @objects_blueprint.protect(auth=True, right='base.framework.object.activation')
@@ -899,17 +953,8 @@ def delete_object_with_child_locations(public_id: int, request_user: UserModel):
         current_location = locations_manager.get_location_for_object(public_id)
 
         if current_object_instance and current_location:
-            # get all child locations for this location
-            build_params = BuilderParameters([{"$match":{"public_id":{"$gt":1}}}])
-
-            iteration_result: IterationResult[CmdbLocation] = locations_manager.iterate(build_params)
-
-            all_locations: list[dict] = [location_.__dict__ for location_ in iteration_result.results]
-            all_children = locations_manager.get_all_children(current_location.public_id, all_locations)
-
             # delete all child locations
-            for child in all_children:
-                locations_manager.delete({'public_id':child['public_id']})
+            locations_manager.delete_many({'ancestors': current_location.public_id})
 
             # delete the current object and its location
             locations_manager.delete({'public_id':current_location.public_id})
@@ -963,19 +1008,11 @@ def delete_object_with_child_objects(public_id: int, request_user: UserModel):
 
         if current_object_instance and current_location:
             # get all child locations for this location
-            builder_params = BuilderParameters([{"$match":{"public_id":{"$gt":1}}}])
-
-            iteration_result: IterationResult[CmdbLocation] = locations_manager.iterate(builder_params)
-
-            all_locations: list[dict] = [location_.__dict__ for location_ in iteration_result.results]
-            all_children_locations = locations_manager.get_all_children(current_location.public_id, all_locations)
+            all_children_locations = locations_manager.get_all_children(current_location.public_id)
+            children_object_ids = [child['object_id'] for child in all_children_locations]
 
-            children_object_ids = []
-
-            # delete all child locations and extract their corresponding object_ids
-            for child in all_children_locations:
-                children_object_ids.append(child['object_id'])
-                locations_manager.delete({'public_id':child['public_id']})
+            # delete all child locations
+            locations_manager.delete_many({'ancestors': current_location.public_id})
 
             # # delete the objects of child locations
             for child_object_id in children_object_ids:
@@ -1003,88 +1040,82 @@ def delete_object_with_child_objects(public_id: int, request_user: UserModel):
 @insert_request_user
 @objects_blueprint.protect(auth=True, right='base.framework.object.delete')
 def delete_many_objects(public_ids, request_user: UserModel):
-    """TODO: document"""
+    """
+    Deletes multiple objects and logs their deletion
+
+    Every step runs once for all objects: the objects, types and locations are loaded with one query each,
+    the links, references and objects are removed with one write each and the logs are inserted together.
+
+    Args:
+        public_ids (str): Comma separated public_ids of the objects which should be deleted
+        request_user (UserModel): The user requesting the deletion of the objects
+
+    Returns:
+        Response: public_ids of the deleted objects (`successfully`) and the objects which could not be deleted
+    """
     logs_manager: LogsManager = ManagerProvider.get_manager(ManagerType.LOGS_MANAGER, request_user)
     locations_manager: LocationsManager = ManagerProvider.get_manager(ManagerType.LOCATIONS_MANAGER, request_user)
     objects_manager: ObjectsManager = ManagerProvider.get_manager(ManagerType.OBJECTS_MANAGER, request_user)
+    object_links_manager: ObjectLinksManager = ManagerProvider.get_manager(ManagerType.OBJECT_LINKS_MANAGER,
+                                                                           request_user)
 
-    try:
-        ids = []
-        operator_in = {'$in': []}
-        filter_public_ids = {'public_id': {}}
+    ids = []
 
-        for v in public_ids.split(","):
-            try:
-                ids.append(int(v))
-            except (ValueError, TypeError):
-                return abort(400)
-
-        operator_in.update({'$in': ids})
-        filter_public_ids.update({'public_id': operator_in})
+    for v in public_ids.split(","):
+        try:
+            ids.append(int(v))
+        except (ValueError, TypeError):
+            return abort(400)
 
-        ack = []
-        objects = objects_manager.get_objects_by(**filter_public_ids)
+    try:
+        objects = [CmdbObject.from_data(object_data)
+                   for object_data in objects_manager.get(filter={'public_id': {'$in': ids}})]
 
         # At the current state it is not possible to bulk delete objects with locations
         # check if any object has a location
-        for current_object_instance in objects:
-            try:
-                location_for_object = locations_manager.get_location_for_object(current_object_instance.public_id)
+        try:
+            if locations_manager.get_locations_by(object_id={'$in': [obj.public_id for obj in objects]}):
+                return ErrorMessage(405, """It is not possible to bulk delete objects
+                                         if any of them has a location""").response()
+        except ManagerGetError:
+            pass
 
-                if location_for_object:
-                    return ErrorMessage(405, """It is not possible to bulk delete objects
-                                             if any of them has a location""").response()
-            except ManagerGetError:
-                pass
+        object_types = objects_manager.get_object_types({obj.type_id for obj in objects})
 
-        for current_object_instance in objects:
-            try:
-                # Remove object links and references
-                delete_object_links(current_object_instance.public_id, request_user)
-                objects_manager.delete_all_object_references(current_object_instance.public_id)
-
-                current_type_instance = objects_manager.get_object_type(current_object_instance.get_type_id())
-                current_object_render_result = CmdbRender(object_instance=current_object_instance,
-                                                          type_instance=current_type_instance,
-                                                          render_user=request_user,
-                                                          ref_render=False,
-                                                          objects_manager=objects_manager
-                                                          ).result()
-            except ObjectManagerGetError as err:
-                LOGGER.debug("[delete_many_objects] ObjectManagerGetError: %s", err.message)
-                return abort(404)
-            except InstanceRenderError as err:
+        for object_type in object_types.values():
+            if not object_type.active:
                 #TODO: ERROR-FIX
-                LOGGER.error("[delete_many_objects] InstanceRenderError: %s", err.message)
-                return abort(500)
+                raise AccessDeniedError(f'Objects cannot be removed because type `{object_type.name}` is deactivated.')
 
-            try:
-                ack.append(objects_manager.delete_object(current_object_instance.get_public_id(),
-                                                         request_user,
-                                                         AccessControlPermission.DELETE))
-            except ObjectManagerDeleteError:
-                #TODO:ERROR-FIX
-                return abort(400)
-            except AccessDeniedError as err:
-                #TODO:ERROR-FIX
-                return abort(403)
+            verify_access(object_type, request_user, AccessControlPermission.DELETE)
 
-            try:
-                # generate log
-                log_data = {
-                    'object_id': current_object_instance.get_public_id(),
-                    'version': current_object_render_result.object_information['version'],
-                    'user_id': request_user.get_public_id(),
-                    'user_name': request_user.get_display_name(),
-                    'comment': 'Object was deleted',
-                    'render_state': json.dumps(current_object_render_result, default=default).encode('UTF-8')
-                }
-                logs_manager.insert_log(action=LogAction.DELETE, log_type=CmdbObjectLog.__name__, **log_data)
-            except ManagerInsertError as err:
-                LOGGER.debug("[delete_many_objects] ManagerInsertError: %s", err.message)
+        objects = [obj for obj in objects if obj.type_id in object_types]
+        object_ids = [obj.public_id for obj in objects]
+        failed = [ResponseFailedMessage(error_message=f'Object with ID: {obj_id} not found!', status=404,
+                                        public_id=obj_id).to_dict()
+                  for obj_id in ids if obj_id not in object_ids]
+
+        if not objects:
+            return make_response({'successfully': [], 'failed': failed})
 
-        return make_response({'successfully': ack})
+        render_results = RenderList(objects, request_user, objects_manager=objects_manager,
+                                    batch=True).render_result_list()
 
+        # Remove object links and references
+        object_links_manager.delete_links_of_objects(object_ids)
+        objects_manager.delete_many_object_references(object_ids)
+
+        deleted_ids = objects_manager.delete_objects(objects, request_user)
+    except AccessDeniedError as err:
+        LOGGER.error("[delete_many_objects] AccessDeniedError: %s", err)
+        return abort(403)
+    except ObjectManagerGetError as err:
+        LOGGER.debug("[delete_many_objects] ObjectManagerGetError: %s", err.message)
+        return abort(404)
+    except InstanceRenderError as err:
+        #TODO: ERROR-FIX
+        LOGGER.error("[delete_many_objects] InstanceRenderError: %s", err.message)
+        return abort(500)
     except ObjectManagerDeleteError as err:
         #TODO: ERROR-FIX
         return jsonify(message='Delete Error', error=err.message)
@@ -1092,6 +1123,31 @@ def delete_many_objects(public_ids, request_user: UserModel):
         #TODO: ERROR-FIX
         return abort(500)
 
+    delete_logs = []
+
+    for current_object_instance, current_object_render_result in zip(objects, render_results):
+        if current_object_instance.public_id not in deleted_ids:
+            failed.append(ResponseFailedMessage(error_message='Object could not be deleted', status=500,
+                                                public_id=current_object_instance.public_id).to_dict())
+            continue
+
+        delete_logs.append({
+            'object_id': current_object_instance.get_public_id(),
+            'version': current_object_render_result.object_information['version'],
+            'user_id': request_user.get_public_id(),
+            'user_name': request_user.get_display_name(),
+            'comment': 'Object was deleted',
+            'render_state': json.dumps(current_object_render_result, default=default).encode('UTF-8')
+        })
+
+    # generate logs
+    try:
+        logs_manager.insert_logs(LogAction.DELETE, CmdbObjectLog.__name__, delete_logs)
+    except ManagerInsertError as err:
+        LOGGER.debug("[delete_many_objects] ManagerInsertError: %s", err.message)
+
+    return make_response({'successfully': deleted_ids, 'failed': failed})
+
 # -------------------------------------------------------------------------------------------------------------------- #
 #                                                   HELPER - METHODS                                                   #
 # -------------------------------------------------------------------------------------------------------------------- #
@@ -1119,10 +1175,117 @@ def delete_object_links(public_id: int, request_user: UserModel) -> None:
     object_links_manager: ObjectLinksManager = ManagerProvider.get_manager(ManagerType.OBJECT_LINKS_MANAGER,
                                                                            request_user)
 
-    object_link_filter: dict = {'$or': [{'primary': public_id}, {'secondary': public_id}]}
-    builder_params = BuilderParameters(object_link_filter)
+    object_links_manager.delete_links_of_objects([public_id])
+
+
+def build_object_update(current_object_instance: CmdbObject,
+                        old_fields: list[dict],
+                        data: dict,
+                        active_state: bool,
+                        request_user: UserModel) -> tuple[dict, dict]:
+    """
+    Builds the new data of an edited object and the data of its log entry
+
+    Fields which are not contained in `data` keep their old values. The version is raised by the share
+    of the changed fields.
+
+    Args:
+        current_object_instance (CmdbObject): The stored object
+        old_fields (list[dict]): `name` and `value` of every field of the stored object
+        data (dict): New data of the object with an optional `comment`
+        active_state (bool): New active state, the object keeps its state if it is not a bool
+        request_user (UserModel): User requesting the update
+
+    Raises:
+        TypeError: If the new data does not fit to the object
+
+    Returns:
+        tuple[dict, dict]: New data of the object and the data of its log entry
+    """
+    new_data = copy.deepcopy(data)
+    update_comment = new_data.pop('comment', '')
+
+    try:
+        new_data['public_id'] = current_object_instance.public_id
+        new_data['creation_time'] = current_object_instance.creation_time
+        new_data['author_id'] = current_object_instance.author_id
+        new_data['active'] = active_state if active_state in [True, False] else current_object_instance.active
+
+        if 'version' not in data:
+            new_data['version'] = current_object_instance.version
+
+        for item in data['fields']:
+            for old in old_fields:
+                if item['name'] == old['name']:
+                    old['value'] = item['value']
+        new_data['fields'] = old_fields
+    except (KeyError, IndexError, ValueError):
+        pass
+
+    # update edit time
+    new_data['last_edit_time'] = datetime.now(timezone.utc)
+    new_data['editor_id'] = request_user.public_id
+
+    update_object_instance = CmdbObject(**json.loads(json.dumps(new_data, default=json_util.default),
+                                                     object_hook=object_hook))
+
+    # calc version
+    changes = current_object_instance / update_object_instance
+
+    if len(changes['new']) == 1:
+        new_data['version'] = update_object_instance.update_version(update_object_instance.VERSIONING_PATCH)
+    elif len(changes['new']) == len(update_object_instance.fields):
+        new_data['version'] = update_object_instance.update_version(update_object_instance.VERSIONING_MAJOR)
+    elif len(changes['new']) > (len(update_object_instance.fields) / 2):
+        new_data['version'] = update_object_instance.update_version(update_object_instance.VERSIONING_MINOR)
+    else:
+        new_data['version'] = update_object_instance.update_version(update_object_instance.VERSIONING_PATCH)
+
+    log_data = {
+        'object_id': current_object_instance.public_id,
+        'version': update_object_instance.get_version(),
+        'user_id': request_user.get_public_id(),
+        'user_name': request_user.get_display_name(),
+        'comment': update_comment,
+        'changes': changes,
+        'render_state': json.dumps(update_object_instance, default=default).encode('UTF-8')
+    }
+
+    return new_data, log_data
+
+
+def get_field_values(object_instance: CmdbObject, type_instance: TypeModel) -> list[dict]:
+    """
+    Retrieves the names and values of all fields of an object in the order of the type sections
+
+    Fields of the type which the object does not contain get the value None, dates stored as string are parsed.
+
+    Args:
+        object_instance (CmdbObject): The stored object
+        type_instance (TypeModel): Type of the object
+
+    Returns:
+        list[dict]: `name` and `value` of every field
+    """
+    type_fields = {field['name']: field for field in type_instance.fields}
+    object_values = {field['name']: field.get('value') for field in object_instance.fields}
+    field_values = []
+
+    for section in type_instance.render_meta.sections:
+        if isinstance(section, TypeReferenceSection):
+            field_names = [f'{section.name}-field']
+        else:
+            field_names = section.fields
+
+        for field_name in field_names:
+            if field_name not in type_fields:
+                continue
+
+            value = object_values.get(field_name)
+
+            if type_fields[field_name].get('type') == 'date' and isinstance(value, str) and value:
+                value = parse(value, fuzzy=True)
 
-    links: list[ObjectLinkModel] = object_links_manager.iterate(builder_params).results
+            field_values.append({'name': field_name, 'value': value})
 
-    for link in links:
-        object_links_manager.delete({'public_id':link.public_id})
+    return field_values
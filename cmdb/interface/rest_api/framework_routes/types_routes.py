@@ -29,8 +29,7 @@
 from cmdb.interface.blueprint import APIBlueprint
 from cmdb.interface.response import GetMultiResponse, GetSingleResponse, InsertSingleResponse, UpdateSingleResponse, \
     DeleteSingleResponse, make_api_response
-from cmdb.cmdb_objects.cmdb_location import CmdbLocation
-from cmdb.cmdb_objects.cmdb_object import CmdbObject
+from cmdb.cmdb_objects.cmdb_object_refs import CmdbObjectRefs
 from cmdb.interface.route_utils import insert_request_user
 from cmdb.user_management.models.user import UserModel
 from cmdb.manager.manager_provider import ManagerType, ManagerProvider
@@ -139,7 +138,8 @@ def get_types(params: TypeIterationParameters, request_user: UserModel):
                                                                         limit=params.limit,
                                                                         skip=params.skip,
                                                                         sort=params.sort,
-                                                                        order=params.order)
+                                                                        order=params.order,
+                                                                        total=params.total)
 
         types = [TypeModel.to_json(type) for type in iteration_result.results]
 
@@ -234,7 +234,8 @@ def update_type(public_id: int, data: dict, request_user: UserModel):
     try:
         unchanged_type = type_manager.get(public_id)
 
-        data.setdefault('last_edit_time', datetime.now(timezone.utc))
+        # the edit time is set for every update, delta exports transfer the objects of changed types again
+        data['last_edit_time'] = datetime.now(timezone.utc)
         type_ = TypeModel.from_data(data=data)
         type_manager.update(public_id=PublicID(public_id), type=TypeModel.to_json(type_))
         api_response = UpdateSingleResponse(result=data, url=request.url, model=TypeModel.MODEL)
@@ -247,7 +248,6 @@ def update_type(public_id: int, data: dict, request_user: UserModel):
 
     # when types are updated, update all locations with relevant data from this type
     updated_type = type_manager.get(public_id)
-    locations_with_type = locations_manager.get_locations_by(type_id=public_id)
 
     loc_data = {
         'type_label': updated_type.label,
@@ -255,16 +255,31 @@ def update_type(public_id: int, data: dict, request_user: UserModel):
         'type_selectable': updated_type.selectable_as_parent
     }
 
-    location: CmdbLocation
-    for location in locations_with_type:
-        locations_manager.update({'public_id':location.public_id}, loc_data)
+    try:
+        locations_manager.update_many({'type_id': public_id}, loc_data)
+    except ManagerUpdateError as err:
+        LOGGER.error("[update_type] Locations of type %s could not be updated: %s", public_id, err.message)
+
+    # adjust the multi data sections of all objects of the type to the changed fields
+    changed_sections = type_manager.get_changed_multi_data_sections(unchanged_type, data)
 
-    # check and update all multi data sections for the type if required
-    updated_objects = type_manager.handle_mutli_data_sections(unchanged_type, data)
+    migration_error = None
 
-    an_object: CmdbObject
-    for an_object in updated_objects:
-        objects_manager.update_object(an_object.public_id, CmdbObject.to_json(an_object))
+    try:
+        type_manager.migrate_multi_data_sections(public_id, changed_sections)
+    except ManagerUpdateError as err:
+        LOGGER.error("[update_type] Multi data sections of type %s could not be migrated: %s", public_id, err.message)
+        migration_error = err
+
+    # the reference edges of the objects depend on the reference fields of the type
+    if CmdbObjectRefs.get_reference_fields(TypeModel.to_json(unchanged_type)) \
+            != CmdbObjectRefs.get_reference_fields(TypeModel.to_json(updated_type)):
+        objects_manager.object_refs.index_type(public_id)
+
+    if migration_error:
+        return abort(500, f"Type with public_id: {public_id} was updated, but the multi data sections of its objects "
+                          "could not be migrated! The migration is resumed on the next start "
+                          "or with --resume-type-migrations.")
 
     return api_response.make_response()
 
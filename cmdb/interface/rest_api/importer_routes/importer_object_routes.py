@@ -14,7 +14,6 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 """TODO: document"""
-import json
 import logging
 from flask import request, abort
 from werkzeug.datastructures import FileStorage
@@ -24,8 +23,6 @@
 from cmdb.manager.type_manager import TypeManager
 from cmdb.manager.logs_manager import LogsManager
 
-from cmdb.database.utils import default
-from cmdb.framework.models.log import LogAction, CmdbObjectLog
 from cmdb.importer.importer_config import ObjectImporterConfig
 from cmdb.importer.importer_response import ImporterObjectResponse
 from cmdb.importer.parser_base import BaseObjectParser
@@ -37,14 +34,11 @@
     get_element_from_data_request, generate_parsed_output, verify_import_access
 from cmdb.user_management.models.user import UserModel
 from cmdb.manager.manager_provider import ManagerType, ManagerProvider
-from cmdb.framework.cmdb_render import CmdbRender
 from cmdb.importer import load_parser_class, load_importer_class, __OBJECT_IMPORTER__, __OBJECT_PARSER__, \
     __OBJECT_IMPORTER_CONFIG__, load_importer_config_class
 
-from cmdb.errors.manager import ManagerInsertError
 from cmdb.errors.security import AccessDeniedError
 from cmdb.errors.manager.object_manager import ObjectManagerGetError
-from cmdb.errors.render import InstanceRenderError
 from cmdb.errors.importer import ImportRuntimeError, ParserRuntimeError, ImporterLoadError, ParserLoadError
 # -------------------------------------------------------------------------------------------------------------------- #
 
@@ -201,7 +195,8 @@ def import_objects(request_user: UserModel):
         #TODO: ERROR-FIX
         LOGGER.debug("[import_objects] ImporterLoadError: %s", err.message)
         return abort(406)
-    importer = importer_class(working_file, importer_config, parser, objects_manager, request_user)
+    importer = importer_class(working_file, importer_config, parser, objects_manager, request_user,
+                              logs_manager=logs_manager)
 
     try:
         import_response: ImporterObjectResponse = importer.start_import()
@@ -216,39 +211,4 @@ def import_objects(request_user: UserModel):
     # close request file
     request_file.close()
 
-    # log all successful imports
-    for message in import_response.success_imports:
-        try:
-            # get object state of every imported object
-            current_type_instance = objects_manager.get_object_type(importer_config_request.get('type_id'))
-            current_object = objects_manager.get_object(message.public_id)
-
-            current_object_render_result = CmdbRender(object_instance=current_object,
-                                                      type_instance=current_type_instance,
-                                                      render_user=request_user,
-                                                      objects_manager=objects_manager).result()
-
-            # insert object create log
-            log_params = {
-                'object_id': message.public_id,
-                'user_id': request_user.get_public_id(),
-                'user_name': request_user.get_display_name(),
-                'comment': 'Object was imported',
-                'render_state': json.dumps(current_object_render_result, default=default).encode('UTF-8'),
-                'version': current_object.version
-            }
-
-            logs_manager.insert_log(action=LogAction.CREATE, log_type=CmdbObjectLog.__name__, **log_params)
-
-        except ObjectManagerGetError as err:
-            LOGGER.debug("[import_objects] ObjectManagerGetError: %s", err.message)
-            return abort(404)
-        except InstanceRenderError as err:
-            #TODO: ERROR-FIX
-            LOGGER.debug("[import_objects] InstanceRenderError: %s", err.message)
-            return abort(500)
-        except ManagerInsertError as err:
-            #TODO: ERROR-FIX
-            LOGGER.debug("[import_objects] ManagerInsertError: %s", err.message)
-
     return make_response(import_response)
@@ -74,7 +74,8 @@ def get_logs_with_existing_objects(params: CollectionParameters, request_user: U
 
     try:
         query = logs_manager.query_builder.prepare_log_query()
-        builder_params = BuilderParameters(query, params.limit, params.skip, params.sort, params.order)
+        builder_params = BuilderParameters(query, params.limit, params.skip, params.sort, params.order,
+                                           params.cursor_mode, params.cursor, params.total)
 
         object_logs = logs_manager.iterate(builder_params)
         logs = [CmdbObjectLog.to_json(_) for _ in object_logs.results]
@@ -84,7 +85,9 @@ def get_logs_with_existing_objects(params: CollectionParameters, request_user: U
                                         params,
                                         request.url,
                                         CmdbMetaLog.MODEL,
-                                        request.method == 'HEAD')
+                                        request.method == 'HEAD',
+                                        next_cursor=object_logs.next_cursor,
+                                        prev_cursor=object_logs.prev_cursor)
     except ManagerIterationError as err:
         LOGGER.debug("[get_logs_with_existing_objects] ManagerIterationError: %s", err.message)
         return ErrorMessage(400, "Could not retrieve existing object logs from database!").response()
@@ -109,7 +112,8 @@ def get_logs_with_deleted_objects(params: CollectionParameters, request_user: Us
 
     try:
         query = logs_manager.query_builder.prepare_log_query(False)
-        builder_params = BuilderParameters(query, params.limit, params.skip, params.sort, params.order)
+        builder_params = BuilderParameters(query, params.limit, params.skip, params.sort, params.order,
+                                           params.cursor_mode, params.cursor, params.total)
 
         object_logs = logs_manager.iterate(builder_params)
         logs = [CmdbObjectLog.to_json(_) for _ in object_logs.results]
@@ -119,7 +123,9 @@ def get_logs_with_deleted_objects(params: CollectionParameters, request_user: Us
                                         params,
                                         request.url,
                                         CmdbMetaLog.MODEL,
-                                        request.method == 'HEAD')
+                                        request.method == 'HEAD',
+                                        next_cursor=object_logs.next_cursor,
+                                        prev_cursor=object_logs.prev_cursor)
     except ManagerIterationError as err:
         LOGGER.debug("[get_logs_with_deleted_objects] ManagerIterationError: %s", err.message)
         return ErrorMessage(400, "Could not retrieve deleted objects logs from database!").response()
@@ -148,7 +154,8 @@ def get_object_delete_logs(params: CollectionParameters, request_user: UserModel
             'action': LogAction.DELETE.value
         }
 
-        builder_params = BuilderParameters(query, params.limit, params.skip, params.sort, params.order)
+        builder_params = BuilderParameters(query, params.limit, params.skip, params.sort, params.order,
+                                           params.cursor_mode, params.cursor, params.total)
         object_logs = logs_manager.iterate(builder_params)
         logs = [CmdbObjectLog.to_json(_) for _ in object_logs.results]
 
@@ -157,7 +164,9 @@ def get_object_delete_logs(params: CollectionParameters, request_user: UserModel
                                         params,
                                         request.url,
                                         CmdbMetaLog.MODEL,
-                                        request.method == 'HEAD')
+                                        request.method == 'HEAD',
+                                        next_cursor=object_logs.next_cursor,
+                                        prev_cursor=object_logs.prev_cursor)
     except ManagerIterationError as err:
         LOGGER.debug("[get_object_delete_logs] ManagerIterationError: %s", err.message)
         return ErrorMessage(400, "Could not retrieve the deleted object logs from database!").response()
@@ -186,7 +195,9 @@ def get_logs_by_object(object_id: int, params: CollectionParameters, request_use
                                            params.limit,
                                            params.skip,
                                            params.sort,
-                                           params.order)
+                                           params.order,
+                                           params.cursor_mode,
+                                           params.cursor)
 
         iteration_result = logs_manager.iterate(builder_params)
 
@@ -197,7 +208,9 @@ def get_logs_by_object(object_id: int, params: CollectionParameters, request_use
                                         params,
                                         request.url,
                                         CmdbMetaLog.MODEL,
-                                        request.method == 'HEAD')
+                                        request.method == 'HEAD',
+                                        next_cursor=iteration_result.next_cursor,
+                                        prev_cursor=iteration_result.prev_cursor)
     except ManagerIterationError as err:
         LOGGER.debug("[get_logs_by_object] ManagerIterationError: %s", err.message)
         return ErrorMessage(400, f"Could not retrieve logs for object with ID:{object_id}!").response()
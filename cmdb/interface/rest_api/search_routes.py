@@ -19,6 +19,7 @@
 from flask import request, abort
 
 from cmdb.manager.objects_manager import ObjectsManager
+from cmdb.cmdb_objects.cmdb_search_entry import CmdbSearchEntry
 
 from cmdb.interface.route_utils import make_response, insert_request_user, login_required
 from cmdb.search import Search
@@ -51,10 +52,11 @@ def quick_search_result_counter(request_user: UserModel):
     pipeline: Pipeline = builder.build(search_term=search_term,
                                        user=request_user,
                                        permission=AccessControlPermission.READ,
-                                       active_flag=only_active)
+                                       active_flag=only_active,
+                                       objects_manager=objects_manager)
 
     try:
-        result = list(objects_manager.aggregate_objects(pipeline=pipeline))
+        result = list(objects_manager.aggregate_from_other_collection(CmdbSearchEntry.COLLECTION, pipeline=pipeline))
     except Exception as err:
         LOGGER.error('[Search count]: %s',err)
         return abort(400)
@@ -105,7 +107,7 @@ def search_framework(request_user: UserModel):
 
         result = searcher.aggregate(pipeline=query, request_user=request_user, limit=limit, skip=skip,
                                     resolve=resolve_object_references, permission=AccessControlPermission.READ,
-                                    active=only_active)
+                                    active=only_active, matches_regex=builder.matches_regex)
     except Exception as err:
         LOGGER.error('[search_framework]: %s',err)
         return make_response([], 204)
@@ -69,7 +69,8 @@ def get_groups(params: CollectionParameters, request_user: UserModel):
 
     try:
         iteration_result: IterationResult[UserGroupModel] = group_manager.iterate(
-            filter=params.filter, limit=params.limit, skip=params.skip, sort=params.sort, order=params.order)
+            filter=params.filter, limit=params.limit, skip=params.skip, sort=params.sort, order=params.order,
+            total=params.total)
         groups = [UserGroupModel.to_dict(group) for group in iteration_result.results]
 
         api_response = GetMultiResponse(groups, total=iteration_result.total, params=params,
@@ -20,7 +20,7 @@
 import logging
 from functools import wraps
 from datetime import datetime
-from flask import request, abort, current_app, make_response as flask_response
+from flask import request, abort, current_app, g, make_response as flask_response
 from werkzeug._internal import _wsgi_decoding_dance
 
 from cmdb.manager.users_manager import UsersManager
@@ -39,7 +39,6 @@
 from cmdb.security.token.validator import TokenValidator
 
 from cmdb.errors.manager import ManagerGetError
-from cmdb.errors.security import TokenValidationError
 # -------------------------------------------------------------------------------------------------------------------- #
 
 LOGGER = logging.getLogger(__name__)
@@ -93,10 +92,9 @@ def decorated(*args, **kwargs):
 
 #@deprecated
 def auth_is_valid() -> bool:
-    """TODO: document"""
+    """Checks if the current request carries a valid authorization"""
     try:
-        parse_authorization_header(request.headers['Authorization'])
-        return True
+        return load_request_auth()
     except Exception as err:
         LOGGER.error(err)
         return False
@@ -104,39 +102,16 @@ def auth_is_valid() -> bool:
 
 def user_has_right(required_right: str) -> bool:
     """Check if a user has a specific right"""
-    with current_app.app_context():
-        users_manager = UsersManager(current_app.database_manager)
-        group_manager = GroupManager(current_app.database_manager, RightManager(rights))
-
-    token = parse_authorization_header(request.headers['Authorization'])
-
-    try:
-        decrypted_token = TokenValidator(database_manager=current_app.database_manager).decode_token(token)
-    except TokenValidationError as err:
-        #TODO: ERROR-FIX
-        LOGGER.debug("[user_has_right] Error: %s", str(err))
+    if not load_request_auth():
         return abort(401)
 
-    try:
-        user_id = decrypted_token['DATAGERRY']['value']['user']['public_id']
-
-        if current_app.cloud_mode:
-            database = decrypted_token['DATAGERRY']['value']['user']['database']
-            users_manager = UsersManager(current_app.database_manager, database)
-            group_manager = GroupManager(current_app.database_manager, RightManager(rights), database)
-
-        user = users_manager.get_user(user_id)
-        group = group_manager.get(user.group_id)
-        right_status = group.has_right(required_right)
+    group: UserGroupModel = g.request_user_group
 
-        if not right_status:
-            right_status = group.has_extended_right(required_right)
-
-        return right_status
-
-    except ManagerGetError:
+    if not group:
         return False
 
+    return group.has_right(required_right) or group.has_extended_right(required_right)
+
 
 #@deprecated
 def insert_request_user(func):
@@ -146,37 +121,66 @@ def insert_request_user(func):
 
     @functools.wraps(func)
     def get_request_user(*args, **kwargs):
-        with current_app.app_context():
-            users_manager = UsersManager(current_app.database_manager)
-
-        token = parse_authorization_header(request.headers['Authorization'])
-        try:
-            with current_app.app_context():
-                decrypted_token = TokenValidator(current_app.database_manager).decode_token(token)
-        except TokenValidationError:
-            #TODO: ERROR-FIX
+        if not load_request_auth() or not g.request_user:
             return abort(401)
 
-        try:
-            user_id = decrypted_token['DATAGERRY']['value']['user']['public_id']
-
-            if current_app.cloud_mode:
-                database = decrypted_token['DATAGERRY']['value']['user']['database']
-                users_manager = UsersManager(current_app.database_manager, database)
-        except ValueError:
-            return abort(401)
-        except Exception as err:
-            LOGGER.debug("[insert_request_user] Uncatched error type: %s", type(err))
-            return abort(401)
-
-        user = users_manager.get_user(user_id)
-        kwargs.update({'request_user': user})
+        kwargs.update({'request_user': g.request_user})
 
         return func(*args, **kwargs)
 
     return get_request_user
 
 
+def load_request_auth() -> bool:
+    """
+    Authenticates the current request once and stores the result on `flask.g`
+
+    The decoded token claims, the request user and the group of the user are available as
+    `g.auth_claims`, `g.request_user` and `g.request_user_group` until the request ends.
+    Every following call inside the same request only reads the stored result.
+
+    Returns:
+        bool: True if the request carries a valid token
+    """
+    if 'auth_claims' in g:
+        return g.auth_claims is not None
+
+    g.auth_claims = None
+    g.request_user = None
+    g.request_user_group = None
+
+    auth_claims = decode_authorization_header(request.headers.get('Authorization'))
+
+    if auth_claims is None:
+        return False
+
+    g.auth_claims = auth_claims
+
+    try:
+        user_id = auth_claims['DATAGERRY']['value']['user']['public_id']
+        database = None
+
+        if current_app.cloud_mode:
+            database = auth_claims['DATAGERRY']['value']['user']['database']
+    except Exception as err:
+        LOGGER.debug("[load_request_auth] Invalid token payload: %s, Type: %s", err, type(err))
+        g.auth_claims = None
+        return False
+
+    with current_app.app_context():
+        users_manager = UsersManager(current_app.database_manager, database)
+        group_manager = GroupManager(current_app.database_manager, RightManager(rights), database)
+
+    try:
+        g.request_user = users_manager.get_user(user_id)
+        g.request_user_group = group_manager.get(g.request_user.group_id)
+    except ManagerGetError as err:
+        #TODO: ERROR-FIX
+        LOGGER.debug("[load_request_auth] User or group of the token not found: %s", err)
+
+    return True
+
+
 #@deprecated
 def right_required(required_right: str, excepted: dict = None):
     """wraps function for routes which requires a special user right
@@ -185,19 +189,19 @@ def right_required(required_right: str, excepted: dict = None):
     def _page_right(func):
         @functools.wraps(func)
         def _decorate(*args, **kwargs):
-            group_manager = GroupManager(current_app.database_manager, RightManager(rights))
-
             try:
                 current_user: UserModel = kwargs['request_user']
             except KeyError:
                 return abort(400, 'No request user was provided')
             try:
-                if current_app.cloud_mode:
+                if g.get('request_user') is current_user and g.request_user_group:
+                    group: UserGroupModel = g.request_user_group
+                else:
                     group_manager = GroupManager(current_app.database_manager,
                                                  RightManager(rights),
-                                                 current_user.database)
+                                                 current_user.database if current_app.cloud_mode else None)
+                    group: UserGroupModel = group_manager.get(current_user.group_id)
 
-                group: UserGroupModel = group_manager.get(current_user.group_id)
                 has_right = group.has_right(required_right)
             except ManagerGetError:
                 return abort(404, 'Group or right does not exist!')
@@ -225,15 +229,7 @@ def parse_authorization_header(header):
     if not header:
         return None
 
-    value = _wsgi_decoding_dance(header)
-
-    try:
-        auth_type, auth_info = value.split(None, 1)
-        auth_type = auth_type.lower()
-    except ValueError:
-        # Fallback for old versions
-        auth_type = b"bearer"
-        auth_info = value
+    auth_type, auth_info = split_authorization_header(header)
 
     if auth_type in (b"basic","basic"):
         try:
@@ -302,8 +298,62 @@ def parse_authorization_header(header):
 
     return None
 
+
+def decode_authorization_header(header):
+    """
+    Parses the HTTP Auth Header and decodes its JWT Token
+    Args:
+        header: Authorization header of the HTTP Request
+    Returns:
+        JWTClaims: Decoded and validated claims of the token, None if the header is not valid
+    """
+    if not header:
+        return None
+
+    auth_type, auth_info = split_authorization_header(header)
+
+    if auth_type in ("bearer", b"bearer"):
+        token = auth_info
+    else:
+        # A basic authorization is exchanged for a newly generated token
+        token = parse_authorization_header(header)
+
+    if not token:
+        return None
+
+    try:
+        with current_app.app_context():
+            tv = TokenValidator(current_app.database_manager)
+            decoded_token = tv.decode_token(token)
+            tv.validate_token(decoded_token)
+
+        return decoded_token
+    except Exception:
+        return None
+
 # ------------------------------------------------------ HELPER ------------------------------------------------------ #
 
+def split_authorization_header(header) -> tuple:
+    """
+    Splits the HTTP Auth Header into the authorization type and the credentials
+    Args:
+        header: Authorization header of the HTTP Request
+    Returns:
+        tuple: Lowercase authorization type and the credentials
+    """
+    value = _wsgi_decoding_dance(header)
+
+    try:
+        auth_type, auth_info = value.split(None, 1)
+        auth_type = auth_type.lower()
+    except ValueError:
+        # Fallback for old versions
+        auth_type = b"bearer"
+        auth_info = value
+
+    return auth_type, auth_info
+
+
 def check_user_in_mysql_db(mail: str, password: str):
     """Simulates Users in MySQL DB"""
 
@@ -15,11 +15,17 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 """Contains implementation of BaseManager"""
 import logging
+from pymongo.errors import PyMongoError
 from pymongo.results import DeleteResult
 
 from cmdb.database.mongo_database_manager import MongoDatabaseManager
 
 from cmdb.framework.utils import Collection
+from cmdb.framework.results import IterationResult
+from cmdb.manager.query_builder.base_query_builder import BaseQueryBuilder
+from cmdb.manager.query_builder.builder_parameters import BuilderParameters, TotalCount
+from cmdb.security.acl.permission import AccessControlPermission
+from cmdb.user_management.models.user import UserModel
 
 from cmdb.errors.manager import ManagerInsertError,\
                                 ManagerGetError,\
@@ -36,9 +42,10 @@
 class BaseManager:
     """This is the base class for every FrameworkManager"""
 
-    def __init__(self, collection: Collection, dbm: MongoDatabaseManager):
+    def __init__(self, collection: Collection, dbm: MongoDatabaseManager, query_builder: BaseQueryBuilder = None):
         self.collection: Collection = collection
         self.dbm: MongoDatabaseManager = dbm
+        self.query_builder: BaseQueryBuilder = query_builder or BaseQueryBuilder()
 
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -200,6 +207,69 @@ def aggregate_from_other_collection(self, collection: str, *args, **kwargs):
             raise ManagerIterationError(err) from err
 
 
+    def iterate_query(self,
+                      builder_params: BuilderParameters,
+                      user: UserModel = None,
+                      permission: AccessControlPermission = None,
+                      collection: str = None) -> IterationResult:
+        """
+        Retrieves a page of documents and their total
+
+        The page is read with the `build()` pipeline of the `query_builder` of the manager. Its sort is followed by
+        the limit and in cursor mode preceded by the range match of the cursor, so MongoDB only reads the page.
+        The exact total of a page comes from a separate count pipeline without sort.
+        Without page borders (limit, skip or cursor) the total is the number of results, so no count is needed.
+
+        Args:
+            builder_params (BuilderParameters): Contains input to identify the target of action
+            user (UserModel, optional): User requesting this action
+            permission (AccessControlPermission, optional): Permission which should be checked for the user
+            collection (str, optional): Collection the pipeline starts from, the collection of the manager if not set
+
+        Raises:
+            ManagerIterationError: If the aggregation failed
+
+        Returns:
+            IterationResult: Raw documents of the page, the total is None for `TotalCount.NONE`
+        """
+        total_count = builder_params.get_total()
+
+        if total_count == TotalCount.ESTIMATED and (builder_params.has_criteria() or (user and permission)):
+            total_count = TotalCount.EXACT
+
+        has_page_borders = builder_params.has_limit() or builder_params.get_skip() != 0 \
+                           or builder_params.is_cursor_mode()
+
+        collection = collection or self.collection
+
+        try:
+            results = list(self.aggregate_from_other_collection(collection,
+                                                                self.query_builder.build(builder_params,
+                                                                                         user,
+                                                                                         permission)))
+
+            if total_count == TotalCount.ESTIMATED:
+                total = self.dbm.get_collection(collection).estimated_document_count()
+            elif total_count == TotalCount.EXACT and has_page_borders:
+                count_result = next(self.aggregate_from_other_collection(collection,
+                                                                         self.query_builder.count(
+                                                                             builder_params.get_criteria(),
+                                                                             user,
+                                                                             permission)), {})
+                total = count_result.get('total', 0)
+            elif total_count == TotalCount.EXACT:
+                total = len(results)
+            else:
+                total = None
+        except PyMongoError as err:
+            raise ManagerIterationError(err) from err
+
+        iteration_result = IterationResult(results, total)
+        iteration_result.apply_cursor(builder_params)
+
+        return iteration_result
+
+
     def get_next_public_id(self):
         """
         Retrieves next public_id for the collection
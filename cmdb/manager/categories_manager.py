@@ -21,6 +21,7 @@
 from cmdb.database.mongo_database_manager import MongoDatabaseManager
 from cmdb.manager.type_manager import TypeManager
 from cmdb.manager.base_manager import BaseManager
+from cmdb.manager.category_tree_cache import CATEGORY_TREE_CACHE
 
 from cmdb.event_management.event import Event
 from cmdb.framework import CategoryModel
@@ -29,7 +30,6 @@
 from cmdb.security.acl.permission import AccessControlPermission
 from cmdb.user_management.models.user import UserModel
 
-from cmdb.manager.query_builder.base_query_builder import BaseQueryBuilder
 from cmdb.manager.query_builder.builder_parameters import BuilderParameters
 
 from cmdb.errors.manager import ManagerInsertError,\
@@ -55,7 +55,6 @@ def __init__(self, dbm: MongoDatabaseManager, event_queue: Union[Queue, Event] =
             event_queue (Queue, Event): The queue for sending events or the created event to send
         """
         self.event_queue = event_queue
-        self.query_builder = BaseQueryBuilder()
 
         if database:
             dbm.connector.set_database(database)
@@ -79,6 +78,16 @@ def tree(self) -> CategoryTree:
 
         return CategoryTree(categories, types)
 
+
+    def get_tree_data(self) -> list[dict]:
+        """
+        Get the serialised category tree from the cache, the tree is only built after changes
+
+        Returns:
+            list[dict]: Json conform nodes of the root categories
+        """
+        return CATEGORY_TREE_CACHE.get_tree(self.dbm, lambda: CategoryTree.to_json(self.tree))
+
 # --------------------------------------------------- CRUD - CREATE -------------------------------------------------- #
 
     def insert_category(self, category: dict) -> int:
@@ -100,6 +109,14 @@ def insert_category(self, category: dict) -> int:
 
         return ack
 
+
+    def insert(self, data: dict, skip_public: bool = False) -> int:
+        """Inserts a category and invalidates the cached category tree"""
+        ack = super().insert(data, skip_public)
+        CATEGORY_TREE_CACHE.invalidate(self.dbm)
+
+        return ack
+
 # ---------------------------------------------------- CRUD - READ --------------------------------------------------- #
 
     def iterate(self,
@@ -118,22 +135,9 @@ def iterate(self,
         Returns:
             IterationResult[CategoryModel]: Result which matches the Builderparameters
         """
-        try:
-            query: list[dict] = self.query_builder.build(builder_params,user, permission)
-            count_query: list[dict] = self.query_builder.count(builder_params.get_criteria())
-
-            aggregation_result = list(self.aggregate(query))
-            total_cursor = self.aggregate(count_query)
-
-            total = 0
-            while total_cursor.alive:
-                total = next(total_cursor)['total']
-
-        except ManagerGetError as err:
-            raise ManagerIterationError(err) from err
+        iteration_result: IterationResult[CategoryModel] = self.iterate_query(builder_params, user, permission)
 
         try:
-            iteration_result: IterationResult[CategoryModel] = IterationResult(aggregation_result, total)
             iteration_result.convert_to(CategoryModel)
         except Exception as err:
             raise ManagerIterationError(err) from err
@@ -164,6 +168,32 @@ def count_categories(self):
         return categories_count
 
 
+# --------------------------------------------------- CRUD - UPDATE -------------------------------------------------- #
+
+    def update(self, criteria: dict, data: dict, *args, **kwargs):
+        """Updates a category and invalidates the cached category tree"""
+        ack = super().update(criteria, data, *args, **kwargs)
+        CATEGORY_TREE_CACHE.invalidate(self.dbm)
+
+        return ack
+
+
+    def update_many(self, criteria: dict, update: dict, add_to_set: bool = False):
+        """Updates categories and invalidates the cached category tree"""
+        ack = super().update_many(criteria, update, add_to_set)
+        CATEGORY_TREE_CACHE.invalidate(self.dbm)
+
+        return ack
+
+# --------------------------------------------------- CRUD - DELETE -------------------------------------------------- #
+
+    def delete(self, criteria: dict) -> bool:
+        """Deletes a category and invalidates the cached category tree"""
+        ack = super().delete(criteria)
+        CATEGORY_TREE_CACHE.invalidate(self.dbm)
+
+        return ack
+
 # ------------------------------------------------- HELPER FUNCTIONS ------------------------------------------------- #
 
     def reset_children_categories(self, public_id: int) -> None:
@@ -174,16 +204,7 @@ def reset_children_categories(self, public_id: int) -> None:
             public_id (int): public_id of parent category
         """
         try:
-            # Get all children
-            cursor_result = self.get(filter={'parent': public_id})
-
-            # Update all child categories
-            for category in cursor_result:
-                category['parent'] = None
-                category_public_id = category['public_id']
-                self.update({'public_id':category_public_id}, category)
-        except ManagerGetError as err:
-            raise ManagerGetError(err) from err
+            self.update_many({'parent': public_id}, {'parent': None})
         except ManagerUpdateError as err:
             LOGGER.debug("[reset_children_categories] ManagerUpdateError: %s", err.message)
             raise ManagerUpdateError(err) from err
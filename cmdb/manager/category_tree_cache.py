@@ -0,0 +1,156 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2024 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Process wide cache for the serialised category tree
+
+The category tree is loaded with every page of the UI but changes only with categories and types. The cache holds
+the tree per tenant database. Every write of a category or type increases a revision counter of the tenant in the
+database, other processes compare their revision with it at most every `REVALIDATION_INTERVAL` seconds.
+"""
+import copy
+import time
+import logging
+import threading
+from typing import Callable, Union
+from pymongo import ReturnDocument
+
+from cmdb.database.database_manager import DatabaseManager
+from cmdb.framework.models.category import CategoryModel
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                             CategoryTreeSnapshot - CLASS                                             #
+# -------------------------------------------------------------------------------------------------------------------- #
+class CategoryTreeSnapshot:
+    """Serialised category tree of a single tenant database"""
+
+    def __init__(self, revision: int, tree: list[dict]):
+        self.revision: int = revision
+        self.last_check: float = time.monotonic()
+        self.tree: list[dict] = tree
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                               CategoryTreeCache - CLASS                                              #
+# -------------------------------------------------------------------------------------------------------------------- #
+class CategoryTreeCache:
+    """
+    Cache of the serialised category tree keyed by tenant database
+
+    Notes:
+        The cached tree is never handed out directly. Every call returns a deep copy.
+    """
+
+    REVISION_COLLECTION = 'datastorage.revisions'
+    REVISION_ID = CategoryModel.COLLECTION
+    REVALIDATION_INTERVAL: float = 5.0
+
+    def __init__(self, revalidation_interval: float = REVALIDATION_INTERVAL):
+        self.revalidation_interval = revalidation_interval
+        self.__snapshots: dict[str, CategoryTreeSnapshot] = {}
+        self.__generations: dict[str, int] = {}
+        self.__lock = threading.RLock()
+        self.hits: int = 0
+        self.misses: int = 0
+
+
+    def get_tree(self, dbm: DatabaseManager, build_tree: Callable[[], list[dict]]) -> list[dict]:
+        """
+        Retrieves the serialised category tree of the tenant
+
+        Args:
+            dbm (DatabaseManager): Database connection of the tenant
+            build_tree (Callable[[], list[dict]]): Builds the serialised tree if no valid snapshot exists
+
+        Returns:
+            list[dict]: Copy of the serialised tree
+        """
+        database_name = dbm.connector.database.name
+
+        with self.__lock:
+            snapshot = self.__snapshots.get(database_name)
+            generation = self.__generations.get(database_name, 0)
+
+            if snapshot and time.monotonic() - snapshot.last_check < self.revalidation_interval:
+                self.hits += 1
+                return copy.deepcopy(snapshot.tree)
+
+        revision = self.__load_revision(dbm)
+
+        with self.__lock:
+            if snapshot and revision is not None and snapshot.revision == revision \
+                    and self.__snapshots.get(database_name) is snapshot:
+                snapshot.last_check = time.monotonic()
+                self.hits += 1
+                return copy.deepcopy(snapshot.tree)
+
+            self.misses += 1
+
+        tree = build_tree()
+
+        with self.__lock:
+            # a snapshot is only stored if the tenant was not invalidated while the tree was built
+            if revision is not None and self.__generations.get(database_name, 0) == generation:
+                self.__snapshots[database_name] = CategoryTreeSnapshot(revision, copy.deepcopy(tree))
+
+        return tree
+
+
+    def invalidate(self, dbm: DatabaseManager):
+        """
+        Drops the tree of the tenant and increases the revision of the tenant, so that other processes
+        drop their tree too
+
+        Args:
+            dbm (DatabaseManager): Database connection of the tenant
+        """
+        try:
+            dbm.get_collection(self.REVISION_COLLECTION).find_one_and_update({'_id': self.REVISION_ID},
+                                                                             {'$inc': {'revision': 1}},
+                                                                             upsert=True,
+                                                                             return_document=ReturnDocument.AFTER)
+        except Exception as err:
+            #TODO: ERROR-FIX
+            LOGGER.warning("[CategoryTreeCache] Revision of categories could not be increased: %s", err)
+
+        with self.__lock:
+            database_name = dbm.connector.database.name
+            self.__snapshots.pop(database_name, None)
+            self.__generations[database_name] = self.__generations.get(database_name, 0) + 1
+
+
+    def clear(self):
+        """Removes all tenants from the cache"""
+        with self.__lock:
+            self.__snapshots = {}
+            self.__generations = {name: generation + 1 for name, generation in self.__generations.items()}
+
+# ------------------------------------------------- HELPER - SECTION ------------------------------------------------- #
+
+    def __load_revision(self, dbm: DatabaseManager) -> Union[int, None]:
+        """Reads the current category revision of the tenant, None if it could not be read"""
+        try:
+            revision_doc = dbm.get_collection(self.REVISION_COLLECTION).find_one({'_id': self.REVISION_ID})
+        except Exception as err:
+            #TODO: ERROR-FIX
+            LOGGER.debug("[CategoryTreeCache] Revision of categories could not be read: %s", err)
+            return None
+
+        return revision_doc['revision'] if revision_doc else 0
+
+
+CATEGORY_TREE_CACHE = CategoryTreeCache()
@@ -25,13 +25,11 @@
 from cmdb.manager.base_manager import BaseManager
 
 from cmdb.event_management.event import Event
-from cmdb.manager.query_builder.base_query_builder import BaseQueryBuilder
 from cmdb.manager.query_builder.builder_parameters import BuilderParameters
 from cmdb.docapi.docapi_template.docapi_template import DocapiTemplate
 from cmdb.user_management.models.user import UserModel
 from cmdb.framework.results import IterationResult
 
-from cmdb.errors.manager import ManagerIterationError
 from cmdb.errors.docapi import DocapiGetError, DocapiInsertError, DocapiUpdateError, DocapiDeleteError
 # -------------------------------------------------------------------------------------------------------------------- #
 
@@ -54,7 +52,6 @@ def __init__(self, dbm: MongoDatabaseManager, event_queue: Union[Queue, Event] =
             database (str): name of database for cloud mode
         """
         self.event_queue = event_queue
-        self.query_builder = BaseQueryBuilder()
 
         if database:
             dbm.connector.set_database(database)
@@ -122,19 +119,8 @@ def get_template(self, public_id: int) -> DocapiTemplate:
 
     def get_templates(self, builder_params: BuilderParameters) -> IterationResult[DocapiTemplate]:
         """TODO: document"""
-        try:
-            query: list[dict] = self.query_builder.build(builder_params)
-            count_query: list[dict] = self.query_builder.count(builder_params.get_criteria())
-
-            aggregation_result = list(self.aggregate(query))
-            total_cursor = self.aggregate(count_query)
-            total = 0
-            while total_cursor.alive:
-                total = next(total_cursor)['total']
-        except Exception as err:
-            raise ManagerIterationError(err) from err
+        iteration_result: IterationResult[DocapiTemplate] = self.iterate_query(builder_params)
 
-        iteration_result: IterationResult[DocapiTemplate] = IterationResult(aggregation_result, total)
         iteration_result.convert_to(DocapiTemplate)
 
         return iteration_result
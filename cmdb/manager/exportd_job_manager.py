@@ -15,14 +15,15 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 """TODO: document"""
 import logging
-from typing import Union
+from typing import Iterable, Union
 from datetime import datetime, timezone
+from pymongo import UpdateOne
 
 from cmdb.database.database_manager_mongo import DatabaseManagerMongo
 from cmdb.cmdb_objects.cmdb_base import CmdbManagerBase
 
 from cmdb.event_management.event import Event
-from cmdb.exportd.exportd_job.exportd_job import ExportdJob
+from cmdb.exportd.exportd_job.exportd_job import ExportdJob, ExportdExportedObject
 from cmdb.user_management.models.user import UserModel
 
 from cmdb.errors.manager.object_manager import ObjectManagerGetError
@@ -40,6 +41,8 @@
 class ExportdJobManager(CmdbManagerBase):
     """TODO: document"""
 
+    EXPORTED_BATCH_SIZE: int = 1000
+
     def __init__(self, database_manager: DatabaseManagerMongo, event_queue=None, database: str = None):
         self._event_queue = event_queue
 
@@ -196,6 +199,7 @@ def delete_job(self, public_id: int, request_user: UserModel) -> bool:
         """TODO: document"""
         try:
             ack = self._delete(collection=ExportdJob.COLLECTION, public_id=public_id)
+            self.delete_watermark(public_id)
             if self._event_queue:
                 event = Event("cmdb.exportd.deleted", {"id": public_id, "active": False,
                                                        "user_id": request_user.get_public_id(),
@@ -216,3 +220,77 @@ def run_job_manual(self, public_id: int, request_user: UserModel) -> bool:
             self._event_queue.put(event)
 
         return True
+
+
+# ---------------------------------------------------- WATERMARKS ---------------------------------------------------- #
+
+    def get_watermark(self, public_id: int) -> Union[dict, None]:
+        """
+        Retrieves the state of the last successful run of a delta job
+
+        Args:
+            public_id (int): public_id of the job
+
+        Returns:
+            dict: `date` of the run, None if there was no run yet
+        """
+        return self.dbm.get_collection(ExportdJob.WATERMARK_COLLECTION).find_one({'job_id': public_id},
+                                                                                 {'_id': 0})
+
+
+    def get_exported_ids(self, public_id: int) -> set[int]:
+        """
+        Retrieves the objects which a delta job transferred to its destinations
+
+        Args:
+            public_id (int): public_id of the job
+
+        Returns:
+            set[int]: public_ids of the objects which are at the destinations
+        """
+        return {exported['public_id'] for exported in self.dbm.get_collection(ExportdExportedObject.COLLECTION).find(
+                                                                                {'job_id': public_id},
+                                                                                {'_id': 0, 'public_id': 1})}
+
+
+    def set_watermark(self, public_id: int, date: datetime, added_ids: Iterable[int], removed_ids: Iterable[int]):
+        """
+        Stores the state of a successful run of a delta job
+
+        The exported objects are kept as one document per job and object, a run only writes the objects
+        which were added to or removed from the destinations.
+
+        Args:
+            public_id (int): public_id of the job
+            date (datetime): Start of the run, objects changed after it are transferred by the next run
+            added_ids (Iterable[int]): public_ids of the objects which are new at the destinations
+            removed_ids (Iterable[int]): public_ids of the objects which were removed from the destinations
+        """
+        exported_collection = self.dbm.get_collection(ExportdExportedObject.COLLECTION)
+        removed_ids, added_ids = sorted(removed_ids), sorted(added_ids)
+
+        for index in range(0, len(removed_ids), self.EXPORTED_BATCH_SIZE):
+            exported_collection.delete_many({'job_id': public_id,
+                                             'public_id': {'$in': removed_ids[index:index + self.EXPORTED_BATCH_SIZE]}})
+
+        for index in range(0, len(added_ids), self.EXPORTED_BATCH_SIZE):
+            exported_collection.bulk_write([UpdateOne({'job_id': public_id, 'public_id': object_id},
+                                                      {'$setOnInsert': {'job_id': public_id, 'public_id': object_id}},
+                                                      upsert=True)
+                                            for object_id in added_ids[index:index + self.EXPORTED_BATCH_SIZE]],
+                                           ordered=False)
+
+        self.dbm.get_collection(ExportdJob.WATERMARK_COLLECTION).replace_one({'job_id': public_id},
+                                                                             {'job_id': public_id, 'date': date},
+                                                                             upsert=True)
+
+
+    def delete_watermark(self, public_id: int):
+        """
+        Removes the state of a delta job, the next run transfers all objects again
+
+        Args:
+            public_id (int): public_id of the job
+        """
+        self.dbm.get_collection(ExportdJob.WATERMARK_COLLECTION).delete_one({'job_id': public_id})
+        self.dbm.get_collection(ExportdExportedObject.COLLECTION).delete_many({'job_id': public_id})
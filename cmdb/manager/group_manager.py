@@ -23,9 +23,8 @@
 from cmdb.user_management.models.group import UserGroupModel
 from cmdb.framework.results import IterationResult
 from cmdb.framework.utils import PublicID
-from cmdb.search import Pipeline
 
-from cmdb.errors.manager import ManagerUpdateError, ManagerDeleteError, ManagerGetError, ManagerIterationError
+from cmdb.errors.manager import ManagerUpdateError, ManagerDeleteError, ManagerGetError
 # -------------------------------------------------------------------------------------------------------------------- #
 
 class GroupManager(ManagerBase):
@@ -57,18 +56,7 @@ def iterate(self, filter: dict, limit: int, skip: int, sort: str, order: int, *a
         Returns:
             IterationResult: Instance of IterationResult with generic CategoryModel.
         """
-        try:
-            query: Pipeline = self.builder.build(filter=filter, limit=limit, skip=skip, sort=sort, order=order)
-            count_query: Pipeline = self.builder.count(filter=filter)
-            aggregation_result = list(self._aggregate(self.collection, query))
-            total_cursor = self._aggregate(self.collection, count_query)
-            total = 0
-            while total_cursor.alive:
-                total = next(total_cursor)['total']
-        except ManagerGetError as err:
-            raise ManagerIterationError(err) from err
-
-        iteration_result: IterationResult[UserGroupModel] = IterationResult(aggregation_result, total)
+        iteration_result: IterationResult[UserGroupModel] = self._iterate(filter, limit, skip, sort, order, **kwargs)
         iteration_result.convert_to(UserGroupModel)
 
         return iteration_result
@@ -17,6 +17,7 @@
 import logging
 from queue import Queue
 from typing import Union
+from pymongo import UpdateOne
 
 from cmdb.database.mongo_database_manager import MongoDatabaseManager
 from cmdb.manager.type_manager import TypeManager
@@ -27,10 +28,9 @@
 from cmdb.framework.results.iteration import IterationResult
 from cmdb.security.acl.permission import AccessControlPermission
 from cmdb.user_management.models.user import UserModel
-from cmdb.manager.query_builder.base_query_builder import BaseQueryBuilder
 from cmdb.manager.query_builder.builder_parameters import BuilderParameters
 
-from cmdb.errors.manager import ManagerInsertError, ManagerGetError, ManagerIterationError
+from cmdb.errors.manager import ManagerInsertError, ManagerGetError, ManagerIterationError, ManagerUpdateError
 # -------------------------------------------------------------------------------------------------------------------- #
 
 LOGGER = logging.getLogger(__name__)
@@ -56,7 +56,6 @@ def __init__(self, dbm: MongoDatabaseManager, event_queue: Union[Queue, Event] =
         if database:
             dbm.connector.set_database(database)
 
-        self.query_builder = BaseQueryBuilder()
         self.type_manager = TypeManager(dbm)
         super().__init__(CmdbLocation.COLLECTION, dbm)
 
@@ -64,13 +63,14 @@ def __init__(self, dbm: MongoDatabaseManager, event_queue: Union[Queue, Event] =
 
     def insert_location(self, data: dict) -> int:
         """
-        Insert new location in the database
+        Insert new location in the database, the ancestors are set from the parent location
         Args:
             data (dict): data of the new location
         Returns:
             Public ID of the new object in database
         """
         try:
+            data['ancestors'] = self.get_ancestors_for_parent(data['parent'])
             ack = self.insert(data)
         except Exception as err:
             raise ManagerInsertError(err) from err
@@ -95,21 +95,9 @@ def iterate(self,
         Returns:
             IterationResult[CmdbLocation]: Result which matches the Builderparameters
         """
-        try:
-            query: list[dict] = self.query_builder.build(builder_params,user, permission)
-            count_query: list[dict] = self.query_builder.count(builder_params.get_criteria())
-
-            aggregation_result = list(self.aggregate(query))
-            total_cursor = self.aggregate(count_query)
-
-            total = 0
-            while total_cursor.alive:
-                total = next(total_cursor)['total']
-        except ManagerGetError as err:
-            raise ManagerIterationError(err) from err
+        iteration_result: IterationResult[CmdbLocation] = self.iterate_query(builder_params, user, permission)
 
         try:
-            iteration_result: IterationResult[CmdbLocation] = IterationResult(aggregation_result, total)
             iteration_result.convert_to(CmdbLocation)
         except Exception as err:
             raise ManagerIterationError(err) from err
@@ -186,34 +174,151 @@ def get_locations_by(self, **requirements):
 
         return locations_list
 
-# ------------------------------------------------- HELPER FUNCTIONS ------------------------------------------------- #
 
-    def get_all_children(self, public_id: int, all_locations: dict):
+    def get_all_children(self, public_id: int) -> list[dict]:
         """
-        Retrieves all children for a given location with the public_id
+        Retrieves all children of all levels for a given location with one query on the indexed ancestors
 
         Args:
             public_id (int): public_id of the parent location
-            all_locations (dict): all locations from db
 
         Returns:
             (list[dict]): Returns all child locations
         """
-        found_children: list[dict] = []
-        recursive_children: list[dict] = []
+        return list(self.get(filter={'ancestors': public_id}))
+
+
+    def get_ancestors(self, public_id: int) -> list[CmdbLocation]:
+        """
+        Retrieves the parent locations of a location, starting with the root location
+
+        Args:
+            public_id (int): public_id of the location
+
+        Raises:
+            ManagerGetError: If the location does not exist
+
+        Returns:
+            list[CmdbLocation]: Parent locations from the root location down to the direct parent
+        """
+        location = self.get_one(public_id)
+
+        if not location:
+            raise ManagerGetError(f'Location with ID: {public_id} not found!')
+
+        ancestor_ids: list[int] = location.get('ancestors', [])
+        ancestors = {ancestor['public_id']: ancestor for ancestor in self.get(filter={'public_id':
+                                                                                        {'$in': ancestor_ids}})}
+
+        return [CmdbLocation(**ancestors[ancestor_id]) for ancestor_id in ancestor_ids if ancestor_id in ancestors]
+
+# --------------------------------------------------- CRUD - UPDATE -------------------------------------------------- #
+
+    def update_location(self, object_id: int, data: dict):
+        """
+        Updates the location of an object, a changed parent moves the location with all its children
+
+        Args:
+            object_id (int): public_id of the object of the location
+            data (dict): New values of the location
+
+        Raises:
+            ManagerUpdateError: If the location could not be updated or would be moved below itself
+
+        Returns:
+            UpdateResult: Acknowledgment of database
+        """
+        try:
+            location = self.get_one_by({'object_id': object_id})
+
+            if not location:
+                raise ManagerGetError(f'Location of the object with ID: {object_id} not found!')
+
+            if 'parent' in data and data['parent'] != location['parent']:
+                ancestors = self.get_ancestors_for_parent(data['parent'])
+
+                if location['public_id'] in ancestors:
+                    raise ManagerUpdateError('A location can not be moved below one of its children!')
+
+                data['ancestors'] = ancestors
+                self.__move_children(location['public_id'], ancestors)
+        except ManagerGetError as err:
+            raise ManagerUpdateError(err) from err
+
+        return self.update({'public_id': location['public_id']}, data)
+
+# ------------------------------------------------- HELPER FUNCTIONS ------------------------------------------------- #
+
+    def get_ancestors_for_parent(self, parent: int) -> list[int]:
+        """
+        Returns the ancestors of a location below the given parent location
+
+        Args:
+            parent (int): public_id of the parent location
+
+        Raises:
+            ManagerGetError: If the parent location does not exist
+
+        Returns:
+            list[int]: The ancestors of the parent followed by the parent
+        """
+        parent_location = self.get_one(parent)
+
+        if not parent_location:
+            raise ManagerGetError(f'Parent location with ID: {parent} not found!')
+
+        return parent_location.get('ancestors', []) + [parent]
+
+
+    def rebuild_ancestors(self) -> int:
+        """
+        Sets the ancestors of all locations from their parents
+
+        Locations with a missing parent or inside a parent cycle keep the ancestors up to the break.
+
+        Returns:
+            int: Number of updated locations
+        """
+        locations = {location['public_id']: location
+                     for location in self.get(filter={}, projection={'_id': 0, 'public_id': 1, 'parent': 1,
+                                                                     'ancestors': 1})}
+        resolved: dict[int, list[int]] = {}
+        requests = []
+
+        for public_id in locations:
+            # walk up until a location with resolved ancestors, then resolve the path downwards
+            path = []
+            current_id = public_id
+
+            while current_id in locations and current_id not in resolved and current_id not in path:
+                path.append(current_id)
+                current_id = locations[current_id].get('parent')
+
+            ancestors = resolved[current_id] + [current_id] if current_id in resolved else []
+
+            for location_id in reversed(path):
+                resolved[location_id] = ancestors
+                ancestors = ancestors + [location_id]
+
+        for public_id, ancestors in resolved.items():
+            if locations[public_id].get('ancestors') != ancestors:
+                requests.append(UpdateOne({'public_id': public_id}, {'$set': {'ancestors': ancestors}}))
+
+        if requests:
+            self.dbm.get_collection(self.collection).bulk_write(requests, ordered=False)
+
+        return len(requests)
 
-        # add direct children
-        for location in all_locations:
-            if location['parent'] == public_id:
-                found_children.append(location)
 
-        # search recursive for all children
-        if len(found_children) > 0:
-            for child in found_children:
-                recursive_children = self.get_all_children(child['public_id'], all_locations)
+    def __move_children(self, public_id: int, ancestors: list[int]):
+        """Replaces the ancestors above a moved location in the ancestors of all its children"""
+        requests = []
 
-                # add recursive children to found_children
-                if len(recursive_children) > 0:
-                    found_children += recursive_children
+        for child in self.get(filter={'ancestors': public_id}, projection={'_id': 0, 'public_id': 1, 'ancestors': 1}):
+            child_ancestors: list[int] = child['ancestors']
+            requests.append(UpdateOne({'public_id': child['public_id']},
+                                      {'$set': {'ancestors': ancestors + child_ancestors[
+                                                                        child_ancestors.index(public_id):]}}))
 
-        return found_children
+        if requests:
+            self.dbm.get_collection(self.collection).bulk_write(requests, ordered=False)
@@ -18,6 +18,7 @@
 from datetime import datetime, timezone
 from queue import Queue
 from typing import Union
+from pymongo.errors import PyMongoError
 
 from cmdb.manager.base_manager import BaseManager
 from cmdb.database.mongo_database_manager import MongoDatabaseManager
@@ -28,10 +29,9 @@
 from cmdb.framework.results.iteration import IterationResult
 from cmdb.security.acl.permission import AccessControlPermission
 from cmdb.user_management.models.user import UserModel
-from cmdb.manager.query_builder.base_query_builder import BaseQueryBuilder
 from cmdb.manager.query_builder.builder_parameters import BuilderParameters
 
-from cmdb.errors.manager import ManagerGetError, ManagerIterationError, ManagerInsertError
+from cmdb.errors.manager import ManagerIterationError, ManagerInsertError
 # -------------------------------------------------------------------------------------------------------------------- #
 LOGGER = logging.getLogger(__name__)
 # -------------------------------------------------------------------------------------------------------------------- #
@@ -51,7 +51,6 @@ def __init__(self, dbm: MongoDatabaseManager, event_queue: Union[Queue, Event] =
             event_queue (Queue, Event): The queue for sending events or the created event to send
         """
         self.event_queue = event_queue
-        self.query_builder = BaseQueryBuilder()
 
         if database:
             dbm.connector.set_database(database)
@@ -89,6 +88,45 @@ def insert_log(self, action: LogAction, log_type: str, *args, **kwargs) -> int:
 
         return ack
 
+
+    def insert_logs(self, action: LogAction, log_type: str, logs: list[dict]) -> list[int]:
+        """
+        Creates multiple logs of the same action with a single write
+
+        Args:
+            action (LogAction): The action of the logs
+            log_type (str): The log type
+            logs (list[dict]): Data of every log
+
+        Raises:
+            ManagerInsertError: If the logs could not be written
+
+        Returns:
+            list[int]: public_ids of the new logs
+        """
+        if not logs:
+            return []
+
+        public_ids = list(self.dbm.reserve_public_ids(self.collection, len(logs)))
+        log_time = datetime.now(timezone.utc)
+        new_logs = []
+
+        for public_id, log_data in zip(public_ids, logs):
+            new_log = CmdbLog(**{**log_data,
+                                 'public_id': public_id,
+                                 'action': action.value,
+                                 'action_name': action.name,
+                                 'log_type': log_type,
+                                 'log_time': log_time})
+            new_logs.append(CmdbObjectLog.to_json(new_log))
+
+        try:
+            self.dbm.get_collection(self.collection).insert_many(new_logs, ordered=False)
+        except PyMongoError as err:
+            raise ManagerInsertError(err) from err
+
+        return public_ids
+
 # ---------------------------------------------------- CRUD - READ --------------------------------------------------- #
 
     def iterate(self,
@@ -107,21 +145,9 @@ def iterate(self,
         Returns:
             IterationResult[CmdbMetaLog]: Result which matches the Builderparameters
         """
-        try:
-            query: list[dict] = self.query_builder.build(builder_params,user, permission)
-            count_query: list[dict] = self.query_builder.count(builder_params.get_criteria())
-
-            aggregation_result = list(self.aggregate(query))
-            total_cursor = self.aggregate(count_query)
-
-            total = 0
-            while total_cursor.alive:
-                total = next(total_cursor)['total']
-        except ManagerGetError as err:
-            raise ManagerIterationError(err) from err
+        iteration_result: IterationResult[CmdbMetaLog] = self.iterate_query(builder_params, user, permission)
 
         try:
-            iteration_result: IterationResult[CmdbMetaLog] = IterationResult(aggregation_result, total)
             iteration_result.convert_to(CmdbObjectLog)
         except Exception as err:
             raise ManagerIterationError(err) from err
@@ -133,6 +133,7 @@ def __get_manager_args(manager_type: ManagerType, request_user: UserModel):
                 ManagerType.SECTION_TEMPLATES_MANAGER,
                 ManagerType.OBJECT_LINKS_MANAGER,
                 ManagerType.EXPORTD_JOB_MANAGER,
+                ManagerType.TYPE_MANAGER,
             ]:
                 return common_args + (current_app.event_queue, request_user.database)
 
@@ -145,7 +146,6 @@ def __get_manager_args(manager_type: ManagerType, request_user: UserModel):
                 ManagerType.USER_SETTINGS_MANAGER,
                 ManagerType.MEDIA_FILE_MANAGER,
                 ManagerType.EXPORTD_LOG_MANAGER,
-                ManagerType.TYPE_MANAGER,
                 ManagerType.EXPORT_D_LOG_MANAGER,
                 ManagerType.EXPORT_D_JOB_MANAGER,
                 ManagerType.SYSTEM_SETTINGS_READER,
@@ -163,6 +163,7 @@ def __get_manager_args(manager_type: ManagerType, request_user: UserModel):
                 ManagerType.SECTION_TEMPLATES_MANAGER,
                 ManagerType.OBJECT_LINKS_MANAGER,
                 ManagerType.EXPORTD_JOB_MANAGER,
+                ManagerType.TYPE_MANAGER,
             ]:
                 return common_args + (current_app.event_queue,)
 
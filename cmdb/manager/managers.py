@@ -15,6 +15,7 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 """TODO: document"""
 from typing import Union
+from pymongo.errors import PyMongoError
 
 from cmdb.database.database_manager_mongo import DatabaseManagerMongo
 from cmdb.framework.results import IterationResult
@@ -23,6 +24,9 @@
 from cmdb.manager import AbstractManagerBase
 from cmdb.search import Query, Pipeline
 from cmdb.manager.query_builder.builder import Builder
+from cmdb.manager.query_builder.builder_parameters import TotalCount
+
+from cmdb.errors.manager import ManagerIterationError
 # -------------------------------------------------------------------------------------------------------------------- #
 
 # -------------------------------------------------------------------------------------------------------------------- #
@@ -134,6 +138,53 @@ def find(self, filter: dict, *args, **kwargs) -> ListResult:
         raise NotImplementedError
 
 
+    def _iterate(self, filter: dict, limit: int, skip: int, sort: str, order: int, *args, **kwargs) \
+            -> IterationResult:
+        """
+        Retrieves a page of documents and their total
+
+        The page is read with sort, skip and limit in one pipeline, so MongoDB only sorts the documents up to
+        the page. The exact total of a page comes from a separate count pipeline without sort.
+
+        Args:
+            filter: match requirements of field values
+            limit: max number of elements to return
+            skip: number of elements to skip first
+            sort: sort field
+            order: sort order
+            total (TotalCount, optional): How the total is determined, exact by default
+
+        Raises:
+            ManagerIterationError: If the aggregation failed
+
+        Returns:
+            IterationResult: Raw documents of the page, the total is None for `TotalCount.NONE`
+        """
+        total_count: TotalCount = kwargs.get('total', TotalCount.EXACT)
+
+        if total_count == TotalCount.ESTIMATED and filter:
+            total_count = TotalCount.EXACT
+
+        try:
+            query: Pipeline = self.builder.build(filter=filter, limit=limit, skip=skip, sort=sort, order=order)
+            results = list(self._aggregate(self.collection, query))
+
+            if total_count == TotalCount.ESTIMATED:
+                total = self._database_manager.get_collection(self.collection).estimated_document_count()
+            elif total_count == TotalCount.EXACT and (limit != 0 or skip != 0):
+                count_result = next(self._aggregate(self.collection, self.builder.count(filter=filter)), {})
+                total = count_result.get('total', 0)
+            elif total_count == TotalCount.EXACT:
+                # without page borders every matching document is in the results, so no count is needed
+                total = len(results)
+            else:
+                total = None
+        except PyMongoError as err:
+            raise ManagerIterationError(err) from err
+
+        return IterationResult(results, total)
+
+
     def get(self, public_id: PublicID) -> dict:
         """TODO: document"""
         raise NotImplementedError
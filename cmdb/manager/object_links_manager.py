@@ -28,7 +28,6 @@
 from cmdb.security.acl.permission import AccessControlPermission
 from cmdb.user_management.models.user import UserModel
 from cmdb.framework.results import IterationResult
-from cmdb.manager.query_builder.base_query_builder import BaseQueryBuilder
 from cmdb.manager.query_builder.builder_parameters import BuilderParameters
 
 from cmdb.errors.manager import ManagerGetError, ManagerInsertError, ManagerDeleteError, ManagerIterationError
@@ -58,7 +57,6 @@ def __init__(self, dbm: MongoDatabaseManager, event_queue: Union[Queue, Event] =
         if database:
             dbm.connector.set_database(database)
 
-        self.query_builder = BaseQueryBuilder()
         self.objects_manager = ObjectsManager(dbm)
         super().__init__(ObjectLinkModel.COLLECTION, dbm)
 
@@ -111,21 +109,9 @@ def iterate(self,
         """
         Iterate over a collection where the public id exists
         """
-        try:
-            query: list[dict] = self.query_builder.build(builder_params, user, permission)
-            count_query: list[dict] = self.query_builder.count(builder_params.get_criteria())
-
-            aggregation_result = list(self.aggregate(query))
-            total_cursor = self.aggregate(count_query)
-
-            total = 0
-            while total_cursor.alive:
-                total = next(total_cursor)['total']
-        except ManagerGetError as err:
-            raise ManagerIterationError(err) from err
+        iteration_result: IterationResult[ObjectLinkModel] = self.iterate_query(builder_params, user, permission)
 
         try:
-            iteration_result: IterationResult[ObjectLinkModel] = IterationResult(aggregation_result, total)
             iteration_result.convert_to(ObjectLinkModel)
         except Exception as err:
             raise ManagerIterationError(err) from err
@@ -205,3 +191,22 @@ def delete_object_link(self,
             return link
         except Exception as err:
             raise ManagerDeleteError(err) from err
+
+
+    def delete_links_of_objects(self, public_ids: list[int]) -> int:
+        """
+        Deletes all object links of the given objects with a single delete
+
+        Args:
+            public_ids (list[int]): public_ids of the objects, as primary or secondary of the links
+
+        Raises:
+            ManagerDeleteError: If the links could not be deleted
+
+        Returns:
+            int: Number of deleted links
+        """
+        public_ids = list(public_ids)
+
+        return self.delete_many({'$or': [{'primary': {'$in': public_ids}},
+                                         {'secondary': {'$in': public_ids}}]}).deleted_count
@@ -0,0 +1,351 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2024 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Maintains the reference edges (`framework.object_refs`) of the objects
+
+Every object has one document with the edges to the objects it references. The documents are written
+together with the objects, so the referencing objects of an object are found with an indexed lookup.
+A failed edge write never fails the object write, the next rebuild repairs the document.
+
+The edges are only read after a rebuild of all edges was completed (recorded in `settings.conf`). Before that,
+e.g. while an existing database is filled in the background, the referencing objects are found by a scan
+of the object data.
+"""
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Iterable
+from pymongo import DeleteOne, ReplaceOne
+from pymongo.errors import PyMongoError
+
+from cmdb.database.database_manager import DatabaseManager
+from cmdb.manager.base_manager import BaseManager
+from cmdb.manager.query_builder.builder import Builder
+from cmdb.manager.type_cache import TYPE_CACHE
+
+from cmdb.utils.system_reader import SystemSettingsReader
+
+from cmdb.cmdb_objects.cmdb_object import CmdbObject
+from cmdb.cmdb_objects.cmdb_object_refs import CmdbObjectRefs
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                               ObjectRefsManager - CLASS                                              #
+# -------------------------------------------------------------------------------------------------------------------- #
+class ObjectRefsManager(BaseManager):
+    """
+    Builds, refreshes and reads the reference edges of objects
+    Extends: BaseManager
+    """
+
+    BATCH_SIZE: int = 500
+    # `_id` of the state document in the settings collection
+    STATE_ID: str = 'object_refs'
+
+    def __init__(self, dbm: DatabaseManager):
+        """
+        Args:
+            dbm (DatabaseManager): Database connection, only collection access is used
+        """
+        super().__init__(CmdbObjectRefs.COLLECTION, dbm)
+
+# ----------------------------------------------------- INDEXING ----------------------------------------------------- #
+
+    def index_objects(self, public_ids: Iterable[int]):
+        """
+        Rebuilds the edges of objects, the edges of objects which do not exist anymore are removed
+
+        Args:
+            public_ids (Iterable[int]): public_ids of the changed objects
+        """
+        try:
+            sorted_ids = sorted(set(public_ids))
+
+            for start in range(0, len(sorted_ids), self.BATCH_SIZE):
+                batch_ids = sorted_ids[start:start + self.BATCH_SIZE]
+                objects = list(self.dbm.get_collection(CmdbObject.COLLECTION).find({'public_id': {'$in': batch_ids}},
+                                                                                   {'_id': 0}))
+                found_ids = {object_data['public_id'] for object_data in objects}
+
+                self.__write_edges(objects,
+                                   [DeleteOne({'public_id': public_id}) for public_id in batch_ids
+                                                                        if public_id not in found_ids])
+        except PyMongoError as err:
+            #TODO: ERROR-FIX
+            LOGGER.warning("[ObjectRefsManager] Reference edges of %s could not be written: %s", public_ids, err)
+            self.__set_incomplete()
+
+
+    def index_type(self, type_id: int) -> int:
+        """
+        Rebuilds the edges of all objects of a type, e.g. after its reference fields changed
+
+        Args:
+            type_id (int): public_id of the type
+
+        Returns:
+            int: Number of indexed objects
+        """
+        try:
+            return self.__write_all_edges({'type_id': type_id})
+        except PyMongoError as err:
+            #TODO: ERROR-FIX
+            LOGGER.warning("[ObjectRefsManager] Reference edges of type %s could not be written: %s", type_id, err)
+            self.__set_incomplete()
+            return 0
+
+
+    def remove_objects(self, public_ids: Iterable[int]):
+        """
+        Removes the edges of deleted objects
+
+        Args:
+            public_ids (Iterable[int]): public_ids of the deleted objects
+        """
+        try:
+            self.dbm.get_collection(self.collection).delete_many({'public_id': {'$in': list(public_ids)}})
+        except PyMongoError as err:
+            #TODO: ERROR-FIX
+            LOGGER.warning("[ObjectRefsManager] Reference edges of %s could not be removed: %s", public_ids, err)
+            self.__set_incomplete()
+
+
+    def rebuild(self) -> int:
+        """
+        Rebuilds the edges of all objects and removes the edges without object
+
+        The existing edges stay readable during the rebuild, they are replaced batch by batch.
+        The completed rebuild is recorded, unless an edge write failed meanwhile.
+
+        Returns:
+            int: Number of indexed objects
+        """
+        rebuild_time = datetime.now(timezone.utc)
+        indexed_objects = self.__write_all_edges({})
+
+        self.dbm.get_collection(self.collection).delete_many({'indexed_time': {'$lt': rebuild_time}})
+        self.__set_complete(rebuild_time)
+
+        return indexed_objects
+
+
+    def is_complete(self) -> bool:
+        """
+        Checks if a rebuild of all edges was completed and no edge write failed since then
+
+        Returns:
+            bool: True if the edges contain all references, otherwise the object data has to be scanned
+        """
+        return self.dbm.get_collection(SystemSettingsReader.COLLECTION).count_documents({'_id': self.STATE_ID,
+                                                                                          'complete': True}) > 0
+
+
+    def is_outdated(self) -> bool:
+        """
+        Checks if the edges are incomplete or the number of edge documents differs from the number of objects
+
+        Returns:
+            bool: True if the edges should be rebuilt
+        """
+        return not self.is_complete() \
+               or self.dbm.get_collection(CmdbObject.COLLECTION).estimated_document_count() \
+                  != self.dbm.get_collection(self.collection).estimated_document_count()
+
+
+    def rebuild_in_background(self) -> threading.Thread:
+        """
+        Rebuilds the edges in a daemon thread if they are outdated, the object data is scanned until it finished
+
+        Returns:
+            threading.Thread: The started thread
+        """
+        def run_rebuild():
+            try:
+                if self.is_outdated():
+                    self.__set_incomplete()
+                    LOGGER.info("OBJECT REFS: Rebuilding the reference edges")
+                    LOGGER.info("OBJECT REFS: Rebuild finished, indexed objects: %s", self.rebuild())
+            except PyMongoError as err:
+                LOGGER.error("OBJECT REFS: Rebuild failed: %s", err)
+
+        rebuild_thread = threading.Thread(target=run_rebuild, name='ObjectRefsRebuild', daemon=True)
+        rebuild_thread.start()
+
+        return rebuild_thread
+
+# ------------------------------------------------------ READING ----------------------------------------------------- #
+
+    def get_referencing_ids(self, target_ids: Iterable[int]) -> list[int]:
+        """
+        Retrieves the objects which reference any of the given objects
+
+        Args:
+            target_ids (Iterable[int]): public_ids of the referenced objects
+
+        Returns:
+            list[int]: Sorted public_ids of the referencing objects
+        """
+        if not self.is_complete():
+            return sorted(edges['public_id'] for edges in self.__scan_edges(target_ids))
+
+        return sorted(edges['public_id'] for edges in self.dbm.get_collection(self.collection).find(
+                                                                {'references.target_id': {'$in': list(target_ids)}},
+                                                                {'_id': 0, 'public_id': 1}))
+
+
+    def get_edges(self, target_ids: Iterable[int]) -> list[dict]:
+        """
+        Retrieves the edge documents of the objects which reference any of the given objects
+
+        Args:
+            target_ids (Iterable[int]): public_ids of the referenced objects
+
+        Returns:
+            list[dict]: `public_id` of the referencing object and only its `references` to the given objects
+        """
+        target_ids = set(target_ids)
+
+        if self.is_complete():
+            documents = self.dbm.get_collection(self.collection).find(
+                                                                {'references.target_id': {'$in': list(target_ids)}},
+                                                                {'_id': 0, 'public_id': 1, 'references': 1})
+        else:
+            documents = self.__scan_edges(target_ids)
+
+        return [{'public_id': edges['public_id'],
+                 'references': [edge for edge in edges['references'] if edge['target_id'] in target_ids]}
+                for edges in documents]
+
+
+    def get_referencing_objects_stages(self, target_id: int) -> list[dict]:
+        """
+        Builds the stages which lead from the edges targeting an object to the referencing objects,
+        the pipeline runs on the collection of the edges
+
+        Args:
+            target_id (int): public_id of the referenced object
+
+        Returns:
+            list[dict]: Aggregation stages which output the referencing object documents
+        """
+        return [
+            Builder.match_({'references.target_id': target_id}),
+            Builder.project_({'_id': 0, 'public_id': 1}),
+            Builder.lookup_(_from=CmdbObject.COLLECTION, _local='public_id', _foreign='public_id', _as='object'),
+            Builder.unwind_({'path': '$object'}),
+            {'$replaceRoot': {'newRoot': '$object'}},
+        ]
+
+
+    def get_scan_criteria(self, target_ids: Iterable[int]) -> dict:
+        """
+        Builds the filter which finds the objects referencing any of the given objects in their data
+
+        Only the reference fields of the types are matched, in the fields and in the multi data sections.
+
+        Args:
+            target_ids (Iterable[int]): public_ids of the referenced objects
+
+        Returns:
+            dict: Filter for the object collection
+        """
+        target_ids = list(target_ids)
+        type_criteria = []
+
+        for type_data in TYPE_CACHE.get_all_type_data(self.dbm):
+            field_names = list(CmdbObjectRefs.get_reference_fields(type_data))
+
+            if not field_names:
+                continue
+
+            reference_filter = {'name': {'$in': field_names}, 'value': {'$in': target_ids}}
+            type_criteria.append({'type_id': type_data['public_id'],
+                                  '$or': [{'fields': {'$elemMatch': reference_filter}},
+                                          {'multi_data_sections.values.data': {'$elemMatch': reference_filter}}]})
+
+        return {'$or': type_criteria} if type_criteria else {'public_id': {'$in': []}}
+
+# ------------------------------------------------- HELPER - SECTION ------------------------------------------------- #
+
+    def __set_complete(self, rebuild_time: datetime):
+        """Records a completed rebuild, unless an edge write failed after the rebuild started"""
+        settings = self.dbm.get_collection(SystemSettingsReader.COLLECTION)
+
+        if settings.count_documents({'_id': self.STATE_ID, 'failed_time': {'$gte': rebuild_time}}) > 0:
+            LOGGER.warning("OBJECT REFS: Edge writes failed during the rebuild, the edges stay incomplete")
+            return
+
+        settings.update_one({'_id': self.STATE_ID},
+                            {'$set': {'complete': True, 'rebuilt_time': rebuild_time}},
+                            upsert=True)
+
+
+    def __set_incomplete(self):
+        """Records that edges could be missing, they are not read until the next completed rebuild"""
+        try:
+            self.dbm.get_collection(SystemSettingsReader.COLLECTION).update_one(
+                                                    {'_id': self.STATE_ID},
+                                                    {'$set': {'complete': False,
+                                                              'failed_time': datetime.now(timezone.utc)}},
+                                                    upsert=True)
+        except PyMongoError as err:
+            LOGGER.error("OBJECT REFS: State could not be written: %s", err)
+
+
+    def __scan_edges(self, target_ids: Iterable[int]) -> list[dict]:
+        """Builds the edges of the objects which reference any of the given objects from the object data"""
+        objects = list(self.dbm.get_collection(CmdbObject.COLLECTION).find(self.get_scan_criteria(target_ids),
+                                                                           {'_id': 0}))
+        type_data = TYPE_CACHE.get_many_type_data(self.dbm, list({object_data['type_id'] for object_data in objects}))
+
+        return [CmdbObjectRefs.to_data(CmdbObjectRefs.from_object(object_data, type_data.get(object_data['type_id'])))
+                for object_data in objects]
+
+
+    def __write_all_edges(self, criteria: dict) -> int:
+        """Rebuilds the edges of all objects matching the criteria batch by batch"""
+        indexed_objects = 0
+        batch = []
+
+        for object_data in self.dbm.get_collection(CmdbObject.COLLECTION).find(criteria, {'_id': 0},
+                                                                               batch_size=self.BATCH_SIZE):
+            batch.append(object_data)
+
+            if len(batch) >= self.BATCH_SIZE:
+                indexed_objects += self.__write_edges(batch)
+                batch = []
+
+        if batch:
+            indexed_objects += self.__write_edges(batch)
+
+        return indexed_objects
+
+
+    def __write_edges(self, objects: list[dict], requests: list = None) -> int:
+        """Builds the edges of objects and writes them in one bulk"""
+        requests = requests or []
+        type_data = TYPE_CACHE.get_many_type_data(self.dbm, list({object_data['type_id'] for object_data in objects}))
+
+        for object_data in objects:
+            edges = CmdbObjectRefs.from_object(object_data, type_data.get(object_data['type_id']))
+            requests.append(ReplaceOne({'public_id': edges.public_id}, CmdbObjectRefs.to_data(edges), upsert=True))
+
+        if requests:
+            self.dbm.get_collection(self.collection).bulk_write(requests, ordered=False)
+
+        return len(objects)
@@ -18,12 +18,18 @@
 """
 import logging
 import json
+from datetime import datetime, timezone
 from queue import Queue
-from typing import Union
-from bson import Regex, json_util
+from typing import Iterator, Union
+from bson import json_util
+from pymongo import InsertOne, ReplaceOne, UpdateOne
+from pymongo.errors import BulkWriteError
 
 from cmdb.database.mongo_database_manager import MongoDatabaseManager
 from cmdb.manager.base_manager import BaseManager
+from cmdb.manager.search_index_manager import SearchIndexManager
+from cmdb.manager.object_refs_manager import ObjectRefsManager
+from cmdb.manager.type_cache import TYPE_CACHE
 
 from cmdb.event_management.event import Event
 from cmdb.framework import CmdbObject
@@ -32,6 +38,7 @@
 from cmdb.manager.query_builder.builder_parameters import BuilderParameters
 from cmdb.user_management.models.user import UserModel
 from cmdb.security.acl.helpers import verify_access
+from cmdb.security.acl.resolver import AccessControlResolver
 from cmdb.security.acl.permission import AccessControlPermission
 from cmdb.framework.models.type import TypeModel
 from cmdb.database.utils import object_hook
@@ -41,6 +48,7 @@
 from cmdb.errors.manager.object_manager import ObjectManagerGetError,\
                                                ObjectManagerInitError,\
                                                ObjectManagerInsertError,\
+                                               ObjectManagerUpdateError,\
                                                ObjectManagerDeleteError
 from cmdb.errors.manager import ManagerGetError, ManagerInsertError, ManagerIterationError, ManagerUpdateError
 from cmdb.errors.security import AccessDeniedError
@@ -66,12 +74,13 @@ def __init__(self, dbm: MongoDatabaseManager, event_queue: Union[Queue, Event] =
             database (str): name of database for cloud mode
         """
         self.event_queue = event_queue
-        self.query_builder = BaseQueryBuilder()
 
         if database:
             dbm.connector.set_database(database)
 
-        super().__init__(CmdbObject.COLLECTION, dbm)
+        super().__init__(CmdbObject.COLLECTION, dbm, BaseQueryBuilder(AccessControlResolver(dbm)))
+        self.search_index = SearchIndexManager(dbm)
+        self.object_refs = ObjectRefsManager(dbm)
 
 # --------------------------------------------------- CRUD - CREATE -------------------------------------------------- #
 
@@ -120,6 +129,9 @@ def insert_object(self,
             LOGGER.debug("[insert_object] Error while inserting object. Exception: %s", str(err))
             raise ObjectManagerInsertError(err) from err
 
+        self.search_index.index_objects([ack], cascade=False)
+        self.object_refs.index_objects([ack])
+
         try:
             if self.event_queue:
                 event = Event("cmdb.core.object.added",
@@ -138,6 +150,84 @@ def insert_object(self,
 
         return ack
 
+
+    def insert_many_objects(self, objects: list[dict], replace_ids: set[int] = None) -> dict[int, str]:
+        """
+        Inserts multiple objects with a single unordered bulk write
+
+        The objects must already contain their public_id. The type and the ACL are not checked,
+        the caller validates them once for all objects (see `ObjectImporter`).
+        One `cmdb.core.objects.added` event is sent for each type of the written objects.
+
+        Args:
+            objects (list[dict]): Objects which should be inserted
+            replace_ids (set[int], optional): public_ids of existing objects which are replaced
+
+        Raises:
+            ObjectManagerInsertError: If the bulk write failed as a whole
+
+        Returns:
+            dict[int, str]: Error messages of the objects which could not be written or were not found
+                            by their index in `objects`
+        """
+        if not objects:
+            return {}
+
+        replace_ids = replace_ids or set()
+        requests = []
+
+        for obj in objects:
+            if obj['public_id'] in replace_ids:
+                requests.append(ReplaceOne({'public_id': obj['public_id']}, obj, upsert=True))
+            else:
+                requests.append(InsertOne(obj))
+
+        failed_objects: dict[int, str] = {}
+
+        try:
+            self.dbm.bulk_write(self.collection, requests, ordered=False)
+        except BulkWriteError as err:
+            for write_error in err.details.get('writeErrors', []):
+                failed_objects[write_error['index']] = write_error.get('errmsg', str(err))
+        except Exception as err:
+            #TODO: ERROR-FIX
+            LOGGER.debug("[insert_many_objects] Error while inserting objects. Exception: %s", str(err))
+            raise ObjectManagerInsertError(err) from err
+
+        written_objects = [obj for index, obj in enumerate(objects) if index not in failed_objects]
+
+        if not written_objects:
+            return failed_objects
+
+        self.dbm.update_public_id_counter(self.collection, max(obj['public_id'] for obj in written_objects))
+        # replaced objects can be referenced by other objects
+        self.search_index.index_objects([obj['public_id'] for obj in written_objects], cascade=bool(replace_ids))
+        self.object_refs.index_objects([obj['public_id'] for obj in written_objects])
+
+        try:
+            if self.event_queue:
+                written_types: dict[int, list[dict]] = {}
+
+                for obj in written_objects:
+                    written_types.setdefault(obj['type_id'], []).append(obj)
+
+                for type_id, type_objects in written_types.items():
+                    event = Event("cmdb.core.objects.added",
+                                    {
+                                        "ids": [obj['public_id'] for obj in type_objects],
+                                        "type_id": type_id,
+                                        "user_id": type_objects[0]['author_id'],
+                                        "event": 'insert'
+                                    }
+                                 )
+
+                    self.event_queue.put(event)
+        except Exception as err:
+            #TODO: ERROR-FIX
+            LOGGER.debug("[insert_many_objects] Error while creating objects event. Error: %s", str(err))
+
+        return failed_objects
+
 # ---------------------------------------------------- CRUD - READ --------------------------------------------------- #
 
     def get_object(self, public_id: int,
@@ -176,42 +266,67 @@ def get_object(self, public_id: int,
     def iterate(self,
                 builder_params: BuilderParameters,
                 user: UserModel = None,
-                permission: AccessControlPermission = None) -> IterationResult[CmdbObject]:
+                permission: AccessControlPermission = None,
+                collection: str = None) -> IterationResult[CmdbObject]:
         """
         Performs an aggregation on the database
         Args:
             builder_params (BuilderParameters): Contains input to identify the target of action
             user (UserModel, optional): User requesting this action
             permission (AccessControlPermission, optional): Permission which should be checked for the user
+            collection (str, optional): Collection the pipeline starts from, the object collection if not set
         Raises:
             ManagerIterationError: Raised when something goes wrong during the aggregate part
             ManagerIterationError: Raised when something goes wrong during the building of the IterationResult
         Returns:
             IterationResult[CmdbObject]: Result which matches the Builderparameters
         """
+        iteration_result: IterationResult[CmdbObject] = self.iterate_query(builder_params, user, permission,
+                                                                           collection)
+
         try:
-            query: list[dict] = self.query_builder.build(builder_params, user, permission)
-            count_query: list[dict] = self.query_builder.count(builder_params.get_criteria())
+            iteration_result.convert_to(CmdbObject)
+        #TODO: ERROR-FIX
+        except Exception as err:
+            raise ManagerIterationError(err) from err
 
-            aggregation_result = list(self.aggregate(query))
-            total_cursor = self.aggregate(count_query)
+        return iteration_result
 
-            total = 0
-            while total_cursor.alive:
-                total = next(total_cursor)['total']
 
-        #TODO: ERROR-FIX
-        except ManagerGetError as err:
-            raise ManagerIterationError(err) from err
+    def iterate_cursor(self,
+                       builder_params: BuilderParameters,
+                       user: UserModel = None,
+                       permission: AccessControlPermission = None,
+                       batch_size: int = 1000,
+                       group_by_type: bool = False) -> Iterator[CmdbObject]:
+        """
+        Performs an aggregation on the database and yields the objects while the cursor is read,
+        no total is counted and the results are never held in a list
 
+        Args:
+            builder_params (BuilderParameters): Contains input to identify the target of action
+            user (UserModel, optional): User requesting this action
+            permission (AccessControlPermission, optional): Permission which should be checked for the user
+            batch_size (int): Number of documents the cursor fetches per round trip
+            group_by_type (bool): Sort by the type first, so that the objects of a type follow each other
+        Raises:
+            ManagerIterationError: Raised when something goes wrong during the aggregate part
+        Returns:
+            Iterator[CmdbObject]: Objects which match the Builderparameters
+        """
         try:
-            iteration_result: IterationResult[CmdbObject] = IterationResult(aggregation_result, total)
-            iteration_result.convert_to(CmdbObject)
+            query: list[dict] = self.query_builder.build(builder_params, user, permission)
+
+            if group_by_type:
+                query = [{'$sort': {'type_id': 1, **stage['$sort']}} if '$sort' in stage else stage
+                         for stage in query]
+
+            cursor = self.aggregate(query, batchSize=batch_size)
         #TODO: ERROR-FIX
-        except Exception as err:
+        except ManagerGetError as err:
             raise ManagerIterationError(err) from err
 
-        return iteration_result
+        return (CmdbObject.from_data(object_data) for object_data in cursor)
 
 
     def get_objects_by(self,
@@ -304,7 +419,7 @@ def get_object_type(self, type_id: int) -> TypeModel:
             TypeModel: CmdbType with the given type_id
         """
         try:
-            requested_type = self.get_one_from_other_collection(TypeModel.COLLECTION, type_id)
+            requested_type = TYPE_CACHE.get_type_data(self.dbm, type_id)
             requested_type = TypeModel.from_data(requested_type)
         except Exception as err:
             LOGGER.debug("[get_object_type] Error: %s, Type: %s", err, type(err))
@@ -313,6 +428,27 @@ def get_object_type(self, type_id: int) -> TypeModel:
         return requested_type
 
 
+    def get_object_types(self, type_ids: list[int]) -> dict[int, TypeModel]:
+        """
+        Retrieves multiple CmdbTypes with a single query for the types which are not cached
+
+        Args:
+            type_ids (list[int]): public_ids of the CmdbTypes
+
+        Raises:
+            ObjectManagerGetError: When the CmdbTypes could not be retrieved
+
+        Returns:
+            dict[int, TypeModel]: The found CmdbTypes by their public_id, missing types are left out
+        """
+        try:
+            return {type_id: TypeModel.from_data(type_data)
+                    for type_id, type_data in TYPE_CACHE.get_many_type_data(self.dbm, list(type_ids)).items()}
+        except Exception as err:
+            LOGGER.debug("[get_object_types] Error: %s, Type: %s", err, type(err))
+            raise ObjectManagerGetError(f"Error while retrieving types with IDs: {type_ids}. Error: {err}") from err
+
+
     def count_objects(self, criteria: dict = None):
         """
         Returns the number of objects with the given criteria
@@ -355,98 +491,42 @@ def aggregate_objects(self, pipeline: list[dict], **kwargs):
             raise ObjectManagerGetError(error) from error
 
 
-    def get_mds_references_for_object(self, referenced_object: CmdbObject, query_filter: Union[dict, list]):
-        """TODO: document"""
-        object_type_id = referenced_object.type_id
-
-        query = []
-
-        if isinstance(query_filter, dict):
-            query.append(query_filter)
-        elif isinstance(query_filter, list):
-            for a_filter in query_filter:
-                if "$match" in a_filter and len(a_filter["$match"]) > 0:
-                    if "type_id" in a_filter["$match"]:
-                        filter_type_id = a_filter["$match"]["type_id"]
-                        del a_filter["$match"]["type_id"]
-                        a_filter["$match"]["public_id"] = filter_type_id
-
-            query += query_filter
-
-        # Get all types which reference this type
-        query.append({'$match': {"$and": [
-                                    {"fields.type": "ref"},
-                                    {"fields.ref_types": object_type_id}
-                                ]}
-                    })
-
-        # Filter the public_id's of these types
-        query.append({'$project': {"public_id": 1, "_id": 0}})
-
-        # Get all objects of these types
-        query.append(Builder.lookup_(_from='framework.objects',
-                                     _local='public_id',
-                                     _foreign='type_id',
-                                     _as='type_objects'))
-
-        # Filter out types which don't have any objects
-        query.append({'$match': {"type_objects.0": {"$exists": True}}})
-
-        # Spread out the arrays
-        query.append(Builder.unwind_({'path': '$type_objects'}))
-
-        # Filter the objects which actually have any multi section data
-        query.append({'$match': {"type_objects.multi_data_sections.0": {"$exists": True}}})
-
-        # Remove the public_id field
-        query.append({'$project': {"type_objects": 1}})
-
-        # Spread out as a list
-        query.append({'$replaceRoot': {"newRoot": '$type_objects'}})
-
-        query.append({'$project': {"_id": 0}})
-
-        # query.append({'$sort': {sort: order}})
-
-        try:
-            results = list(self.aggregate_from_other_collection(TypeModel.COLLECTION, query))
-        except ManagerIterationError as err:
-            #TODO: ERROR-FIX
-            LOGGER.debug("[get_mds_references_for_object] aggregation error: %s", err.message)
-
-        matching_results = []
-
-        # Check if the mds data references the current object
-        for result in results:
-            try:
-                for mds_entry in result["multi_data_sections"]:
-                    for value in mds_entry["values"]:
-                        data_set: dict
-                        for data_set in value["data"]:
-                            if self.__is_ref_field(data_set["name"], result) and \
-                            "value" in data_set.keys() and \
-                            data_set["value"] == referenced_object.public_id:
-                                matching_results.append(result)
-                                # this result is a match => go back to outer loop
-                                raise StopIteration()
-            except StopIteration:
-                pass
-
-        return matching_results
-
-
-    #TODO: REFACTOR-FIX
     def references(self,
                    object_: CmdbObject,
-                   criteria: dict,
+                   criteria: Union[dict, list],
                    limit: int,
                    skip: int,
                    sort: str,
                    order: int,
                    user: UserModel = None,
                    permission: AccessControlPermission = None) -> IterationResult[CmdbObject]:
-        """TODO: document"""
+        """
+        Retrieves the objects which reference an object, in their fields or in their multi data sections
+
+        The pipeline starts at the reference edges of the object and joins the referencing objects. As long as
+        no rebuild of the edges was completed, the object data is scanned instead. The page is sorted and
+        sliced by the database.
+
+        Args:
+            object_ (CmdbObject): The referenced object
+            criteria (dict | list): Additional filter stages for the referencing objects
+            limit (int): Max number of returned objects
+            skip (int): Number of skipped objects
+            sort (str): Sort field
+            order (int): Sort order
+            user (UserModel, optional): User requesting this action
+            permission (AccessControlPermission, optional): Permission which should be checked for the user
+
+        Returns:
+            IterationResult[CmdbObject]: The page of referencing objects
+        """
         query = []
+        collection = self.collection
+
+        if self.object_refs.is_complete():
+            # the pipeline starts at the edges, they share the type_id with their objects for the access control
+            query += self.object_refs.get_referencing_objects_stages(object_.public_id)
+            collection = self.object_refs.collection
 
         #TODO: ERROR-FIX (it is only one of these)
         if isinstance(criteria, dict):
@@ -454,35 +534,12 @@ def references(self,
         elif isinstance(criteria, list):
             query += criteria
 
-        query.append(Builder.lookup_(_from='framework.types', _local='type_id', _foreign='public_id', _as='type'))
-
-        query.append(Builder.unwind_({'path': '$type'}))
-
-        field_ref_query = {
-                'type.fields.type': 'ref',
-                '$or': [
-                    {'type.fields.ref_types': Regex(f'.*{object_.type_id}.*', 'i')},
-                    {'type.fields.ref_types': object_.type_id}
-                ]
-        }
+        if collection == self.collection:
+            query.append(Builder.match_(self.object_refs.get_scan_criteria([object_.public_id])))
 
-        section_ref_query = {
-                'type.render_meta.sections.type': 'ref-section',
-                'type.render_meta.sections.reference.type_id': object_.type_id
-        }
+        builder_params = BuilderParameters(criteria=query, limit=limit, skip=skip, sort=sort, order=order)
 
-        query.append(Builder.match_(Builder.or_([field_ref_query, section_ref_query])))
-        query.append(Builder.match_({'fields.value': object_.public_id}))
-
-        builder_params = BuilderParameters(criteria=query, sort=sort, order=order)
-
-        # limit and skip will be handled when merged with the MDS results in '__merge_mds_references()'
-        result = self.iterate(builder_params, user, permission)
-        mds_result = self.get_mds_references_for_object(object_, criteria)
-
-        merge_result = self.__merge_mds_references(mds_result, result, limit, skip, sort, order)
-
-        return merge_result
+        return self.iterate(builder_params, user, permission, collection)
 
 
     # TODO: REFACTOR-FIX (Move to TypeManager once refactored)
@@ -586,6 +643,9 @@ def update_object(self,
         if update_result.matched_count != 1:
             raise ManagerUpdateError('Something happened during the update!')
 
+        self.search_index.index_objects([public_id])
+        self.object_refs.index_objects([public_id])
+
         if self.event_queue and user:
             try:
                 event = Event("cmdb.core.object.updated",
@@ -612,14 +672,116 @@ def update_many_objects(self, query: dict, update: dict, add_to_set: bool = Fals
         Returns:
             acknowledgment of database
         """
+        updated_ids = [obj['public_id'] for obj in self.get(filter=query, projection={'_id': 0, 'public_id': 1})]
+
         try:
             update_result = self.update_many(criteria=query, update=update, add_to_set=add_to_set)
         except (ManagerUpdateError, AccessDeniedError) as err:
             #TODO: ERROR-FIX
             raise err
 
+        self.search_index.index_objects(updated_ids)
+        self.object_refs.index_objects(updated_ids)
+
         return update_result
 
+
+    def bulk_update_objects(self, objects: list[dict], user: UserModel = None) -> dict[int, str]:
+        """
+        Updates multiple objects with a single unordered bulk write
+
+        The objects must contain their public_id. The type and the ACL are not checked,
+        the caller validates them once for all objects. One `cmdb.core.objects.updated` event is sent
+        for each type of the written objects.
+
+        Args:
+            objects (list[dict]): New data of the objects
+            user (UserModel, optional): User who updated the objects
+
+        Raises:
+            ObjectManagerUpdateError: If the bulk write failed as a whole
+
+        Returns:
+            dict[int, str]: Error messages of the objects which could not be written or were not found
+                            by their index in `objects`
+        """
+        if not objects:
+            return {}
+
+        instances = [json.loads(json.dumps(obj, default=json_util.default), object_hook=object_hook)
+                     for obj in objects]
+        failed_objects: dict[int, str] = {}
+
+        try:
+            matched_count = self.dbm.bulk_write(self.collection,
+                                                [UpdateOne({'public_id': instance['public_id']}, {'$set': instance})
+                                                 for instance in instances],
+                                                ordered=False).matched_count
+        except BulkWriteError as err:
+            matched_count = err.details.get('nMatched', 0)
+
+            for write_error in err.details.get('writeErrors', []):
+                failed_objects[write_error['index']] = write_error.get('errmsg', str(err))
+        except Exception as err:
+            #TODO: ERROR-FIX
+            LOGGER.debug("[bulk_update_objects] Error while updating objects. Exception: %s", str(err))
+            raise ObjectManagerUpdateError(err) from err
+
+        # objects which were deleted after the caller read them are not matched by their update
+        if matched_count < len(instances) - len(failed_objects):
+            failed_objects.update(self.__get_unmatched_objects(instances, failed_objects))
+
+        written_objects = [instance for index, instance in enumerate(instances) if index not in failed_objects]
+
+        if not written_objects:
+            return failed_objects
+
+        self.search_index.index_objects([instance['public_id'] for instance in written_objects])
+        self.object_refs.index_objects([instance['public_id'] for instance in written_objects])
+
+        if self.event_queue and user:
+            try:
+                written_types: dict[int, list[int]] = {}
+
+                for instance in written_objects:
+                    written_types.setdefault(instance.get('type_id'), []).append(instance['public_id'])
+
+                for type_id, public_ids in written_types.items():
+                    event = Event("cmdb.core.objects.updated",
+                                    {
+                                        "ids": public_ids,
+                                        "type_id": type_id,
+                                        "user_id": user.get_public_id(),
+                                        "event": 'update'
+                                    }
+                                 )
+
+                    self.event_queue.put(event)
+            except Exception as err:
+                LOGGER.debug("[bulk_update_objects] Event error: %s, Type: %s", err, type(err))
+
+        return failed_objects
+
+
+    def __get_unmatched_objects(self, instances: list[dict], failed_objects: dict[int, str]) -> dict[int, str]:
+        """
+        Retrieves the objects of a bulk update which do not exist anymore
+
+        Args:
+            instances (list[dict]): Written data of the objects
+            failed_objects (dict[int, str]): Objects which already failed by their index
+
+        Returns:
+            dict[int, str]: Error messages of the missing objects by their index in `instances`
+        """
+        public_ids = [instance['public_id'] for index, instance in enumerate(instances) if index not in failed_objects]
+        existing_ids = {obj['public_id'] for obj in self.get(filter={'public_id': {'$in': public_ids}},
+                                                             projection={'_id': 0, 'public_id': 1})}
+
+        return {index: f'Object with ID: {instance["public_id"]} not found!'
+                for index, instance in enumerate(instances)
+                if index not in failed_objects and instance['public_id'] not in existing_ids}
+
 # --------------------------------------------------- CRUD - DELETE -------------------------------------------------- #
 
     def delete_object(self, public_id: int, user: UserModel, permission: AccessControlPermission = None):
@@ -655,10 +817,14 @@ def delete_object(self, public_id: int, user: UserModel, permission: AccessContr
 
         try:
             ack = self.delete({'public_id': public_id})
-            return ack
         except Exception as err:
             raise ObjectManagerDeleteError(str(err)) from err
 
+        self.search_index.remove_objects([public_id])
+        self.object_refs.remove_objects([public_id])
+
+        return ack
+
 
     def delete_many_objects(self, filter_query: dict, public_ids, user: UserModel):
         """TODO: document"""
@@ -667,6 +833,10 @@ def delete_many_objects(self, filter_query: dict, public_ids, user: UserModel):
         except Exception as err:
             raise ObjectManagerDeleteError(str(err)) from err
 
+        if public_ids:
+            self.search_index.remove_objects(public_ids)
+            self.object_refs.remove_objects(public_ids)
+
         try:
             if self.event_queue:
                 event = Event("cmdb.core.objects.deleted", {"ids": public_ids,
@@ -679,101 +849,131 @@ def delete_many_objects(self, filter_query: dict, public_ids, user: UserModel):
         return ack
 
 
-    def delete_all_object_references(self, public_id: int):
+    def delete_objects(self, objects: list[CmdbObject], user: UserModel) -> list[int]:
         """
-        Delete all references to the object with the given public_id
+        Deletes multiple objects with a single delete
+
+        The types and the ACL are not checked, the caller validates them once for all objects.
+        One `cmdb.core.objects.deleted` event is sent for each type of the deleted objects.
 
         Args:
-            public_id (int): public_id of targeted object
-        """
-        object_instance: CmdbObject = self.get_object(public_id)
-        # Get all objects which reference the targeted object
-        iteration_result: IterationResult = self.references(
-                                                    object_=object_instance,
-                                                    criteria={'$match': {'active': {'$eq': True}}},
-                                                    limit=0,
-                                                    skip=0,
-                                                    sort='public_id',
-                                                    order=1
-                                                )
-
-        referenced_objects: list[dict] =  [object_.__dict__ for object_ in iteration_result.results]
-
-        # Delete the reference in each object and update them
-        for refed_object in referenced_objects:
-            for field in refed_object['fields']:
-                field_value: int = field['value']
-                field_name: str = field['name']
-
-                if field_name.startswith('ref-') and field_value == public_id:
-                    field['value'] = ""
-
-            refed_object_id = refed_object['public_id']
-            self.update_object(refed_object_id, refed_object)
-
-# ------------------------------------------------- HELPER FUNCTIONS ------------------------------------------------- #
-
-    def __merge_mds_references(self,
-                                mds_result: list,
-                                obj_result: IterationResult,
-                                limit: int,
-                                skip: int,
-                                sort: str,
-                                order: int):
-        """TODO: document"""
-        try:
-            referenced_ids = []
+            objects (list[CmdbObject]): The objects which should be deleted
+            user (UserModel): User who deleted the objects
 
-            # get public_id's of all currently referenced objects
-            for obj in obj_result.results:
-                referenced_ids.append(obj.public_id)
+        Raises:
+            ObjectManagerDeleteError: If the objects could not be deleted
 
+        Returns:
+            list[int]: public_ids of the deleted objects
+        """
+        public_ids = [obj.get_public_id() for obj in objects]
 
-            # add mds objects to normal references if they are not already inside
-            for ref_object in mds_result:
-                tmp_object = CmdbObject.from_data(ref_object)
+        if not public_ids:
+            return []
 
-                if tmp_object.public_id not in referenced_ids:
-                    obj_result.results.append(tmp_object)
+        try:
+            delete_result = self.delete_many({'public_id': {'$in': public_ids}})
+
+            # objects which are still there could not be deleted
+            if delete_result.deleted_count != len(public_ids):
+                remaining_ids = {obj['public_id'] for obj in self.get(filter={'public_id': {'$in': public_ids}},
+                                                                      projection={'_id': 0, 'public_id': 1})}
+                public_ids = [public_id for public_id in public_ids if public_id not in remaining_ids]
+        except Exception as err:
+            raise ObjectManagerDeleteError(str(err)) from err
 
-            obj_result.total = len(obj_result.results)
+        self.search_index.remove_objects(public_ids)
+        self.object_refs.remove_objects(public_ids)
 
-            # sort all findings according to sort and order
-            descending_order = order == -1
+        if self.event_queue:
             try:
-                obj_result.results.sort(key=lambda x: getattr(x, sort), reverse=descending_order)
+                deleted_types: dict[int, list[int]] = {}
+
+                for obj in objects:
+                    if obj.get_public_id() in public_ids:
+                        deleted_types.setdefault(obj.get_type_id(), []).append(obj.get_public_id())
+
+                for type_id, type_object_ids in deleted_types.items():
+                    event = Event("cmdb.core.objects.deleted",
+                                    {
+                                        "ids": type_object_ids,
+                                        "type_id": type_id,
+                                        "user_id": user.get_public_id(),
+                                        "event": 'delete'
+                                    }
+                                 )
+
+                    self.event_queue.put(event)
             except Exception as err:
-                #TODO: ERROR-FIX
-                LOGGER.debug("References sorting error: %s", err)
+                LOGGER.debug("[delete_objects] Event error: %s, Type: %s", err, type(err))
 
-            # just keep the given limit of objects if limit > 0
-            if limit > 0:
-                list_length = limit + skip
+        return public_ids
 
-                # if the list_length is longer than the object_list then just set it to len(object_list)
-                if list_length > len(obj_result.results):
-                    list_length = len(obj_result.results)
 
-                try:
-                    obj_result.results = obj_result.results[skip:list_length]
-                except Exception as err:
-                    #TODO: ERROR-FIX
-                    LOGGER.debug("References list slice error: %s", err)
+    def delete_all_object_references(self, public_id: int):
+        """
+        Delete all references to the object with the given public_id
 
-            # obj_result.total = len(obj_result.results)
-        except Exception as err:
-            #TODO: ERROR-FIX
-            LOGGER.info("[__merge_mds_references] Error: %s", err)
+        Args:
+            public_id (int): public_id of targeted object
+        """
+        self.delete_many_object_references([public_id])
 
-        return obj_result
 
+    def delete_many_object_references(self, public_ids: list[int]) -> list[int]:
+        """
+        Delete all references to the objects with the given public_ids
 
-    def __is_ref_field(self, field_name: str, ref_object: dict) -> bool:
-        """TODO: document"""
-        ref_type = self.get_object_type(ref_object["type_id"])
+        The referencing objects are read from their reference edges. The references are cleared by the
+        database with one update for the fields and one update for the multi data sections.
+
+        Args:
+            public_ids (list[int]): public_ids of the targeted objects
+
+        Raises:
+            ObjectManagerUpdateError: If the references could not be deleted
+
+        Returns:
+            list[int]: public_ids of the objects whose references were deleted
+        """
+        field_ids, field_names = set(), set()
+        mds_ids, mds_names = set(), set()
+        # the changed objects are transferred again by delta exports
+        edit_time = datetime.now(timezone.utc)
+
+        try:
+            for edges in self.object_refs.get_edges(public_ids):
+                for edge in edges['references']:
+                    if edge['via_mds']:
+                        mds_ids.add(edges['public_id'])
+                        mds_names.add(edge['field'])
+                    else:
+                        field_ids.add(edges['public_id'])
+                        field_names.add(edge['field'])
+
+            reference_updates = [
+                (field_ids, field_names, 'fields.$[entry].value'),
+                (mds_ids, mds_names, 'multi_data_sections.$[].values.$[].data.$[entry].value'),
+            ]
+
+            for update_ids, update_names, value_path in reference_updates:
+                if not update_ids:
+                    continue
+
+                self.dbm.get_collection(self.collection).update_many(
+                    {'public_id': {'$in': list(update_ids)}},
+                    {'$set': {value_path: '', 'last_edit_time': edit_time}},
+                    array_filters=[{'entry.name': {'$in': list(update_names)},
+                                    'entry.value': {'$in': list(public_ids)}}]
+                )
+        except Exception as err:
+            LOGGER.debug("[delete_many_object_references] Error: %s, Type: %s", err, type(err))
+            raise ObjectManagerUpdateError(err) from err
+
+        referencing_ids = sorted(field_ids | mds_ids)
 
-        for field in ref_type.fields:
-            if field["name"] == field_name and field["type"] == "ref":
-                return True
+        if referencing_ids:
+            self.search_index.index_objects(referencing_ids, cascade=False)
+            self.object_refs.index_objects(referencing_ids)
 
-        return False
+        return referencing_ids
@@ -19,10 +19,12 @@
 
 from cmdb.security.acl.permission import AccessControlPermission
 from cmdb.security.acl.builder import AccessControlQueryBuilder
+from cmdb.security.acl.resolver import AccessControlResolver
 from cmdb.user_management.models.user import UserModel
 from cmdb.framework.models.log import CmdbObjectLog, LogAction
 from .builder import Builder
 from .builder_parameters import BuilderParameters
+from .page_cursor import PageCursor
 # -------------------------------------------------------------------------------------------------------------------- #
 
 LOGGER = logging.getLogger(__name__)
@@ -32,8 +34,14 @@
 # -------------------------------------------------------------------------------------------------------------------- #
 class BaseQueryBuilder(Builder):
     """TODO: document"""
-    def __init__(self):
+    def __init__(self, acl_resolver: AccessControlResolver = None):
+        """
+        Args:
+            acl_resolver (AccessControlResolver, optional): Restricts the documents by their `type_id` before all
+                                                            other stages instead of joining the types after `$skip`
+        """
         self.query: list[dict] = []
+        self.acl_resolver: AccessControlResolver = acl_resolver
         super().__init__()
 
 
@@ -58,10 +66,15 @@ def build(self,
             order: Sort order
         Returns:
             Union[dict, list[dict]]: The build query
+
+        Notes:
+            In cursor mode one document more than the limit is read, it shows that another page follows
         """
         self.query = self.__init_query(builder_params.get_criteria(), object_builder_mode)
 
-        if object_builder_mode:
+        if builder_params.is_cursor_mode():
+            self.__add_cursor_stages(builder_params)
+        elif object_builder_mode:
             # TODO: Remove nasty quick hack
             if builder_params.get_sort().startswith('fields'):
                 sort_value = builder_params.get_sort()[7:]
@@ -81,13 +94,14 @@ def build(self,
         else:
             self.query.append(self.sort_(builder_params.get_sort(), builder_params.get_order()))
 
-        self.query.append(self.skip_(builder_params.get_skip()))
+        if not builder_params.is_cursor_mode():
+            self.query.append(self.skip_(builder_params.get_skip()))
 
         if user and permission:
-            self.query.extend(AccessControlQueryBuilder().build(user.group_id, permission))
+            self.__add_access_control(user, permission)
 
         if builder_params.has_limit():
-            self.query.append(self.limit_(builder_params.get_limit()))
+            self.query.append(self.limit_(builder_params.get_limit() + int(builder_params.is_cursor_mode())))
 
         return self.query
 
@@ -107,7 +121,7 @@ def count(self,
         self.query = self.__init_query(criteria)
 
         if user and permission:
-            self.query.extend(AccessControlQueryBuilder().build(user.group_id, permission))
+            self.__add_access_control(user, permission)
 
         self.query.append(self.count_('total'))
 
@@ -120,6 +134,40 @@ def clear(self):
         self.query = None
 
 
+    def __add_cursor_stages(self, builder_params: BuilderParameters):
+        """
+        Adds the range match behind the cursor and the sort with public_id as tiebreaker
+
+        Args:
+            builder_params (BuilderParameters): Parameters in cursor mode
+        """
+        cursor: PageCursor = builder_params.get_cursor()
+        sort = builder_params.get_sort()
+        query_order = cursor.get_query_order() if cursor else builder_params.get_order()
+
+        if cursor:
+            self.query.append(self.match_(cursor.build_query()))
+
+        if sort == 'public_id':
+            self.query.append({'$sort': {'public_id': query_order}})
+        else:
+            self.query.append({'$sort': {sort: query_order, 'public_id': query_order}})
+
+
+    def __add_access_control(self, user: UserModel, permission: AccessControlPermission):
+        """
+        Restricts the query to the documents the user may access
+
+        Args:
+            user (UserModel): User requesting the documents
+            permission (AccessControlPermission): Permission which should be checked for the user
+        """
+        if self.acl_resolver:
+            self.query.insert(0, self.acl_resolver.build_match(user.group_id, permission))
+        else:
+            self.query.extend(AccessControlQueryBuilder().build(user.group_id, permission))
+
+
     def __init_query(self, criteria: Union[dict, list[dict]], object_builder_mode: bool = False) -> list[dict]:
         """
         Initialises the query with valid format
@@ -14,9 +14,21 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>
 """TODO: document"""
+from enum import Enum
 from typing import Union
+
+from cmdb.manager.query_builder.page_cursor import PageCursor
 # -------------------------------------------------------------------------------------------------------------------- #
 
+class TotalCount(Enum):
+    """How the total number of documents of an iteration is determined"""
+    EXACT = 'exact'
+    # collection metadata, only used without filter and ACL, otherwise exact
+    ESTIMATED = 'estimated'
+    # no total, the total of the result is None
+    NONE = 'none'
+
+
 class BuilderParameters:
     """TODO: document"""
 
@@ -25,8 +37,16 @@ def __init__(self,
                  limit: int = 0,
                  skip: int = 0,
                  sort: str = 'public_id',
-                 order: int = 1):
-
+                 order: int = 1,
+                 cursor_mode: bool = False,
+                 cursor: PageCursor = None,
+                 total: TotalCount = TotalCount.EXACT):
+        """
+        Args:
+            cursor_mode (bool): Pages by the sort value and public_id instead of skipping, `skip` is ignored
+            cursor (PageCursor, optional): Border of the requested page in cursor mode, first page if not set
+            total (TotalCount): How the total number of documents is determined
+        """
         self.criteria = criteria
         #TODO: raise exception if limit is smaller than 0
         self.limit = limit
@@ -34,6 +54,9 @@ def __init__(self,
         self.sort = sort
         #TODO: raise exception if order is neither 1 nor -1
         self.order = order
+        self.cursor_mode = cursor_mode
+        self.cursor = cursor
+        self.total = total
 
     def __repr__(self):
         return f"""
@@ -69,3 +92,23 @@ def get_sort(self) -> str:
     def get_order(self) -> int:
         """Returns order attribute"""
         return self.order
+
+
+    def is_cursor_mode(self) -> bool:
+        """Returns if the pages are read by keyset instead of skip"""
+        return self.cursor_mode
+
+
+    def get_cursor(self) -> Union[PageCursor, None]:
+        """Returns cursor attribute"""
+        return self.cursor
+
+
+    def get_total(self) -> TotalCount:
+        """Returns total attribute"""
+        return self.total
+
+
+    def has_criteria(self) -> bool:
+        """Returns if the criteria filter any documents"""
+        return bool(self.criteria)
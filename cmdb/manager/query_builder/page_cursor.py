@@ -0,0 +1,165 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2024 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Keyset pagination cursor
+
+A cursor marks the position of a page border with the sort value and the public_id of the border document.
+The next page starts behind it with a range `$match` instead of skipping all documents of the previous pages.
+"""
+import base64
+import binascii
+from typing import Any
+from bson import json_util
+# -------------------------------------------------------------------------------------------------------------------- #
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                                  PageCursor - CLASS                                                  #
+# -------------------------------------------------------------------------------------------------------------------- #
+class PageCursor:
+    """Position of a page border for keyset pagination"""
+
+    NEXT: int = 1
+    PREV: int = -1
+
+    def __init__(self, sort: str, order: int, value: Any, public_id: int, direction: int = NEXT):
+        """
+        Args:
+            sort (str): Sort field of the pages
+            order (int): Sort order of the pages (1 or -1)
+            value (Any): Value of the sort field of the border document
+            public_id (int): public_id of the border document, decides between equal sort values
+            direction (int): NEXT for the documents behind the border, PREV for the documents before it
+        """
+        self.sort = sort
+        self.order = order
+        self.value = value
+        self.public_id = public_id
+        self.direction = direction
+
+
+    def get_query_order(self) -> int:
+        """Returns the order in which the documents are read from the border"""
+        return self.order * self.direction
+
+
+    def build_query(self) -> dict:
+        """
+        Builds the range filter for the documents behind the border in reading direction
+
+        Null and missing sort values are sorted before all other values, but range operators never match them
+        or compare other values with them. They are therefore matched explicitly.
+
+        Returns:
+            dict: Filter on the sort field and the public_id
+        """
+        operator = '$gt' if self.get_query_order() == 1 else '$lt'
+
+        if self.sort == 'public_id':
+            return {'public_id': {operator: self.public_id}}
+
+        if self.value is None:
+            if self.get_query_order() == 1:
+                return {'$or': [
+                    {self.sort: {'$ne': None}},
+                    {self.sort: None, 'public_id': {operator: self.public_id}}
+                ]}
+
+            return {self.sort: None, 'public_id': {operator: self.public_id}}
+
+        ranges = [
+            {self.sort: {operator: self.value}},
+            {self.sort: self.value, 'public_id': {operator: self.public_id}}
+        ]
+
+        if self.get_query_order() == -1:
+            ranges.append({self.sort: None})
+
+        return {'$or': ranges}
+
+# ------------------------------------------------------ ENCODING ---------------------------------------------------- #
+
+    def encode(self) -> str:
+        """
+        Encodes the cursor as url safe token
+
+        Returns:
+            str: The opaque token
+        """
+        data = json_util.dumps({'s': self.sort, 'o': self.order, 'v': self.value, 'i': self.public_id,
+                                'd': self.direction})
+
+        return base64.urlsafe_b64encode(data.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor":
+        """
+        Decodes a token of `encode()`
+
+        Args:
+            token (str): The opaque token
+
+        Raises:
+            ValueError: If the token is no valid cursor
+
+        Returns:
+            PageCursor: The decoded cursor
+        """
+        try:
+            data = json_util.loads(base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)).decode('utf-8'))
+
+            return cls(sort=str(data['s']),
+                       order=cls.__check_direction(data['o']),
+                       value=data['v'],
+                       public_id=int(data['i']),
+                       direction=cls.__check_direction(data['d']))
+        except (binascii.Error, UnicodeDecodeError, KeyError, TypeError, ValueError) as err:
+            raise ValueError(f'Invalid page cursor: {token}') from err
+
+
+    @classmethod
+    def from_document(cls, document: dict, sort: str, order: int, direction: int) -> "PageCursor":
+        """
+        Creates the cursor at the border of a document
+
+        Args:
+            document (dict): Raw document at the page border
+            sort (str): Sort field of the pages, nested fields are separated by dots
+            order (int): Sort order of the pages
+            direction (int): NEXT or PREV
+
+        Returns:
+            PageCursor: Cursor behind (NEXT) or before (PREV) the document
+        """
+        value = document
+
+        for key in sort.split('.'):
+            if isinstance(value, list) and key.isdigit():
+                value = value[int(key)] if int(key) < len(value) else None
+            else:
+                value = value.get(key) if isinstance(value, dict) else None
+
+        return cls(sort, order, value, document['public_id'], direction)
+
+# ------------------------------------------------- HELPER - SECTION ------------------------------------------------- #
+
+    @staticmethod
+    def __check_direction(direction) -> int:
+        """Checks that a order or direction is 1 or -1"""
+        if direction not in (1, -1):
+            raise ValueError(f'Invalid direction: {direction}')
+
+        return direction
@@ -0,0 +1,217 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2024 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Maintains the search entries (`framework.searchEntries`) of the objects
+
+Every object has one entry with the words of its own string values and of the values of the objects it references.
+The entries are written together with the objects, the entries of referencing objects are refreshed as well.
+A failed index write never fails the object write, the next rebuild repairs the entry.
+"""
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Iterable
+from pymongo import DeleteOne, ReplaceOne
+from pymongo.errors import PyMongoError
+
+from cmdb.database.database_manager import DatabaseManager
+from cmdb.manager.base_manager import BaseManager
+from cmdb.manager.type_cache import TYPE_CACHE
+
+from cmdb.cmdb_objects.cmdb_object import CmdbObject
+from cmdb.cmdb_objects.cmdb_search_entry import CmdbSearchEntry
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                              SearchIndexManager - CLASS                                              #
+# -------------------------------------------------------------------------------------------------------------------- #
+class SearchIndexManager(BaseManager):
+    """
+    Builds and refreshes the search entries of objects
+    Extends: BaseManager
+    """
+
+    BATCH_SIZE: int = 500
+    REFERENCE_FIELD_TYPES = ('ref', 'location', 'ref-section-field')
+
+    def __init__(self, dbm: DatabaseManager):
+        """
+        Args:
+            dbm (DatabaseManager): Database connection, only collection access is used
+        """
+        super().__init__(CmdbSearchEntry.COLLECTION, dbm)
+
+# ----------------------------------------------------- INDEXING ----------------------------------------------------- #
+
+    def index_objects(self, public_ids: Iterable[int], cascade: bool = True):
+        """
+        Rebuilds the entries of objects, entries of objects which do not exist anymore are removed
+
+        Args:
+            public_ids (Iterable[int]): public_ids of the changed objects
+            cascade (bool): Also rebuild the entries of the objects which reference the changed objects
+        """
+        try:
+            public_ids = set(public_ids)
+
+            if cascade:
+                public_ids.update(self.__get_referencing_ids(public_ids))
+
+            sorted_ids = sorted(public_ids)
+
+            for start in range(0, len(sorted_ids), self.BATCH_SIZE):
+                batch_ids = sorted_ids[start:start + self.BATCH_SIZE]
+                objects = list(self.dbm.get_collection(CmdbObject.COLLECTION).find({'public_id': {'$in': batch_ids}},
+                                                                                   {'_id': 0}))
+                found_ids = {object_data['public_id'] for object_data in objects}
+
+                self.__write_entries(objects,
+                                     [DeleteOne({'public_id': public_id}) for public_id in batch_ids
+                                                                          if public_id not in found_ids])
+        except PyMongoError as err:
+            #TODO: ERROR-FIX
+            LOGGER.warning("[SearchIndexManager] Search entries of %s could not be written: %s", public_ids, err)
+
+
+    def remove_objects(self, public_ids: Iterable[int]):
+        """
+        Removes the entries of deleted objects and rebuilds the entries which referenced them
+
+        Args:
+            public_ids (Iterable[int]): public_ids of the deleted objects
+        """
+        try:
+            public_ids = list(public_ids)
+            referencing_ids = self.__get_referencing_ids(public_ids)
+
+            self.dbm.get_collection(self.collection).delete_many({'public_id': {'$in': public_ids}})
+        except PyMongoError as err:
+            #TODO: ERROR-FIX
+            LOGGER.warning("[SearchIndexManager] Search entries of %s could not be removed: %s", public_ids, err)
+            return
+
+        if referencing_ids:
+            self.index_objects(referencing_ids, cascade=False)
+
+
+    def rebuild(self) -> int:
+        """
+        Rebuilds the entries of all objects and removes the entries without object
+
+        The existing entries stay searchable during the rebuild, they are replaced batch by batch.
+
+        Returns:
+            int: Number of indexed objects
+        """
+        rebuild_time = datetime.now(timezone.utc)
+        indexed_objects = 0
+        batch = []
+
+        for object_data in self.dbm.get_collection(CmdbObject.COLLECTION).find({}, {'_id': 0},
+                                                                               batch_size=self.BATCH_SIZE):
+            batch.append(object_data)
+
+            if len(batch) >= self.BATCH_SIZE:
+                indexed_objects += self.__write_entries(batch)
+                batch = []
+
+        if batch:
+            indexed_objects += self.__write_entries(batch)
+
+        self.dbm.get_collection(self.collection).delete_many({'indexed_time': {'$lt': rebuild_time}})
+
+        return indexed_objects
+
+
+    def is_outdated(self) -> bool:
+        """
+        Checks if the number of entries differs from the number of objects
+
+        Returns:
+            bool: True if the entries should be rebuilt
+        """
+        return self.dbm.get_collection(CmdbObject.COLLECTION).estimated_document_count() \
+               != self.dbm.get_collection(self.collection).estimated_document_count()
+
+
+    def rebuild_in_background(self) -> threading.Thread:
+        """
+        Rebuilds the entries in a daemon thread if they are outdated
+
+        Returns:
+            threading.Thread: The started thread
+        """
+        def run_rebuild():
+            try:
+                if self.is_outdated():
+                    LOGGER.info("SEARCH INDEX: Rebuilding the search entries")
+                    LOGGER.info("SEARCH INDEX: Rebuild finished, indexed objects: %s", self.rebuild())
+            except PyMongoError as err:
+                LOGGER.error("SEARCH INDEX: Rebuild failed: %s", err)
+
+        rebuild_thread = threading.Thread(target=run_rebuild, name='SearchIndexRebuild', daemon=True)
+        rebuild_thread.start()
+
+        return rebuild_thread
+
+# ------------------------------------------------- HELPER - SECTION ------------------------------------------------- #
+
+    def __write_entries(self, objects: list[dict], requests: list = None) -> int:
+        """Builds the entries of objects with one query for all referenced objects and writes them in one bulk"""
+        requests = requests or []
+        type_ids = list({object_data['type_id'] for object_data in objects})
+        ref_field_names: dict[int, set[str]] = {
+            type_id: {field['name'] for field in type_data.get('fields', [])
+                                   if field.get('type') in self.REFERENCE_FIELD_TYPES}
+            for type_id, type_data in TYPE_CACHE.get_many_type_data(self.dbm, type_ids).items()
+        }
+
+        referenced_ids = set()
+
+        for object_data in objects:
+            for field in object_data.get('fields', []):
+                if field.get('name') in ref_field_names.get(object_data['type_id'], ()):
+                    referenced_ids.update(CmdbSearchEntry.get_reference_ids(field.get('value')))
+
+        referenced_fields: dict[int, list[dict]] = {}
+
+        if referenced_ids:
+            referenced_fields = {
+                ref_object['public_id']: ref_object.get('fields', [])
+                for ref_object in self.dbm.get_collection(CmdbObject.COLLECTION).find(
+                                                                        {'public_id': {'$in': list(referenced_ids)}},
+                                                                        {'_id': 0, 'public_id': 1, 'fields': 1})
+            }
+
+        for object_data in objects:
+            entry = CmdbSearchEntry.from_object(object_data,
+                                                ref_field_names.get(object_data['type_id'], set()),
+                                                referenced_fields)
+            requests.append(ReplaceOne({'public_id': entry.public_id}, CmdbSearchEntry.to_data(entry), upsert=True))
+
+        if requests:
+            self.dbm.get_collection(self.collection).bulk_write(requests, ordered=False)
+
+        return len(objects)
+
+
+    def __get_referencing_ids(self, public_ids: Iterable[int]) -> set[int]:
+        """Returns the public_ids of the objects whose entries contain values of the given objects"""
+        return {entry['public_id'] for entry in self.dbm.get_collection(self.collection).find(
+                                                                        {'references': {'$in': list(public_ids)}},
+                                                                        {'_id': 0, 'public_id': 1})}
@@ -33,7 +33,6 @@
 from cmdb.framework.results.list import ListResult
 from cmdb.security.acl.permission import AccessControlPermission
 from cmdb.user_management.models.user import UserModel
-from cmdb.manager.query_builder.base_query_builder import BaseQueryBuilder
 from cmdb.manager.query_builder.builder_parameters import BuilderParameters
 
 from cmdb.errors.manager import ManagerGetError, ManagerIterationError, ManagerInsertError
@@ -63,7 +62,6 @@ def __init__(self, dbm: MongoDatabaseManager, event_queue: Union[Queue, Event] =
         if database:
             dbm.connector.set_database(database)
 
-        self.query_builder = BaseQueryBuilder()
         self.type_manager = TypeManager(dbm)
         self.objects_manager = ObjectsManager(dbm)
 
@@ -117,21 +115,9 @@ def iterate(self,
         Returns:
             IterationResult[CmdbSectionTemplate]: Result which matches the Builderparameters
         """
-        try:
-            query: list[dict] = self.query_builder.build(builder_params,user, permission)
-            count_query: list[dict] = self.query_builder.count(builder_params.get_criteria())
-
-            aggregation_result = list(self.aggregate(query))
-            total_cursor = self.aggregate(count_query)
-
-            total = 0
-            while total_cursor.alive:
-                total = next(total_cursor)['total']
-        except ManagerGetError as err:
-            raise ManagerIterationError(err) from err
+        iteration_result: IterationResult[CmdbSectionTemplate] = self.iterate_query(builder_params, user, permission)
 
         try:
-            iteration_result: IterationResult[CmdbSectionTemplate] = IterationResult(aggregation_result, total)
             iteration_result.convert_to(CmdbSectionTemplate)
         except Exception as err:
             raise ManagerIterationError(err) from err
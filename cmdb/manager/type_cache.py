@@ -0,0 +1,368 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2024 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Process wide cache for the documents of the framework types
+
+Types are read for nearly every object operation but change rarely. The cache holds the raw type documents per
+tenant database. Every write of a type increases a revision counter of the tenant in the database, other processes
+compare their revision with it at most every `REVALIDATION_INTERVAL` seconds and drop their entries on a mismatch.
+"""
+import copy
+import time
+import logging
+import threading
+from typing import Callable, Union
+from pymongo import ReturnDocument
+
+from cmdb.database.database_manager import DatabaseManager
+from cmdb.event_management.event import Event
+from cmdb.framework.models.type import TypeModel
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                                TypeCacheTenant - CLASS                                               #
+# -------------------------------------------------------------------------------------------------------------------- #
+class TypeCacheTenant:
+    """Cached type documents of a single tenant database"""
+
+    def __init__(self):
+        self.revision: int = None
+        self.last_check: float = 0
+        self.types: dict[int, dict] = {}
+        self.complete: bool = False
+        self.generation: int = 0
+
+
+    def clear(self):
+        """Drops all cached types of the tenant"""
+        self.types = {}
+        self.complete = False
+        self.generation += 1
+
+
+    def drop(self, public_id: int):
+        """Drops a single type of the tenant"""
+        self.types.pop(public_id, None)
+        self.complete = False
+        self.generation += 1
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                                   TypeCache - CLASS                                                  #
+# -------------------------------------------------------------------------------------------------------------------- #
+class TypeCache:
+    """
+    Cache of the raw type documents keyed by tenant database and type public_id
+
+    Notes:
+        The cached documents are never handed out directly. Every call returns a deep copy,
+        because renders and managers write into the field dicts of a type.
+    """
+
+    REVISION_COLLECTION = 'datastorage.revisions'
+    REVISION_ID = TypeModel.COLLECTION
+    REVALIDATION_INTERVAL: float = 5.0
+
+    def __init__(self, revalidation_interval: float = REVALIDATION_INTERVAL):
+        self.revalidation_interval = revalidation_interval
+        self.__tenants: dict[str, TypeCacheTenant] = {}
+        self.__lock = threading.RLock()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.invalidations: int = 0
+
+# ------------------------------------------------------ READING ----------------------------------------------------- #
+
+    def get_type_data(self, dbm: DatabaseManager, public_id: int) -> Union[dict, None]:
+        """
+        Retrieves the document of a type
+
+        Args:
+            dbm (DatabaseManager): Database connection of the tenant
+            public_id (int): public_id of the type
+
+        Returns:
+            dict: Copy of the type document or None if the type does not exist
+        """
+        self.__revalidate(dbm)
+
+        with self.__lock:
+            tenant = self.__get_tenant(dbm)
+            type_data = tenant.types.get(public_id)
+
+            if type_data is not None:
+                self.hits += 1
+                return copy.deepcopy(type_data)
+
+            self.misses += 1
+            generation = tenant.generation
+
+            if tenant.complete:
+                return None
+
+        type_data = dbm.get_collection(TypeModel.COLLECTION).find_one({'public_id': public_id}, {'_id': 0})
+
+        if type_data is not None:
+            self.__store(dbm, tenant, generation, [type_data])
+
+        return copy.deepcopy(type_data)
+
+
+    def get_many_type_data(self, dbm: DatabaseManager, public_ids: list[int]) -> dict[int, dict]:
+        """
+        Retrieves the documents of multiple types, missing types are loaded with a single query
+
+        Args:
+            dbm (DatabaseManager): Database connection of the tenant
+            public_ids (list[int]): public_ids of the types
+
+        Returns:
+            dict[int, dict]: Copies of the found type documents by their public_id
+        """
+        found_types: dict[int, dict] = {}
+        missing_ids = []
+
+        self.__revalidate(dbm)
+
+        with self.__lock:
+            tenant = self.__get_tenant(dbm)
+            generation = tenant.generation
+
+            for public_id in public_ids:
+                type_data = tenant.types.get(public_id)
+
+                if type_data is not None:
+                    self.hits += 1
+                    found_types[public_id] = copy.deepcopy(type_data)
+                else:
+                    self.misses += 1
+
+                    if not tenant.complete:
+                        missing_ids.append(public_id)
+
+        if missing_ids:
+            loaded_types = list(dbm.get_collection(TypeModel.COLLECTION).find({'public_id': {'$in': missing_ids}},
+                                                                              {'_id': 0}))
+            self.__store(dbm, tenant, generation, loaded_types)
+
+            for type_data in loaded_types:
+                found_types[type_data['public_id']] = copy.deepcopy(type_data)
+
+        return found_types
+
+
+    def get_all_type_data(self, dbm: DatabaseManager) -> list[dict]:
+        """
+        Retrieves the documents of all types of the tenant
+
+        Args:
+            dbm (DatabaseManager): Database connection of the tenant
+
+        Returns:
+            list[dict]: Copies of all type documents sorted by public_id
+        """
+        self.__revalidate(dbm)
+
+        with self.__lock:
+            tenant = self.__get_tenant(dbm)
+
+            if tenant.complete:
+                self.hits += 1
+                return [copy.deepcopy(tenant.types[public_id]) for public_id in sorted(tenant.types)]
+
+            self.misses += 1
+            generation = tenant.generation
+
+        loaded_types = list(dbm.get_collection(TypeModel.COLLECTION).find({}, {'_id': 0}).sort('public_id', 1))
+        self.__store(dbm, tenant, generation, loaded_types, complete=True)
+
+        return copy.deepcopy(loaded_types)
+
+    def select_type_ids(self, dbm: DatabaseManager, predicate: Callable[[dict], bool]) -> list[int]:
+        """
+        Retrieves the public_ids of all types whose document matches a predicate
+
+        Args:
+            dbm (DatabaseManager): Database connection of the tenant
+            predicate (Callable[[dict], bool]): Check for a type document, it receives the cached
+                                                document itself and must not change it
+
+        Returns:
+            list[int]: Sorted public_ids of the matching types
+        """
+        self.__revalidate(dbm)
+
+        with self.__lock:
+            tenant = self.__get_tenant(dbm)
+
+            if tenant.complete:
+                self.hits += 1
+                return [public_id for public_id in sorted(tenant.types) if predicate(tenant.types[public_id])]
+
+        return [type_data['public_id'] for type_data in self.get_all_type_data(dbm) if predicate(type_data)]
+
+# --------------------------------------------------- INVALIDATION --------------------------------------------------- #
+
+    def invalidate(self, dbm: DatabaseManager, public_id: int = None):
+        """
+        Removes a type (or all types) of the tenant from the cache and increases the revision of the tenant,
+        so that other processes drop their entries too
+
+        Args:
+            dbm (DatabaseManager): Database connection of the tenant
+            public_id (int, optional): public_id of the changed type, None for all types
+        """
+        try:
+            revision_doc = dbm.get_collection(self.REVISION_COLLECTION).find_one_and_update(
+                                                                        {'_id': self.REVISION_ID},
+                                                                        {'$inc': {'revision': 1}},
+                                                                        upsert=True,
+                                                                        return_document=ReturnDocument.AFTER
+                                                                    )
+            revision = revision_doc['revision']
+        except Exception as err:
+            #TODO: ERROR-FIX
+            LOGGER.warning("[TypeCache] Revision of types could not be increased: %s", err)
+            revision = None
+
+        with self.__lock:
+            tenant = self.__get_tenant(dbm)
+            self.invalidations += 1
+
+            if public_id is None:
+                tenant.clear()
+            else:
+                tenant.drop(public_id)
+
+            tenant.revision = revision
+
+
+    def handle_event(self, event: Event, database: str = None):
+        """
+        Drops cached types when a `cmdb.core.objecttype.*` event was received
+
+        Args:
+            event (Event): The received event
+            database (str, optional): Tenant database of the event, all tenants if not set
+        """
+        if not event.get_type().startswith('cmdb.core.objecttype'):
+            return
+
+        with self.__lock:
+            tenants = [self.__tenants[database]] if database in self.__tenants else list(self.__tenants.values())
+            public_id = event.get_param('id')
+            self.invalidations += 1
+
+            for tenant in tenants:
+                if public_id is None:
+                    tenant.clear()
+                else:
+                    tenant.drop(public_id)
+
+
+    def clear(self):
+        """Removes all tenants from the cache"""
+        with self.__lock:
+            self.__tenants = {}
+
+
+    def get_statistics(self) -> dict:
+        """Returns the hit and miss counters of the cache"""
+        with self.__lock:
+            requests = self.hits + self.misses
+
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / requests, 4) if requests else 0,
+                'invalidations': self.invalidations,
+                'tenants': {name: len(tenant.types) for name, tenant in self.__tenants.items()}
+            }
+
+# ------------------------------------------------- HELPER - SECTION ------------------------------------------------- #
+
+    def __get_tenant(self, dbm: DatabaseManager) -> TypeCacheTenant:
+        """Returns the cache of the current database of the connection, the lock has to be held"""
+        database_name = dbm.connector.database.name
+        tenant = self.__tenants.get(database_name)
+
+        if not tenant:
+            tenant = TypeCacheTenant()
+            self.__tenants[database_name] = tenant
+
+        return tenant
+
+
+    def __revalidate(self, dbm: DatabaseManager):
+        """
+        Checks the revision of the tenant after the revalidation interval and drops its types if it changed
+
+        The revision is read without holding the lock, so a slow database does not block the lookups of other
+        tenants. It is only applied if the tenant was not changed while it was read.
+        """
+        with self.__lock:
+            tenant = self.__get_tenant(dbm)
+
+            if time.monotonic() - tenant.last_check < self.revalidation_interval:
+                return
+
+            generation = tenant.generation
+
+        revision = self.__load_revision(dbm)
+
+        with self.__lock:
+            if self.__tenants.get(dbm.connector.database.name) is not tenant or tenant.generation != generation:
+                return
+
+            if revision != tenant.revision:
+                tenant.clear()
+                tenant.revision = revision
+
+            tenant.last_check = time.monotonic()
+
+
+    def __load_revision(self, dbm: DatabaseManager) -> Union[int, None]:
+        """Reads the current type revision of the tenant"""
+        try:
+            revision_doc = dbm.get_collection(self.REVISION_COLLECTION).find_one({'_id': self.REVISION_ID})
+        except Exception as err:
+            #TODO: ERROR-FIX
+            LOGGER.debug("[TypeCache] Revision of types could not be read: %s", err)
+            return None
+
+        return revision_doc['revision'] if revision_doc else 0
+
+
+    def __store(self,
+                dbm: DatabaseManager,
+                tenant: TypeCacheTenant,
+                generation: int,
+                types: list[dict],
+                complete: bool = False):
+        """Adds loaded types to the tenant if the tenant was not invalidated while they were loaded"""
+        with self.__lock:
+            if self.__tenants.get(dbm.connector.database.name) is not tenant or tenant.generation != generation:
+                return
+
+            for type_data in types:
+                tenant.types[type_data['public_id']] = copy.deepcopy(type_data)
+
+            if complete:
+                tenant.complete = True
+
+
+TYPE_CACHE = TypeCache()
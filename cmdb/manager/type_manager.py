@@ -18,12 +18,18 @@
 """
 import json
 import logging
+import threading
+from datetime import datetime, timezone
+from queue import Queue
 from typing import Union
 from bson import json_util
+from pymongo.errors import PyMongoError
 
 from cmdb.database.database_manager_mongo import DatabaseManagerMongo
 from cmdb.manager.managers import ManagerBase
 from cmdb.manager.objects_manager import ObjectsManager
+from cmdb.manager.type_cache import TYPE_CACHE
+from cmdb.manager.category_tree_cache import CATEGORY_TREE_CACHE
 
 from cmdb.database.utils import object_hook
 from cmdb.framework import TypeModel
@@ -31,10 +37,11 @@
 from cmdb.framework.results.iteration import IterationResult
 from cmdb.framework.results.list import ListResult
 from cmdb.framework.utils import PublicID
-from cmdb.search import Pipeline
 from cmdb.cmdb_objects.cmdb_object import CmdbObject
+from cmdb.event_management.event import Event
+from cmdb.utils.system_reader import SystemSettingsReader
 
-from cmdb.errors.manager import ManagerUpdateError, ManagerDeleteError, ManagerGetError, ManagerIterationError
+from cmdb.errors.manager import ManagerUpdateError, ManagerDeleteError, ManagerGetError
 # -------------------------------------------------------------------------------------------------------------------- #
 
 LOGGER = logging.getLogger(__name__)
@@ -47,13 +54,22 @@ class TypeManager(ManagerBase):
     Manager for the type module. Manages the CRUD functions of the types and the iteration over the collection.
     """
 
-    def __init__(self, database_manager: DatabaseManagerMongo, database: str = None):
+    MIGRATION_BATCH_SIZE: int = 1000
+    # prefix of the `_id` of the pending migrations in the settings collection
+    MIGRATION_STATE_ID: str = 'type_migration'
+
+    def __init__(self, database_manager: DatabaseManagerMongo, event_queue: Union[Queue, Event] = None,
+                 database: str = None):
         """
         Constructor of `TypeManager`
 
         Args:
             database_manager: Connection to the database class.
+            event_queue (Queue, Event): The queue for events in RabbitMQ
+            database (str): name of database for cloud mode
         """
+        self.event_queue = event_queue
+
         if database:
             database_manager.connector.set_database(database)
 
@@ -82,19 +98,7 @@ def iterate(self, filter: dict, limit: int, skip: int, sort: str, order: int, *a
         Returns:
             IterationResult: Instance of IterationResult with generic TypeModel.
         """
-
-        try:
-            query: Pipeline = self.builder.build(filter=filter, limit=limit, skip=skip, sort=sort, order=order)
-            count_query: Pipeline = self.builder.count(filter=filter)
-            aggregation_result = list(self._aggregate(self.collection, query))
-            total_cursor = self._aggregate(self.collection, count_query)
-            total = 0
-            while total_cursor.alive:
-                total = next(total_cursor)['total']
-        except ManagerGetError as err:
-            raise ManagerIterationError(err) from err
-
-        iteration_result: IterationResult[TypeModel] = IterationResult(aggregation_result, total)
+        iteration_result: IterationResult[TypeModel] = self._iterate(filter, limit, skip, sort, order, **kwargs)
         iteration_result.convert_to(TypeModel)
         return iteration_result
 
@@ -123,8 +127,12 @@ def get(self, public_id: Union[PublicID, int]) -> TypeModel:
         Returns:
             TypeModel: Instance of TypeModel with data.
         """
-        cursor_result = self._get(self.collection, filter={'public_id': public_id}, limit=1)
-        for resource_result in cursor_result.limit(-1):
+        try:
+            resource_result = TYPE_CACHE.get_type_data(self._database_manager, public_id)
+        except Exception as err:
+            raise ManagerGetError(err) from err
+
+        if resource_result:
             return TypeModel.from_data(resource_result)
 
         raise ManagerGetError(f'Type with ID: {public_id} not found!')
@@ -148,7 +156,10 @@ def insert(self, type: Union[TypeModel, dict]) -> PublicID:
         elif isinstance(type, dict):
             type = json.loads(json.dumps(type, default=json_util.default), object_hook=object_hook)
 
-        return self._insert(self.collection, resource=type)
+        result_id = self._insert(self.collection, resource=type)
+        self.__type_changed('added', result_id)
+
+        return result_id
 
 
     def update(self, public_id: Union[PublicID, int], type: Union[TypeModel, dict]):
@@ -168,6 +179,8 @@ def update(self, public_id: Union[PublicID, int], type: Union[TypeModel, dict]):
             type = json.loads(json.dumps(type, default=json_util.default), object_hook=object_hook)
 
         update_result = self._update(self.collection, filter={'public_id': public_id}, resource=type)
+        self.__type_changed('updated', public_id)
+
         if update_result.matched_count != 1:
             raise ManagerUpdateError('Something happened during the update!')
 
@@ -186,6 +199,7 @@ def delete(self, public_id: Union[PublicID, int]) -> TypeModel:
         """
         raw_type: TypeModel = self.get(public_id=public_id)
         delete_result = self._delete(self.collection, filter={'public_id': public_id})
+        self.__type_changed('deleted', public_id)
 
         if delete_result.deleted_count == 0:
             raise ManagerDeleteError(err='No type matched this public id')
@@ -194,110 +208,281 @@ def delete(self, public_id: Union[PublicID, int]) -> TypeModel:
 
 # -------------------------------------------------- HELPER SECTION -------------------------------------------------- #
 
-    def handle_mutli_data_sections(self, target_type: TypeModel, updated_data: dict):
-        """TODO: document"""
-        added_fields: dict = {}
-        deleted_fields: dict = {}
+    def __type_changed(self, action: str, public_id: int):
+        """
+        Invalidates the cached type and informs the other processes about the change
+
+        Args:
+            action (str): 'added', 'updated' or 'deleted'
+            public_id (int): public_id of the changed type
+        """
+        TYPE_CACHE.invalidate(self._database_manager, public_id)
+        CATEGORY_TREE_CACHE.invalidate(self._database_manager)
+
+        try:
+            if self.event_queue:
+                event = Event(f"cmdb.core.objecttype.{action}",
+                              {
+                                  "id": public_id,
+                                  "database": self._database_manager.connector.database.name,
+                                  "event": action
+                              })
+                self.event_queue.put(event)
+        except Exception as err:
+            LOGGER.debug("[__type_changed] Event error: %s, Type: %s", err, type(err))
+
+
+    def get_changed_multi_data_sections(self, target_type: TypeModel, updated_data: dict) -> dict[str, list[str]]:
+        """
+        Retrieves the multi data sections whose fields are changed by a type update
+
+        Args:
+            target_type (TypeModel): The type before the update
+            updated_data (dict): The updated type data
+
+        Returns:
+            dict[str, list[str]]: The new field names by the names of the changed sections
+        """
+        changed_sections: dict[str, list[str]] = {}
 
         a_section: TypeFieldSection
         for a_section in target_type.render_meta.sections:
-            # LOGGER.info(f"a type section: {a_section}")
+            if a_section.type != "multi-data-section":
+                continue
 
-            if a_section.type == "multi-data-section":
-                for updated_section in updated_data["render_meta"]["sections"]:
-                    # LOGGER.info(f"new sections: {updated_section}")
+            for updated_section in updated_data["render_meta"]["sections"]:
+                if a_section.type == updated_section["type"] and a_section.name == updated_section["name"]:
+                    if a_section.fields != updated_section["fields"]:
+                        changed_sections[a_section.name] = list(updated_section["fields"])
 
-                    if a_section.type == updated_section["type"] and a_section.name == updated_section["name"]:
-                        # get the field changes for each multi-data-section
-                        added_fields[a_section.name] = self.fields_diff(a_section.fields,
-                                                                        updated_section["fields"],
-                                                                        True)
-                        deleted_fields[a_section.name] = self.fields_diff(a_section.fields,
-                                                                          updated_section["fields"],
-                                                                          False)
+        return changed_sections
 
-        return self.update_multi_data_fields(target_type, added_fields, deleted_fields)
 
+    def migrate_multi_data_sections(self, type_id: int, sections: dict[str, list[str]]) -> int:
+        """
+        Adjusts the multi data section values of all objects of a type to the fields of the sections
 
-    def update_multi_data_fields(self, target_type: TypeModel, added_fields: dict, deleted_fields: dict):
-        """TODO: document"""
-        # get all objects of this type
-        all_type_objects = self.objects_manager.get_objects_by(type_id=target_type.public_id)
+        Entries of removed fields are removed and added fields get an entry with an empty value. The migration is
+        recorded in `settings.conf` before the objects are updated in batches of public_ids and the last migrated
+        public_id is stored after every batch. An interrupted migration is continued by
+        `resume_multi_data_sections_migrations`. A migration which is still pending for the type is merged into
+        the new one and restarted from the first object, every batch is idempotent.
+
+        Args:
+            type_id (int): public_id of the type
+            sections (dict[str, list[str]]): The field names by the names of the multi data sections
+
+        Raises:
+            ManagerUpdateError: If the migration could not be recorded or a batch could not be migrated
 
-        # update the multi-data-sections
-        an_object: CmdbObject
-        for an_object in all_type_objects:
+        Returns:
+            int: Number of changed objects
+        """
+        if not sections:
+            return 0
+
+        settings = self._database_manager.get_collection(SystemSettingsReader.COLLECTION)
+        migration_id = f'{self.MIGRATION_STATE_ID}_{type_id}'
+
+        try:
+            pending_migration = settings.find_one({'_id': migration_id})
+            pending_sections = self.__get_migration_sections(pending_migration) if pending_migration else {}
+
+            migration = {
+                '_id': migration_id,
+                'type_id': type_id,
+                'sections': [{'name': name, 'fields': fields}
+                             for name, fields in {**pending_sections, **sections}.items()],
+                'last_id': 0,
+            }
+            settings.replace_one({'_id': migration_id}, migration, upsert=True)
+        except PyMongoError as err:
+            raise ManagerUpdateError(f'Migration of type {type_id} could not be recorded: {err}') from err
+
+        return self.__run_migration(migration)
+
+
+    def get_pending_migrations(self) -> list[dict]:
+        """
+        Retrieves the multi data section migrations which were not finished
+
+        Returns:
+            list[dict]: The recorded migrations with their `type_id`, `sections` and `last_id`
+        """
+        return list(self._database_manager.get_collection(SystemSettingsReader.COLLECTION)
+                                          .find({'_id': {'$regex': f'^{self.MIGRATION_STATE_ID}_'}}))
+
+
+    def resume_multi_data_sections_migrations(self) -> int:
+        """
+        Continues all pending multi data section migrations after their last migrated public_id
+
+        Raises:
+            ManagerUpdateError: If a migration could not be finished, the remaining migrations are still resumed
+
+        Returns:
+            int: Number of changed objects
+        """
+        changed_objects = 0
+        errors = []
+
+        for migration in self.get_pending_migrations():
+            LOGGER.info("TYPE MIGRATION: Resuming type %s after public_id %s",
+                        migration['type_id'], migration['last_id'])
             try:
-                for current_mds_section in an_object.multi_data_sections:
-                    section_id = current_mds_section["section_id"]
-                    fields_to_add = added_fields[section_id]
-                    fields_to_delete = deleted_fields[section_id]
+                changed_objects += self.__run_migration(migration)
+            except ManagerUpdateError as err:
+                errors.append(err.message)
 
-                    # add new fields and remove deleted fields
-                    if len(fields_to_add) > 0:
-                        for data_set in current_mds_section["values"]:
-                            data_set = self.create_mds_field_entries(fields_to_add, data_set)
+        if errors:
+            raise ManagerUpdateError('; '.join(errors))
 
-                    if len(fields_to_delete) > 0:
-                        for data_set in current_mds_section["values"]:
-                            data_set = self.delete_mds_field_entries(fields_to_delete, data_set)
+        return changed_objects
 
-            except Exception as err:
-                LOGGER.error(f"Error while updating multi data fields of objects: {err}")
 
-        return all_type_objects
+    def resume_in_background(self) -> threading.Thread:
+        """
+        Resumes the pending multi data section migrations in a daemon thread
 
+        Returns:
+            threading.Thread: The started thread
+        """
+        def run_resume():
+            try:
+                if self.get_pending_migrations():
+                    LOGGER.info("TYPE MIGRATION: Resume finished, changed objects: %s",
+                                self.resume_multi_data_sections_migrations())
+            except (ManagerUpdateError, PyMongoError) as err:
+                LOGGER.error("TYPE MIGRATION: Resume failed: %s", err)
 
+        resume_thread = threading.Thread(target=run_resume, name='TypeMigrationResume', daemon=True)
+        resume_thread.start()
 
-    def create_mds_field_entries(self, fields_to_add: list, data_set) -> list:
-        """TODO: document"""
-        try:
-            for field_name in fields_to_add:
+        return resume_thread
 
-                new_field = {
-                    "name": field_name,
-                    "value": None
-                }
 
-                data_set["data"].append(new_field)
-        except Exception as err:
-            LOGGER.debug(f"Error in create_mds_field_entries(): {err}")
+    def __run_migration(self, migration: dict) -> int:
+        """
+        Migrates the objects of a recorded migration in batches after its `last_id` and removes the record at the end
 
-        return data_set
+        Args:
+            migration (dict): The recorded migration
 
+        Raises:
+            ManagerUpdateError: If a batch could not be migrated, the record keeps the last migrated public_id
 
-    def delete_mds_field_entries(self, fields_to_delete: list, data_set: list) -> list:
-        """TODO: document"""
-        to_delete = []
+        Returns:
+            int: Number of changed objects
+        """
+        type_id = migration['type_id']
+        sections = self.__get_migration_sections(migration)
+
+        settings = self._database_manager.get_collection(SystemSettingsReader.COLLECTION)
+        objects_collection = self._database_manager.get_collection(CmdbObject.COLLECTION)
+        criteria = {
+            'type_id': type_id,
+            'multi_data_sections.section_id': {'$in': list(sections)},
+        }
+        sections_migration = self.__build_sections_migration(sections)
+
+        changed_objects = 0
+        last_id = migration['last_id']
 
         try:
-            # get all fields which should be deleted
-            for field_name in fields_to_delete:
-                index: int = 0
+            while True:
+                batch_ids = [object_data['public_id'] for object_data in
+                             objects_collection.find({**criteria, 'public_id': {'$gt': last_id}},
+                                                     {'_id': 0, 'public_id': 1})
+                                               .sort('public_id', 1)
+                                               .limit(self.MIGRATION_BATCH_SIZE)]
+                if not batch_ids:
+                    break
 
-                for entry in data_set["data"]:
-                    if entry["name"] == field_name:
-                        break
+                batch_criteria = {**criteria, 'public_id': {'$gt': last_id, '$lte': batch_ids[-1]}}
+                pipeline = self.__build_migration_pipeline(sections_migration, datetime.now(timezone.utc))
+                changed_objects += objects_collection.update_many(batch_criteria, pipeline).modified_count
+                last_id = batch_ids[-1]
+                settings.update_one({'_id': migration['_id']}, {'$set': {'last_id': last_id}})
 
-                    index += 1
+                LOGGER.info("TYPE MIGRATION: Type %s, migrated objects until public_id %s", type_id, last_id)
 
-                to_delete.append(index)
+            settings.delete_one({'_id': migration['_id']})
+        except PyMongoError as err:
+            raise ManagerUpdateError(f'Migration of type {type_id} stopped after public_id {last_id}: {err}') from err
 
-            # delete from end
-            for idx in to_delete[::-1]:
-                del data_set["data"][idx]
+        return changed_objects
 
-        except Exception as err:
-            LOGGER.debug(f"Error in delete_mds_field_entries(): {err}") 
 
-        return data_set
+    @staticmethod
+    def __get_migration_sections(migration: dict) -> dict[str, list[str]]:
+        """Returns the field names by the names of the sections of a recorded migration"""
+        return {section['name']: section['fields'] for section in migration['sections']}
 
 
-    def fields_diff(self, initial_fields: list, new_fields: list,  check_added: bool = False) -> list:
-        """TODO: document"""
-        if check_added:
-            # check which fields were added
-            return [field_name for field_name in new_fields if field_name not in initial_fields]
+    @staticmethod
+    def __build_migration_pipeline(sections_migration: dict, edit_time: datetime) -> list[dict]:
+        """
+        Builds the update pipeline which migrates the multi data sections of an object
 
-        #check which fields were deleted
-        return [field_name for field_name in initial_fields if field_name not in new_fields]
+        The `last_edit_time` is only set if the sections are changed, so that delta exports transfer the object
+        again and a repeated migration changes nothing.
+
+        Args:
+            sections_migration (dict): Expression for the new `multi_data_sections` of an object
+            edit_time (datetime): New `last_edit_time` of the changed objects
+
+        Returns:
+            list[dict]: The update pipeline
+        """
+        return [
+            {'$set': {'migrated_sections': sections_migration}},
+            {'$set': {
+                'last_edit_time': {'$cond': [{'$eq': ['$migrated_sections', '$multi_data_sections']},
+                                             '$last_edit_time',
+                                             edit_time]},
+                'multi_data_sections': '$migrated_sections',
+            }},
+            {'$project': {'migrated_sections': 0}},
+        ]
+
+
+    @staticmethod
+    def __build_sections_migration(sections: dict[str, list[str]]) -> dict:
+        """
+        Builds the aggregation expression which adjusts the values of the multi data sections to their fields
+
+        Args:
+            sections (dict[str, list[str]]): The field names by the names of the multi data sections
+
+        Returns:
+            dict: Expression for the new `multi_data_sections` of an object
+        """
+        branches = []
+
+        for section_name, field_names in sections.items():
+            data_entries = {
+                '$concatArrays': [
+                    # keep the entries of the fields which still exist
+                    {'$filter': {'input': {'$ifNull': ['$$data_set.data', []]},
+                                 'as': 'entry',
+                                 'cond': {'$in': ['$$entry.name', {'$literal': field_names}]}}},
+                    # add the entries of the new fields
+                    {'$filter': {'input': {'$literal': [{'name': name, 'value': None} for name in field_names]},
+                                 'as': 'entry',
+                                 'cond': {'$not': [{'$in': ['$$entry.name',
+                                                            {'$ifNull': ['$$data_set.data.name', []]}]}]}}},
+                ]
+            }
+
+            branches.append({
+                'case': {'$eq': ['$$section.section_id', section_name]},
+                'then': {'$mergeObjects': ['$$section', {
+                    'values': {'$map': {'input': {'$ifNull': ['$$section.values', []]},
+                                        'as': 'data_set',
+                                        'in': {'$mergeObjects': ['$$data_set', {'data': data_entries}]}}}
+                }]}
+            })
+
+        return {'$map': {'input': '$multi_data_sections',
+                         'as': 'section',
+                         'in': {'$switch': {'branches': branches, 'default': '$$section'}}}}
@@ -22,10 +22,9 @@
 
 from cmdb.user_management.models.user import UserModel
 from cmdb.framework.results import IterationResult
-from cmdb.manager.query_builder.base_query_builder import BaseQueryBuilder
 from cmdb.manager.query_builder.builder_parameters import BuilderParameters
 
-from cmdb.errors.manager import ManagerUpdateError, ManagerDeleteError, ManagerGetError, ManagerIterationError
+from cmdb.errors.manager import ManagerUpdateError, ManagerDeleteError, ManagerGetError
 # -------------------------------------------------------------------------------------------------------------------- #
 
 LOGGER = logging.getLogger(__name__)
@@ -41,7 +40,6 @@ def __init__(self, dbm: MongoDatabaseManager, database: str = None):
         if database:
             dbm.connector.set_database(database)
 
-        self.query_builder = BaseQueryBuilder()
 
         super().__init__(UserModel.COLLECTION, dbm)
 
@@ -131,20 +129,8 @@ def iterate(self, builder_params: BuilderParameters) -> IterationResult[UserMode
         Returns:
             IterationResult: Instance of IterationResult with generic UserModel.
         """
-        try:
-            query: list[dict] = self.query_builder.build(builder_params)
-            count_query: list[dict] = self.query_builder.count(builder_params.get_criteria())
-
-            aggregation_result = list(self.aggregate(query))
-            total_cursor = self.aggregate(count_query)
-
-            total = 0
-            while total_cursor.alive:
-                total = next(total_cursor)['total']
-        except ManagerGetError as err:
-            raise ManagerIterationError(err) from err
+        iteration_result: IterationResult[UserModel] = self.iterate_query(builder_params)
 
-        iteration_result: IterationResult[UserModel] = IterationResult(aggregation_result, total)
         iteration_result.convert_to(UserModel)
 
         return iteration_result
@@ -14,11 +14,13 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 """TODO: document"""
+import re
 import logging
 
 from cmdb.manager.objects_manager import ObjectsManager
 
 from cmdb.cmdb_objects.cmdb_object import CmdbObject
+from cmdb.cmdb_objects.cmdb_search_entry import CmdbSearchEntry
 from cmdb.framework.models.type import TypeModel
 from cmdb.framework.cmdb_render import RenderResult, RenderList
 from cmdb.search import Search
@@ -29,6 +31,7 @@
 from cmdb.user_management.models.user import UserModel
 from cmdb.security.acl.permission import AccessControlPermission
 from cmdb.security.acl.builder import AccessControlQueryBuilder
+from cmdb.security.acl.resolver import AccessControlResolver
 from cmdb.framework.utils import PublicID
 # -------------------------------------------------------------------------------------------------------------------- #
 
@@ -50,101 +53,37 @@ def __init__(self, pipeline: Pipeline = None):
 
 
     def build(self, search_term, user: UserModel = None, permission: AccessControlPermission = None,
-              active_flag: bool = False, *args, **kwargs) -> Pipeline:
-        """Build a pipeline query out of search search term"""
-
-        regex = self.regex_('fields.value', f'{search_term}', 'ims')
-        pipe_and = self.and_([regex, {'active': {"$eq": True}} if active_flag else {}])
-        pipe_match = self.match_(pipe_and)
+              active_flag: bool = False, objects_manager: ObjectsManager = None, *args, **kwargs) -> Pipeline:
+        """
+        Build a count pipeline for the search entries out of the search term
 
-        # load reference fields in runtime.
-        self.pipeline = SearchReferencesPipelineBuilder().build()
+        Every word of the search term has to be the beginning of a word in the values
+        of the object or of the objects it references.
+        """
+        pipe_and = self.and_([CmdbSearchEntry.build_token_query(search_term),
+                              {'active': {"$eq": True}} if active_flag else {}])
+        self.add_pipe(self.match_(pipe_and))
 
         # permission builds
         if user and permission:
-            self.pipeline = [*self.pipeline, *(AccessControlQueryBuilder().build(group_id=PublicID(user.group_id),
-                                                                                 permission=permission))]
-        self.add_pipe(pipe_match)
-        self.add_pipe({'$group': {"_id": {'active': '$active'}, 'count': {'$sum': 1}}})
-        self.add_pipe({'$group': {'_id': 0,
-                                  'levels': {'$push': {'_id': '$_id.active', 'count': '$count'}},
-                                  'total': {'$sum': '$count'}}
-                      })
-        self.add_pipe({'$unwind': '$levels'})
-        self.add_pipe({'$sort': {"levels._id": -1}})
-        self.add_pipe(
-            {'$group': {'_id': 0, 'levels': {'$push': {'count': "$levels.count"}}, "total": {'$avg': '$total'}}})
-        self.add_pipe({
-            '$project': {
-                'total': "$total",
-                'active': {'$arrayElemAt': ["$levels", 0]},
-                'inactive': {'$arrayElemAt': ["$levels", 1]}
-            }})
-        self.add_pipe({
-            '$project': {
-                '_id': 0,
-                'active': {'$cond': [{'$ifNull': ["$active", False]}, '$active.count', 0]},
-                'inactive': {'$cond': [{'$ifNull': ['$inactive', False]}, '$inactive.count', 0]},
-                'total': '$total'
-            }})
+            if objects_manager:
+                acl_match = AccessControlResolver(objects_manager.dbm).build_match(user.group_id, permission)
+                self.pipeline = [acl_match, *self.pipeline]
+            else:
+                self.pipeline = [*self.pipeline, *(AccessControlQueryBuilder().build(group_id=PublicID(user.group_id),
+                                                                                     permission=permission))]
+        self.add_pipe({'$group': {"_id": '$active', 'count': {'$sum': 1}}})
+        self.add_pipe({'$group': {
+            '_id': 0,
+            'active': {'$sum': {'$cond': ['$_id', '$count', 0]}},
+            'inactive': {'$sum': {'$cond': ['$_id', 0, '$count']}},
+            'total': {'$sum': '$count'}
+        }})
+        self.add_pipe(self.project_({'_id': 0, 'active': 1, 'inactive': 1, 'total': 1}))
 
         return self.pipeline
 
 
-class SearchReferencesPipelineBuilder(PipelineBuilder):
-    """TODO: document"""
-
-    def __init__(self, pipeline: Pipeline = None):
-        """
-        Init constructor load reference fields in runtime.
-        The search should interpret reference section like normal field contents.
-        This means that fields should already be loaded into the object during runtime.
-        Args:
-            pipeline: preset a for defined pipeline
-        """
-        super().__init__(pipeline=pipeline)
-
-
-    def build(self, *args, **kwargs) -> Pipeline:
-        # Load reference fields in runtime
-        self.add_pipe(self.lookup_('framework.objects', 'fields.value', 'public_id', 'data'))
-        self.add_pipe(
-            self.project_({
-                '_id': 1, 'public_id': 1, 'type_id': 1, 'active': 1, 'author_id': 1, 'creation_time': 1, 'version': 1,
-                'last_edit_time': 1, 'fields': 1, 'relatesTo': '$data.public_id',
-                'simple': {
-                    '$reduce': {
-                        'input': "$data.fields",
-                        'initialValue': [],
-                        'in': {'$setUnion': ["$$value", "$$this"]}
-                    }
-                }
-            })
-        )
-        self.add_pipe(
-            self.group_('$_id', {
-                'public_id': {'$first': '$public_id'},
-                'type_id': {'$first': '$type_id'},
-                'active': {'$first': '$active'},
-                'author_id': {'$first': '$author_id'},
-                'creation_time': {'$first': '$creation_time'},
-                'last_edit_time': {'$first': '$last_edit_time'},
-                'version': {'$first': 'version'},
-                'fields': {'$first': '$fields'},
-                'simple': {'$first': '$simple'},
-                'relatesTo': {'$first': '$relatesTo'}
-            })
-        )
-        self.add_pipe(
-            self.project_({
-                '_id': 1, 'public_id': 1, 'type_id': 1, 'active': 1, 'author_id': 1, 'creation_time': 1, 'version': 1,
-                'last_edit_time': 1, 'fields': {'$concatArrays': ['$fields', '$simple']}, 'relatesTo': 1,
-            })
-        )
-        self.add_pipe(self.sort_('public_id', 1))
-        return self.pipeline
-
-
 class SearchPipelineBuilder(PipelineBuilder):
     """TODO: document"""
 
@@ -154,6 +93,7 @@ def __init__(self, pipeline: Pipeline = None):
             pipeline: preset a for defined pipeline
         """
         super().__init__(pipeline=pipeline)
+        self.matches_regex: list[str] = []
 
 
     def get_regex_pipes_values(self) -> list[str]:
@@ -194,22 +134,31 @@ def build(self, params: list[SearchParam],
               objects_manager: ObjectsManager = None,
               user: UserModel = None, permission: AccessControlPermission = None,
               active_flag: bool = False, *args, **kwargs) -> Pipeline:
-        """Build a pipeline query out of frontend params"""
+        """
+        Build a pipeline query for the search entries out of frontend params
+
+        Text params match the beginning of words, regex params match the values of the entries.
+        The regexes of the matches are stored in `matches_regex`.
+        """
         # clear pipeline
         self.clear()
-
-        # load reference fields in runtime.
-        self.pipeline = SearchReferencesPipelineBuilder().build()
+        self.matches_regex = []
 
         # fetch only active objects
         if active_flag:
             self.add_pipe(self.match_({'active': {"$eq": True}}))
 
         # text builds
-        text_params = [_ for _ in params if _.search_form in ('text','regex')]
+        text_params = [_ for _ in params if _.search_form == 'text']
         for param in text_params:
-            regex = self.regex_('fields.value', param.search_text, 'ims')
-            self.add_pipe(self.match_(regex))
+            self.add_pipe(self.match_(CmdbSearchEntry.build_token_query(param.search_text)))
+            self.matches_regex.extend(rf'\b{re.escape(token)}'
+                                      for token in CmdbSearchEntry.tokenize([param.search_text]))
+
+        regex_params = [_ for _ in params if _.search_form == 'regex']
+        for param in regex_params:
+            self.add_pipe(self.match_(self.regex_('values', param.search_text, 'ims')))
+            self.matches_regex.append(param.search_text)
 
         # type builds
         disjunction_query = []
@@ -241,8 +190,14 @@ def build(self, params: list[SearchParam],
 
         # permission builds
         if user and permission:
-            self.pipeline = [*self.pipeline, *(AccessControlQueryBuilder().build(group_id=PublicID(user.group_id),
-                                                                                 permission=permission))]
+            if objects_manager:
+                acl_match = AccessControlResolver(objects_manager.dbm).build_match(user.group_id, permission)
+                self.pipeline = [acl_match, *self.pipeline]
+            else:
+                self.pipeline = [*self.pipeline, *(AccessControlQueryBuilder().build(group_id=PublicID(user.group_id),
+                                                                                     permission=permission))]
+        self.add_pipe(self.sort_('public_id', 1))
+
         return self.pipeline
 
 
@@ -265,7 +220,7 @@ def aggregate(self, pipeline: Pipeline, request_user: UserModel = None, permissi
             permission (AccessControlPermission) : Permission enum for possible ACL operations..
             limit (int): max number of documents to return
             skip (int): number of documents to be skipped
-            **kwargs:
+            **kwargs: matches_regex (list[str]) of the pipeline builder, extracted from the pipeline if not set
         Returns:
             SearchResult with generic list of RenderResults
         """
@@ -277,9 +232,13 @@ def aggregate(self, pipeline: Pipeline, request_user: UserModel = None, permissi
         stages: dict = {}
 
         stages.update({'metadata': [SearchPipelineBuilder.count_('total')]})
+        # only the objects of the requested page are loaded
         stages.update({'data': [
             SearchPipelineBuilder.skip_(skip),
-            SearchPipelineBuilder.limit_(limit)
+            SearchPipelineBuilder.limit_(limit),
+            SearchPipelineBuilder.lookup_(CmdbObject.COLLECTION, 'public_id', 'public_id', 'object'),
+            SearchPipelineBuilder.unwind_('$object'),
+            {'$replaceRoot': {'newRoot': '$object'}}
         ]})
 
         group_stage: dict = {
@@ -301,14 +260,18 @@ def aggregate(self, pipeline: Pipeline, request_user: UserModel = None, permissi
         }
         stages.update(group_stage)
         plb.add_pipe(SearchPipelineBuilder.facet_(stages))
-        raw_search_result = self.objects_manager.aggregate_objects(pipeline=plb.pipeline)
+        raw_search_result = self.objects_manager.aggregate_from_other_collection(CmdbSearchEntry.COLLECTION,
+                                                                                 pipeline=plb.pipeline)
         raw_search_result_list = list(raw_search_result)
 
-        try:
-            matches_regex = plb.get_regex_pipes_values()
-        except Exception as err:
-            LOGGER.error('Extract regex pipes: %s',err)
-            matches_regex = []
+        matches_regex = kwargs.get('matches_regex')
+
+        if matches_regex is None:
+            try:
+                matches_regex = plb.get_regex_pipes_values()
+            except Exception as err:
+                LOGGER.error('Extract regex pipes: %s',err)
+                matches_regex = []
 
         if len(raw_search_result_list[0]['data']) > 0:
             raw_search_result_list_entry = raw_search_result_list[0]
@@ -317,7 +280,8 @@ def aggregate(self, pipeline: Pipeline, request_user: UserModel = None, permissi
 
             rendered_result_list = RenderList(pre_rendered_result_list,
                                               request_user,
-                                              objects_manager=self.objects_manager).render_result_list()
+                                              objects_manager=self.objects_manager,
+                                              batch=True).render_result_list()
 
             total_results = raw_search_result_list_entry['metadata'][0].get('total', 0)
             group_result_list = raw_search_result_list[0]['group']
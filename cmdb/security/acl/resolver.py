@@ -0,0 +1,94 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2024 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Resolves the access control lists of the types to the type ids a group may access
+
+ACLs are stored on the types, so the check whether a group may access an object only depends on its type_id.
+The allowed type ids are calculated from the cached types and matched before any other stage of a pipeline.
+"""
+import logging
+
+from cmdb.database.database_manager import DatabaseManager
+from cmdb.framework.utils import PublicID
+from cmdb.manager.type_cache import TYPE_CACHE
+from cmdb.security.acl.permission import AccessControlPermission
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                             AccessControlResolver - CLASS                                            #
+# -------------------------------------------------------------------------------------------------------------------- #
+class AccessControlResolver:
+    """Calculates the type ids a group may access for a permission"""
+
+    def __init__(self, dbm: DatabaseManager):
+        self.dbm = dbm
+
+
+    def get_allowed_type_ids(self, group_id: PublicID, permission: AccessControlPermission) -> list[int]:
+        """
+        Retrieves the public_ids of all types whose objects the group may access
+
+        Args:
+            group_id (PublicID): public_id of the group
+            permission (AccessControlPermission): Permission which is requested
+
+        Returns:
+            list[int]: public_ids of the accessible types
+        """
+        return TYPE_CACHE.select_type_ids(self.dbm,
+                                          lambda type_data: self.has_type_access(type_data, group_id, permission))
+
+
+    def build_match(self, group_id: PublicID, permission: AccessControlPermission) -> dict:
+        """
+        Builds the `$match` stage which restricts objects to the accessible types
+
+        Args:
+            group_id (PublicID): public_id of the group
+            permission (AccessControlPermission): Permission which is requested
+
+        Returns:
+            dict: The match stage on `type_id`
+        """
+        return {'$match': {'type_id': {'$in': self.get_allowed_type_ids(group_id, permission)}}}
+
+
+    @staticmethod
+    def has_type_access(type_data: dict, group_id: PublicID, permission: AccessControlPermission) -> bool:
+        """
+        Checks the ACL of a type document, equal to the ACL match of the `AccessControlQueryBuilder`
+
+        Args:
+            type_data (dict): Document of the type
+            group_id (PublicID): public_id of the group
+            permission (AccessControlPermission): Permission which is requested
+
+        Returns:
+            bool: True if the group may access objects of the type
+        """
+        acl = type_data.get('acl')
+
+        if acl is None or acl.get('activated') is False:
+            return True
+
+        group_permissions = acl.get('groups', {}).get('includes', {}).get(str(group_id))
+
+        if isinstance(group_permissions, list):
+            return permission.value in group_permissions
+
+        return group_permissions == permission.value
@@ -19,6 +19,7 @@
 from Crypto import Random
 from Crypto.PublicKey import RSA
 from cmdb.database.database_manager_mongo import DatabaseManagerMongo
+from cmdb.security.key.holder import KeyHolder
 from cmdb.utils.system_writer import SystemSettingsWriter
 # -------------------------------------------------------------------------------------------------------------------- #
 
@@ -44,6 +45,7 @@ def generate_rsa_keypair(self):
         LOGGER.debug("POC => generate asymmetric_key")
 
         self.ssw.write('security', {'asymmetric_key': asymmetric_key})
+        KeyHolder.clear_cache()
 
 
     def generate_symmetric_aes_key(self):
@@ -15,6 +15,7 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 """TODO: document"""
 import logging
+import threading
 from flask import current_app
 
 from cmdb.database.database_manager_mongo import DatabaseManagerMongo
@@ -28,16 +29,22 @@
 #                                                   KeyHolder - CLASS                                                  #
 # -------------------------------------------------------------------------------------------------------------------- #
 class KeyHolder:
-    """TODO: document"""
+    """
+    Provides the asymmetric key pair used to sign and verify tokens
+
+    The key pair of a database is read once from the settings and then kept in-process,
+    it only changes when a new pair is generated (see `KeyHolder.clear_cache`)
+    """
+
+    __KEY_CACHE: dict[str, dict] = {}
+    __KEY_CACHE_LOCK = threading.Lock()
 
     def __init__(self, database_manager: DatabaseManagerMongo):
         """
         Args:
-            key_directory: key based directory
+            database_manager: Database connection holding the `settings.conf` collection
         """
-        self.ssr = SystemSettingsReader(database_manager)
-        self.rsa_public = self.get_public_key()
-        self.rsa_private = self.get_private_key()
+        self.database_manager = database_manager
 
 
     def get_public_key(self):
@@ -45,7 +52,7 @@ def get_public_key(self):
         if current_app.cloud_mode:
             return current_app.asymmetric_key['public']
 
-        return self.ssr.get_value('asymmetric_key', 'security')['public']
+        return self.__get_asymmetric_key()['public']
 
 
     def get_private_key(self):
@@ -53,4 +60,25 @@ def get_private_key(self):
         if current_app.cloud_mode:
             return current_app.asymmetric_key['private']
 
-        return self.ssr.get_value('asymmetric_key', 'security')['private']
+        return self.__get_asymmetric_key()['private']
+
+
+    @classmethod
+    def clear_cache(cls):
+        """Removes all cached key pairs, they are read again from the settings on the next access"""
+        with cls.__KEY_CACHE_LOCK:
+            cls.__KEY_CACHE.clear()
+
+
+    def __get_asymmetric_key(self) -> dict:
+        """Returns the key pair of the current database, the settings are only read on the first access"""
+        database_name = self.database_manager.connector.database.name
+        asymmetric_key = KeyHolder.__KEY_CACHE.get(database_name)
+
+        if asymmetric_key is None:
+            asymmetric_key = SystemSettingsReader(self.database_manager).get_value('asymmetric_key', 'security')
+
+            with KeyHolder.__KEY_CACHE_LOCK:
+                KeyHolder.__KEY_CACHE[database_name] = asymmetric_key
+
+        return asymmetric_key
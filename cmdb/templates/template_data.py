@@ -18,9 +18,8 @@
 
 from cmdb.manager.objects_manager import ObjectsManager
 
-from cmdb.framework.cmdb_render import CmdbRender
-
-from cmdb.errors.manager.object_manager import ObjectManagerGetError
+from cmdb.cmdb_objects.cmdb_object import CmdbObject
+from cmdb.framework.cmdb_render import RenderList, RenderResult
 # -------------------------------------------------------------------------------------------------------------------- #
 
 LOGGER = logging.getLogger(__name__)
@@ -45,13 +44,115 @@ def get_template_data(self):
 class ObjectTemplateData(AbstractTemplateData):
     """TODO: document"""
 
-    def __init__(self, cmdb_object, objects_manager: ObjectsManager):
+    def __init__(self, cmdb_object, objects_manager: ObjectsManager, builder: "ObjectTemplateDataBuilder" = None):
+        """
+        Args:
+            cmdb_object (RenderResult): Rendered object
+            objects_manager (ObjectsManager): Manager used to load the referenced objects
+            builder (ObjectTemplateDataBuilder, optional): Builder whose already expanded references are reused
+        """
         super().__init__()
         self.objects_manager = objects_manager
-        self._template_data = self.__get_objectdata(cmdb_object, 3)
+        builder = builder or ObjectTemplateDataBuilder(objects_manager)
+        self._template_data = builder.build([cmdb_object])[0]
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                          ObjectTemplateDataBuilder - CLASS                                           #
+# -------------------------------------------------------------------------------------------------------------------- #
+class ObjectTemplateDataBuilder:
+    """
+    Builds the template data of many objects
+
+    The references are expanded level by level for all objects together, every level is loaded with one `$in`
+    query and rendered as batch. Referenced objects are kept for the lifetime of the builder, so objects
+    referenced by many others (e.g. a common location) are loaded and rendered once.
+    """
+
+    REFERENCE_FIELD_TYPES = ('ref', 'location')
+
+    def __init__(self, objects_manager: ObjectsManager, depth: int = 3):
+        """
+        Args:
+            objects_manager (ObjectsManager): Manager used to load the referenced objects
+            depth (int): Number of reference levels which are expanded
+        """
+        self.objects_manager = objects_manager
+        self.depth = depth
+        self.__references: dict[int, RenderResult] = {}
+        self.__missing_ids: set[int] = set()
+        self.__object_data: dict[tuple[int, int], dict] = {}
+
+
+    def build(self, cmdb_objects: list[RenderResult]) -> list[dict]:
+        """
+        Builds the template data of rendered objects
+
+        Args:
+            cmdb_objects (list[RenderResult]): Rendered objects
+
+        Returns:
+            list[dict]: Template data in the order of the objects
+        """
+        self.__expand_references(cmdb_objects)
+
+        return [self.__get_objectdata(cmdb_object, self.depth) for cmdb_object in cmdb_objects]
+
+
+    def __expand_references(self, cmdb_objects: list[RenderResult]):
+        """Loads the referenced objects of all levels, each level with one query"""
+        level = list(cmdb_objects)
+
+        for _ in range(self.depth):
+            ref_ids = set()
+
+            for cmdb_object in level:
+                ref_ids.update(self.__get_reference_ids(cmdb_object))
 
+            unknown_ids = [ref_id for ref_id in ref_ids
+                           if ref_id not in self.__references and ref_id not in self.__missing_ids]
 
-    def __get_objectdata(self, cmdb_object, iteration):
+            if unknown_ids:
+                self.__load_references(unknown_ids)
+
+            level = [self.__references[ref_id] for ref_id in ref_ids if ref_id in self.__references]
+
+            if not level:
+                break
+
+
+    def __load_references(self, public_ids: list[int]):
+        """Loads and renders referenced objects, ids without object are remembered as missing"""
+        objects = [CmdbObject(**object_data)
+                   for object_data in self.objects_manager.get(filter={'public_id': {'$in': public_ids}})]
+
+        try:
+            rendered = RenderList(objects, None, objects_manager=self.objects_manager, batch=True).render_result_list()
+        except Exception as err:
+            # an object which can not be rendered (e.g. without type) must not hide the others
+            LOGGER.error(err)
+            rendered = []
+
+            for cmdb_object in objects:
+                try:
+                    rendered.extend(RenderList([cmdb_object], None,
+                                               objects_manager=self.objects_manager).render_result_list())
+                except Exception as object_err:
+                    LOGGER.error(object_err)
+
+        for render_result in rendered:
+            self.__references[render_result.object_information['object_id']] = render_result
+
+        self.__missing_ids.update(public_id for public_id in public_ids if public_id not in self.__references)
+
+
+    def __get_reference_ids(self, cmdb_object: RenderResult) -> list[int]:
+        """Returns the public_ids referenced by the reference fields of an object"""
+        return [field['value'] for field in cmdb_object.fields
+                if field.get('type') in self.REFERENCE_FIELD_TYPES
+                    and isinstance(field.get('value'), int) and not isinstance(field.get('value'), bool)]
+
+
+    def __get_objectdata(self, cmdb_object: RenderResult, iteration: int) -> dict:
         data = {}
         data["id"] = cmdb_object.object_information['object_id']
         data["fields"] = {}
@@ -60,17 +161,18 @@ def __get_objectdata(self, cmdb_object, iteration):
             try:
                 field_name = field["name"]
 
-                if (field["type"] == "ref" or field["type"] == "location") and field["value"] and iteration > 0:
-                    # resolve type
-                    current_object = self.objects_manager.get_object(field["value"])
-                    type_instance = self.objects_manager.get_object_type(current_object.get_type_id())
+                if field["type"] in self.REFERENCE_FIELD_TYPES and field["value"] and iteration > 0:
+                    # references which could not be loaded are left out
+                    if field["value"] not in self.__references:
+                        continue
+
+                    data_key = (field["value"], iteration - 1)
 
-                    cmdb_render_object = CmdbRender(object_instance=current_object,
-                                                    type_instance=type_instance,
-                                                    render_user=None,
-                                                    objects_manager=self.objects_manager)
+                    if data_key not in self.__object_data:
+                        self.__object_data[data_key] = self.__get_objectdata(self.__references[field["value"]],
+                                                                             iteration - 1)
 
-                    data["fields"][field_name] = self.__get_objectdata(cmdb_render_object.result(), iteration - 1)
+                    data["fields"][field_name] = self.__object_data[data_key]
                 elif field['type'] == 'ref-section-field':
                     data['fields'][field_name] = {'fields': {}}
 
@@ -78,8 +180,6 @@ def __get_objectdata(self, cmdb_object, iteration):
                         data['fields'][field_name]['fields'][section_ref_field['name']] = section_ref_field['value']
                 else:
                     data["fields"][field_name] = field["value"]
-            except ObjectManagerGetError:
-                continue
             except Exception as err:
                 LOGGER.error(err)
 
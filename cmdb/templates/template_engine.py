@@ -13,22 +13,117 @@
 #
 # You should have received a copy of the GNU Affero General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
-"""TODO: document"""
+"""
+Rendering of the jinja templates of exportd variables and DocAPI documents
+
+The compiled templates are cached per process in a bounded LRU keyed by the template source,
+so a template is compiled once and not for every rendered object.
+"""
 import logging
+import threading
+from collections import OrderedDict
 import jinja2
+from jinja2.sandbox import SandboxedEnvironment
 # -------------------------------------------------------------------------------------------------------------------- #
 
 LOGGER = logging.getLogger(__name__)
 
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                                 TemplateCache - CLASS                                                #
+# -------------------------------------------------------------------------------------------------------------------- #
+class TemplateCache:
+    """Thread safe LRU of the templates compiled by one jinja environment"""
+
+    MAX_SIZE: int = 512
+
+    def __init__(self, environment: jinja2.Environment, max_size: int = MAX_SIZE):
+        """
+        Args:
+            environment (jinja2.Environment): Environment which compiles the templates
+            max_size (int): Number of kept templates, the least recently used one is dropped first
+        """
+        self.environment = environment
+        self.max_size = max_size
+        self.__templates: OrderedDict[str, jinja2.Template] = OrderedDict()
+        self.__lock = threading.Lock()
+
+
+    def get_template(self, template_string: str) -> jinja2.Template:
+        """
+        Retrieves the compiled template of a template source
+
+        Args:
+            template_string (str): Source of the template
+
+        Raises:
+            jinja2.TemplateSyntaxError: If the source is no valid template
+
+        Returns:
+            jinja2.Template: The compiled template
+        """
+        with self.__lock:
+            template = self.__templates.get(template_string)
+
+            if template is not None:
+                self.__templates.move_to_end(template_string)
+                return template
+
+        # compiled outside of the lock, a template compiled twice in parallel is stored once
+        template = self.environment.from_string(template_string)
+
+        with self.__lock:
+            self.__templates[template_string] = template
+            self.__templates.move_to_end(template_string)
+
+            while len(self.__templates) > self.max_size:
+                self.__templates.popitem(last=False)
+
+        return template
+
+
+    def clear(self):
+        """Removes all compiled templates"""
+        with self.__lock:
+            self.__templates.clear()
+
+
+    def __len__(self) -> int:
+        return len(self.__templates)
+
+
+TEMPLATE_CACHE = TemplateCache(jinja2.Environment(undefined=jinja2.ChainableUndefined))
+SANDBOXED_TEMPLATE_CACHE = TemplateCache(SandboxedEnvironment(undefined=jinja2.ChainableUndefined))
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                                TemplateEngine - CLASS                                                #
+# -------------------------------------------------------------------------------------------------------------------- #
 class TemplateEngine:
-    """TODO: document"""
+    """Renders template strings with the compiled templates of the process wide cache"""
 
-    def __init__(self):
-        pass
+    def __init__(self, sandboxed: bool = False):
+        """
+        Args:
+            sandboxed (bool): Render in a jinja sandbox, which denies access to unsafe attributes and methods
+        """
+        self.template_cache = SANDBOXED_TEMPLATE_CACHE if sandboxed else TEMPLATE_CACHE
 
 
     def render_template_string(self, template_string, template_data):
         """TODO: document"""
-        environment = jinja2.Environment(undefined=jinja2.ChainableUndefined)
-        template = environment.from_string(template_string)
-        return template.render(template_data)
+        return self.template_cache.get_template(template_string).render(template_data)
+
+
+    def render_many(self, template_string: str, template_data_list: list[dict]) -> list[str]:
+        """
+        Renders one template with the data of several objects
+
+        Args:
+            template_string (str): Source of the template
+            template_data_list (list[dict]): Data of every rendering
+
+        Returns:
+            list[str]: The rendered strings in the order of the data
+        """
+        template = self.template_cache.get_template(template_string)
+
+        return [template.render(template_data) for template_data in template_data_list]
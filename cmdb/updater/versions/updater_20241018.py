@@ -0,0 +1,42 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2024 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""Sets the ancestors of all existing locations"""
+import logging
+
+from cmdb.updater.updater import Updater
+from cmdb.manager.locations_manager import LocationsManager
+# -------------------------------------------------------------------------------------------------------------------- #
+LOGGER = logging.getLogger(__name__)
+
+class Update20241018(Updater):
+    """Adds the ancestors to the locations, which are used for the subtree queries of the location tree"""
+
+    def creation_date(self):
+        return '20241018'
+
+
+    def description(self):
+        return """
+                Add the property 'ancestors' to all locations
+               """
+
+
+    def start_update(self):
+        """Sets the ancestors of every location from the parents"""
+        updated_locations = LocationsManager(self.database_manager).rebuild_ancestors()
+        LOGGER.info("Updated 'ancestors' of %s locations", updated_locations)
+
+        super().increase_updater_version(20241018)
@@ -22,6 +22,7 @@
 from cmdb.security.security import SecurityManager
 from cmdb.manager.group_manager import GroupManager
 from cmdb.manager.users_manager import UsersManager
+from cmdb.manager.type_cache import TYPE_CACHE
 
 from cmdb.security.key.generator import KeyGenerator
 from cmdb.user_management import __FIXED_GROUPS__
@@ -92,3 +93,11 @@ def preset_database(database_manager, database_name):
     )
 
     users_manager.insert_user(admin_user)
+
+
+@pytest.fixture(autouse=True)
+def reset_type_cache():
+    """Types are written and dropped directly in the database by the fixtures, so every test starts without cache"""
+    TYPE_CACHE.clear()
+    yield
+    TYPE_CACHE.clear()
@@ -0,0 +1,81 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2024 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""Tests of the reconciliation of the declared indexes"""
+from pymongo import IndexModel
+from pytest import fixture
+
+from cmdb.cmdb_objects.cmdb_dao import CmdbDAO
+from cmdb.database.database_manager_mongo import DatabaseManagerMongo
+from cmdb.database.index_manager import IndexManager
+# -------------------------------------------------------------------------------------------------------------------- #
+
+TEST_COLLECTION = 'test.indexed_documents'
+
+
+class IndexedTestModel(CmdbDAO):
+    """Model with a compound and a multikey index"""
+    COLLECTION = TEST_COLLECTION
+    INDEX_KEYS = [
+        {'keys': [('type_id', CmdbDAO.DAO_ASCENDING), ('public_id', CmdbDAO.DAO_ASCENDING)],
+         'name': 'type_id_public_id', 'unique': False},
+        {'keys': [('fields.name', CmdbDAO.DAO_ASCENDING), ('fields.value', CmdbDAO.DAO_ASCENDING)],
+         'name': 'fields_name_value', 'unique': False}
+    ]
+
+
+@fixture(autouse=True)
+def clean_collection(database_manager: DatabaseManagerMongo):
+    """Creates an empty test collection before every test and removes it afterwards"""
+    database_manager.get_collection(TEST_COLLECTION).drop()
+    database_manager.create_collection(TEST_COLLECTION)
+    yield
+    database_manager.get_collection(TEST_COLLECTION).drop()
+
+
+def test_reconcile_builds_missing_indexes(database_manager):
+    """All declared indexes are built once, a second run has nothing to do"""
+    index_manager = IndexManager(database_manager, [IndexedTestModel])
+
+    created_indexes = index_manager.reconcile()
+
+    assert sorted(created_indexes[TEST_COLLECTION]) == ['fields_name_value', 'public_id', 'type_id_public_id']
+    assert index_manager.reconcile() == {}
+
+
+def test_existing_index_with_other_name_is_kept(database_manager):
+    """Indexes are compared by their keys, an existing index with another name is not built again"""
+    database_manager.create_indexes(TEST_COLLECTION, [IndexModel([('public_id', 1)], name='legacy_public_id')])
+    index_manager = IndexManager(database_manager, [IndexedTestModel])
+
+    created_indexes = index_manager.reconcile()
+
+    assert 'public_id' not in created_indexes[TEST_COLLECTION]
+
+
+def test_report_lists_missing_and_existing_indexes(database_manager):
+    """The report shows missing indexes before and existing indexes with their usage after the reconciliation"""
+    index_manager = IndexManager(database_manager, [IndexedTestModel])
+
+    report = index_manager.get_report()[0]
+    assert {index['name'] for index in report['missing']} == {'fields_name_value', 'public_id', 'type_id_public_id'}
+
+    index_manager.reconcile()
+    database_manager.get_collection(TEST_COLLECTION).find_one({'type_id': 1, 'public_id': 1})
+
+    report = index_manager.get_report()[0]
+    assert report['missing'] == []
+    assert all(index['declared'] for index in report['indexes'])
+    assert 'type_id_public_id' in IndexManager.format_report([report])
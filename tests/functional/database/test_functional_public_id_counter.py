@@ -0,0 +1,125 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2024 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""Tests of the atomic public_id counter with parallel inserters"""
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from pytest import fixture
+
+from cmdb.database.counter import PublicIDCounter, PublicIDBlock
+from cmdb.database.database_manager_mongo import DatabaseManagerMongo
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+TEST_COLLECTION = 'test.counter_documents'
+INSERTERS = 8
+INSERTS_PER_INSERTER = 250
+
+
+@fixture(autouse=True)
+def clean_counter(database_manager: DatabaseManagerMongo):
+    """Removes the test collection and its counter before and after every test"""
+    def drop_collection():
+        database_manager.get_collection(TEST_COLLECTION).drop()
+        database_manager.get_collection(PublicIDCounter.COLLECTION).delete_one({'_id': TEST_COLLECTION})
+
+    drop_collection()
+    yield
+    drop_collection()
+
+
+def _run_parallel(mongodb_parameters, task) -> list[int]:
+    """Runs the task in parallel inserters, every inserter uses an own connection like a separate worker"""
+    host, port, database = mongodb_parameters
+
+    def _inserter(_):
+        return task(DatabaseManagerMongo(host, port, database))
+
+    with ThreadPoolExecutor(max_workers=INSERTERS) as executor:
+        results = list(executor.map(_inserter, range(INSERTERS)))
+
+    return [public_id for result in results for public_id in result]
+
+
+def test_parallel_inserts_get_unique_public_ids(mongodb_parameters, database_manager):
+    """Every document inserted by parallel inserters gets an own public_id"""
+    def _insert(dbm: DatabaseManagerMongo) -> list[int]:
+        return [dbm.insert(TEST_COLLECTION, {'value': i}) for i in range(INSERTS_PER_INSERTER)]
+
+    public_ids = _run_parallel(mongodb_parameters, _insert)
+    stored_ids = database_manager.get_collection(TEST_COLLECTION).distinct('public_id')
+    counter = database_manager.get_collection(PublicIDCounter.COLLECTION).find_one({'_id': TEST_COLLECTION})
+
+    assert len(public_ids) == INSERTERS * INSERTS_PER_INSERTER
+    assert len(set(public_ids)) == len(public_ids)
+    assert sorted(stored_ids) == list(range(1, len(public_ids) + 1))
+    assert counter['counter'] == len(public_ids)
+
+
+def test_parallel_block_reservations_do_not_overlap(mongodb_parameters, database_manager):
+    """Blocks reserved by parallel inserters never share a public_id"""
+    def _reserve(dbm: DatabaseManagerMongo) -> list[int]:
+        public_ids = PublicIDBlock(dbm, TEST_COLLECTION, block_size=40)
+        return [public_ids.next_id() for _ in range(INSERTS_PER_INSERTER)]
+
+    public_ids = _run_parallel(mongodb_parameters, _reserve)
+    counter = database_manager.get_collection(PublicIDCounter.COLLECTION).find_one({'_id': TEST_COLLECTION})
+
+    assert len(set(public_ids)) == INSERTERS * INSERTS_PER_INSERTER
+    assert max(public_ids) <= counter['counter']
+
+
+def test_counter_starts_after_existing_documents(database_manager):
+    """A missing counter is created from the highest existing public_id"""
+    database_manager.get_collection(TEST_COLLECTION).insert_many([{'public_id': 5}, {'public_id': 17}])
+
+    assert database_manager.get_next_public_id(TEST_COLLECTION) == 18
+    assert list(database_manager.reserve_public_ids(TEST_COLLECTION, 3)) == [19, 20, 21]
+
+
+def test_released_block_returns_unused_public_ids(database_manager):
+    """Unused public_ids of a block are given back if nobody reserved ids in the meantime"""
+    with PublicIDBlock(database_manager, TEST_COLLECTION, block_size=10) as public_ids:
+        assert [public_ids.next_id(), public_ids.next_id()] == [1, 2]
+
+    assert database_manager.get_next_public_id(TEST_COLLECTION) == 3
+
+
+def test_block_reservation_throughput(mongodb_parameters):
+    """Reserving blocks hands out public_ids much faster than one counter update per id"""
+    def _single(dbm: DatabaseManagerMongo) -> list[int]:
+        return [dbm.get_next_public_id(TEST_COLLECTION) for _ in range(INSERTS_PER_INSERTER)]
+
+    def _block(dbm: DatabaseManagerMongo) -> list[int]:
+        public_ids = PublicIDBlock(dbm, TEST_COLLECTION, block_size=INSERTS_PER_INSERTER)
+        return [public_ids.next_id() for _ in range(INSERTS_PER_INSERTER)]
+
+    start = time.perf_counter()
+    single_ids = _run_parallel(mongodb_parameters, _single)
+    single_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    block_ids = _run_parallel(mongodb_parameters, _block)
+    block_duration = time.perf_counter() - start
+
+    LOGGER.info("public_ids per second - single: %.0f, block: %.0f",
+                len(single_ids) / single_duration,
+                len(block_ids) / block_duration)
+
+    assert len(set(single_ids + block_ids)) == len(single_ids) + len(block_ids)
+    assert block_duration < single_duration
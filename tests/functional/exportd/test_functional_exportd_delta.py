@@ -0,0 +1,131 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2024 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""Tests of the delta runs of exportd jobs after server side changes of objects and types"""
+import csv
+from datetime import datetime, timezone
+from pytest import fixture
+
+from cmdb.database.database_manager_mongo import DatabaseManagerMongo
+from cmdb.manager.objects_manager import ObjectsManager
+from cmdb.manager.exportd_log_manager import ExportdLogManager
+from cmdb.framework import TypeModel, CmdbObject, CmdbObjectRefs
+from cmdb.event_management.event import Event
+from cmdb.exportd.exporter_base import ExportdManagerBase
+from cmdb.exportd.exportd_job.exportd_job import ExportdJob, ExportdExportedObject
+# -------------------------------------------------------------------------------------------------------------------- #
+
+NOW = datetime.now(timezone.utc)
+
+LOCATION_TYPE = {'public_id': 961, 'name': 'delta-location', 'label': 'Location', 'author_id': 1,
+                 'creation_time': NOW, 'active': True, 'version': '1.0.0',
+                 'fields': [{'type': 'text', 'name': 'name', 'label': 'Name'}],
+                 'render_meta': {'icon': '', 'sections': [{'type': 'section', 'name': 'location', 'label': 'Location',
+                                                           'fields': ['name']}],
+                                 'externals': [], 'summary': {'fields': ['name']}},
+                 'acl': {'activated': False, 'groups': {'includes': {}}}}
+SERVER_TYPE = {'public_id': 962, 'name': 'delta-server', 'label': 'Server', 'author_id': 1,
+               'creation_time': NOW, 'active': True, 'version': '1.0.0',
+               'fields': [{'type': 'text', 'name': 'hostname', 'label': 'Hostname'},
+                          {'type': 'ref', 'name': 'location', 'label': 'Location', 'ref_types': [961]}],
+               'render_meta': {'icon': '', 'sections': [{'type': 'section', 'name': 'server', 'label': 'Server',
+                                                         'fields': ['hostname', 'location']}],
+                               'externals': [], 'summary': {'fields': ['hostname']}},
+               'acl': {'activated': False, 'groups': {'includes': {}}}}
+
+
+def make_object(public_id: int, type_id: int, fields: list[dict]) -> dict:
+    """Creates an object document"""
+    return {'public_id': public_id, 'type_id': type_id, 'active': True, 'author_id': 1, 'creation_time': NOW,
+            'version': '1.0.0', 'fields': fields, 'multi_data_sections': []}
+
+
+@fixture(autouse=True)
+def delta_objects(database_manager: DatabaseManagerMongo):
+    """Writes a location and two servers of it directly into the database and removes them afterwards"""
+    database_manager.get_collection(TypeModel.COLLECTION).insert_many([dict(LOCATION_TYPE), dict(SERVER_TYPE)])
+    database_manager.get_collection(CmdbObject.COLLECTION).insert_many([
+        make_object(961, 961, [{'name': 'name', 'value': 'Berlin'}]),
+        make_object(962, 962, [{'name': 'hostname', 'value': 'web-01'}, {'name': 'location', 'value': 961}]),
+        make_object(963, 962, [{'name': 'hostname', 'value': 'web-02'}, {'name': 'location', 'value': ''}]),
+    ])
+    ObjectsManager(database_manager).object_refs.index_objects([961, 962, 963])
+    yield
+    for collection in (TypeModel.COLLECTION, CmdbObject.COLLECTION, CmdbObjectRefs.COLLECTION):
+        database_manager.get_collection(collection).delete_many({'public_id': {'$gte': 961, '$lte': 963}})
+    for collection in (ExportdJob.WATERMARK_COLLECTION, ExportdExportedObject.COLLECTION):
+        database_manager.get_collection(collection).delete_many({'job_id': 961})
+
+
+def run_job(database_manager: DatabaseManagerMongo, filename: str, added_objects: list) -> dict[str, str]:
+    """
+    Runs a delta job of the servers into a csv file
+
+    Returns:
+        dict[str, str]: The hostname and location columns of the file by the object ID, `added_objects` receives
+                        the IDs of the transferred objects
+    """
+    job = ExportdJob(public_id=961, name='delta-servers', active=True, delta=True,
+                     sources=[{'type_id': 962, 'condition': []}],
+                     destination=[{'className': 'ExternalSystemCsv',
+                                   'parameter': [{'name': 'csv_filename', 'value': filename},
+                                                 {'name': 'csv_delimiter', 'value': ';'},
+                                                 {'name': 'csv_enclosure', 'value': '"'},
+                                                 {'name': 'csv_id_column', 'value': 'id'}]}],
+                     variables=[{'name': 'hostname', 'default': '{{fields.hostname}}', 'templates': []},
+                                {'name': 'location', 'default': '{{fields.location.fields.name}}', 'templates': []}],
+                     scheduling={'event': {'active': False, 'subset': False}})
+    objects_manager = ObjectsManager(database_manager)
+    event = Event('cmdb.exportd.run_manual', {'id': 961, 'user_id': 1, 'event': 'manual'})
+    exporter = ExportdManagerBase(job, ExportdLogManager(database_manager), event, objects_manager)
+
+    external_system = exporter.destinations[0].get_external_system()
+    add_object = external_system.add_object
+    external_system.add_object = lambda cmdb_object, template_data: (
+        added_objects.append(cmdb_object.object_information['object_id']), add_object(cmdb_object, template_data))
+
+    exporter.execute(1, 'admin', log_flag=False)
+
+    with open(filename, 'r', encoding='utf-8', newline='') as csv_file:
+        return {row['id']: (row['hostname'], row['location'])
+                for row in csv.DictReader(csv_file, delimiter=';', quotechar='"')}
+
+
+def test_delta_run_transfers_cleared_references(database_manager, tmp_path):
+    """Objects whose references were cleared by the deletion of the referenced object are transferred again"""
+    filename = str(tmp_path / 'servers.csv')
+    added_objects = []
+
+    assert run_job(database_manager, filename, added_objects) == {'962': ('web-01', 'Berlin'), '963': ('web-02', '')}
+
+    ObjectsManager(database_manager).delete_many_object_references([961])
+    added_objects.clear()
+
+    assert run_job(database_manager, filename, added_objects) == {'962': ('web-01', ''), '963': ('web-02', '')}
+    assert added_objects == [962]
+
+
+def test_delta_run_after_type_edit_transfers_all_objects(database_manager, tmp_path):
+    """An edit of a source type transfers all objects of the sources, not only the changed ones"""
+    filename = str(tmp_path / 'servers.csv')
+    added_objects = []
+    run_job(database_manager, filename, added_objects)
+
+    database_manager.get_collection(TypeModel.COLLECTION).update_one(
+        {'public_id': 962}, {'$set': {'label': 'Servers', 'last_edit_time': datetime.now(timezone.utc)}})
+    added_objects.clear()
+    run_job(database_manager, filename, added_objects)
+
+    assert sorted(added_objects) == [962, 963]
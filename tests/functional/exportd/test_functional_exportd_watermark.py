@@ -0,0 +1,51 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2024 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""Tests of the watermarks of delta exportd jobs"""
+from datetime import datetime, timezone
+from pytest import fixture
+
+from cmdb.database.database_manager_mongo import DatabaseManagerMongo
+from cmdb.manager.exportd_job_manager import ExportdJobManager
+from cmdb.exportd.exportd_job.exportd_job import ExportdJob, ExportdExportedObject
+# -------------------------------------------------------------------------------------------------------------------- #
+
+@fixture(autouse=True)
+def clean_watermarks(database_manager: DatabaseManagerMongo):
+    """Removes the watermarks of the test jobs afterwards"""
+    yield
+    for collection in (ExportdJob.WATERMARK_COLLECTION, ExportdExportedObject.COLLECTION):
+        database_manager.get_collection(collection).delete_many({'job_id': {'$in': [941, 942]}})
+
+
+def test_watermark_writes_only_changed_exported_objects(database_manager):
+    """The exported objects are kept per job and object, a run adds and removes only its changes"""
+    job_manager = ExportdJobManager(database_manager)
+    job_manager.EXPORTED_BATCH_SIZE = 2
+    run_date = datetime.now(timezone.utc)
+
+    job_manager.set_watermark(941, run_date, added_ids=[1, 2, 3, 4, 5], removed_ids=[])
+    job_manager.set_watermark(942, run_date, added_ids=[1], removed_ids=[])
+    job_manager.set_watermark(941, run_date, added_ids=[5, 6], removed_ids=[1, 3])
+
+    assert job_manager.get_exported_ids(941) == {2, 4, 5, 6}
+    assert job_manager.get_exported_ids(942) == {1}
+    assert 'exported_ids' not in job_manager.get_watermark(941)
+
+    job_manager.delete_watermark(941)
+
+    assert job_manager.get_watermark(941) is None
+    assert job_manager.get_exported_ids(941) == set()
+    assert job_manager.get_exported_ids(942) == {1}
@@ -0,0 +1,69 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2024 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""Tests of the location hierarchy"""
+from pytest import fixture, raises
+
+from cmdb.database.database_manager_mongo import DatabaseManagerMongo
+from cmdb.manager.locations_manager import LocationsManager
+from cmdb.cmdb_objects.cmdb_location import CmdbLocation
+from cmdb.framework.models.location_node import LocationNode
+
+from cmdb.errors.manager import ManagerUpdateError
+# -------------------------------------------------------------------------------------------------------------------- #
+
+@fixture
+def locations_manager(database_manager: DatabaseManagerMongo):
+    """Inserts the locations 900 -> 901 -> 902 -> 903 and 901 -> 904 and removes them afterwards"""
+    manager = LocationsManager(database_manager)
+    database_manager.get_collection(CmdbLocation.COLLECTION).insert_one(
+        {'public_id': 900, 'name': 'location-900', 'parent': 0, 'object_id': 900, 'type_id': 1,
+         'type_label': 'Location', 'type_icon': 'fas fa-cube', 'type_selectable': True, 'ancestors': []})
+
+    for public_id, parent in ((901, 900), (902, 901), (903, 902), (904, 901)):
+        manager.insert_location({'public_id': public_id, 'name': f'location-{public_id}', 'parent': parent,
+                                 'object_id': public_id, 'type_id': 1, 'type_label': 'Location',
+                                 'type_icon': 'fas fa-cube', 'type_selectable': True})
+    yield manager
+    database_manager.get_collection(CmdbLocation.COLLECTION).delete_many({'public_id': {'$gte': 900, '$lte': 904}})
+
+
+def test_subtree_and_ancestors(locations_manager: LocationsManager):
+    """Children of all levels and the parent chain are read from the ancestors"""
+    assert sorted(child['public_id'] for child in locations_manager.get_all_children(901)) == [902, 903, 904]
+    assert [ancestor.public_id for ancestor in locations_manager.get_ancestors(903)] == [900, 901, 902]
+
+
+def test_move_location_updates_children(locations_manager: LocationsManager):
+    """Moving a location rewrites the ancestors of its children, a move below itself is refused"""
+    locations_manager.update_location(902, {'parent': 904})
+
+    assert locations_manager.get_one(903)['ancestors'] == [900, 901, 904, 902]
+
+    with raises(ManagerUpdateError):
+        locations_manager.update_location(901, {'parent': 903})
+
+    with raises(ManagerUpdateError):
+        locations_manager.update_location(999, {'name': 'object-without-location'})
+
+
+def test_build_tree(locations_manager: LocationsManager):
+    """The tree is built from the flat location list"""
+    tree = LocationNode.build_tree(list(locations_manager.get(filter={'public_id': {'$gte': 901, '$lte': 904}})),
+                                   root_id=900)
+
+    assert [node.public_id for node in tree] == [901]
+    assert [child.public_id for child in tree[0].children] == [902, 904]
+    assert [child.public_id for child in tree[0].children[0].children] == [903]
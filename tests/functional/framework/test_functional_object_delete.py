@@ -0,0 +1,119 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2024 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""Tests of the deletion of multiple objects"""
+from pytest import fixture
+
+from cmdb.database.database_manager_mongo import DatabaseManagerMongo
+from cmdb.manager.objects_manager import ObjectsManager
+from cmdb.manager.object_links_manager import ObjectLinksManager
+from cmdb.utils.system_reader import SystemSettingsReader
+from cmdb.framework import TypeModel, CmdbObject, CmdbObjectRefs, ObjectLinkModel
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOCATION_TYPE = {'public_id': 921, 'name': 'delete-location', 'fields': [{'type': 'text', 'name': 'name'}],
+                 'render_meta': {'sections': [{'type': 'section', 'name': 'location', 'fields': ['name']}]}}
+SERVER_TYPE = {'public_id': 922, 'name': 'delete-server',
+               'fields': [{'type': 'text', 'name': 'hostname'}, {'type': 'ref', 'name': 'ref-location'},
+                          {'type': 'ref', 'name': 'ref-rack'}, {'type': 'text', 'name': 'slot'}],
+               'render_meta': {'sections': [{'type': 'section', 'name': 'server',
+                                             'fields': ['hostname', 'ref-location']},
+                                            {'type': 'multi-data-section', 'name': 'racks',
+                                             'fields': ['ref-rack', 'slot']}]}}
+
+
+@fixture(autouse=True)
+def delete_objects(database_manager: DatabaseManagerMongo):
+    """Writes two locations, two servers and their links directly into the database and removes them afterwards"""
+    database_manager.get_collection(TypeModel.COLLECTION).insert_many([dict(LOCATION_TYPE), dict(SERVER_TYPE)])
+    database_manager.get_collection(CmdbObject.COLLECTION).insert_many([
+        {'public_id': 921, 'type_id': 921, 'active': True, 'fields': [{'name': 'name', 'value': 'Berlin'}]},
+        {'public_id': 922, 'type_id': 921, 'active': True, 'fields': [{'name': 'name', 'value': 'Hamburg'}]},
+        {'public_id': 923, 'type_id': 922, 'active': True,
+         'fields': [{'name': 'hostname', 'value': 'web-01'}, {'name': 'ref-location', 'value': 921}]},
+        {'public_id': 924, 'type_id': 922, 'active': False,
+         'fields': [{'name': 'hostname', 'value': 'web-02'}, {'name': 'ref-location', 'value': 922}]},
+    ])
+    database_manager.get_collection(ObjectLinkModel.COLLECTION).insert_many([
+        {'public_id': 921, 'primary': 921, 'secondary': 923},
+        {'public_id': 922, 'primary': 924, 'secondary': 922},
+        {'public_id': 923, 'primary': 923, 'secondary': 924},
+    ])
+    ObjectsManager(database_manager).object_refs.index_objects([921, 922, 923, 924])
+    yield
+    for collection in (TypeModel.COLLECTION, CmdbObject.COLLECTION, ObjectLinkModel.COLLECTION,
+                       CmdbObjectRefs.COLLECTION):
+        database_manager.get_collection(collection).delete_many({'public_id': {'$gte': 921, '$lte': 924}})
+
+
+def test_delete_objects_with_references_and_links(database_manager):
+    """The references to and the links of the deleted objects are removed with the objects"""
+    objects_manager = ObjectsManager(database_manager)
+    locations = [CmdbObject.from_data(location) for location in objects_manager.get(filter={'type_id': 921})]
+
+    assert ObjectLinksManager(database_manager).delete_links_of_objects([921, 922]) == 2
+    assert sorted(objects_manager.delete_many_object_references([921, 922])) == [923, 924]
+    assert sorted(objects_manager.delete_objects(locations, None)) == [921, 922]
+
+    servers = {server['public_id']: server for server in objects_manager.get(filter={'type_id': 922})}
+
+    assert servers[923]['fields'] == [{'name': 'hostname', 'value': 'web-01'}, {'name': 'ref-location', 'value': ''}]
+    assert servers[924]['fields'][1] == {'name': 'ref-location', 'value': ''}
+    assert objects_manager.count_objects({'type_id': 921}) == 0
+    assert database_manager.get_collection(ObjectLinkModel.COLLECTION).count_documents(
+                                                            {'public_id': {'$gte': 921, '$lte': 923}}) == 1
+    assert objects_manager.object_refs.get_referencing_ids([921, 922]) == []
+
+
+def test_delete_references_in_multi_data_sections(database_manager):
+    """References inside of the multi data sections are cleared as well"""
+    objects_manager = ObjectsManager(database_manager)
+    database_manager.get_collection(CmdbObject.COLLECTION).update_one({'public_id': 924}, {'$set': {
+        'multi_data_sections': [{'section_id': 'racks', 'highest_id': 2, 'values': [
+            {'multi_data_id': 1, 'data': [{'name': 'ref-rack', 'value': 921}, {'name': 'slot', 'value': 921}]},
+            {'multi_data_id': 2, 'data': [{'name': 'ref-rack', 'value': 922}]},
+        ]}]
+    }})
+    objects_manager.object_refs.index_objects([924])
+
+    objects_manager.delete_all_object_references(921)
+
+    server = objects_manager.get_one(924)
+
+    assert server['fields'][1] == {'name': 'ref-location', 'value': 922}
+    assert server['multi_data_sections'][0]['values'] == [
+        {'multi_data_id': 1, 'data': [{'name': 'ref-rack', 'value': ''}, {'name': 'slot', 'value': 921}]},
+        {'multi_data_id': 2, 'data': [{'name': 'ref-rack', 'value': 922}]},
+    ]
+
+
+def test_references_before_and_after_completed_rebuild(database_manager):
+    """The object data is scanned until a rebuild of the edges was completed, afterwards the edges are read"""
+    objects_manager = ObjectsManager(database_manager)
+    settings = database_manager.get_collection(SystemSettingsReader.COLLECTION)
+    settings.delete_one({'_id': objects_manager.object_refs.STATE_ID})
+    database_manager.get_collection(CmdbObjectRefs.COLLECTION).delete_one({'public_id': 923})
+
+    assert objects_manager.object_refs.is_complete() is False
+    assert objects_manager.object_refs.get_referencing_ids([921]) == [923]
+
+    objects_manager.object_refs.rebuild()
+    references = objects_manager.references(objects_manager.get_object(921), [], limit=10, skip=0,
+                                            sort='public_id', order=1)
+
+    assert objects_manager.object_refs.is_complete() is True
+    assert [server.public_id for server in references.results] == [923]
+
+    settings.delete_one({'_id': objects_manager.object_refs.STATE_ID})
@@ -0,0 +1,79 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2024 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""Tests of the keyset pagination over sort fields with null values"""
+from datetime import datetime, timezone
+from pytest import fixture, mark
+
+from cmdb.database.database_manager_mongo import DatabaseManagerMongo
+from cmdb.manager.objects_manager import ObjectsManager
+from cmdb.manager.query_builder.builder_parameters import BuilderParameters
+from cmdb.manager.query_builder.page_cursor import PageCursor
+from cmdb.framework import CmdbObject
+# -------------------------------------------------------------------------------------------------------------------- #
+
+# public_id: editor_id, the editor of never edited objects is null or missing
+EDITORS = {941: None, 942: 2, 943: None, 944: 1, 945: 2, 946: 'missing', 947: 1}
+
+
+@fixture(autouse=True)
+def edited_objects(database_manager: DatabaseManagerMongo):
+    """Writes objects with and without an editor directly into the database and removes them afterwards"""
+    objects = []
+
+    for public_id, editor_id in EDITORS.items():
+        object_data = {'public_id': public_id, 'type_id': 941, 'active': True, 'author_id': 1, 'version': '1.0.0',
+                       'creation_time': datetime.now(timezone.utc), 'fields': []}
+
+        if editor_id != 'missing':
+            object_data['editor_id'] = editor_id
+
+        objects.append(object_data)
+
+    database_manager.get_collection(CmdbObject.COLLECTION).insert_many(objects)
+    yield
+    database_manager.get_collection(CmdbObject.COLLECTION).delete_many({'public_id': {'$gte': 941, '$lte': 947}})
+
+
+def read_pages(objects_manager: ObjectsManager, order: int, token: str = None, backwards: bool = False) -> tuple:
+    """
+    Reads all pages of two objects from the cursor token on in one direction
+
+    Returns:
+        tuple: The public_ids of the pages in sort order and the token in the other direction of the last read page
+    """
+    pages = []
+
+    while True:
+        builder_params = BuilderParameters({'type_id': 941}, limit=2, sort='editor_id', order=order, cursor_mode=True,
+                                           cursor=PageCursor.decode(token) if token else None)
+        result = objects_manager.iterate(builder_params)
+        pages.append([object_.public_id for object_ in result.results])
+        token = result.prev_cursor if backwards else result.next_cursor
+
+        if not token:
+            return (pages[::-1], result.next_cursor) if backwards else (pages, result.prev_cursor)
+
+
+@mark.parametrize('order', [1, -1])
+def test_pages_over_null_sort_values(database_manager, order):
+    """Null and missing sort values are sorted before all other values and no page border skips objects"""
+    objects_manager = ObjectsManager(database_manager)
+    expected = [941, 943, 946, 944, 947, 942, 945]
+
+    pages, prev_token = read_pages(objects_manager, order)
+
+    assert [public_id for page in pages for public_id in page] == (expected if order == 1 else expected[::-1])
+    assert read_pages(objects_manager, order, prev_token, backwards=True)[0] == pages[:-1]
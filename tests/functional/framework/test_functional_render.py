@@ -0,0 +1,112 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2024 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""Tests of the rendering of object lists with prefetched references"""
+from datetime import datetime, timezone
+from pytest import fixture, mark
+
+from cmdb.database.database_manager_mongo import DatabaseManagerMongo
+from cmdb.manager.objects_manager import ObjectsManager
+from cmdb.manager.users_manager import UsersManager
+from cmdb.framework import TypeModel, CmdbObject
+from cmdb.framework.cmdb_render import RenderList
+# -------------------------------------------------------------------------------------------------------------------- #
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def make_type(public_id: int, name: str, fields: list[dict], sections: list[dict], summary: list[str]) -> dict:
+    """Creates a type document"""
+    return {'public_id': public_id, 'name': name, 'label': name.title(), 'author_id': 1, 'creation_time': NOW,
+            'active': True, 'version': '1.0.0', 'fields': fields,
+            'render_meta': {'icon': 'fas fa-cube', 'sections': sections, 'externals': [],
+                            'summary': {'fields': summary}},
+            'acl': {'activated': False, 'groups': {'includes': {}}}}
+
+
+def make_object(public_id: int, type_id: int, fields: list[dict], editor_id: int = None) -> dict:
+    """Creates an object document"""
+    return {'public_id': public_id, 'type_id': type_id, 'active': True, 'author_id': 1, 'editor_id': editor_id,
+            'creation_time': NOW, 'last_edit_time': None, 'version': '1.0.0', 'fields': fields,
+            'multi_data_sections': []}
+
+
+RENDER_TYPES = [
+    make_type(951, 'render-location', [{'type': 'text', 'name': 'name', 'label': 'Name'}],
+              [{'type': 'section', 'name': 'location', 'label': 'Location', 'fields': ['name']}], ['name']),
+    make_type(952, 'render-vendor', [{'type': 'text', 'name': 'vendor-name', 'label': 'Vendor'},
+                                     {'type': 'ref', 'name': 'vendor-location', 'label': 'Location',
+                                      'ref_types': [951]}],
+              [{'type': 'section', 'name': 'vendor', 'label': 'Vendor',
+                'fields': ['vendor-name', 'vendor-location']}], ['vendor-name']),
+    make_type(953, 'render-server', [{'type': 'text', 'name': 'hostname', 'label': 'Hostname'},
+                                     {'type': 'ref', 'name': 'ref-vendor', 'label': 'Vendor', 'ref_types': [952]},
+                                     {'type': 'location', 'name': 'dg_location', 'label': 'Location'},
+                                     {'type': 'ref-section-field', 'name': 'owner-field', 'label': 'Owner'}],
+              [{'type': 'section', 'name': 'server', 'label': 'Server',
+                'fields': ['hostname', 'ref-vendor', 'dg_location']},
+               {'type': 'ref-section', 'name': 'owner', 'label': 'Owner', 'fields': ['owner-field'],
+                'reference': {'type_id': 952, 'section_name': 'vendor', 'selected_fields': []}}],
+              ['hostname']),
+]
+
+RENDER_OBJECTS = [
+    make_object(951, 951, [{'name': 'name', 'value': 'Berlin'}]),
+    make_object(952, 952, [{'name': 'vendor-name', 'value': 'Dell'}, {'name': 'vendor-location', 'value': 951}]),
+    make_object(953, 953, [{'name': 'hostname', 'value': 'web-01'}, {'name': 'ref-vendor', 'value': 952},
+                           {'name': 'dg_location', 'value': 951}, {'name': 'owner-field', 'value': 952}],
+                editor_id=1),
+    # references to objects which do not exist and an editor which does not exist
+    make_object(954, 953, [{'name': 'hostname', 'value': 'web-02'}, {'name': 'ref-vendor', 'value': 959},
+                           {'name': 'dg_location', 'value': 959}, {'name': 'owner-field', 'value': 959}],
+                editor_id=959),
+    make_object(955, 953, [{'name': 'hostname', 'value': 'web-03'}, {'name': 'ref-vendor', 'value': ''},
+                           {'name': 'dg_location', 'value': None}, {'name': 'owner-field', 'value': ''}]),
+]
+
+
+@fixture(autouse=True)
+def render_objects(database_manager: DatabaseManagerMongo):
+    """Writes the types and objects directly into the database and removes them afterwards"""
+    database_manager.get_collection(TypeModel.COLLECTION).insert_many([dict(type_) for type_ in RENDER_TYPES])
+    database_manager.get_collection(CmdbObject.COLLECTION).insert_many([dict(obj) for obj in RENDER_OBJECTS])
+    yield
+    for collection in (TypeModel.COLLECTION, CmdbObject.COLLECTION):
+        database_manager.get_collection(collection).delete_many({'public_id': {'$gte': 951, '$lte': 955}})
+
+
+def render(database_manager: DatabaseManagerMongo, ref_render: bool, batch: bool) -> list[dict]:
+    """Renders all objects of the test with new managers, without the time of the render"""
+    objects_manager = ObjectsManager(database_manager)
+    object_list = objects_manager.get_objects_by(sort='public_id', direction=1,
+                                                 public_id={'$gte': 951, '$lte': 955})
+    request_user = UsersManager(database_manager).get_user(1)
+
+    results = RenderList(object_list, request_user, ref_render, objects_manager, batch).render_result_list(raw=True)
+
+    for result in results:
+        result.pop('current_render_time')
+
+    return results
+
+
+@mark.parametrize('ref_render', [False, True])
+def test_batch_render_equals_single_render(database_manager, ref_render):
+    """Prefetching the references of a list does not change the rendered objects"""
+    single_results = render(database_manager, ref_render, batch=False)
+    batch_results = render(database_manager, ref_render, batch=True)
+
+    assert [result['object_information']['object_id'] for result in batch_results] == [951, 952, 953, 954, 955]
+    assert batch_results == single_results
@@ -0,0 +1,84 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2024 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""Tests of the search entries of objects"""
+from pytest import fixture
+
+from cmdb.database.database_manager_mongo import DatabaseManagerMongo
+from cmdb.manager.search_index_manager import SearchIndexManager
+from cmdb.cmdb_objects.cmdb_search_entry import CmdbSearchEntry
+from cmdb.search.searchers import QuickSearchPipelineBuilder
+from cmdb.framework import TypeModel, CmdbObject
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOCATION_TYPE = {'public_id': 901, 'name': 'search-location', 'fields': [{'type': 'text', 'name': 'name'}]}
+SERVER_TYPE = {'public_id': 902, 'name': 'search-server',
+               'fields': [{'type': 'text', 'name': 'hostname'}, {'type': 'ref', 'name': 'location'}]}
+
+
+@fixture(autouse=True)
+def search_objects(database_manager: DatabaseManagerMongo):
+    """Writes a location and two servers directly into the database and removes them afterwards"""
+    database_manager.get_collection(TypeModel.COLLECTION).insert_many([dict(LOCATION_TYPE), dict(SERVER_TYPE)])
+    database_manager.get_collection(CmdbObject.COLLECTION).insert_many([
+        {'public_id': 901, 'type_id': 901, 'active': True, 'fields': [{'name': 'name', 'value': 'Berlin Mitte'}]},
+        {'public_id': 902, 'type_id': 902, 'active': True,
+         'fields': [{'name': 'hostname', 'value': 'web-01'}, {'name': 'location', 'value': 901}]},
+        {'public_id': 903, 'type_id': 902, 'active': False,
+         'fields': [{'name': 'hostname', 'value': 'db-01'}, {'name': 'location', 'value': 901}]},
+    ])
+    yield
+    for collection in (TypeModel.COLLECTION, CmdbObject.COLLECTION, CmdbSearchEntry.COLLECTION):
+        database_manager.get_collection(collection).delete_many({'public_id': {'$gte': 901, '$lte': 903}})
+
+
+def count_matches(database_manager: DatabaseManagerMongo, search_term: str) -> dict:
+    """Runs the quick search count for a term"""
+    pipeline = QuickSearchPipelineBuilder().build(search_term)
+    result = list(database_manager.aggregate(CmdbSearchEntry.COLLECTION, pipeline))
+
+    return result[0] if result else {'active': 0, 'inactive': 0, 'total': 0}
+
+
+def test_entries_contain_referenced_values(database_manager):
+    """The entries of referencing objects contain the words of the referenced object"""
+    SearchIndexManager(database_manager).index_objects([901, 902, 903])
+
+    entry = database_manager.get_collection(CmdbSearchEntry.COLLECTION).find_one({'public_id': 902})
+
+    assert entry['references'] == [901]
+    assert entry['tokens'] == ['web', '01', 'berlin', 'mitte']
+    assert count_matches(database_manager, 'berl mit') == {'active': 2, 'inactive': 1, 'total': 3}
+    assert count_matches(database_manager, 'WEB') == {'active': 1, 'inactive': 0, 'total': 1}
+
+
+def test_changed_reference_refreshes_referencing_entries(database_manager):
+    """Updating or removing an object refreshes the entries which contain its values"""
+    search_index = SearchIndexManager(database_manager)
+    search_index.index_objects([901, 902, 903])
+
+    database_manager.get_collection(CmdbObject.COLLECTION).update_one(
+                                                                {'public_id': 901},
+                                                                {'$set': {'fields.0.value': 'Hamburg'}})
+    search_index.index_objects([901])
+
+    assert count_matches(database_manager, 'berlin')['total'] == 0
+    assert count_matches(database_manager, 'hamburg')['total'] == 3
+
+    database_manager.get_collection(CmdbObject.COLLECTION).delete_one({'public_id': 901})
+    search_index.remove_objects([901])
+
+    assert count_matches(database_manager, 'hamburg')['total'] == 0
+    assert count_matches(database_manager, 'db')['total'] == 1
@@ -0,0 +1,71 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2024 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""Tests of the template data of objects"""
+from datetime import datetime, timezone
+from pytest import fixture
+
+from cmdb.database.database_manager_mongo import DatabaseManagerMongo
+from cmdb.manager.objects_manager import ObjectsManager
+from cmdb.framework import TypeModel, CmdbObject
+from cmdb.framework.cmdb_render import RenderList
+from cmdb.templates.template_data import ObjectTemplateDataBuilder
+# -------------------------------------------------------------------------------------------------------------------- #
+
+def make_type(public_id: int, name: str, fields: list[dict]) -> dict:
+    """Creates the document of a type with one section of all fields"""
+    return {'public_id': public_id, 'name': name, 'label': name, 'author_id': 1, 'active': True, 'version': '1.0.0',
+            'creation_time': datetime.now(timezone.utc), 'fields': fields,
+            'render_meta': {'icon': '', 'externals': [], 'summary': {'fields': []},
+                            'sections': [{'type': 'section', 'name': 'section', 'label': 'Section',
+                                          'fields': [field['name'] for field in fields]}]},
+            'acl': {'activated': False, 'groups': {'includes': {}}}}
+
+
+def make_object(public_id: int, type_id: int, fields: list[dict]) -> dict:
+    """Creates the document of an object"""
+    return {'public_id': public_id, 'type_id': type_id, 'active': True, 'author_id': 1, 'version': '1.0.0',
+            'creation_time': datetime.now(timezone.utc), 'fields': fields, 'multi_data_sections': []}
+
+
+@fixture(autouse=True)
+def template_objects(database_manager: DatabaseManagerMongo):
+    """Writes a location and two servers in it directly into the database and removes them afterwards"""
+    database_manager.get_collection(TypeModel.COLLECTION).insert_many([
+        make_type(911, 'template-location', [{'type': 'text', 'name': 'name', 'label': 'Name'}]),
+        make_type(912, 'template-server', [{'type': 'text', 'name': 'hostname', 'label': 'Hostname'},
+                                           {'type': 'ref', 'name': 'location', 'label': 'Location',
+                                            'ref_types': [911]}])])
+    database_manager.get_collection(CmdbObject.COLLECTION).insert_many([
+        make_object(911, 911, [{'name': 'name', 'value': 'Berlin'}]),
+        make_object(912, 912, [{'name': 'hostname', 'value': 'web-01'}, {'name': 'location', 'value': 911}]),
+        make_object(913, 912, [{'name': 'hostname', 'value': 'web-02'}, {'name': 'location', 'value': 911}]),
+    ])
+    yield
+    for collection in (TypeModel.COLLECTION, CmdbObject.COLLECTION):
+        database_manager.get_collection(collection).delete_many({'public_id': {'$gte': 911, '$lte': 913}})
+
+
+def test_shared_reference_is_expanded_once(database_manager):
+    """The servers get the data of their location, which is built once for both"""
+    objects_manager = ObjectsManager(database_manager)
+    servers = [CmdbObject(**server) for server in objects_manager.get(filter={'type_id': 912})]
+    rendered = RenderList(servers, None, objects_manager=objects_manager, batch=True).render_result_list()
+
+    template_data = ObjectTemplateDataBuilder(objects_manager).build(rendered)
+
+    assert [data['fields']['hostname'] for data in template_data] == ['web-01', 'web-02']
+    assert template_data[0]['fields']['location'] == {'id': 911, 'fields': {'name': 'Berlin'}}
+    assert template_data[0]['fields']['location'] is template_data[1]['fields']['location']
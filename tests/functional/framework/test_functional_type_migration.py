@@ -0,0 +1,85 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2024 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""Tests of the migration of multi data sections after a type update"""
+from pytest import fixture
+
+from cmdb.database.database_manager_mongo import DatabaseManagerMongo
+from cmdb.manager.type_manager import TypeManager
+from cmdb.framework import TypeModel, CmdbObject
+from cmdb.utils.system_reader import SystemSettingsReader
+# -------------------------------------------------------------------------------------------------------------------- #
+
+RACK_TYPE = {'public_id': 931, 'name': 'migration-rack', 'label': 'Rack', 'author_id': 1, 'active': True,
+             'fields': [{'type': 'text', 'name': 'slot'}, {'type': 'text', 'name': 'height'},
+                        {'type': 'text', 'name': 'power'}],
+             'render_meta': {'icon': '', 'sections': [{'type': 'multi-data-section', 'name': 'slots',
+                                                       'fields': ['slot', 'height']}]}}
+
+
+@fixture(autouse=True)
+def rack_objects(database_manager: DatabaseManagerMongo):
+    """Writes a rack type and its objects directly into the database and removes them afterwards"""
+    database_manager.get_collection(TypeModel.COLLECTION).insert_one(dict(RACK_TYPE))
+    database_manager.get_collection(CmdbObject.COLLECTION).insert_many([
+        {'public_id': public_id, 'type_id': 931, 'active': True, 'fields': [],
+         'multi_data_sections': [{'section_id': 'slots', 'highest_id': 1, 'values': [
+             {'multi_data_id': 1, 'data': [{'name': 'slot', 'value': public_id}, {'name': 'height', 'value': '1U'}]}
+         ]}]}
+        for public_id in range(931, 936)
+    ])
+    yield
+    for collection in (TypeModel.COLLECTION, CmdbObject.COLLECTION):
+        database_manager.get_collection(collection).delete_many({'public_id': {'$gte': 931, '$lte': 935}})
+    database_manager.get_collection(SystemSettingsReader.COLLECTION).delete_many({'type_id': 931})
+
+
+def test_migrate_added_and_removed_fields(database_manager):
+    """Removed fields lose their entries, added fields get empty entries and a repeated migration changes nothing"""
+    type_manager = TypeManager(database_manager)
+    type_manager.MIGRATION_BATCH_SIZE = 2
+    updated_data = TypeModel.to_json(type_manager.get(931))
+    updated_data['render_meta']['sections'][0]['fields'] = ['slot', 'power']
+
+    changed_sections = type_manager.get_changed_multi_data_sections(type_manager.get(931), updated_data)
+
+    assert changed_sections == {'slots': ['slot', 'power']}
+    assert type_manager.migrate_multi_data_sections(931, changed_sections) == 5
+    assert type_manager.migrate_multi_data_sections(931, changed_sections) == 0
+
+    rack = database_manager.get_collection(CmdbObject.COLLECTION).find_one({'public_id': 933})
+
+    assert rack['multi_data_sections'][0]['values'] == [
+        {'multi_data_id': 1, 'data': [{'name': 'slot', 'value': 933}, {'name': 'power', 'value': None}]}
+    ]
+
+
+def test_resume_interrupted_migration(database_manager):
+    """A recorded migration is continued after its last public_id and removed when it is finished"""
+    type_manager = TypeManager(database_manager)
+    type_manager.MIGRATION_BATCH_SIZE = 2
+    settings = database_manager.get_collection(SystemSettingsReader.COLLECTION)
+    settings.insert_one({'_id': 'type_migration_931', 'type_id': 931,
+                         'sections': [{'name': 'slots', 'fields': ['slot']}], 'last_id': 932})
+
+    assert [migration['type_id'] for migration in type_manager.get_pending_migrations()] == [931]
+    assert type_manager.resume_multi_data_sections_migrations() == 3
+    assert type_manager.get_pending_migrations() == []
+
+    objects = {object_data['public_id']: object_data['multi_data_sections'][0]['values'][0]['data']
+               for object_data in database_manager.get_collection(CmdbObject.COLLECTION).find({'type_id': 931})}
+
+    assert objects[932] == [{'name': 'slot', 'value': 932}, {'name': 'height', 'value': '1U'}]
+    assert objects[933] == [{'name': 'slot', 'value': 933}]
@@ -0,0 +1,61 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2024 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""Tests of the delta runs of the exportd destinations"""
+import csv
+
+from cmdb.framework.cmdb_render import RenderResult
+from cmdb.exportd.exporter_base import ExportVariable
+from cmdb.exportd.externals.external_systems import ExternalSystemCsv
+# -------------------------------------------------------------------------------------------------------------------- #
+
+def make_object(public_id: int) -> RenderResult:
+    """Creates a rendered object without database"""
+    cmdb_object = RenderResult()
+    cmdb_object.object_information['object_id'] = public_id
+    cmdb_object.type_information['type_id'] = 1
+
+    return cmdb_object
+
+
+def export_csv(filename: str, added: list[tuple[int, str]], deleted: list[int] = None, delta: bool = False):
+    """Runs a csv export with the variable `host`"""
+    external_system = ExternalSystemCsv({'csv_filename': filename, 'csv_id_column': 'id'},
+                                        {'host': ExportVariable('host', '{{host}}')})
+    external_system.delta = delta
+    external_system.prepare_export()
+
+    for public_id, host in added:
+        external_system.add_object(make_object(public_id), {'host': host})
+
+    for public_id in deleted or []:
+        external_system.delete_object(public_id)
+
+    external_system.finish_export()
+
+
+def test_csv_delta_run_updates_existing_file(tmp_path):
+    """Delta runs replace the rows of changed objects, append created ones and remove deleted ones"""
+    filename = str(tmp_path / 'export.csv')
+
+    assert ExternalSystemCsv({'csv_filename': filename}, {}).supports_delta() is False
+
+    export_csv(filename, [(1, 'web-01'), (2, 'web-02'), (3, 'db-01')])
+    export_csv(filename, [(2, 'web-02-new'), (4, 'db-02')], deleted=[3], delta=True)
+
+    with open(filename, 'r', encoding='utf-8', newline='') as csv_file:
+        rows = list(csv.reader(csv_file, delimiter=';', quotechar='”'))
+
+    assert rows == [['id', 'host'], ['1', 'web-01'], ['2', 'web-02-new'], ['4', 'db-02']]
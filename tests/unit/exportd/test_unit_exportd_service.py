@@ -0,0 +1,176 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2024 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""Tests of the scheduling of the job runs by the exportd service"""
+from pytest import fixture
+
+from cmdb.event_management.event import Event
+from cmdb.exportd.exportd_job.exportd_job import ExportdJob
+from cmdb.exportd.service import ExportdService
+# -------------------------------------------------------------------------------------------------------------------- #
+
+class StubJobManager:
+    """Returns the event based jobs without database"""
+
+    def __init__(self, jobs: list[ExportdJob]):
+        self.jobs = jobs
+
+
+    def get_job_by_event_based(self, state: bool) -> list[ExportdJob]:
+        """Returns all jobs, they are all event based"""
+        return self.jobs
+
+
+class StubRunner:
+    """Records the executed runs instead of executing the jobs"""
+
+    def __init__(self, jobs: list[ExportdJob] = None):
+        self.exportd_job_manager = StubJobManager(jobs or [])
+        self.runs: list[tuple[int, Event]] = []
+
+
+    def run(self, job_id: int, event: Event) -> bool:
+        """Records the run"""
+        self.runs.append((job_id, event))
+        return True
+
+
+class StubExecutor:
+    """Holds the submitted runs until they are executed by the test"""
+
+    def __init__(self):
+        self.submitted = []
+
+
+    def submit(self, function, *args):
+        """Holds the run"""
+        self.submitted.append((function, args))
+
+
+    def run_all(self):
+        """Executes all held runs"""
+        submitted, self.submitted = self.submitted, []
+
+        for function, args in submitted:
+            function(*args)
+
+
+def make_job(public_id: int, subset: bool = False) -> ExportdJob:
+    """Creates an active event based job of type 3"""
+    return ExportdJob(name=f'job-{public_id}', public_id=public_id, active=True, sources=[{'type_id': 3}],
+                      scheduling={'event': {'active': True, 'subset': subset}})
+
+
+def object_event(**params) -> Event:
+    """Creates an update event of objects of type 3"""
+    event_type = 'cmdb.core.objects.updated' if 'ids' in params else 'cmdb.core.object.updated'
+
+    return Event(event_type, {'type_id': 3, 'user_id': 1, 'event': 'update', **params})
+
+
+@fixture
+def service() -> ExportdService:
+    """Service with a subset job 1, a job 2 for all objects and stubs for the runner and the workers"""
+    exportd_service = ExportdService()
+    exportd_service.init_workers(StubRunner([make_job(1, subset=True), make_job(2)]), StubExecutor())
+
+    return exportd_service
+
+
+def get_stubs(exportd_service: ExportdService) -> tuple[StubRunner, StubExecutor]:
+    """Returns the stubs of the service"""
+    return exportd_service._ExportdService__runner, exportd_service._ExportdService__executor
+
+
+def test_events_within_the_window_are_coalesced(service):
+    """Events within the debounce window result in one run with the latest event"""
+    runner, executor = get_stubs(service)
+
+    service.schedule_run((2, None), object_event(id=4), 100)
+    service.dispatch_due_runs()
+
+    assert not executor.submitted
+
+    service.schedule_run((2, None), object_event(id=5), 0)
+    service.dispatch_due_runs()
+    executor.run_all()
+
+    assert [(job_id, event.get_param('id')) for job_id, event in runner.runs] == [(2, 5)]
+    assert service.get_metrics()['coalesced'] == 1
+
+
+def test_debounce_delay_is_capped(service):
+    """A run starts after the maximal debounce delay even if further events keep re-arming it"""
+    _, executor = get_stubs(service)
+    service.MAX_DEBOUNCE_DELAY = 0
+
+    service.schedule_run((2, None), object_event(id=4), 100)
+    service.schedule_run((2, None), object_event(id=5), 100)
+    service.dispatch_due_runs()
+
+    assert len(executor.submitted) == 1
+
+
+def test_aggregated_events_of_subset_jobs_are_merged(service):
+    """The objects of aggregated events are merged per job, single objects are scheduled on their own"""
+    runner, executor = get_stubs(service)
+    service.DEBOUNCE_DELAY = 0
+
+    service.handler(object_event(ids=[4, 5]))
+    service.handler(object_event(ids=[5, 6]))
+    service.handler(object_event(id=7))
+
+    # the two runs of the subset job are started one after the other
+    for _ in range(2):
+        service.dispatch_due_runs()
+        executor.run_all()
+
+    subset_runs = sorted(event.get_param('ids') or [event.get_param('id')]
+                         for job_id, event in runner.runs if job_id == 1)
+
+    assert subset_runs == [[4, 5, 6], [7]]
+    assert [job_id for job_id, _ in runner.runs].count(2) == 1
+
+
+def test_running_job_is_not_started_again(service):
+    """A due run of a job waits until the running run of the same job released its lock"""
+    runner, executor = get_stubs(service)
+
+    service.schedule_run((2, None), object_event(id=4), 0)
+    service.dispatch_due_runs()
+    service.schedule_run((2, None), object_event(id=5), 0)
+    service.dispatch_due_runs()
+
+    assert len(executor.submitted) == 1
+    assert service.get_metrics()['pending'] == 1
+
+    executor.run_all()
+    service.dispatch_due_runs()
+    executor.run_all()
+
+    assert [event.get_param('id') for _, event in runner.runs] == [4, 5]
+
+
+def test_deactivated_job_is_cancelled(service):
+    """Deactivating a job removes all of its pending runs"""
+    _, executor = get_stubs(service)
+    service.DEBOUNCE_DELAY = 0
+
+    service.handler(object_event(id=4))
+    service.handler(object_event(ids=[5, 6]))
+    service.handler(Event('cmdb.exportd.updated', {'id': 1, 'active': False, 'user_id': 1}))
+    service.dispatch_due_runs()
+
+    assert [args[0] for _, args in executor.submitted] == [2]
@@ -0,0 +1,47 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2024 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""Tests of the subset runs of event based exportd jobs"""
+from cmdb.framework.cmdb_render import RenderResult
+from cmdb.event_management.event import Event
+from cmdb.exportd.exportd_job.exportd_job import ExportdJob
+from cmdb.exportd.exporter_base import ExportSource
+# -------------------------------------------------------------------------------------------------------------------- #
+
+def make_source(event: Event) -> ExportSource:
+    """Creates the source of a subset job without database"""
+    job = ExportdJob(name='subset', public_id=1, sources=[{'type_id': 3, 'condition': []}],
+                     scheduling={'event': {'active': True, 'subset': True}})
+
+    return ExportSource(job, event, None)
+
+
+def test_event_ids_of_single_and_aggregated_events():
+    """Events of one object contain an `id`, aggregated events of many objects contain `ids`"""
+    single = Event('cmdb.core.object.updated', {'id': 4, 'type_id': 3, 'event': 'update'})
+    aggregated = Event('cmdb.core.objects.updated', {'ids': [4, 7], 'type_id': 3, 'event': 'update'})
+
+    assert make_source(single).get_event_ids() == [4]
+    assert make_source(aggregated).get_event_ids() == [4, 7]
+
+
+def test_deleted_objects_of_aggregated_event():
+    """Aggregated delete events remove every object of the event"""
+    aggregated = Event('cmdb.core.objects.deleted', {'ids': [4, 7], 'type_id': 3, 'event': 'delete'})
+
+    deleted: list[RenderResult] = make_source(aggregated).get_objects()
+
+    assert [cmdb_object.object_information['object_id'] for cmdb_object in deleted] == [4, 7]
+    assert [cmdb_object.type_information['type_id'] for cmdb_object in deleted] == [3, 3]
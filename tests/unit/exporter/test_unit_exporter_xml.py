@@ -0,0 +1,65 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2024 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""Tests of the streamed xml export"""
+import xml.dom.minidom
+import xml.etree.ElementTree as ET
+
+from cmdb.framework.cmdb_render import RenderResult
+from cmdb.exporter.exporter_base import XmlExportType
+# -------------------------------------------------------------------------------------------------------------------- #
+
+def make_result(public_id: int, description: str) -> RenderResult:
+    """Creates the render result of an object without database"""
+    result = RenderResult()
+    result.object_information = {'object_id': public_id, 'active': True}
+    result.type_information = {'type_label': 'Server', 'type_id': 1}
+    result.fields = [{'name': 'hostname', 'value': f'server-{public_id}'},
+                     {'name': 'description', 'value': description}]
+
+    return result
+
+
+def export_in_one_document(results: list[RenderResult]) -> str:
+    """Builds the xml file as one pretty printed document, as the export did before it was streamed"""
+    objects = ET.Element('objects')
+
+    for result in results:
+        cmdb_object = ET.SubElement(objects, 'object')
+        meta = ET.SubElement(cmdb_object, 'meta')
+        ET.SubElement(meta, 'object_id').text = str(result.object_information['object_id'])
+        ET.SubElement(meta, 'active').text = str(result.object_information['active'])
+        ET.SubElement(meta, 'type').text = result.type_information['type_label']
+        fields = ET.SubElement(cmdb_object, 'fields')
+
+        for field in result.fields:
+            ET.SubElement(fields, 'field', {'name': field['name'], 'value': str(field['value'])})
+
+    return xml.dom.minidom.parseString(ET.tostring(objects, encoding='unicode', method='xml')).toprettyxml()
+
+
+def test_streamed_export_keeps_multi_line_values():
+    """The object elements are indented without changing the lines inside of their values"""
+    results = [make_result(1, 'first line\nsecond line'), make_result(2, 'single line')]
+
+    exported = XmlExportType().export(results)
+
+    assert exported == export_in_one_document(results)
+    assert '<field name="description" value="first line\nsecond line"/>' in exported
+
+
+def test_streamed_export_without_objects():
+    """An export without objects contains the empty root element"""
+    assert XmlExportType().export([]) == export_in_one_document([])
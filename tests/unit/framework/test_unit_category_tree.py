@@ -0,0 +1,37 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2024 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""Tests of the category tree construction"""
+from cmdb.framework.models.category import CategoryModel, CategoryTree
+# -------------------------------------------------------------------------------------------------------------------- #
+
+def make_category(public_id: int, parent: int = None, order: int = None, types: list[int] = None) -> CategoryModel:
+    """Creates a category without database"""
+    return CategoryModel.from_data({'public_id': public_id, 'name': f'category-{public_id}',
+                                    'label': f'Category {public_id}', 'parent': parent,
+                                    'types': types or [], 'meta': {'icon': '', 'order': order}})
+
+
+def test_tree_structure_and_order():
+    """Children are attached to their parents and sorted by their order, unset orders come last"""
+    categories = [make_category(1), make_category(2, order=1), make_category(3, parent=1, order=2),
+                  make_category(4, parent=1, order=1), make_category(5, parent=4), make_category(6, parent=99)]
+
+    tree = CategoryTree(categories)
+
+    assert [node.category.public_id for node in tree.tree] == [2, 1]
+    assert [node.category.public_id for node in tree.tree[1].children] == [4, 3]
+    assert [node.category.public_id for node in tree.tree[1].children[0].children] == [5]
+    assert [category.public_id for category in tree.flat()] == [2, 1, 4, 5, 3]
@@ -0,0 +1,51 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2024 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""Tests of the reference edges of objects"""
+from cmdb.framework import CmdbObjectRefs
+# -------------------------------------------------------------------------------------------------------------------- #
+
+SERVER_TYPE = {'public_id': 2, 'fields': [{'type': 'text', 'name': 'hostname'}, {'type': 'ref', 'name': 'location'},
+                                          {'type': 'ref', 'name': 'rack'},
+                                          {'type': 'ref-section-field', 'name': 'owner-field'}],
+               'render_meta': {'sections': [{'type': 'section', 'name': 'server', 'fields': ['hostname', 'location']},
+                                            {'type': 'multi-data-section', 'name': 'racks', 'fields': ['rack']},
+                                            {'type': 'ref-section', 'name': 'owner', 'fields': []}]}}
+
+
+def test_reference_fields_of_type():
+    """Only fields of a reference type are reference fields, ref-sections use their section field"""
+    assert CmdbObjectRefs.get_reference_fields(SERVER_TYPE) == {'location': 'server', 'rack': 'racks',
+                                                                'owner-field': 'owner'}
+
+
+def test_edges_of_fields_and_multi_data_sections():
+    """Edges are built for field and multi data section values, duplicated edges are written once"""
+    object_data = {'public_id': 5, 'type_id': 2,
+                   'fields': [{'name': 'hostname', 'value': 7}, {'name': 'location', 'value': 1},
+                              {'name': 'owner-field', 'value': [3, True, '']}],
+                   'multi_data_sections': [{'section_id': 'racks', 'values': [
+                       {'multi_data_id': 1, 'data': [{'name': 'rack', 'value': 4}]},
+                       {'multi_data_id': 2, 'data': [{'name': 'rack', 'value': 4}]},
+                   ]}]}
+
+    edges = CmdbObjectRefs.from_object(object_data, SERVER_TYPE)
+
+    assert edges.public_id == 5
+    assert edges.references == [
+        {'target_id': 1, 'field': 'location', 'section': 'server', 'via_mds': False},
+        {'target_id': 3, 'field': 'owner-field', 'section': 'owner', 'via_mds': False},
+        {'target_id': 4, 'field': 'rack', 'section': 'racks', 'via_mds': True},
+    ]
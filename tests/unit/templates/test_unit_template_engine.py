@@ -0,0 +1,46 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2024 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""Tests of the template rendering"""
+import jinja2
+
+from cmdb.templates.template_engine import TemplateCache, TemplateEngine
+# -------------------------------------------------------------------------------------------------------------------- #
+
+def test_cache_keeps_recently_used_templates():
+    """Templates are compiled once, the least recently used one is dropped when the cache is full"""
+    cache = TemplateCache(jinja2.Environment(undefined=jinja2.ChainableUndefined), max_size=2)
+
+    first = cache.get_template('{{ a }}')
+    cache.get_template('{{ b }}')
+
+    assert cache.get_template('{{ a }}') is first
+
+    cache.get_template('{{ c }}')
+
+    assert len(cache) == 2
+    assert cache.get_template('{{ a }}') is first
+    assert cache.get_template('{{ b }}') is not None and len(cache) == 2
+
+
+def test_render_many_and_sandbox():
+    """One template renders the data of several objects, the sandbox denies unsafe attributes"""
+    template = '{{ fields.name }}-{{ fields.missing.value }}'
+
+    assert TemplateEngine().render_many(template, [{'fields': {'name': 'a'}}, {'fields': {'name': 'b'}}]) \
+           == ['a-', 'b-']
+
+    assert TemplateEngine().render_template_string('{{ x.__class__ }}', {'x': 1}) == "<class 'int'>"
+    assert TemplateEngine(sandboxed=True).render_template_string('{{ x.__class__ }}', {'x': 1}) == ''